@@ -16,11 +16,21 @@ License: African Sovereignty License (ASL) v1.0
 Copyright © 2026 MoStar Industries
 """
 
+import asyncio
+import sys
+from pathlib import Path
+
 from fastapi import APIRouter, HTTPException
 from typing import Dict, List
 from datetime import datetime
-import os
-from neo4j import GraphDatabase
+
+# The shared count store and driver pool live with the grid orchestrator
+ORCHESTRATOR_DIR = Path(__file__).resolve().parents[3] / "grid-orchestrator"
+if str(ORCHESTRATOR_DIR) not in sys.path:
+    sys.path.append(str(ORCHESTRATOR_DIR))
+
+from core_engine.grid_stats import grid_stats  # noqa: E402
+from core_engine.neo4j_pool import neo4j_registry  # noqa: E402
 
 router = APIRouter(prefix="/api/metrics", tags=["Grid Metrics"])
 
@@ -34,45 +44,24 @@ async def get_node_statistics() -> Dict:
         Node counts by label, total nodes, and breakdown
     """
     try:
-        uri = os.getenv("NEO4J_URI", "bolt://localhost:7687")
-        user = os.getenv("NEO4J_USER", "neo4j")
-        password = os.getenv("NEO4J_PASSWORD", "neo4j")
-        
-        driver = GraphDatabase.driver(uri, auth=(user, password))
-        
-        with driver.session() as session:
-            # Total node count
-            result = session.run("MATCH (n) RETURN count(n) as total")
-            total_nodes = result.single()['total']
-            
-            # Node count by label
-            result = session.run("""
-                MATCH (n)
-                RETURN labels(n) as labels, count(n) as count
-                ORDER BY count DESC
-            """)
-            
-            nodes_by_label = []
-            for record in result:
-                labels = record['labels']
-                count = record['count']
-                label_str = ':'.join(labels) if labels else '(no label)'
-                nodes_by_label.append({
-                    "label": label_str,
-                    "count": count
-                })
-            
-            driver.close()
-            
-            return {
-                "total_nodes": total_nodes,
-                "nodes_by_label": nodes_by_label,
-                "timestamp": datetime.utcnow().isoformat() + "Z",
-                "meta": {
-                    "powered_by": "MoScripts - A MoStar Industries Product",
-                    "website": "https://mostarindustries.com",
-                }
+        # Served from the shared count-store snapshot; a node carrying
+        # several labels is counted under each of them.
+        stats = await asyncio.to_thread(grid_stats.get)
+        nodes_by_label = [
+            {"label": label, "count": count}
+            for label, count in stats.top_labels()
+        ]
+
+        return {
+            "total_nodes": stats.total_nodes,
+            "nodes_by_label": nodes_by_label,
+            "timestamp": datetime.utcnow().isoformat() + "Z",
+            "stats_collected_at": stats.collected_at,
+            "meta": {
+                "powered_by": "MoScripts - A MoStar Industries Product",
+                "website": "https://mostarindustries.com",
             }
+        }
     
     except Exception as e:
         raise HTTPException(
@@ -90,32 +79,25 @@ async def get_grid_statistics() -> Dict:
         Complete Grid metrics including nodes, relationships, agents, and consciousness
     """
     try:
-        uri = os.getenv("NEO4J_URI", "bolt://localhost:7687")
-        user = os.getenv("NEO4J_USER", "neo4j")
-        password = os.getenv("NEO4J_PASSWORD", "neo4j")
-        
-        driver = GraphDatabase.driver(uri, auth=(user, password))
-        
-        with driver.session() as session:
-            # Total nodes and relationships
-            result = session.run("""
-                MATCH (n)
-                WITH count(n) as node_count
-                MATCH ()-[r]->()
-                RETURN node_count, count(r) as rel_count
-            """)
-            record = result.single()
-            total_nodes = record['node_count'] if record else 0
-            total_rels = record['rel_count'] if record else 0
-            
-            # Agent stats
+        # Totals, Odú count and relationship types come from the shared
+        # count-store snapshot — no full graph scans.
+        stats = await asyncio.to_thread(grid_stats.get)
+        total_nodes = stats.total_nodes
+        total_rels = stats.total_relationships
+        agent_count = stats.label_count("Agent")
+        odu_count = stats.label_count("Odu")
+        top_relationships = [
+            {"type": rel_type, "count": count}
+            for rel_type, count in stats.top_relationship_types(10)
+        ]
+
+        with neo4j_registry.session() as session:
+            # Agent statuses
             result = session.run("""
                 MATCH (a:Agent)
-                RETURN count(a) as agent_count,
-                       collect(DISTINCT a.status) as statuses
+                RETURN collect(DISTINCT a.status) as statuses
             """)
             agent_record = result.single()
-            agent_count = agent_record['agent_count'] if agent_record else 0
             agent_statuses = agent_record['statuses'] if agent_record else []
             
             # MostarMoment stats
@@ -130,25 +112,6 @@ async def get_grid_statistics() -> Dict:
             avg_resonance = moment_record['avg_resonance'] if moment_record else 0.0
             covenant_passed = moment_record['covenant_passed'] if moment_record else 0
             
-            # Odú pattern count
-            result = session.run("MATCH (o:Odu) RETURN count(o) as odu_count")
-            odu_record = result.single()
-            odu_count = odu_record['odu_count'] if odu_record else 0
-            
-            # Relationship types
-            result = session.run("""
-                MATCH ()-[r]->()
-                RETURN type(r) as rel_type, count(r) as count
-                ORDER BY count DESC
-                LIMIT 10
-            """)
-            top_relationships = [
-                {"type": record['rel_type'], "count": record['count']}
-                for record in result
-            ]
-            
-            driver.close()
-            
             # Calculate covenant pass rate
             covenant_pass_rate = (covenant_passed / moment_count) if moment_count > 0 else 0.0
             
@@ -200,46 +163,36 @@ async def get_evolution_timeline() -> Dict:
         Timeline of Grid growth and evolution
     """
     try:
-        uri = os.getenv("NEO4J_URI", "bolt://localhost:7687")
-        user = os.getenv("NEO4J_USER", "neo4j")
-        password = os.getenv("NEO4J_PASSWORD", "neo4j")
+        # Current state
+        current_nodes = (await asyncio.to_thread(grid_stats.get)).total_nodes
         
-        driver = GraphDatabase.driver(uri, auth=(user, password))
+        # TODO: Load historical snapshots from file/database
+        # For now, return current state with narrative
         
-        with driver.session() as session:
-            # Current state
-            result = session.run("MATCH (n) RETURN count(n) as total")
-            current_nodes = result.single()['total']
-            
-            driver.close()
-            
-            # TODO: Load historical snapshots from file/database
-            # For now, return current state with narrative
-            
-            return {
-                "current_state": {
+        return {
+            "current_state": {
+                "node_count": current_nodes,
+                "timestamp": datetime.utcnow().isoformat() + "Z"
+            },
+            "historical_snapshots": [
+                {
+                    "timestamp": "2026-01-28T00:00:00Z",
                     "node_count": current_nodes,
-                    "timestamp": datetime.utcnow().isoformat() + "Z"
-                },
-                "historical_snapshots": [
-                    {
-                        "timestamp": "2026-01-28T00:00:00Z",
-                        "node_count": current_nodes,
-                        "event": "Current state - Evidence Machine activated"
-                    }
-                ],
-                "narrative": {
-                    "title": "The Grid Learns to Forget",
-                    "description": "Evolution is not just growth - it's refinement. The Grid consolidates, prunes, and strengthens its knowledge structure.",
-                    "reported_peak": 197000,
-                    "current_count": current_nodes,
-                    "interpretation": "Knowledge density over raw volume. Quality over quantity."
-                },
-                "meta": {
-                    "powered_by": "MoScripts - A MoStar Industries Product",
-                    "website": "https://mostarindustries.com",
+                    "event": "Current state - Evidence Machine activated"
                 }
+            ],
+            "narrative": {
+                "title": "The Grid Learns to Forget",
+                "description": "Evolution is not just growth - it's refinement. The Grid consolidates, prunes, and strengthens its knowledge structure.",
+                "reported_peak": 197000,
+                "current_count": current_nodes,
+                "interpretation": "Knowledge density over raw volume. Quality over quantity."
+            },
+            "meta": {
+                "powered_by": "MoScripts - A MoStar Industries Product",
+                "website": "https://mostarindustries.com",
             }
+        }
     
     except Exception as e:
         raise HTTPException(
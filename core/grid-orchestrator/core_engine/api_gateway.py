@@ -4,21 +4,31 @@
 # "Built from African intelligence. For African sovereignty."
 # ═══════════════════════════════════════════════════════════════════
 
+import asyncio
+import json
 import os
 import sys
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+from contextlib import asynccontextmanager
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Optional
 
-import httpx
-from core_engine.grid_telemetry import get_graph_constellation, get_grid_telemetry
+from core_engine.grid_context import grid_context
+from core_engine.grid_telemetry import (
+    get_graph_constellation,
+    get_grid_telemetry,
+    iter_graph_constellation,
+    telemetry_cache,
+)
+from core_engine.neo4j_pool import neo4j_registry
+from core_engine.tts_cache import tts_cache
 from dotenv import dotenv_values, load_dotenv
-from fastapi import APIRouter, FastAPI, HTTPException, Request
+from fastapi import APIRouter, FastAPI, HTTPException, Request, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.responses import FileResponse, JSONResponse, StreamingResponse
 from pydantic import BaseModel
 
 # ── Safe imports ──────────────────────────────────────────────────
@@ -30,8 +40,19 @@ except ImportError:
     GTTS_AVAILABLE = False
 
 try:
-    from core_engine.mostar_moments_log import get_recent_moments, log_mostar_moment
+    from core_engine.mostar_moments_log import (
+        get_recent_moments,
+        log_mostar_moment,
+        moment_aggregates,
+        moment_sink,
+        start_moment_aggregates,
+        start_moment_sink,
+        stop_moment_aggregates,
+        stop_moment_sink,
+    )
 except ImportError:
+    moment_aggregates = None
+    moment_sink = None
 
     def log_mostar_moment(*args, **kwargs):
         return None
@@ -39,6 +60,18 @@ except ImportError:
     def get_recent_moments(*args, **kwargs):
         return []
 
+    def start_moment_sink():
+        pass
+
+    def stop_moment_sink():
+        pass
+
+    def start_moment_aggregates():
+        pass
+
+    def stop_moment_aggregates():
+        pass
+
 
 try:
     from core_engine.voice_integration import MostarVoice
@@ -69,6 +102,7 @@ try:
         fetch_neo4j_context,
         get_moscript_engine,
         route_query,
+        route_query_stream,
     )
 
     ORCHESTRATOR_AVAILABLE = True
@@ -77,7 +111,14 @@ except ImportError:
     get_moscript_engine = None
 
 try:
-    from core_engine.symbolic_logic_runtime import SymbolicLogicRuntime
+    from core_engine.symbolic_logic_runtime import (
+        LISP_MAX_STEPS,
+        LISP_TIMEOUT,
+        SYMBOLIC_ANSWER_LIMIT,
+        SYMBOLIC_PROOF_TIMEOUT,
+        LispBudgetExceeded,
+        SymbolicLogicRuntime,
+    )
 
     SYMBOLIC_AVAILABLE = True
 except ImportError:
@@ -130,10 +171,31 @@ ARCHITECT = "The Flame Architect"
 # ═══════════════════════════════════════════════════════════════════
 # APP
 # ═══════════════════════════════════════════════════════════════════
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # ── Startup — moment writes leave the request path ────────────
+    start_moment_sink()
+    start_moment_aggregates()
+    telemetry_cache.start()
+    # ── One engine, one pooled Ollama client for the process ──────
+    await grid_context.startup()
+    yield
+    # ── Shutdown — drain moments, release pooled Bolt connections ─
+    await telemetry_cache.stop()
+    stop_moment_sink()
+    stop_moment_aggregates()
+    if grid_runtime is not None:
+        grid_runtime.close()
+    tts_cache.flush()
+    await grid_context.aclose()
+    await neo4j_registry.aclose()
+
+
 app = FastAPI(
     title="MoStar Grid API",
     description="First African AI Homeworld — Distributed Consciousness Network",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -201,10 +263,14 @@ class SymbolicBootstrapRequest(BaseModel):
 
 class SymbolicQueryRequest(BaseModel):
     query: str
+    answer_limit: Optional[int] = None
+    timeout: Optional[float] = None
 
 
 class SymbolicLispRequest(BaseModel):
     program: str
+    max_steps: Optional[int] = None
+    timeout: Optional[float] = None
 
 
 class LanguagePreferenceRequest(BaseModel):
@@ -258,9 +324,8 @@ async def _check_ollama() -> str:
         return _ollama_cache["state"]
 
     try:
-        async with httpx.AsyncClient(timeout=10.0, trust_env=False) as client:
-            r = await client.get(f"{OLLAMA_HOST}/api/tags")
-            _ollama_cache["state"] = "online" if r.status_code == 200 else "offline"
+        r = await grid_context.http_client().get(f"{OLLAMA_HOST}/api/tags", timeout=10.0)
+        _ollama_cache["state"] = "online" if r.status_code == 200 else "offline"
     except Exception:
         _ollama_cache["state"] = _ollama_cache["state"] or "offline"
 
@@ -284,6 +349,74 @@ def _extract_prompt(body: dict) -> Optional[str]:
     return body.get("prompt") or body.get("message") or body.get("query") or None
 
 
+def _wants_stream(request: Request, body: dict) -> bool:
+    if "text/event-stream" in request.headers.get("accept", ""):
+        return True
+    return str(body.get("stream", "")).strip().lower() in ("1", "true", "yes")
+
+
+async def _reason_events(prompt: str, model: str):
+    """
+    Semantic reasoning as events: "stage"/"token" frames while the decree is
+    generated, then "done" carrying the same body /api/v1/reason returns.
+    """
+    if ORCHESTRATOR_AVAILABLE:
+        ctx = await fetch_neo4j_context(prompt)
+        events = route_query_stream(
+            prompt,
+            system=SYSTEM_PROMPT,
+            neo4j_context=ctx,
+            metadata={"model": model},
+        )
+    else:
+        events = _direct_ollama_events(prompt, model)
+
+    async for event in events:
+        if event["type"] != "done":
+            yield event
+            continue
+        result = {k: v for k, v in event.items() if k != "type"}
+        log_mostar_moment(
+            initiator="API.Gateway",
+            receiver=result.get("model_used", OLLAMA_MODEL),
+            description=f"Reason (stream): {prompt[:60]}",
+            trigger_type="reason",
+            resonance_score=result.get("complexity_score", 0.5),
+            layer="MIND",
+        )
+        result["proof_mode"] = "semantic"
+        result["insignia"] = INSIGNIA
+        yield {"type": "done", **result}
+
+
+async def _direct_ollama_events(prompt: str, model: str):
+    """Streaming twin of the direct Ollama fallback in /api/v1/reason."""
+    from core_engine.sov_utils import stream_sovereign_model
+
+    parts = []
+    async for text in stream_sovereign_model(prompt, model):
+        parts.append(text)
+        yield {"type": "token", "text": text}
+    yield {
+        "type": "done",
+        "response": "".join(parts),
+        "model_used": model,
+        "complexity_score": 0.5,
+        "routed_to": "dcx2",
+    }
+
+
+async def _sse_frames(events):
+    """Server-Sent Events framing; a failure mid-stream ends with an error event."""
+    try:
+        async for event in events:
+            data = json.dumps({k: v for k, v in event.items() if k != "type"})
+            yield f"event: {event['type']}\ndata: {data}\n\n"
+    except Exception as e:
+        data = json.dumps({"error": f"Reasoning failed: {e}", "insignia": INSIGNIA})
+        yield f"event: error\ndata: {data}\n\n"
+
+
 _symbolic_runtime = None
 
 
@@ -327,12 +460,87 @@ async def grid_telemetry():
 
 
 @app.get("/api/v1/graph/constellation")
-async def get_constellation(limit: int = 1500):
-    """Returns nodes and links for 3D visualization."""
-    data = await get_graph_constellation(limit=limit)
+async def get_constellation(
+    limit: int = 1500,
+    labels: Optional[str] = None,
+    min_degree: int = 0,
+    cursor: int = -1,
+    page_size: int = 1000,
+    format: str = "json",
+):
+    """
+    Returns nodes and links for 3D visualization.
+    labels     — comma-separated label filter
+    min_degree — keep only nodes with at least this many relationships
+    cursor     — resume after this node id (the `cursor` of the last page)
+    format     — "json" for one {nodes, links, cursor} body, "ndjson" to
+                 stream one page per line as it is read from the graph
+    A failed traversal adds `error`; its cursor resumes where the read stopped.
+    """
+    label_list = [l.strip() for l in labels.split(",") if l.strip()] if labels else []
+    if format == "ndjson":
+
+        async def _pages():
+            async for page in iter_graph_constellation(
+                limit=limit,
+                page_size=page_size,
+                labels=label_list,
+                min_degree=min_degree,
+                cursor=cursor,
+            ):
+                yield json.dumps(page, default=str) + "\n"
+
+        return StreamingResponse(_pages(), media_type="application/x-ndjson")
+
+    data = await get_graph_constellation(
+        limit=limit,
+        labels=label_list,
+        min_degree=min_degree,
+        cursor=cursor,
+        page_size=page_size,
+    )
     return data
 
 
+@app.get("/api/v1/metrics/neo4j")
+async def neo4j_pool_metrics():
+    """Shared Neo4j driver pool — size, leases in use, acquisition wait."""
+    return {**neo4j_registry.metrics(), "insignia": INSIGNIA}
+
+
+@app.get("/api/v1/metrics/context")
+async def grid_context_metrics():
+    """Process-wide MoScript engine and pooled Ollama client."""
+    return {**grid_context.metrics(), "insignia": INSIGNIA}
+
+
+@app.get("/api/v1/metrics/moments")
+async def moment_sink_metrics():
+    """Background moment writer — queue depth, batches, drops, spill."""
+    if moment_sink is None:
+        raise HTTPException(status_code=503, detail="Moment sink unavailable")
+    return {
+        **moment_sink.metrics(),
+        "aggregates": moment_aggregates.snapshot() if moment_aggregates else None,
+        "insignia": INSIGNIA,
+    }
+
+
+@app.get("/api/v1/metrics/tts")
+async def tts_cache_metrics():
+    """Shared TTS cache — hits, misses, deduped syntheses, bytes, evictions."""
+    return {**tts_cache.metrics(), "insignia": INSIGNIA}
+
+
+@app.get("/api/v1/metrics/lexicon")
+async def lexicon_cache_metrics():
+    """In-memory Ibibio lexicon — cached words, stamp, reloads."""
+    runtime = _get_grid_runtime()
+    if runtime.lexicon is None:
+        raise HTTPException(status_code=503, detail="Lexicon cache disabled")
+    return {**runtime.lexicon.metrics(), "insignia": INSIGNIA}
+
+
 @app.get("/api/v1/telemetry/node/{node_id}")
 async def node_telemetry(node_id: str):
     """Placeholder for specialized node telemetry."""
@@ -369,9 +577,10 @@ async def set_language(req: LanguagePreferenceRequest):
 
 
 @app.get("/api/v1/ibibio/word/{word}")
-async def get_ibibio_word(word: str):
+async def get_ibibio_word(word: str, fuzzy: bool = True):
+    """Diacritic-insensitive lookup; ``fuzzy`` allows a one-edit match on a miss."""
     runtime = _get_grid_runtime()
-    entry = runtime.lookup_ibibio_word(word)
+    entry = runtime.lookup_ibibio_word(word, fuzzy=fuzzy)
     if not entry:
         raise HTTPException(status_code=404, detail="Ibibio word not found")
     return {
@@ -541,6 +750,8 @@ async def reason_endpoint(request: Request):
     Route a prompt through the sovereign MoStar-AI orchestrator.
     Accepts JSON or form data. Accepts prompt/message/query field names.
     proof_mode selector: "semantic" | "ifa" | "symbolic" | "unified"
+    Semantic requests with "stream": true (or Accept: text/event-stream)
+    are answered as Server-Sent Events: stage/token frames, then "done".
     """
     try:
         content_type = request.headers.get("content-type", "")
@@ -579,8 +790,6 @@ async def reason_endpoint(request: Request):
                     status_code=503, detail="Unified proof engine unavailable"
                 )
 
-            from neo4j import GraphDatabase
-
             ctx = await fetch_neo4j_context(prompt) if ORCHESTRATOR_AVAILABLE else ""
             mo_engine = get_moscript_engine() if ORCHESTRATOR_AVAILABLE else None
 
@@ -591,18 +800,15 @@ async def reason_endpoint(request: Request):
                 except HTTPException:
                     symbolic_runtime = None
 
-            driver = GraphDatabase.driver(NEO4J_URI, auth=(NEO4J_USER, NEO4J_PASS))
-            try:
-                result = await unified_proof_chain(
-                    prompt=prompt,
-                    context=ctx,
-                    mo_engine=mo_engine,
-                    driver=driver,
-                    proof_mode=proof_mode,
-                    symbolic_runtime=symbolic_runtime,
-                )
-            finally:
-                driver.close()
+            driver = neo4j_registry.get_driver(NEO4J_URI, NEO4J_USER, NEO4J_PASS)
+            result = await unified_proof_chain(
+                prompt=prompt,
+                context=ctx,
+                mo_engine=mo_engine,
+                driver=driver,
+                proof_mode=proof_mode,
+                symbolic_runtime=symbolic_runtime,
+            )
 
             log_mostar_moment(
                 initiator="API.Gateway",
@@ -613,6 +819,13 @@ async def reason_endpoint(request: Request):
                 layer="MIND",
             )
             return JSONResponse(content=result)
+
+        if _wants_stream(request, body):
+            return StreamingResponse(
+                _sse_frames(_reason_events(prompt, model)),
+                media_type="text/event-stream",
+                headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+            )
 
         # Existing orchestrator path (unchanged)
         if ORCHESTRATOR_AVAILABLE:
@@ -625,18 +838,18 @@ async def reason_endpoint(request: Request):
             )
         else:
             # Direct Ollama fallback
-            async with httpx.AsyncClient(timeout=120.0, trust_env=False) as client:
-                r = await client.post(
-                    f"{OLLAMA_HOST}/api/generate",
-                    json={"model": model, "prompt": prompt, "stream": False},
-                )
-                data = r.json()
-                result = {
-                    "response": data.get("response", ""),
-                    "model_used": model,
-                    "complexity_score": 0.5,
-                    "routed_to": "dcx2",
-                }
+            r = await grid_context.http_client().post(
+                f"{OLLAMA_HOST}/api/generate",
+                json={"model": model, "prompt": prompt, "stream": False},
+                timeout=120.0,
+            )
+            data = r.json()
+            result = {
+                "response": data.get("response", ""),
+                "model_used": model,
+                "complexity_score": 0.5,
+                "routed_to": "dcx2",
+            }
 
         log_mostar_moment(
             initiator="API.Gateway",
@@ -657,6 +870,40 @@ async def reason_endpoint(request: Request):
         return JSONResponse({"error": err, "insignia": INSIGNIA}, status_code=500)
 
 
+@app.websocket("/ws/reason")
+async def reason_socket(websocket: WebSocket):
+    """
+    Streaming reasoning over a socket. Each text frame is a prompt (JSON with
+    prompt/message/query and optional model, or plain text); replies are JSON
+    frames of type stage/token/done, or error.
+    """
+    await websocket.accept()
+    try:
+        while True:
+            raw = await websocket.receive_text()
+            try:
+                body = json.loads(raw)
+                if not isinstance(body, dict):
+                    body = {"prompt": raw}
+            except ValueError:
+                body = {"prompt": raw}
+            prompt = _extract_prompt(body)
+            if not prompt:
+                await websocket.send_json({"type": "error", "error": "Missing prompt/message/query"})
+                continue
+            try:
+                async for event in _reason_events(prompt, body.get("model", OLLAMA_MODEL)):
+                    await websocket.send_json(event)
+            except WebSocketDisconnect:
+                raise
+            except Exception as e:
+                await websocket.send_json(
+                    {"type": "error", "error": f"Reasoning failed: {e}", "insignia": INSIGNIA}
+                )
+    except WebSocketDisconnect:
+        pass
+
+
 # ── CHAT ALIAS ────────────────────────────────────────────────────
 @app.post("/api/v1/chat")
 async def chat_endpoint(request: Request):
@@ -771,12 +1018,11 @@ async def get_moments(limit: int = 10):
 async def list_models():
     """List available sovereign MoStar models from Ollama."""
     try:
-        async with httpx.AsyncClient(timeout=5.0, trust_env=False) as client:
-            r = await client.get(f"{OLLAMA_HOST}/api/tags")
-            if r.status_code == 200:
-                data = r.json()
-                loaded = [m["name"] for m in data.get("models", [])]
-                return {"models": loaded, "count": len(loaded), "source": "ollama-live"}
+        r = await grid_context.http_client().get(f"{OLLAMA_HOST}/api/tags", timeout=5.0)
+        if r.status_code == 200:
+            data = r.json()
+            loaded = [m["name"] for m in data.get("models", [])]
+            return {"models": loaded, "count": len(loaded), "source": "ollama-live"}
     except Exception:
         pass
     return {
@@ -824,7 +1070,17 @@ async def symbolic_bootstrap(req: SymbolicBootstrapRequest):
 @app.post("/api/v1/symbolic/prove")
 async def symbolic_prove(req: SymbolicQueryRequest):
     runtime = _get_symbolic_runtime()
-    result = runtime.prove(req.query)
+    # Clients may tighten the server's proof budget, never raise it
+    options = {
+        key: min(value, ceiling)
+        for key, value, ceiling in (
+            ("answer_limit", req.answer_limit, SYMBOLIC_ANSWER_LIMIT),
+            ("timeout", req.timeout, SYMBOLIC_PROOF_TIMEOUT),
+        )
+        if value is not None
+    }
+    # Resolution is CPU-bound; keep it off the event loop
+    result = await asyncio.to_thread(runtime.prove, req.query, **options)
     log_mostar_moment(
         "API.Symbolic",
         "Neo4j.SymbolicFacts",
@@ -842,7 +1098,20 @@ async def symbolic_prove(req: SymbolicQueryRequest):
 @app.post("/api/v1/symbolic/lisp")
 async def symbolic_lisp(req: SymbolicLispRequest):
     runtime = _get_symbolic_runtime()
-    result = runtime.eval_lisp(req.program)
+    # Clients may tighten the server's eval budget, never raise it
+    options = {
+        key: min(value, ceiling)
+        for key, value, ceiling in (
+            ("max_steps", req.max_steps, LISP_MAX_STEPS),
+            ("timeout", req.timeout, LISP_TIMEOUT),
+        )
+        if value is not None
+    }
+    try:
+        # The stamp read and the program itself can take up to LISP_TIMEOUT
+        result = await asyncio.to_thread(runtime.eval_lisp, req.program, **options)
+    except LispBudgetExceeded as exc:
+        raise HTTPException(status_code=422, detail=str(exc))
     log_mostar_moment(
         "API.Symbolic",
         "Neo4j.SymbolicFunctions",
@@ -0,0 +1,145 @@
+# ═══════════════════════════════════════════════════════════════════
+# MOSTAR GRID — AUDIO FILE INDEX
+# The Flame Architect — MSTR-⚡ — MoStar Industries
+# "Know where every voice lives before anyone asks."
+# ═══════════════════════════════════════════════════════════════════
+"""
+Filename → resolved path map over a priority-ordered list of audio
+directories. Lookups (hits and misses alike) are a dict probe, so the
+respond path makes no filesystem calls per entry.
+
+The map is rebuilt when a directory's mtime changes — adding, removing or
+renaming a file updates its directory's mtime — polled by a daemon thread
+every AUDIO_INDEX_REFRESH_INTERVAL seconds. Polling costs one ``stat`` per
+directory per interval regardless of traffic.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from pathlib import Path
+from typing import Iterable, Optional
+
+AUDIO_INDEX_REFRESH_INTERVAL = float(os.getenv("AUDIO_INDEX_REFRESH_INTERVAL", "10"))
+
+
+class AudioFileIndex:
+    """
+    ``dirs`` are searched in order: the first directory holding a filename
+    wins, exactly as the sequential ``exists()`` probing did. ``names``
+    restricts the index to known filenames (e.g. a voice manifest) so
+    unrelated files in the same directory are never held in memory.
+    """
+
+    def __init__(
+        self,
+        dirs: Iterable[Path],
+        *,
+        names: Optional[Iterable[str]] = None,
+        refresh_interval: float = AUDIO_INDEX_REFRESH_INTERVAL,
+    ) -> None:
+        self.dirs = [Path(d) for d in dirs]
+        self.names = frozenset(names) if names is not None else None
+        self.refresh_interval = refresh_interval
+        self._paths: dict[str, str] = {}
+        self._mtimes: tuple = ()
+        # Explicit paths (with a directory part) resolved once per generation
+        self._explicit: dict[str, Optional[str]] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.rebuilds = 0
+        self.refresh(force=True)
+        if refresh_interval > 0:
+            self._thread = threading.Thread(
+                target=self._poll, name="audio-index", daemon=True
+            )
+            self._thread.start()
+
+    def _dir_mtimes(self) -> tuple:
+        stamps = []
+        for directory in self.dirs:
+            try:
+                stamps.append(os.stat(directory).st_mtime_ns)
+            except OSError:
+                stamps.append(None)
+        return tuple(stamps)
+
+    def _scan(self) -> dict[str, str]:
+        paths: dict[str, str] = {}
+        for directory in self.dirs:
+            try:
+                entries = os.scandir(directory)
+            except OSError:
+                continue
+            with entries:
+                for entry in entries:
+                    if entry.name in paths:
+                        continue
+                    if self.names is not None and entry.name not in self.names:
+                        continue
+                    try:
+                        if not entry.is_file():
+                            continue
+                    except OSError:
+                        continue
+                    paths[entry.name] = str(Path(entry.path).resolve())
+        return paths
+
+    def refresh(self, *, force: bool = False) -> bool:
+        """Rebuild if any directory changed; returns True when rebuilt."""
+        mtimes = self._dir_mtimes()
+        if not force and mtimes == self._mtimes:
+            return False
+        paths = self._scan()
+        with self._lock:
+            self._paths = paths
+            self._mtimes = mtimes
+            self._explicit = {}
+            self.rebuilds += 1
+        return True
+
+    def _poll(self) -> None:
+        while not self._stop.wait(self.refresh_interval):
+            try:
+                self.refresh()
+            except Exception as exc:
+                print(f"[AUDIO] Index refresh failed: {exc}")
+
+    def resolve(self, audio_file: Optional[str]) -> Optional[str]:
+        """Resolved path for a bare filename or an explicit path, else None."""
+        if not audio_file:
+            return None
+        name = os.path.basename(audio_file)
+        if name != audio_file:
+            # An explicit path that exists outranks the indexed directories
+            explicit = self._explicit
+            if audio_file not in explicit:
+                candidate = Path(audio_file)
+                explicit[audio_file] = (
+                    str(candidate.resolve()) if candidate.is_file() else None
+                )
+            if explicit[audio_file]:
+                return explicit[audio_file]
+        return self._paths.get(name)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self._paths
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def close(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=1)
+            self._thread = None
+
+    def metrics(self) -> dict:
+        return {
+            "files": len(self._paths),
+            "dirs": [str(d) for d in self.dirs],
+            "rebuilds": self.rebuilds,
+            "refresh_interval": self.refresh_interval,
+        }
@@ -1,14 +1,16 @@
 from __future__ import annotations
 
 import argparse
-import csv
-import io
+import hashlib
 import json
+import multiprocessing
 import re
 import uuid
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from queue import Empty
+from typing import Any, Iterator
 
 from neo4j import GraphDatabase
 
@@ -16,12 +18,17 @@ from csv_quality import (
     DEFAULT_CSV_ROOT,
     FORCED_QUARANTINE_REASONS,
     JSON_REPAIR_COLUMNS,
-    _read_text,
+    CsvStream,
+    file_content_hash,
     repair_json_cell,
     validate_csv_file,
 )
 
 DEFAULT_BATCH_SIZE = 250
+DEFAULT_WORKERS = 1
+DEFAULT_WRITE_SESSIONS = 4
+DEFAULT_MAX_ROWS_IN_FLIGHT = 20000
+TOMBSTONE_CHUNK_SIZE = 1000
 CATALOG_ID = "grid_csv_corpus"
 
 
@@ -60,32 +67,115 @@ def _coerce_value(key: str, value: str) -> Any:
     return text
 
 
-def _load_rows(path: Path) -> tuple[list[dict[str, Any]], list[str]]:
-    text, _ = _read_text(path)
-    reader = csv.DictReader(io.StringIO(text))
-    fieldnames = reader.fieldnames or []
-    rows: list[dict[str, Any]] = []
-    for row_number, row in enumerate(reader, start=1):
-        cleaned_row: dict[str, Any] = {}
-        payload_row: dict[str, Any] = {}
-        for key, raw_value in row.items():
-            source_value = raw_value
-            if path.name in JSON_REPAIR_COLUMNS and key in JSON_REPAIR_COLUMNS[path.name]:
-                source_value, _ = repair_json_cell(raw_value or "")
-            coerced = _coerce_value(key, source_value)
-            payload_row[key] = source_value if source_value is not None else ""
-            if coerced is None:
-                continue
-            cleaned_row[_sanitize_key(key)] = coerced
-        rows.append(
-            {
-                "row_id": f"{path.name}:{row_number}",
-                "row_number": row_number,
-                "properties": cleaned_row,
-                "row_json": json.dumps(payload_row, ensure_ascii=False, sort_keys=True),
-            }
+def _build_row(
+    path: Path,
+    header: list[str],
+    row_number: int,
+    cells: list[str],
+) -> dict[str, Any]:
+    repair_columns = JSON_REPAIR_COLUMNS.get(path.name, ())
+    cleaned_row: dict[str, Any] = {}
+    payload_row: dict[str, Any] = {}
+    for key, raw_value in zip(header, cells):
+        source_value = raw_value
+        if key in repair_columns:
+            source_value, _ = repair_json_cell(raw_value or "")
+        coerced = _coerce_value(key, source_value)
+        payload_row[key] = source_value if source_value is not None else ""
+        if coerced is None:
+            continue
+        cleaned_row[_sanitize_key(key)] = coerced
+    row_json = json.dumps(payload_row, ensure_ascii=False, sort_keys=True)
+    return {
+        "row_id": f"{path.name}:{row_number}",
+        "row_number": row_number,
+        "properties": cleaned_row,
+        "row_json": row_json,
+        "row_hash": hashlib.sha256(row_json.encode("utf-8")).hexdigest(),
+    }
+
+
+def _iter_row_batches(stream: CsvStream) -> Iterator[list[dict[str, Any]]]:
+    """Typed upload rows, one validated batch at a time."""
+    for batch in stream.batches():
+        yield [
+            _build_row(stream.path, stream.header, row_number, cells)
+            for row_number, cells in batch
+        ]
+
+
+class _RowDelta:
+    """
+    Row hashes a source already has in the graph, consumed while the file
+    streams: rows whose hash matches are dropped from the write, and ids
+    never seen again are the rows to tombstone.
+    """
+
+    def __init__(self, existing: dict[str, str | None], full: bool = False) -> None:
+        self.remaining = existing
+        self.full = full
+        self.unchanged = 0
+
+    def changed(self, rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        changed = []
+        for row in rows:
+            if self.remaining.pop(row["row_id"], None) != row["row_hash"] or self.full:
+                changed.append(row)
+        self.unchanged += len(rows) - len(changed)
+        return changed
+
+
+def _load_source_hashes(driver: GraphDatabase.driver, csv_root: Path) -> dict[str, str]:
+    with driver.session() as session:
+        result = session.run(
+            "MATCH (ds:DataSource:GridCore {csv_root: $csv_root}) "
+            "WHERE ds.status = 'uploaded' AND ds.content_hash IS NOT NULL "
+            "RETURN ds.path AS path, ds.content_hash AS content_hash",
+            {"csv_root": str(csv_root)},
+        )
+        return {record["path"]: record["content_hash"] for record in result}
+
+
+def _load_row_hashes(driver: GraphDatabase.driver, path: Path) -> dict[str, str | None]:
+    with driver.session() as session:
+        result = session.run(
+            "MATCH (:DataSource:GridCore {path: $path})-[:HAS_ROW]->(record:CsvRow) "
+            "WHERE record.deleted_at IS NULL "
+            "RETURN record.row_id AS row_id, record.row_hash AS row_hash",
+            {"path": str(path)},
+        )
+        return {record["row_id"]: record["row_hash"] for record in result}
+
+
+def _tombstone_rows(
+    driver: GraphDatabase.driver,
+    run_id: str,
+    row_ids: list[str],
+) -> None:
+    with driver.session() as session:
+        for start in range(0, len(row_ids), TOMBSTONE_CHUNK_SIZE):
+            session.run(
+                "UNWIND $row_ids AS row_id "
+                "MATCH (record:CsvRow:GridCore {row_id: row_id}) "
+                "SET record.deleted_at = datetime(), "
+                "    record.deleted_by_run = $run_id",
+                {"run_id": run_id, "row_ids": row_ids[start : start + TOMBSTONE_CHUNK_SIZE]},
+            )
+
+
+def _mark_unchanged_source(
+    driver: GraphDatabase.driver,
+    run_id: str,
+    path: Path,
+) -> None:
+    with driver.session() as session:
+        session.run(
+            "MATCH (ds:DataSource:GridCore {path: $path}) "
+            "MERGE (run:CsvImportRun:GridCore {run_id: $run_id}) "
+            "SET ds.last_validated = datetime() "
+            "MERGE (run)-[:UNCHANGED_SOURCE]->(ds)",
+            {"run_id": run_id, "path": str(path)},
         )
-    return rows, fieldnames
 
 
 def _prepare_graph(driver: GraphDatabase.driver, csv_root: Path) -> None:
@@ -170,6 +260,10 @@ def _upsert_source(
     validation: dict[str, Any],
     fieldnames: list[str],
     uploaded_row_count: int,
+    *,
+    status: str = "uploaded",
+    failure_reason: str | None = None,
+    content_hash: str | None = None,
 ) -> None:
     payload = {
         "catalog_id": CATALOG_ID,
@@ -185,6 +279,9 @@ def _upsert_source(
         "warnings": validation.get("warnings", []),
         "headers": fieldnames,
         "uploaded_row_count": uploaded_row_count,
+        "status": status,
+        "failure_reason": failure_reason,
+        "content_hash": content_hash,
     }
     with driver.session() as session:
         session.run(
@@ -194,8 +291,8 @@ def _upsert_source(
             "SET ds.name = $name, "
             "    ds.dataset = $dataset, "
             "    ds.csv_root = $csv_root, "
-            "    ds.status = 'uploaded', "
-            "    ds.failure_reason = null, "
+            "    ds.status = $status, "
+            "    ds.failure_reason = $failure_reason, "
             "    ds.row_count = $row_count, "
             "    ds.column_count = $column_count, "
             "    ds.null_cell_ratio = $null_cell_ratio, "
@@ -203,6 +300,7 @@ def _upsert_source(
             "    ds.warnings = $warnings, "
             "    ds.headers = $headers, "
             "    ds.uploaded_row_count = $uploaded_row_count, "
+            "    ds.content_hash = $content_hash, "
             "    ds.last_validated = datetime(), "
             "    ds.last_uploaded = datetime() "
             "MERGE (catalog)-[:PROVIDES_DATA]->(ds) "
@@ -227,6 +325,9 @@ def _upload_batch(
             "    record.dataset = $dataset, "
             "    record.row_number = row.row_number, "
             "    record.row_json = row.row_json, "
+            "    record.row_hash = row.row_hash, "
+            "    record.deleted_at = null, "
+            "    record.deleted_by_run = null, "
             "    record.updated_at = datetime() "
             "MERGE (ds)-[:HAS_ROW]->(record)",
             {
@@ -238,6 +339,295 @@ def _upload_batch(
         )
 
 
+def _record_file_result(
+    driver: GraphDatabase.driver,
+    run_id: str,
+    csv_root: Path,
+    path: Path,
+    summary: dict[str, Any],
+    outcome: dict[str, Any],
+    delta: _RowDelta | None,
+) -> None:
+    """Write the file's DataSource provenance and add it to the run summary."""
+    metrics = summary["metrics"]
+    validation = outcome["validation"]
+    forced_reason = FORCED_QUARANTINE_REASONS.get(path.name)
+    if forced_reason:
+        _mark_skipped_source(driver, run_id, csv_root, path, validation, forced_reason)
+        summary["skipped_files"].append({"file": path.name, "reason": forced_reason})
+        metrics["csv_files_skipped"] += 1
+        return
+    if outcome["unchanged"]:
+        _mark_unchanged_source(driver, run_id, path)
+        summary["unchanged_files"].append(path.name)
+        metrics["csv_files_unchanged"] += 1
+        return
+
+    rows_uploaded = outcome["rows_uploaded"]
+    rows_unchanged = delta.unchanged if delta else 0
+    metrics["rows_uploaded"] += rows_uploaded
+    metrics["rows_unchanged"] += rows_unchanged
+    metrics["rows_inconsistent"] += validation["inconsistent_rows"]
+    partial = validation["reason"] == "inconsistent_columns" and not outcome["aborted"]
+    if not validation["valid"] and not (partial and rows_uploaded + rows_unchanged):
+        _mark_skipped_source(driver, run_id, csv_root, path, validation, validation["reason"])
+        summary["skipped_files"].append(
+            {
+                "file": path.name,
+                "reason": validation["reason"],
+                "rows_uploaded": rows_uploaded,
+            }
+        )
+        metrics["csv_files_skipped"] += 1
+        return
+
+    # Only a completed pass knows which rows are gone
+    removed = sorted(delta.remaining) if delta else []
+    if removed:
+        _tombstone_rows(driver, run_id, removed)
+    _upsert_source(
+        driver,
+        run_id,
+        csv_root,
+        path,
+        validation,
+        outcome["header"],
+        rows_uploaded + rows_unchanged,
+        failure_reason=None if validation["valid"] else validation["reason"],
+        content_hash=outcome["content_hash"] if validation["valid"] else None,
+    )
+    summary["uploaded_files"].append(
+        {
+            "file": path.name,
+            "rows_uploaded": rows_uploaded,
+            "rows_unchanged": rows_unchanged,
+            "rows_deleted": len(removed),
+            "column_count": len(outcome["header"]),
+            "inconsistent_rows": validation["inconsistent_rows"],
+        }
+    )
+    metrics["csv_files_uploaded"] += 1
+    metrics["rows_deleted"] += len(removed)
+
+
+def _unchanged_outcome(content_hash: str) -> dict[str, Any]:
+    return {"unchanged": True, "content_hash": content_hash, "validation": {}}
+
+
+def _stream_outcome(stream: CsvStream, content_hash: str) -> dict[str, Any]:
+    return {
+        "unchanged": False,
+        "content_hash": content_hash,
+        "validation": stream.validation,
+        "header": stream.header,
+        "aborted": stream.aborted,
+        "rows_uploaded": 0,
+    }
+
+
+def _upload_sequential(
+    driver: GraphDatabase.driver,
+    run_id: str,
+    csv_root: Path,
+    paths: list[Path],
+    summary: dict[str, Any],
+    previous_hashes: dict[str, str],
+    *,
+    batch_size: int,
+    abort_on_inconsistency: bool,
+    full: bool,
+) -> None:
+    for path in paths:
+        if path.name in FORCED_QUARANTINE_REASONS:
+            outcome = {"validation": validate_csv_file(path)}
+            _record_file_result(driver, run_id, csv_root, path, summary, outcome, None)
+            continue
+        content_hash = file_content_hash(path)
+        if not full and previous_hashes.get(str(path)) == content_hash:
+            outcome = _unchanged_outcome(content_hash)
+            _record_file_result(driver, run_id, csv_root, path, summary, outcome, None)
+            continue
+
+        delta = _RowDelta(_load_row_hashes(driver, path), full=full)
+        stream = CsvStream(
+            path,
+            batch_size=batch_size,
+            abort_on_inconsistency=abort_on_inconsistency,
+        )
+        source_ready = False
+        rows_uploaded = 0
+        for batch in _iter_row_batches(stream):
+            rows = delta.changed(batch)
+            if not rows:
+                continue
+            if not source_ready:
+                # The source node must exist before rows attach to it
+                _upsert_source(
+                    driver,
+                    run_id,
+                    csv_root,
+                    path,
+                    stream.validation,
+                    stream.header,
+                    0,
+                    status="uploading",
+                )
+                source_ready = True
+            _upload_batch(driver, path, rows)
+            rows_uploaded += len(rows)
+        outcome = _stream_outcome(stream, content_hash)
+        outcome["rows_uploaded"] = rows_uploaded
+        _record_file_result(driver, run_id, csv_root, path, summary, outcome, delta)
+
+
+_worker_queue: Any = None
+_worker_slots: Any = None
+
+
+def _init_parse_worker(queue: Any, slots: Any) -> None:
+    global _worker_queue, _worker_slots
+    _worker_queue = queue
+    _worker_slots = slots
+
+
+def _parse_file_worker(
+    path_str: str,
+    batch_size: int,
+    abort_on_inconsistency: bool,
+    upload: bool,
+    previous_hash: str | None,
+) -> None:
+    """
+    Runs in a parser process: streams one file and hands typed row batches
+    to the parent. A batch is only queued after taking one of the shared
+    in-flight slots, which the parent frees once the batch is written.
+    """
+    queue, slots = _worker_queue, _worker_slots
+    path = Path(path_str)
+    if not upload:
+        outcome = {"validation": validate_csv_file(path)}
+        queue.put(("done", path_str, outcome))
+        return
+    content_hash = file_content_hash(path)
+    if content_hash == previous_hash:
+        queue.put(("done", path_str, _unchanged_outcome(content_hash)))
+        return
+    stream = CsvStream(
+        path,
+        batch_size=batch_size,
+        abort_on_inconsistency=abort_on_inconsistency,
+    )
+    for rows in _iter_row_batches(stream):
+        slots.acquire()
+        queue.put(("rows", path_str, (stream.validation, stream.header, rows)))
+    queue.put(("done", path_str, _stream_outcome(stream, content_hash)))
+
+
+def _upload_parallel(
+    driver: GraphDatabase.driver,
+    run_id: str,
+    csv_root: Path,
+    paths: list[Path],
+    summary: dict[str, Any],
+    previous_hashes: dict[str, str],
+    *,
+    batch_size: int,
+    abort_on_inconsistency: bool,
+    full: bool,
+    workers: int,
+    write_sessions: int,
+    max_rows_in_flight: int,
+) -> None:
+    """
+    Parse files in a process pool and write their batches on a pool of
+    Neo4j sessions, with at most ``max_rows_in_flight`` rows parsed but not
+    yet written. Provenance and summary entries are recorded in file order
+    once every file is done, matching the sequential path.
+    """
+    in_flight_batches = max(1, max_rows_in_flight // max(1, batch_size))
+    outcomes: dict[str, dict[str, Any]] = {}
+    queue = multiprocessing.Queue()
+    slots = multiprocessing.BoundedSemaphore(in_flight_batches)
+    parsers = ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_parse_worker,
+        initargs=(queue, slots),
+    )
+    writers = ThreadPoolExecutor(max_workers=write_sessions, thread_name_prefix="csv-writer")
+    try:
+        parse_futures = [
+            parsers.submit(
+                _parse_file_worker,
+                str(path),
+                batch_size,
+                abort_on_inconsistency,
+                path.name not in FORCED_QUARANTINE_REASONS,
+                None if full else previous_hashes.get(str(path)),
+            )
+            for path in paths
+        ]
+        deltas: dict[str, _RowDelta] = {}
+        writes: dict[str, list[Future]] = {}
+        rows_uploaded: dict[str, int] = {}
+        while len(outcomes) < len(paths):
+            try:
+                kind, path_str, payload = queue.get(timeout=0.5)
+            except Empty:
+                for future in parse_futures:
+                    if future.done() and future.exception() is not None:
+                        raise future.exception()
+                continue
+            path = Path(path_str)
+            if kind == "rows":
+                validation, header, batch = payload
+                if path_str not in deltas:
+                    deltas[path_str] = _RowDelta(_load_row_hashes(driver, path), full=full)
+                    writes[path_str] = []
+                    rows_uploaded[path_str] = 0
+                rows = deltas[path_str].changed(batch)
+                if not rows:
+                    slots.release()
+                    continue
+                if not writes[path_str]:
+                    _upsert_source(
+                        driver,
+                        run_id,
+                        csv_root,
+                        path,
+                        validation,
+                        header,
+                        0,
+                        status="uploading",
+                    )
+                future = writers.submit(_upload_batch, driver, path, rows)
+                future.add_done_callback(lambda _: slots.release())
+                writes[path_str].append(future)
+                rows_uploaded[path_str] += len(rows)
+                continue
+            for future in writes.pop(path_str, []):
+                future.result()
+            if "rows_uploaded" in payload:
+                payload["rows_uploaded"] = rows_uploaded.get(path_str, 0)
+            outcomes[path_str] = payload
+    except BaseException:
+        parsers.shutdown(wait=False, cancel_futures=True)
+        raise
+    finally:
+        writers.shutdown(wait=True)
+        parsers.shutdown(wait=True)
+
+    for path in paths:
+        _record_file_result(
+            driver,
+            run_id,
+            csv_root,
+            path,
+            summary,
+            outcomes[str(path)],
+            deltas.get(str(path)),
+        )
+
+
 def upload_csv_corpus(
     csv_root: str | Path,
     neo4j_uri: str,
@@ -245,70 +635,100 @@ def upload_csv_corpus(
     neo4j_password: str,
     *,
     batch_size: int = DEFAULT_BATCH_SIZE,
+    abort_on_inconsistency: bool = False,
+    workers: int = DEFAULT_WORKERS,
+    write_sessions: int = DEFAULT_WRITE_SESSIONS,
+    max_rows_in_flight: int = DEFAULT_MAX_ROWS_IN_FLIGHT,
+    full: bool = False,
 ) -> dict[str, Any]:
+    """
+    Validate and upload every CSV under ``csv_root`` in one streaming pass
+    per file. Rows with the wrong column count are left out (and reported);
+    with ``abort_on_inconsistency`` a file stops at its first such row and is
+    marked skipped, keeping whatever batches were already written.
+
+    With ``workers`` > 1, files are parsed concurrently in that many
+    processes and written on ``write_sessions`` Neo4j sessions.
+
+    Re-imports are incremental: files whose content hash matches the last
+    successful upload are skipped, and changed files only write rows whose
+    hash changed and tombstone (``deleted_at``) rows that disappeared.
+    ``full`` rewrites every row regardless.
+    """
     csv_root_path = Path(csv_root)
     driver = GraphDatabase.driver(neo4j_uri, auth=(neo4j_user, neo4j_password))
     summary = {
         "csv_root": str(csv_root_path),
         "uploaded_files": [],
+        "unchanged_files": [],
         "skipped_files": [],
         "metrics": {
             "csv_files_seen": 0,
             "csv_files_uploaded": 0,
+            "csv_files_unchanged": 0,
             "csv_files_skipped": 0,
             "rows_uploaded": 0,
+            "rows_unchanged": 0,
+            "rows_deleted": 0,
+            "rows_inconsistent": 0,
         },
     }
     try:
         _prepare_graph(driver, csv_root_path)
         run_id = _create_import_run(driver, csv_root_path)
         summary["run_id"] = run_id
-        for path in sorted(csv_root_path.iterdir()):
-            if not path.is_file() or path.suffix.lower() != ".csv":
-                continue
-            summary["metrics"]["csv_files_seen"] += 1
-            validation = validate_csv_file(path)
-            forced_reason = FORCED_QUARANTINE_REASONS.get(path.name)
-            if forced_reason:
-                _mark_skipped_source(driver, run_id, csv_root_path, path, validation, forced_reason)
-                summary["skipped_files"].append({"file": path.name, "reason": forced_reason})
-                summary["metrics"]["csv_files_skipped"] += 1
-                continue
-            if not validation["valid"]:
-                _mark_skipped_source(
-                    driver,
-                    run_id,
-                    csv_root_path,
-                    path,
-                    validation,
-                    validation["reason"],
-                )
-                summary["skipped_files"].append(
-                    {"file": path.name, "reason": validation["reason"]}
-                )
-                summary["metrics"]["csv_files_skipped"] += 1
-                continue
-            rows, fieldnames = _load_rows(path)
-            _upsert_source(driver, run_id, csv_root_path, path, validation, fieldnames, len(rows))
-            for start in range(0, len(rows), batch_size):
-                _upload_batch(driver, path, rows[start : start + batch_size])
-            summary["uploaded_files"].append(
-                {"file": path.name, "rows_uploaded": len(rows), "column_count": len(fieldnames)}
+        paths = [
+            path
+            for path in sorted(csv_root_path.iterdir())
+            if path.is_file() and path.suffix.lower() == ".csv"
+        ]
+        summary["metrics"]["csv_files_seen"] = len(paths)
+        previous_hashes = _load_source_hashes(driver, csv_root_path)
+        if workers > 1 and len(paths) > 1:
+            _upload_parallel(
+                driver,
+                run_id,
+                csv_root_path,
+                paths,
+                summary,
+                previous_hashes,
+                batch_size=batch_size,
+                abort_on_inconsistency=abort_on_inconsistency,
+                full=full,
+                workers=workers,
+                write_sessions=write_sessions,
+                max_rows_in_flight=max_rows_in_flight,
+            )
+        else:
+            _upload_sequential(
+                driver,
+                run_id,
+                csv_root_path,
+                paths,
+                summary,
+                previous_hashes,
+                batch_size=batch_size,
+                abort_on_inconsistency=abort_on_inconsistency,
+                full=full,
             )
-            summary["metrics"]["csv_files_uploaded"] += 1
-            summary["metrics"]["rows_uploaded"] += len(rows)
         with driver.session() as session:
             session.run(
                 "MATCH (run:CsvImportRun:GridCore {run_id: $run_id}) "
                 "SET run.completed_at = datetime(), "
                 "    run.csv_files_uploaded = $csv_files_uploaded, "
+                "    run.csv_files_unchanged = $csv_files_unchanged, "
                 "    run.csv_files_skipped = $csv_files_skipped, "
-                "    run.rows_uploaded = $rows_uploaded",
+                "    run.rows_uploaded = $rows_uploaded, "
+                "    run.rows_unchanged = $rows_unchanged, "
+                "    run.rows_deleted = $rows_deleted",
                 {
                     "run_id": run_id,
                     "csv_files_uploaded": summary["metrics"]["csv_files_uploaded"],
+                    "csv_files_unchanged": summary["metrics"]["csv_files_unchanged"],
                     "csv_files_skipped": summary["metrics"]["csv_files_skipped"],
                     "rows_uploaded": summary["metrics"]["rows_uploaded"],
+                    "rows_unchanged": summary["metrics"]["rows_unchanged"],
+                    "rows_deleted": summary["metrics"]["rows_deleted"],
                 },
             )
     finally:
@@ -323,6 +743,11 @@ def main() -> None:
     parser.add_argument("--neo4j-user", required=True)
     parser.add_argument("--neo4j-password", required=True)
     parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--abort-on-inconsistency", action="store_true")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS)
+    parser.add_argument("--write-sessions", type=int, default=DEFAULT_WRITE_SESSIONS)
+    parser.add_argument("--max-rows-in-flight", type=int, default=DEFAULT_MAX_ROWS_IN_FLIGHT)
+    parser.add_argument("--full", action="store_true", help="Rewrite every row, ignoring hashes")
     args = parser.parse_args()
     result = upload_csv_corpus(
         csv_root=args.csv_root,
@@ -330,6 +755,11 @@ def main() -> None:
         neo4j_user=args.neo4j_user,
         neo4j_password=args.neo4j_password,
         batch_size=args.batch_size,
+        abort_on_inconsistency=args.abort_on_inconsistency,
+        workers=args.workers,
+        write_sessions=args.write_sessions,
+        max_rows_in_flight=args.max_rows_in_flight,
+        full=args.full,
     )
     print(json.dumps(result, indent=2, ensure_ascii=False))
 
@@ -1,14 +1,17 @@
 from __future__ import annotations
 
 import argparse
+import codecs
 import csv
+import hashlib
 import io
 import json
 import re
 import shutil
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 from neo4j import GraphDatabase
 from neo4j.exceptions import Neo4jError
@@ -25,6 +28,10 @@ FORCED_QUARANTINE_REASONS = {
     "MostarIndustries-Core.csv": "yaml_like_content",
     "ifa_framework.csv": "empty_content",
 }
+DEFAULT_STREAM_BATCH_SIZE = 250
+# Leading text used for dialect sniffing, YAML detection and quote warnings
+STREAM_SAMPLE_CHARS = 64 * 1024
+ENCODING_CHUNK_BYTES = 1 << 20
 
 
 def _utc_now_iso() -> str:
@@ -44,6 +51,27 @@ def _read_text(path: Path) -> tuple[str, str]:
     return path.read_text(encoding="utf-8", errors="replace"), "utf-8-replace"
 
 
+def _detect_encoding(path: Path) -> str:
+    """The encoding _read_text would pick, decoded chunk by chunk."""
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    try:
+        with path.open("rb") as handle:
+            for chunk in iter(lambda: handle.read(ENCODING_CHUNK_BYTES), b""):
+                decoder.decode(chunk)
+            decoder.decode(b"", final=True)
+        return "utf-8-sig"
+    except UnicodeDecodeError:
+        return "latin-1"
+
+
+def file_content_hash(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for chunk in iter(lambda: handle.read(ENCODING_CHUNK_BYTES), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
 def _detect_dialect(sample: str) -> csv.Dialect:
     try:
         return csv.Sniffer().sniff(sample, delimiters=",;\t|")
@@ -71,8 +99,8 @@ def _raw_csv_warnings(text: str) -> list[str]:
     return warnings
 
 
-def validate_csv_file(path: Path) -> dict[str, Any]:
-    validation = {
+def _new_validation(path: Path) -> dict[str, Any]:
+    return {
         "path": str(path),
         "name": path.name,
         "valid": False,
@@ -84,80 +112,129 @@ def validate_csv_file(path: Path) -> dict[str, Any]:
         "warnings": [],
         "headers": [],
         "corruption_flag": False,
+        "inconsistent_rows": 0,
     }
-    if _is_zone_identifier(path):
-        validation["reason"] = "zone_identifier"
-        validation["corruption_flag"] = True
-        return validation
 
-    text, encoding = _read_text(path)
-    validation["encoding"] = encoding
-    stripped = text.strip()
-    if not stripped:
-        validation["reason"] = "empty_content"
-        validation["corruption_flag"] = True
-        return validation
-
-    warnings = _raw_csv_warnings(text)
-    sample = text[:4096]
-    dialect = _detect_dialect(sample)
-    try:
-        rows = list(csv.reader(io.StringIO(text), dialect=dialect))
-    except csv.Error as exc:
-        validation["reason"] = f"csv_parse_error:{exc}"
-        validation["warnings"] = warnings
-        validation["corruption_flag"] = True
-        return validation
-
-    if not rows:
-        validation["reason"] = "empty_content"
-        validation["warnings"] = warnings
-        validation["corruption_flag"] = True
-        return validation
-
-    header = rows[0]
-    validation["headers"] = header
-    validation["column_count"] = len(header)
-    data_rows = rows[1:]
-
-    if len(header) == 1 and _looks_like_yaml(text):
-        validation["reason"] = "yaml_like_content"
-        validation["warnings"] = warnings
-        validation["corruption_flag"] = True
-        return validation
-
-    if not data_rows:
-        validation["reason"] = "header_only_or_empty"
-        validation["warnings"] = warnings
-        validation["corruption_flag"] = True
-        return validation
-
-    column_counts = {len(row) for row in data_rows}
-    if len(column_counts) != 1 or next(iter(column_counts)) != len(header):
-        validation["reason"] = "inconsistent_columns"
-        validation["row_count"] = len(data_rows)
-        validation["warnings"] = warnings
-        validation["corruption_flag"] = True
-        return validation
-
-    total_cells = max(len(data_rows) * len(header), 1)
-    null_cells = 0
-    multiline_cells = 0
-    for row in data_rows:
-        for cell in row:
-            if cell is None or not str(cell).strip():
-                null_cells += 1
-            if "\n" in str(cell) or "\r" in str(cell):
-                multiline_cells += 1
-    if multiline_cells:
-        warnings.append(f"multiline_cells:{multiline_cells}")
-
-    validation["valid"] = True
-    validation["reason"] = "ok"
-    validation["row_count"] = len(data_rows)
-    validation["null_cell_ratio"] = round(null_cells / total_cells, 6)
-    validation["warnings"] = warnings
-    return validation
+
+class CsvStream:
+    """
+    Single streaming pass over a CSV file: validates while yielding the data
+    rows in batches of ``(row_number, cells)``, so memory stays bounded by the
+    batch size instead of the file size.
+
+    ``validation`` has the shape validate_csv_file returns and is final once
+    ``batches()`` is exhausted. Rows whose column count differs from the
+    header are counted, not yielded; with ``abort_on_inconsistency`` the pass
+    stops at the first one (``aborted`` is then set).
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        batch_size: int = DEFAULT_STREAM_BATCH_SIZE,
+        abort_on_inconsistency: bool = False,
+    ) -> None:
+        self.path = Path(path)
+        self.batch_size = max(1, batch_size)
+        self.abort_on_inconsistency = abort_on_inconsistency
+        self.validation = _new_validation(self.path)
+        self.header: list[str] = []
+        self.rows_yielded = 0
+        self.aborted = False
+
+    def _fail(self, reason: str) -> None:
+        self.validation["reason"] = reason
+        self.validation["corruption_flag"] = True
+
+    def batches(self) -> Iterator[list[tuple[int, list[str]]]]:
+        validation = self.validation
+        if _is_zone_identifier(self.path):
+            self._fail("zone_identifier")
+            return
+
+        encoding = _detect_encoding(self.path)
+        validation["encoding"] = encoding
+        # Universal newlines, as _read_text gives: cell values are unchanged
+        with self.path.open("r", encoding=encoding) as handle:
+            head = handle.read(STREAM_SAMPLE_CHARS)
+            if not head.strip() and not any(
+                chunk.strip() for chunk in iter(lambda: handle.read(STREAM_SAMPLE_CHARS), "")
+            ):
+                self._fail("empty_content")
+                return
+
+            warnings = _raw_csv_warnings(head)
+            validation["warnings"] = warnings
+            dialect = _detect_dialect(head[:4096])
+            handle.seek(0)
+            reader = csv.reader(handle, dialect=dialect)
+
+            batch: list[tuple[int, list[str]]] = []
+            data_rows = 0
+            consistent_rows = 0
+            null_cells = 0
+            multiline_cells = 0
+            try:
+                header = next(reader, None)
+                if header is None:
+                    self._fail("empty_content")
+                    return
+                self.header = header
+                validation["headers"] = header
+                validation["column_count"] = len(header)
+                if len(header) == 1 and _looks_like_yaml(head):
+                    self._fail("yaml_like_content")
+                    return
+
+                for row in reader:
+                    data_rows += 1
+                    if len(row) != len(header):
+                        validation["inconsistent_rows"] += 1
+                        if self.abort_on_inconsistency:
+                            self.aborted = True
+                            break
+                        continue
+                    consistent_rows += 1
+                    for cell in row:
+                        if not cell.strip():
+                            null_cells += 1
+                        if "\n" in cell or "\r" in cell:
+                            multiline_cells += 1
+                    batch.append((data_rows, row))
+                    if len(batch) >= self.batch_size:
+                        self.rows_yielded += len(batch)
+                        yield batch
+                        batch = []
+            except csv.Error as exc:
+                validation["row_count"] = data_rows
+                self._fail(f"csv_parse_error:{exc}")
+                return
+
+        validation["row_count"] = data_rows
+        if multiline_cells:
+            warnings.append(f"multiline_cells:{multiline_cells}")
+        if consistent_rows:
+            validation["null_cell_ratio"] = round(
+                null_cells / (consistent_rows * len(header) or 1), 6
+            )
+        if not data_rows:
+            self._fail("header_only_or_empty")
+        elif validation["inconsistent_rows"]:
+            self._fail("inconsistent_columns")
+        else:
+            validation["valid"] = True
+            validation["reason"] = "ok"
+        if batch:
+            self.rows_yielded += len(batch)
+            yield batch
+
+
+def validate_csv_file(path: Path) -> dict[str, Any]:
+    stream = CsvStream(path)
+    for _ in stream.batches():
+        pass
+    return stream.validation
 
 
 def repair_json_cell(cell: str) -> tuple[str, bool]:
@@ -349,6 +426,15 @@ def _build_datasource_record(
     }
 
 
+def _inspect_file(
+    path: Path, repair_api_endpoints: bool
+) -> tuple[dict[str, Any] | None, dict[str, Any]]:
+    repair_report = None
+    if repair_api_endpoints and path.name in JSON_REPAIR_COLUMNS:
+        repair_report = repair_api_endpoints_file(path)
+    return repair_report, validate_csv_file(path)
+
+
 def process_csv_corpus(
     csv_root: str | Path | None = None,
     quarantine_dir: str | Path | None = None,
@@ -361,6 +447,7 @@ def process_csv_corpus(
     neo4j_uri: str | None = None,
     neo4j_user: str | None = None,
     neo4j_password: str | None = None,
+    workers: int = 1,
 ) -> dict[str, Any]:
     csv_root_path = Path(csv_root) if csv_root else DEFAULT_CSV_ROOT
     quarantine_path = Path(quarantine_dir) if quarantine_dir else DEFAULT_QUARANTINE_DIR
@@ -403,6 +490,21 @@ def process_csv_corpus(
         summary["zone_identifier_files"].extend(ignored)
         summary["metrics"]["zone_identifier_files"] = len(ignored)
 
+    paths = [
+        path
+        for path in sorted(csv_root_path.iterdir())
+        if path.is_file() and not _is_zone_identifier(path) and path.suffix.lower() == ".csv"
+    ]
+    # Repair and validation are per-file CPU work; quarantine moves and
+    # DataSource writes below stay sequential, in file order.
+    if workers > 1 and len(paths) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            inspections = list(
+                pool.map(_inspect_file, paths, [repair_api_endpoints] * len(paths))
+            )
+    else:
+        inspections = [_inspect_file(path, repair_api_endpoints) for path in paths]
+
     driver = None
     if track_data_sources and neo4j_uri and neo4j_user and neo4j_password:
         try:
@@ -412,15 +514,11 @@ def process_csv_corpus(
             driver = None
 
     try:
-        for path in sorted(csv_root_path.iterdir()):
-            if not path.is_file() or _is_zone_identifier(path) or path.suffix.lower() != ".csv":
-                continue
-
+        for path, (repair_report, validation) in zip(paths, inspections):
             summary["metrics"]["csv_files_seen"] += 1
             summary["processed_files"].append(path.name)
 
-            if repair_api_endpoints and path.name in JSON_REPAIR_COLUMNS:
-                repair_report = repair_api_endpoints_file(path)
+            if repair_report is not None:
                 if repair_report["changed"]:
                     summary["repaired_files"].append(
                         {
@@ -438,8 +536,6 @@ def process_csv_corpus(
                         "unrepairable_cells"
                     ]
 
-            validation = validate_csv_file(path)
-
             forced_reason = FORCED_QUARANTINE_REASONS.get(path.name)
             if forced_reason and quarantine_known_bad_files:
                 destination = quarantine_file(path, quarantine_path, forced_reason)
@@ -549,6 +645,7 @@ def main() -> None:
     parser.add_argument("--neo4j-uri")
     parser.add_argument("--neo4j-user")
     parser.add_argument("--neo4j-password")
+    parser.add_argument("--workers", type=int, default=1)
     args = parser.parse_args()
 
     result = process_csv_corpus(
@@ -562,6 +659,7 @@ def main() -> None:
         neo4j_uri=args.neo4j_uri,
         neo4j_user=args.neo4j_user,
         neo4j_password=args.neo4j_password,
+        workers=args.workers,
     )
     print(json.dumps(result, indent=2, ensure_ascii=False))
 
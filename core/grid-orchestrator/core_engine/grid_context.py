@@ -0,0 +1,160 @@
+# ═══════════════════════════════════════════════════════════════════
+# MOSTAR GRID — APPLICATION CONTEXT
+# The Flame Architect — MSTR-⚡ — MoStar Industries
+# "One covenant, one channel to the Flame — per process."
+# ═══════════════════════════════════════════════════════════════════
+"""
+Process-wide MoScriptEngine and pooled Ollama HTTP client.
+
+Awakening an engine reloads FlameCODEX.txt and writes a boot moment, and a
+fresh ``httpx.AsyncClient`` pays a TCP (and TLS) handshake per call. Both
+are created once here, warmed in the API and voice server lifespans, and
+borrowed by sov_utils, the orchestrator and the servers.
+
+The client keeps up to OLLAMA_POOL_SIZE keep-alive connections. HTTP/2 is
+negotiated (ALPN) when ``h2`` is installed and Ollama sits behind TLS;
+plain-http Ollama stays on pooled HTTP/1.1. Proxy and TLS settings from
+the environment (HTTP(S)_PROXY, SSL_CERT_FILE, ...) are honoured unless
+OLLAMA_TRUST_ENV is off.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+from typing import Optional
+
+import httpx
+
+try:
+    import h2  # noqa: F401
+
+    H2_AVAILABLE = True
+except ImportError:
+    H2_AVAILABLE = False
+
+OLLAMA_POOL_SIZE = int(os.getenv("OLLAMA_POOL_SIZE", "20"))
+OLLAMA_KEEPALIVE_EXPIRY = float(os.getenv("OLLAMA_KEEPALIVE_EXPIRY", "60"))
+OLLAMA_HTTP2 = os.getenv("OLLAMA_HTTP2", "1").lower() not in ("0", "false", "no")
+OLLAMA_TRUST_ENV = os.getenv("OLLAMA_TRUST_ENV", "1").lower() not in ("0", "false", "no")
+
+# Per-request timeouts override this default
+OLLAMA_DEFAULT_TIMEOUT = httpx.Timeout(120.0, connect=10.0)
+
+
+class GridContext:
+    """
+    The engine is built on first use (thread-safe). The client belongs to
+    the event loop that created it; a new loop (e.g. a fresh asyncio.run)
+    gets a fresh client, as with the Neo4j async drivers, and the old one
+    is closed rather than leaked.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = OLLAMA_POOL_SIZE,
+        keepalive_expiry: float = OLLAMA_KEEPALIVE_EXPIRY,
+        http2: bool = OLLAMA_HTTP2,
+        trust_env: bool = OLLAMA_TRUST_ENV,
+    ):
+        self.pool_size = pool_size
+        self.keepalive_expiry = keepalive_expiry
+        self.http2 = http2 and H2_AVAILABLE
+        self.trust_env = trust_env
+        self._lock = threading.Lock()
+        self._engine = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._retired_clients: list[httpx.AsyncClient] = []
+        self.clients_opened = 0
+        self.requests = 0
+
+    # ── Engine ────────────────────────────────────────────────────
+    @property
+    def engine(self):
+        if self._engine is None:
+            with self._lock:
+                if self._engine is None:
+                    from core_engine.moscript_engine import MoScriptEngine
+
+                    self._engine = MoScriptEngine()
+        return self._engine
+
+    # ── Ollama client ─────────────────────────────────────────────
+    def http_client(self) -> httpx.AsyncClient:
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._client_loop is not loop or self._client.is_closed:
+            self._retire_client()
+            self._client = httpx.AsyncClient(
+                http2=self.http2,
+                timeout=OLLAMA_DEFAULT_TIMEOUT,
+                limits=httpx.Limits(
+                    max_connections=self.pool_size,
+                    max_keepalive_connections=self.pool_size,
+                    keepalive_expiry=self.keepalive_expiry,
+                ),
+                trust_env=self.trust_env,
+                event_hooks={"request": [self._count_request]},
+            )
+            self._client_loop = loop
+            self.clients_opened += 1
+            print(
+                f"[GRID CONTEXT] Ollama client opened | pool={self.pool_size} | "
+                f"http2={self.http2}"
+            )
+        return self._client
+
+    def _retire_client(self) -> None:
+        # Close the previous loop's client on that loop while it still runs;
+        # otherwise keep it so aclose() can release its connections.
+        client, old_loop = self._client, self._client_loop
+        if client is None or client.is_closed:
+            return
+        if old_loop is not None and old_loop.is_running() and not old_loop.is_closed():
+            asyncio.run_coroutine_threadsafe(self._close_client(client), old_loop)
+        else:
+            self._retired_clients.append(client)
+        print("[GRID CONTEXT] Retired Ollama client from a previous event loop")
+
+    @staticmethod
+    async def _close_client(client: httpx.AsyncClient) -> None:
+        try:
+            await client.aclose()
+        except Exception as exc:
+            print(f"[GRID CONTEXT] Ollama client close failed: {exc}")
+
+    async def _count_request(self, request: httpx.Request) -> None:
+        self.requests += 1
+
+    # ── Lifespan ──────────────────────────────────────────────────
+    async def startup(self) -> None:
+        """Awaken the engine and open the client before the first request."""
+        await asyncio.to_thread(lambda: self.engine)
+        self.http_client()
+
+    async def aclose(self) -> None:
+        clients = [*self._retired_clients, self._client]
+        self._retired_clients, self._client, self._client_loop = [], None, None
+        for client in clients:
+            if client is not None and not client.is_closed:
+                await self._close_client(client)
+        print("[GRID CONTEXT] Ollama client closed")
+
+    def metrics(self) -> dict:
+        return {
+            "engine": self._engine.covenant_id if self._engine is not None else None,
+            "executions": self._engine.execution_count if self._engine is not None else 0,
+            "client_open": self._client is not None and not self._client.is_closed,
+            "clients_opened": self.clients_opened,
+            "clients_retired": len(self._retired_clients),
+            "requests": self.requests,
+            "pool_size": self.pool_size,
+            "keepalive_expiry_s": self.keepalive_expiry,
+            "http2": self.http2,
+            "trust_env": self.trust_env,
+        }
+
+
+# Singleton
+grid_context = GridContext()
@@ -7,6 +7,15 @@ from typing import Any, Optional
 
 from neo4j import GraphDatabase
 
+from core_engine.audio_index import AudioFileIndex
+from core_engine.ibibio_lexicon import (
+    LEXICON_FULLTEXT_INDEX,
+    backfill_lexicon_keys,
+    fold_key,
+    fulltext_query,
+)
+from core_engine.ibibio_lexicon_cache import IBIBIO_LEXICON_CACHE, LexiconCache, LexiconIndex
+
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 
 
@@ -79,9 +88,13 @@ class MoStarUnifiedRuntime:
         neo4j_uri: str,
         neo4j_user: str,
         neo4j_password: str,
+        lexicon_cache: Optional[bool] = None,
     ):
         self.semantic = GridSemantic(semantic_path)
         self.driver = GraphDatabase.driver(neo4j_uri, auth=(neo4j_user, neo4j_password))
+        if lexicon_cache is None:
+            lexicon_cache = IBIBIO_LEXICON_CACHE
+        self.lexicon = LexiconCache(self.driver) if lexicon_cache else None
         self.audio_dirs = [
             PROJECT_ROOT
             / "backend"
@@ -110,9 +123,11 @@ class MoStarUnifiedRuntime:
             / "Ibibio_codex"
             / "Ibibio_audio",
         ]
+        self.audio_index = AudioFileIndex(self.audio_dirs)
         self._ensure_schema()
 
     def close(self) -> None:
+        self.audio_index.close()
         self.driver.close()
 
     def _ensure_schema(self) -> None:
@@ -120,6 +135,13 @@ class MoStarUnifiedRuntime:
             session.run(
                 "CREATE CONSTRAINT grid_user_preference_unique IF NOT EXISTS FOR (u:GridUserPreference) REQUIRE u.user_id IS UNIQUE"
             )
+        # Lexicon indexes + keys for any words written since the last run
+        try:
+            result = backfill_lexicon_keys(self.driver)
+            if result["updated"]:
+                print(f"[LEXICON] Keyed {result['updated']} IbibioWord nodes")
+        except Exception as exc:
+            print(f"[LEXICON] Key backfill skipped: {exc}")
 
     def _normalize_language(self, language: str) -> str:
         return self.LANGUAGE_ALIASES.get(
@@ -187,24 +209,19 @@ class MoStarUnifiedRuntime:
         }
 
     def _audio_path_for(self, audio_file: Optional[str]) -> Optional[str]:
-        if not audio_file:
+        return self.audio_index.resolve(audio_file)
+
+    def _lexicon_index(self) -> Optional[LexiconIndex]:
+        """The in-memory lexicon, or None to query Neo4j directly."""
+        if self.lexicon is None:
+            return None
+        try:
+            return self.lexicon.index()
+        except Exception as exc:
+            print(f"[LEXICON] Cache unavailable, querying Neo4j: {exc}")
             return None
-        candidate = Path(audio_file)
-        if candidate.exists():
-            return str(candidate.resolve())
-        for audio_dir in self.audio_dirs:
-            audio_path = audio_dir / candidate.name
-            if audio_path.exists():
-                return str(audio_path.resolve())
-        return None
 
-    def lookup_ibibio_word(self, word: str) -> Optional[dict[str, Any]]:
-        with self.driver.session() as session:
-            record = session.run(
-                """
-                MATCH (w:IbibioWord)
-                WHERE toLower(w.orthography) = toLower($word)
-                OPTIONAL MATCH (w)-[:HAS_AUDIO_ASSET]->(asset:AudioAsset)
+    _WORD_FIELDS = """
                 RETURN w.orthography AS orthography,
                        w.english AS english,
                        w.tone_pattern AS tone_pattern,
@@ -212,11 +229,66 @@ class MoStarUnifiedRuntime:
                        w.speaker AS speaker,
                        w.audio_file AS audio_file,
                        asset.grid_path AS grid_path,
-                       asset.filename AS asset_filename
+                       asset.filename AS asset_filename"""
+
+    def lookup_ibibio_word(
+        self, word: str, *, fuzzy: bool = False
+    ) -> Optional[dict[str, Any]]:
+        """
+        Index seek on the folded ``orthography_key``; the exact spelling
+        (then its lowercase) wins among tone/diacritic variants. With
+        ``fuzzy``, a miss falls back to the full-text index (one edit).
+        Served from the lexicon cache when it is enabled.
+        """
+        key = fold_key(word)
+        if not key:
+            return None
+        index = self._lexicon_index()
+        if index is not None:
+            payload = index.lookup_word(word, fuzzy=fuzzy)
+            if payload is not None:
+                payload["native_audio_path"] = self._audio_path_for(
+                    payload.get("audio_file") or payload.get("asset_filename")
+                )
+            return payload
+        with self.driver.session() as session:
+            record = session.run(
+                """
+                MATCH (w:IbibioWord {orthography_key: $key})
+                OPTIONAL MATCH (w)-[:HAS_AUDIO_ASSET]->(asset:AudioAsset)
+                WITH w, asset
+                ORDER BY CASE
+                           WHEN w.orthography = $word THEN 0
+                           WHEN toLower(w.orthography) = toLower($word) THEN 1
+                           ELSE 2
+                         END,
+                         CASE WHEN w.audio_file IS NULL THEN 1 ELSE 0 END"""
+                + self._WORD_FIELDS
+                + """,
+                       'exact' AS match_type,
+                       null AS score
                 LIMIT 1
                 """,
-                {"word": word},
+                {"key": key, "word": word},
             ).single()
+            if not record and fuzzy:
+                record = session.run(
+                    """
+                    CALL db.index.fulltext.queryNodes($index, $query, {limit: 1})
+                    YIELD node AS w, score
+                    OPTIONAL MATCH (w)-[:HAS_AUDIO_ASSET]->(asset:AudioAsset)
+                    WITH w, asset, score"""
+                    + self._WORD_FIELDS
+                    + """,
+                           'fuzzy' AS match_type,
+                           score
+                    LIMIT 1
+                    """,
+                    {
+                        "index": LEXICON_FULLTEXT_INDEX,
+                        "query": fulltext_query(word, "orthography_key"),
+                    },
+                ).single()
         if not record:
             return None
         payload = dict(record)
@@ -226,34 +298,58 @@ class MoStarUnifiedRuntime:
         return payload
 
     def lookup_english_phrase(
-        self, phrase: str, limit: int = 5
+        self, phrase: str, limit: int = 5, *, fuzzy: bool = True
+    ) -> list[dict[str, Any]]:
+        """
+        Ranked full-text search over the folded English gloss: an exact
+        gloss first, then Lucene score, then entries that have audio.
+        Served from the lexicon cache when it is enabled.
+        """
+        query = fulltext_query(phrase, "english_key", fuzzy=fuzzy)
+        if not query:
+            return []
+        index = self._lexicon_index()
+        if index is not None:
+            records = index.search_gloss(phrase, limit, fuzzy=fuzzy)
+        else:
+            records = self._query_english_phrase(phrase, query, limit)
+        results: list[dict[str, Any]] = []
+        for row in records:
+            payload = dict(row)
+            payload["native_audio_path"] = self._audio_path_for(
+                payload.get("audio_file")
+            )
+            results.append(payload)
+        return results
+
+    def _query_english_phrase(
+        self, phrase: str, query: str, limit: int
     ) -> list[dict[str, Any]]:
         with self.driver.session() as session:
-            records = session.run(
+            return session.run(
                 """
-                MATCH (w:IbibioWord)
-                WHERE toLower(w.english) CONTAINS toLower($phrase)
+                CALL db.index.fulltext.queryNodes($index, $query)
+                YIELD node AS w, score
                 RETURN w.orthography AS orthography,
                        w.english AS english,
                        w.tone_pattern AS tone_pattern,
                        w.pos AS pos,
                        w.speaker AS speaker,
-                       w.audio_file AS audio_file
-                ORDER BY CASE WHEN toLower(w.english) = toLower($phrase) THEN 0 ELSE 1 END,
+                       w.audio_file AS audio_file,
+                       score
+                ORDER BY CASE WHEN w.english_key = $key THEN 0 ELSE 1 END,
+                         score DESC,
                          CASE WHEN w.audio_file IS NULL THEN 1 ELSE 0 END,
                          w.orthography ASC
                 LIMIT $limit
                 """,
-                {"phrase": phrase, "limit": limit},
+                {
+                    "index": LEXICON_FULLTEXT_INDEX,
+                    "query": query,
+                    "key": fold_key(phrase),
+                    "limit": limit,
+                },
             ).data()
-        results: list[dict[str, Any]] = []
-        for row in records:
-            payload = dict(row)
-            payload["native_audio_path"] = self._audio_path_for(
-                payload.get("audio_file")
-            )
-            results.append(payload)
-        return results
 
     def covenant_audit(self) -> dict[str, Any]:
         with self.driver.session() as session:
@@ -384,6 +480,16 @@ class MoStarUnifiedRuntime:
                     "entry": top,
                     "state": state,
                 }
+            fuzzy_match = self.lookup_ibibio_word(utterance, fuzzy=True)
+            if fuzzy_match:
+                return {
+                    "kind": "ibibio_word",
+                    "language": language,
+                    "text": fuzzy_match["orthography"],
+                    "translation": fuzzy_match.get("english"),
+                    "entry": fuzzy_match,
+                    "state": state,
+                }
             return {
                 "kind": "ibibio_not_found",
                 "language": language,
@@ -0,0 +1,199 @@
+# ═══════════════════════════════════════════════════════════════════
+# MOSTAR GRID — GRID STATS
+# The Flame Architect — MSTR-⚡ — MoStar Industries
+# Counts come from the count store — the graph is never walked.
+# ═══════════════════════════════════════════════════════════════════
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from typing import Optional
+
+from core_engine.neo4j_pool import neo4j_registry
+
+GRID_STATS_TTL_SECONDS = float(os.getenv("GRID_STATS_TTL_SECONDS", "30"))
+
+# apoc.meta.stats() reads the count store: constant time per label/type.
+APOC_STATS_CYPHER = """
+CALL apoc.meta.stats()
+YIELD nodeCount, relCount, labels, relTypesCount
+RETURN nodeCount, relCount, labels, relTypesCount
+"""
+
+TOTALS_CYPHER = """
+CALL { MATCH (n) RETURN count(n) AS nodeCount }
+CALL { MATCH ()-[r]->() RETURN count(r) AS relCount }
+RETURN nodeCount, relCount
+"""
+
+
+def _quote(name: str) -> str:
+    return "`" + name.replace("`", "``") + "`"
+
+
+@dataclass
+class GridStats:
+    """Materialised graph-size snapshot shared by telemetry and metrics APIs."""
+
+    total_nodes: int = 0
+    total_relationships: int = 0
+    labels: dict[str, int] = field(default_factory=dict)
+    relationship_types: dict[str, int] = field(default_factory=dict)
+    source: str = "empty"
+    collected_at: str = ""
+    collect_ms: float = 0.0
+
+    @property
+    def density(self) -> float:
+        # Directed graph density: E / (V * (V - 1))
+        if self.total_nodes > 1:
+            return self.total_relationships / (self.total_nodes * (self.total_nodes - 1))
+        return 0.0
+
+    def label_count(self, label: str) -> int:
+        return self.labels.get(label, 0)
+
+    def top_labels(self, limit: Optional[int] = None) -> list[tuple[str, int]]:
+        ranked = sorted(
+            ((k, v) for k, v in self.labels.items() if v > 0),
+            key=lambda kv: kv[1],
+            reverse=True,
+        )
+        return ranked[:limit] if limit else ranked
+
+    def top_relationship_types(self, limit: Optional[int] = None) -> list[tuple[str, int]]:
+        ranked = sorted(
+            ((k, v) for k, v in self.relationship_types.items() if v > 0),
+            key=lambda kv: kv[1],
+            reverse=True,
+        )
+        return ranked[:limit] if limit else ranked
+
+    def to_dict(self) -> dict:
+        data = asdict(self)
+        data["density"] = round(self.density, 6)
+        return data
+
+
+class GridStatsService:
+    """
+    Cached GridStats snapshot.
+    - Prefers ``apoc.meta.stats()``.
+    - Without APOC, issues one count-store lookup per label and per
+      relationship type, each of the form ``MATCH (n:Label) RETURN count(n)``.
+    - Concurrent callers share a single collection; failures keep the
+      last good snapshot.
+    """
+
+    def __init__(self, ttl: float = GRID_STATS_TTL_SECONDS):
+        self.ttl = ttl
+        self._snapshot: Optional[GridStats] = None
+        self._fetched_at = 0.0
+        self._lock = threading.Lock()
+        self._apoc_available: Optional[bool] = None
+
+    def get(self, force: bool = False) -> GridStats:
+        if not force and self._fresh():
+            return self._snapshot
+        with self._lock:
+            # Another caller may have refreshed while we waited
+            if not force and self._fresh():
+                return self._snapshot
+            try:
+                self._snapshot = self._collect()
+                self._fetched_at = time.monotonic()
+            except Exception as exc:
+                if self._snapshot is None:
+                    raise
+                print(f"[GRID STATS] ⚠️ Refresh failed, serving last snapshot: {exc}")
+            return self._snapshot
+
+    def invalidate(self) -> None:
+        self._fetched_at = 0.0
+
+    def _fresh(self) -> bool:
+        return (
+            self._snapshot is not None
+            and time.monotonic() - self._fetched_at < self.ttl
+        )
+
+    # ── Collection ────────────────────────────────────────────────
+    def _collect(self) -> GridStats:
+        started = time.perf_counter()
+        with neo4j_registry.session() as session:
+            stats = None
+            if self._apoc_available is not False:
+                stats = self._collect_apoc(session)
+            if stats is None:
+                stats = self._collect_count_store(session)
+        stats.collected_at = datetime.now(timezone.utc).isoformat()
+        stats.collect_ms = round((time.perf_counter() - started) * 1000, 3)
+        return stats
+
+    def _collect_apoc(self, session) -> Optional[GridStats]:
+        try:
+            record = session.run(APOC_STATS_CYPHER).single()
+        except Exception as exc:
+            # ClientError: apoc not installed / not allowed
+            print(f"[GRID STATS] apoc.meta.stats unavailable ({exc}) — using count store")
+            self._apoc_available = False
+            return None
+        self._apoc_available = True
+        return GridStats(
+            total_nodes=record["nodeCount"],
+            total_relationships=record["relCount"],
+            labels=dict(record["labels"]),
+            relationship_types=self._strip_rel_patterns(record["relTypesCount"]),
+            source="apoc.meta.stats",
+        )
+
+    @staticmethod
+    def _strip_rel_patterns(rel_types: dict) -> dict[str, int]:
+        # relTypesCount keys are plain type names; older APOC versions
+        # return "()-[:TYPE]->()" patterns instead.
+        cleaned = {}
+        for key, count in rel_types.items():
+            if key.startswith("()-[:"):
+                key = key[len("()-[:"):].split("]", 1)[0]
+            cleaned[key] = count
+        return cleaned
+
+    def _collect_count_store(self, session) -> GridStats:
+        totals = session.run(TOTALS_CYPHER).single()
+        labels = [r["label"] for r in session.run("CALL db.labels() YIELD label RETURN label")]
+        rel_types = [
+            r["relationshipType"]
+            for r in session.run(
+                "CALL db.relationshipTypes() YIELD relationshipType RETURN relationshipType"
+            )
+        ]
+        return GridStats(
+            total_nodes=totals["nodeCount"],
+            total_relationships=totals["relCount"],
+            labels=self._count_each(
+                session, labels, "MATCH (n:{name}) RETURN {key} AS name, count(n) AS c"
+            ),
+            relationship_types=self._count_each(
+                session, rel_types, "MATCH ()-[r:{name}]->() RETURN {key} AS name, count(r) AS c"
+            ),
+            source="count_store",
+        )
+
+    @staticmethod
+    def _count_each(session, names: list[str], template: str) -> dict[str, int]:
+        if not names:
+            return {}
+        params = {f"k{i}": name for i, name in enumerate(names)}
+        cypher = "\nUNION ALL\n".join(
+            template.format(name=_quote(name), key=f"$k{i}")
+            for i, name in enumerate(names)
+        )
+        return {r["name"]: r["c"] for r in session.run(cypher, params)}
+
+
+# Singleton
+grid_stats = GridStatsService()
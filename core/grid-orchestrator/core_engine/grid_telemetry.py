@@ -7,74 +7,210 @@ Transforms backend data into the canonical API schema, utilizing purely sealed t
 
 import os
 import asyncio
+import time
 from datetime import datetime, timezone
 import logging
+from .grid_context import grid_context
 from .moscript_engine import MoScriptEngine
+from .mostar_moments_log import log_mostar_moment, moment_aggregates
+from .grid_stats import GridStats, grid_stats
 
 log = logging.getLogger("MoStarTelemetry")
 
+TELEMETRY_TTL_SECONDS = float(os.getenv("TELEMETRY_TTL_SECONDS", "15"))
+TELEMETRY_MAX_STALE_SECONDS = float(os.getenv("TELEMETRY_MAX_STALE_SECONDS", "300"))
+TELEMETRY_REFRESH_INTERVAL = float(
+    os.getenv("TELEMETRY_REFRESH_INTERVAL", str(TELEMETRY_TTL_SECONDS * 0.8))
+)
+
+# Independent traversals for one telemetry snapshot — name → (cypher, target).
+# They run concurrently; 24h activity is folded into the grid-state scan.
+# Graph-size counts come from the shared GridStats snapshot, not traversals.
+TELEMETRY_QUERIES = {
+    "grid_state": (
+        """
+            MATCH (m:MoStarMoment)
+            RETURN avg(coalesce(m.resonance_score, 0.85)) as avg_resonance,
+                   max(m.timestamp) as last_cycle,
+                   count(m) as totalMoments,
+                   count(distinct m.initiator) as distinctInitiators,
+                   count(CASE WHEN datetime(m.timestamp) > datetime() - duration('P1D')
+                              THEN 1 END) AS moments24h
+        """,
+        "Grid.Mind",
+    ),
+    "agents": (
+        """
+            MATCH (a:Agent)
+            RETURN coalesce(a.agent_id, a.id, elementId(a)) AS id,
+                   a.name AS name,
+                   coalesce(a.manifestationStrength, 50.0) AS manifestationStrength,
+                   coalesce(a.status, 'online') AS status,
+                   a.task_count AS task_count
+            ORDER BY a.name ASC
+            LIMIT 500
+        """,
+        "Grid.Body",
+    ),
+    "recent_moments": (
+        """
+            MATCH (m:MoStarMoment)
+            RETURN m.quantum_id AS id, m.description AS desc, m.layer AS layer, m.resonance_score AS res, m.timestamp as ts
+            ORDER BY m.timestamp DESC LIMIT 15
+        """,
+        "Grid.Mind",
+    ),
+    "soul_moments": (
+        """MATCH (m:MoStarMoment {layer: 'SOUL'}) RETURN m.quantum_id AS id, m.description AS desc ORDER BY m.timestamp DESC LIMIT 5""",
+        "Grid.Soul",
+    ),
+    "mind_moments": (
+        """MATCH (m:MoStarMoment {layer: 'MIND'}) RETURN m.quantum_id AS id, m.description AS desc ORDER BY m.timestamp DESC LIMIT 5""",
+        "Grid.Mind",
+    ),
+    "body_moments": (
+        """MATCH (m:MoStarMoment {layer: 'BODY'}) RETURN m.quantum_id AS id, m.description AS desc ORDER BY m.timestamp DESC LIMIT 5""",
+        "Grid.Body",
+    ),
+}
+
+
+CONSTELLATION_DEFAULT_LIMIT = 2000
+CONSTELLATION_PAGE_SIZE = 1000
+CONSTELLATION_MAX_PAGE_SIZE = 5000
+CONSTELLATION_LINKS_PER_NODE = 4
+
+# Node filter shared by both constellation queries — internal labels are
+# hidden, $labels (if non-empty) restricts the set, $min_degree samples hubs.
+_CONSTELLATION_FILTER = """NOT labels({v})[0] STARTS WITH '_'
+      AND (size($labels) = 0 OR any(l IN labels({v}) WHERE l IN $labels))
+      AND ($min_degree = 0 OR COUNT {{ ({v})--() }} >= $min_degree)"""
+
+CONSTELLATION_NODES_CYPHER = """
+    MATCH (n)
+    WHERE id(n) > $cursor AND """ + _CONSTELLATION_FILTER.format(v="n") + """
+    WITH n ORDER BY id(n) LIMIT $page_size
+    RETURN id(n) AS id, labels(n) AS labels, n.name AS name, n.description AS desc,
+           n.resonance_score AS resonance, n.timestamp AS timestamp,
+           COUNT { (n)--() } AS degree
+"""
+
+# Links from this page to itself and to earlier pages, plus links from
+# earlier pages into this one — each relationship is sent exactly once.
+CONSTELLATION_LINKS_CYPHER = """
+    MATCH (s)-[r]->(t)
+    WHERE id(s) IN $ids AND id(t) <= $max_id AND """ + _CONSTELLATION_FILTER.format(v="t") + """
+    RETURN id(s) AS source, id(t) AS target, type(r) AS rel
+    LIMIT $link_limit
+    UNION ALL
+    MATCH (s)-[r]->(t)
+    WHERE id(t) IN $ids AND id(s) < $min_id AND """ + _CONSTELLATION_FILTER.format(v="s") + """
+    RETURN id(s) AS source, id(t) AS target, type(r) AS rel
+    LIMIT $link_limit
+"""
+
+
 class CanonicalTelemetryEngine:
     def __init__(self, engine: MoScriptEngine = None):
         self.mo = engine or MoScriptEngine()
 
-    async def _safe_traverse(self, cypher: str, purpose: str, target: str = "Grid.Mind"):
+    async def _safe_traverse(
+        self,
+        cypher: str,
+        purpose: str,
+        target: str = "Grid.Mind",
+        audit: bool = True,
+        params: dict = None,
+    ):
+        records, _ = await self._traverse(cypher, purpose, target, audit, params)
+        return records
+
+    async def _traverse(
+        self,
+        cypher: str,
+        purpose: str,
+        target: str = "Grid.Mind",
+        audit: bool = True,
+        params: dict = None,
+    ):
+        """(records, None) when the traversal is aligned, else ([], reason)."""
         ritual = {
             "operation": "neo4j_traverse",
             "payload": {
                 "cypher": cypher,
                 "purpose": purpose,
-                "redaction_level": "standard"
+                "redaction_level": "standard",
+                "audit": audit,
+                "params": params or {},
             },
-            "target": target
+            "target": target,
+            "audit": audit,
         }
         res = await self.mo.interpret(ritual)
         if res.get("status") == "aligned":
-            return res.get("result", {}).get("records", [])
-        return []
+            return res.get("result", {}).get("records", []), None
+        return [], res.get("error") or f"traversal {res.get('status', 'failed')}"
+
+    async def _grid_stats(self) -> GridStats:
+        try:
+            return await asyncio.to_thread(grid_stats.get)
+        except Exception as exc:
+            log.warning("GridStats unavailable: %s", exc)
+            return GridStats()
 
     async def get_grid_telemetry(self) -> dict:
         """
         Gathers Grid telemetry using MoScript-governed Neo4j traversals
         and formats it into Canonical Telemetry v3.
+        The traversals are independent and run concurrently; one summary
+        moment is logged per snapshot instead of one per traversal.
+        Once the incremental moment aggregates have reconciled, grid state
+        is read from them instead of scanning every MoStarMoment.
         """
+        started = time.perf_counter()
+        queries = dict(TELEMETRY_QUERIES)
+        aggregates = moment_aggregates.snapshot() if moment_aggregates.ready else None
+        if aggregates is not None:
+            queries.pop("grid_state")
+        names = list(queries)
+        stats, *results = await asyncio.gather(
+            self._grid_stats(),
+            *(
+                self._safe_traverse(cypher, f"telemetry_{name}", target, audit=False)
+                for name, (cypher, target) in queries.items()
+            ),
+        )
+        rows = dict(zip(names, results))
+
         # --- 1. Grid State ---
-        grid_state_cypher = """
-            MATCH (m:MoStarMoment)
-            RETURN avg(coalesce(m.resonance_score, 0.85)) as avg_resonance,
-                   max(m.timestamp) as last_cycle,
-                   count(m) as totalMoments,
-                   count(distinct m.initiator) as distinctInitiators
-        """
-        grid_state_records = await self._safe_traverse(grid_state_cypher, "telemetry_grid_state")
-        
+        if aggregates is not None:
+            grid_state_records = [{
+                "avg_resonance": aggregates["avgResonance"],
+                "last_cycle": aggregates["lastCycle"],
+                "totalMoments": aggregates["totalMoments"],
+                "distinctInitiators": aggregates["distinctInitiators"],
+                "moments24h": aggregates["moments24h"],
+            }]
+        else:
+            grid_state_records = rows["grid_state"]
         avg_resonance = 0.85
         last_cycle = datetime.now(timezone.utc).isoformat()
         total_moments = 0
         distinct_initiators = 0
+        moments_24h = 0
         if grid_state_records:
             avg_resonance = float(grid_state_records[0].get("avg_resonance") or 0.85)
             last_cycle = grid_state_records[0].get("last_cycle") or last_cycle
             total_moments = grid_state_records[0].get("totalMoments") or 0
             distinct_initiators = grid_state_records[0].get("distinctInitiators") or 0
+            moments_24h = grid_state_records[0].get("moments24h") or 0
 
         # Calculate a pseudo confidence based on resonance threshold
         confidence = min(100.0, max(0.0, avg_resonance * 100 + 5.0))
 
         # --- 2. Agents ---
-        agents_cypher = """
-            MATCH (a:Agent)
-            RETURN coalesce(a.agent_id, a.id, elementId(a)) AS id,
-                   a.name AS name,
-                   coalesce(a.manifestationStrength, 50.0) AS manifestationStrength,
-                   coalesce(a.status, 'online') AS status,
-                   a.task_count AS task_count
-            ORDER BY a.name ASC
-            LIMIT 500
-        """
-        agents_records = await self._safe_traverse(agents_cypher, "telemetry_agents", "Grid.Body")
-        
         agents = []
-        for a in agents_records:
+        for a in rows["agents"]:
             agents.append({
                 "id": a.get("id"),
                 "name": a.get("name"),
@@ -83,75 +219,15 @@ class CanonicalTelemetryEngine:
                 "provenance": {"task_count": a.get("task_count", 0)}
             })
 
-        # --- 3. Moments ---
-        # Fetch generic recent
-        recent_cypher = """
-            MATCH (m:MoStarMoment)
-            RETURN m.quantum_id AS id, m.description AS desc, m.layer AS layer, m.resonance_score AS res, m.timestamp as ts
-            ORDER BY m.timestamp DESC LIMIT 15
-        """
-        recent_moments_raw = await self._safe_traverse(recent_cypher, "telemetry_recent_moments")
-        
-        # Categorized moments
-        soul_cypher = """MATCH (m:MoStarMoment {layer: 'SOUL'}) RETURN m.quantum_id AS id, m.description AS desc ORDER BY m.timestamp DESC LIMIT 5"""
-        soul_raw = await self._safe_traverse(soul_cypher, "telemetry_soul_moments", "Grid.Soul")
-
-        mind_cypher = """MATCH (m:MoStarMoment {layer: 'MIND'}) RETURN m.quantum_id AS id, m.description AS desc ORDER BY m.timestamp DESC LIMIT 5"""
-        mind_raw = await self._safe_traverse(mind_cypher, "telemetry_mind_moments", "Grid.Mind")
-        
-        body_cypher = """MATCH (m:MoStarMoment {layer: 'BODY'}) RETURN m.quantum_id AS id, m.description AS desc ORDER BY m.timestamp DESC LIMIT 5"""
-        body_raw = await self._safe_traverse(body_cypher, "telemetry_body_moments", "Grid.Body")
-
-        # --- 4. Database Instance Monitor / Layer Nodes ---
-        neo4j_stats_cypher = """
-            CALL db.labels() YIELD label
-            MATCH (n) WHERE label IN labels(n)
-            WITH label, count(n) AS c
-            WHERE c > 0
-            RETURN label, c
-            ORDER BY c DESC LIMIT 15
-        """
-        neo4j_records = await self._safe_traverse(neo4j_stats_cypher, "telemetry_neo4j_stats")
-        layer_nodes = {rec["label"]: rec["c"] for rec in neo4j_records}
-
-        nodes_cypher = "MATCH (n) RETURN count(n) AS c"
-        nodes_res = await self._safe_traverse(nodes_cypher, "telemetry_total_nodes")
-        total_nodes = nodes_res[0].get("c", 0) if nodes_res else 0
-
-        rels_cypher = "MATCH ()-[r]->() RETURN count(r) AS c"
-        rels_res = await self._safe_traverse(rels_cypher, "telemetry_total_rels")
-        total_rels = rels_res[0].get("c", 0) if rels_res else 0
-
-        # Activity in last 24 hours
-        yesterday = (datetime.now(timezone.utc).timestamp() - 86400)
-        # Convert to ISO string or however the timestamp is stored. Assuming ISO or float.
-        # Let's try to match the timestamp format in the DB.
-        activity_cypher = """
-            MATCH (m:MoStarMoment)
-            WHERE datetime(m.timestamp) > datetime() - duration('P1D')
-            RETURN count(m) AS c
-        """
-        activity_res = await self._safe_traverse(activity_cypher, "telemetry_activity_24h")
-        moments_24h = activity_res[0].get("c", 0) if activity_res else 0
-
-        # --- 5. Advanced Metrics (Relationship Types, Artifacts, Density) ---
-        rel_types_cypher = """
-            CALL db.relationshipTypes() YIELD relationshipType
-            MATCH ()-[r]->() WHERE type(r) = relationshipType
-            RETURN relationshipType, count(r) AS c
-            ORDER BY c DESC LIMIT 10
-        """
-        rel_types_res = await self._safe_traverse(rel_types_cypher, "telemetry_rel_types")
-        relationship_types = {rec["relationshipType"]: rec["c"] for rec in rel_types_res}
+        # --- 3. Database Instance Monitor / Layer Nodes ---
+        layer_nodes = dict(stats.top_labels(15))
+        total_nodes = stats.total_nodes
+        total_rels = stats.total_relationships
 
-        artifacts_cypher = "MATCH (a:KnowledgeArtifact) RETURN count(a) AS c"
-        artifacts_res = await self._safe_traverse(artifacts_cypher, "telemetry_artifacts")
-        total_artifacts = artifacts_res[0].get("c", 0) if artifacts_res else 0
-
-        density = 0.0
-        if total_nodes > 1:
-            # Directed graph density: E / (V * (V - 1))
-            density = total_rels / (total_nodes * (total_nodes - 1))
+        # --- 4. Advanced Metrics (Relationship Types, Artifacts, Density) ---
+        relationship_types = dict(stats.top_relationship_types(10))
+        total_artifacts = stats.label_count("KnowledgeArtifact")
+        density = stats.density
 
         canonical_payload = {
             "gridState": {
@@ -170,78 +246,261 @@ class CanonicalTelemetryEngine:
             "layer_nodes": layer_nodes,
             "relationship_types": relationship_types,
             "moments": {
-                "recent": [dict(m) for m in recent_moments_raw],
-                "soulMoments": [dict(m) for m in soul_raw],
-                "mindMoments": [dict(m) for m in mind_raw],
-                "bodyMoments": [dict(m) for m in body_raw]
+                "recent": [dict(m) for m in rows["recent_moments"]],
+                "soulMoments": [dict(m) for m in rows["soul_moments"]],
+                "mindMoments": [dict(m) for m in rows["mind_moments"]],
+                "bodyMoments": [dict(m) for m in rows["body_moments"]]
             }
         }
-        
+
         # Seal the payload
         canonical_payload["seal"] = self.mo.bless("canonical_telemetry")
 
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        log_mostar_moment(
+            initiator="CanonicalTelemetryEngine",
+            receiver="Grid.Mind",
+            description=f"Telemetry snapshot | {len(names)} traversals in {elapsed_ms:.0f}ms",
+            trigger_type="telemetry_snapshot",
+            resonance_score=0.9,
+            layer="MIND",
+        )
+
         return canonical_payload
 
-    async def get_graph_constellation(self, limit: int = 2000) -> dict:
-        """
-        Fetches nodes and relationships formatted for d3-force-graph.
-        Returns { nodes: [{id, labels, resonance, ...}], links: [{source, target, rel}] }
+    async def iter_constellation(
+        self,
+        limit: int = CONSTELLATION_DEFAULT_LIMIT,
+        page_size: int = CONSTELLATION_PAGE_SIZE,
+        labels: list = None,
+        min_degree: int = 0,
+        cursor: int = -1,
+    ):
         """
-        nodes_cypher = f"""
-            MATCH (n)
-            // Broadened filter: Allow all non-internal labels
-            WHERE NOT labels(n)[0] STARTS WITH '_'
-            RETURN id(n) AS id, labels(n) AS labels, n.name AS name, n.description AS desc, 
-                   n.resonance_score AS resonance, n.timestamp AS timestamp
-            LIMIT 5000
+        Yields the constellation page by page, keyset-paginated on node id.
+        Each page is { nodes, links, cursor } where links cover every
+        relationship between this page and the pages already sent, so
+        the client can merge pages progressively. cursor is None once
+        the graph is exhausted. A failed traversal ends the stream with an
+        error page { nodes: [], links: [], cursor, error } whose cursor
+        resumes after the last page sent.
         """
-        nodes_records = await self._safe_traverse(nodes_cypher, "telemetry_constellation_nodes")
-        
-        nodes = []
-        node_ids = set()
-        for r in nodes_records:
-            nid = r.get("id")
-            nodes.append({
-                "id": nid,
-                "labels": r.get("labels", []),
-                "name": r.get("name") or r.get("desc", "Unknown"),
-                "resonance": float(r.get("resonance", 0.5) or 0.5),
-                "timestamp": r.get("timestamp")
-            })
-            node_ids.add(nid)
+        page_size = max(1, min(page_size, CONSTELLATION_MAX_PAGE_SIZE))
+        filters = {"labels": list(labels or []), "min_degree": max(0, min_degree)}
+        remaining = limit
+        sent_nodes = sent_links = 0
+        while remaining > 0:
+            requested = min(page_size, remaining)
+            node_records, error = await self._traverse(
+                CONSTELLATION_NODES_CYPHER,
+                "telemetry_constellation_nodes",
+                audit=False,
+                params={**filters, "cursor": cursor, "page_size": requested},
+            )
+            if error:
+                yield {"nodes": [], "links": [], "cursor": cursor, "error": error}
+                break
+            if not node_records:
+                cursor = None
+                break
+
+            nodes = [
+                {
+                    "id": r.get("id"),
+                    "labels": r.get("labels", []),
+                    "name": r.get("name") or r.get("desc", "Unknown"),
+                    "resonance": float(r.get("resonance", 0.5) or 0.5),
+                    "timestamp": r.get("timestamp"),
+                    "degree": r.get("degree", 0),
+                }
+                for r in node_records
+            ]
+            ids = [n["id"] for n in nodes]
+            link_records, error = await self._traverse(
+                CONSTELLATION_LINKS_CYPHER,
+                "telemetry_constellation_links",
+                audit=False,
+                params={
+                    **filters,
+                    "ids": ids,
+                    "min_id": ids[0],
+                    "max_id": ids[-1],
+                    "link_limit": len(ids) * CONSTELLATION_LINKS_PER_NODE,
+                },
+            )
+            if error:
+                # Without its links the page cannot be merged; resend it on resume
+                yield {"nodes": [], "links": [], "cursor": cursor, "error": error}
+                break
+            links = [
+                {"source": r.get("source"), "target": r.get("target"), "rel": r.get("rel")}
+                for r in link_records
+            ]
+
+            remaining -= len(nodes)
+            sent_nodes += len(nodes)
+            sent_links += len(links)
+            # A short page means the graph is exhausted; hitting `limit`
+            # leaves a cursor so the client can ask for more later.
+            cursor = ids[-1] if len(nodes) == requested else None
+            yield {"nodes": nodes, "links": links, "cursor": cursor}
+            if cursor is None:
+                break
 
-        if not node_ids:
-            return {"nodes": [], "links": []}
+        log_mostar_moment(
+            initiator="CanonicalTelemetryEngine",
+            receiver="Grid.Soul",
+            description=f"Constellation streamed | {sent_nodes} nodes, {sent_links} links",
+            trigger_type="neo4j_traverse",
+            resonance_score=0.9,
+            layer="SOUL",
+        )
 
-        # Fetch links between these nodes
-        links_cypher = f"""
-            MATCH (s)-[r]->(t)
-            WHERE id(s) IN {list(node_ids)} AND id(t) IN {list(node_ids)}
-            RETURN id(s) AS source, id(t) AS target, type(r) AS rel
-            LIMIT {limit * 2}
+    async def get_graph_constellation(
+        self,
+        limit: int = CONSTELLATION_DEFAULT_LIMIT,
+        labels: list = None,
+        min_degree: int = 0,
+        cursor: int = -1,
+        page_size: int = CONSTELLATION_PAGE_SIZE,
+    ) -> dict:
         """
-        links_records = await self._safe_traverse(links_cypher, "telemetry_constellation_links")
-        
-        links = []
-        for r in links_records:
-            links.append({
-                "source": r.get("source"),
-                "target": r.get("target"),
-                "rel": r.get("rel")
-            })
+        Fetches nodes and relationships formatted for d3-force-graph.
+        Returns { nodes: [{id, labels, resonance, ...}], links: [{source, target, rel}], cursor },
+        plus `error` (with a cursor to resume from) if a traversal failed.
+        """
+        result = {"nodes": [], "links": [], "cursor": None}
+        async for page in self.iter_constellation(
+            limit=limit, page_size=page_size, labels=labels, min_degree=min_degree, cursor=cursor
+        ):
+            result["nodes"].extend(page["nodes"])
+            result["links"].extend(page["links"])
+            result["cursor"] = page["cursor"]
+            if "error" in page:
+                result["error"] = page["error"]
+        return result
+
+class TelemetryCache:
+    """
+    In-memory telemetry snapshot with stale-while-revalidate semantics.
+    - age < ttl        → served as-is
+    - age < max_stale  → served stale while one background refresh runs
+    - otherwise        → callers await the (single, shared) refresh
+    A background refresher started at app startup keeps it fresh.
+    """
+
+    def __init__(
+        self,
+        loader,
+        ttl: float = TELEMETRY_TTL_SECONDS,
+        max_stale: float = TELEMETRY_MAX_STALE_SECONDS,
+        refresh_interval: float = TELEMETRY_REFRESH_INTERVAL,
+    ):
+        self.loader = loader
+        self.ttl = ttl
+        self.max_stale = max_stale
+        self.refresh_interval = refresh_interval
+        self._value = None
+        self._fetched_at = 0.0
+        self._refresh_task = None
+        self._refresher = None
+
+    def age(self) -> float:
+        return time.monotonic() - self._fetched_at
+
+    async def get(self) -> dict:
+        age = self.age()
+        if self._value is None or age >= self.max_stale:
+            value = await self._shared_refresh()
+        else:
+            if age >= self.ttl:
+                self._schedule_refresh()
+            value = self._value
+        return {
+            **value,
+            "cache": {"age_s": round(self.age(), 3), "stale": self.age() >= self.ttl},
+        }
+
+    def _schedule_refresh(self):
+        if self._refresh_task is None or self._refresh_task.done():
+            self._refresh_task = asyncio.create_task(self._refresh())
+        return self._refresh_task
+
+    async def _shared_refresh(self) -> dict:
+        return await asyncio.shield(self._schedule_refresh())
+
+    async def _refresh(self) -> dict:
+        try:
+            value = await self.loader()
+        except Exception as exc:
+            log.warning("Telemetry refresh failed: %s", exc)
+            if self._value is None:
+                raise
+            return self._value
+        self._value = value
+        self._fetched_at = time.monotonic()
+        return value
+
+    async def _refresh_loop(self):
+        while True:
+            try:
+                await self._shared_refresh()
+            except Exception as exc:
+                log.warning("Telemetry refresher error: %s", exc)
+            await asyncio.sleep(self.refresh_interval)
+
+    def start(self):
+        """Start the background refresher on the running loop."""
+        if self._refresher is None or self._refresher.done():
+            self._refresher = asyncio.create_task(self._refresh_loop())
 
-        return {"nodes": nodes, "links": links}
+    async def stop(self):
+        if self._refresher is not None:
+            self._refresher.cancel()
+            try:
+                await self._refresher
+            except asyncio.CancelledError:
+                pass
+            self._refresher = None
 
-async def get_graph_constellation(limit: int = 2000):
+
+_telemetry_engine = None
+
+
+def get_telemetry_engine() -> CanonicalTelemetryEngine:
+    global _telemetry_engine
+    if _telemetry_engine is None:
+        _telemetry_engine = CanonicalTelemetryEngine(engine=grid_context.engine)
+    return _telemetry_engine
+
+
+async def _load_grid_telemetry() -> dict:
+    return await get_telemetry_engine().get_grid_telemetry()
+
+
+telemetry_cache = TelemetryCache(_load_grid_telemetry)
+
+
+async def get_graph_constellation(
+    limit: int = CONSTELLATION_DEFAULT_LIMIT,
+    labels: list = None,
+    min_degree: int = 0,
+    cursor: int = -1,
+    page_size: int = CONSTELLATION_PAGE_SIZE,
+):
     """Async wrapper."""
-    engine = CanonicalTelemetryEngine()
-    return await engine.get_graph_constellation(limit)
+    return await get_telemetry_engine().get_graph_constellation(
+        limit, labels=labels, min_degree=min_degree, cursor=cursor, page_size=page_size
+    )
+
+def iter_graph_constellation(**kwargs):
+    """Async page iterator for streaming responses."""
+    return get_telemetry_engine().iter_constellation(**kwargs)
 
 async def get_grid_telemetry():
-    """Async wrapper for the external world to call."""
-    engine = CanonicalTelemetryEngine()
-    return await engine.get_grid_telemetry()
+    """Async wrapper for the external world to call — served from cache."""
+    return await telemetry_cache.get()
 
 def get_grid_telemetry_sync():
-    """Sync wrapper if needed."""
-    return asyncio.run(get_grid_telemetry())
+    """Sync wrapper if needed — bypasses the loop-bound cache."""
+    return asyncio.run(_load_grid_telemetry())
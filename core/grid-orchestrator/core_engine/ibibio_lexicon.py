@@ -0,0 +1,191 @@
+# ═══════════════════════════════════════════════════════════════════
+# MOSTAR GRID — IBIBIO LEXICON KEYS
+# The Flame Architect — MSTR-⚡ — MoStar Industries
+# Normalised lookup keys so word/phrase lookups are index seeks.
+# ═══════════════════════════════════════════════════════════════════
+"""
+``IbibioWord`` nodes carry two stored keys next to the display fields:
+
+- ``orthography_key`` — casefolded, diacritic-folded orthography
+  (``Ọ̀kọ́`` → ``oko``), behind a range index for exact lookups;
+- ``english_key`` — the same folding applied to the English gloss.
+
+Both keys are also covered by the ``ibibio_lexicon_text`` full-text index,
+which serves ranked phrase search and fuzzy (edit-distance) word matches.
+Keys are computed here in Python because Cypher has no diacritic folding;
+``lexicon_key_version`` marks which folding rules a node was keyed with so
+a rule change is picked up by the next backfill.
+
+Backfill existing nodes with::
+
+    python core/grid-orchestrator/core_engine/ibibio_lexicon.py
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import time
+import unicodedata
+from typing import Any, Optional
+
+LEXICON_KEY_VERSION = 1
+LEXICON_FULLTEXT_INDEX = "ibibio_lexicon_text"
+LEXICON_BACKFILL_BATCH = int(os.getenv("IBIBIO_LEXICON_BACKFILL_BATCH", "1000"))
+# Terms at least this long get a one-edit fuzzy clause (~1)
+LEXICON_FUZZY_MIN_LENGTH = int(os.getenv("IBIBIO_LEXICON_FUZZY_MIN_LENGTH", "4"))
+
+LEXICON_SCHEMA = [
+    "CREATE INDEX ibibio_orthography_key IF NOT EXISTS FOR (w:IbibioWord) ON (w.orthography_key)",
+    "CREATE INDEX ibibio_english_key IF NOT EXISTS FOR (w:IbibioWord) ON (w.english_key)",
+    "CREATE INDEX ibibio_lexicon_key_version IF NOT EXISTS FOR (w:IbibioWord) ON (w.lexicon_key_version)",
+    f"CREATE FULLTEXT INDEX {LEXICON_FULLTEXT_INDEX} IF NOT EXISTS "
+    "FOR (w:IbibioWord) ON EACH [w.orthography_key, w.english_key]",
+]
+
+# Letters NFKD leaves intact (open vowels, eng) fold to their base letter.
+_EXTRA_FOLDS = str.maketrans({
+    "ɔ": "o", "Ɔ": "o", "ɛ": "e", "Ɛ": "e", "ə": "e", "ʌ": "a",
+    "ŋ": "n", "Ŋ": "n", "ı": "i", "ø": "o", "æ": "ae", "ß": "ss",
+})
+# Edits that keep the word count unchanged still invalidate lexicon caches
+LEXICON_REVISION_BUMP = """
+MERGE (lexicon:IbibioLexicon {id: 'ibibio'})
+SET lexicon.revision = coalesce(lexicon.revision, 0) + 1,
+    lexicon.updated_at = datetime()
+"""
+
+_NON_WORD = re.compile(r"[^0-9a-z]+")
+_LUCENE_SPECIAL = re.compile(r'([+\-!(){}\[\]^"~*?:\\/]|&&|\|\|)')
+
+_BACKFILL_READ = """
+MATCH (w:IbibioWord)
+WHERE w.lexicon_key_version IS NULL OR w.lexicon_key_version < $version
+RETURN elementId(w) AS id, w.orthography AS orthography, w.english AS english
+LIMIT $limit
+"""
+
+_BACKFILL_WRITE = """
+UNWIND $rows AS row
+MATCH (w:IbibioWord) WHERE elementId(w) = row.id
+SET w.orthography_key = row.orthography_key,
+    w.english_key = row.english_key,
+    w.lexicon_key_version = $version
+"""
+
+
+def fold_key(value: Any) -> Optional[str]:
+    """Lowercased, diacritic-free, whitespace-collapsed lookup key."""
+    if value is None:
+        return None
+    text = unicodedata.normalize("NFKD", str(value).translate(_EXTRA_FOLDS))
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    text = text.casefold().translate(_EXTRA_FOLDS)
+    text = text.replace("'", "").replace("\u2019", "")
+    key = " ".join(_NON_WORD.sub(" ", text).split())
+    return key or None
+
+
+def lexicon_keys(orthography: Any, english: Any) -> dict[str, Any]:
+    """The properties a writer should SET alongside orthography/english."""
+    return {
+        "orthography_key": fold_key(orthography),
+        "english_key": fold_key(english),
+        "lexicon_key_version": LEXICON_KEY_VERSION,
+    }
+
+
+def _escape(term: str) -> str:
+    return _LUCENE_SPECIAL.sub(r"\\\1", term)
+
+
+def fulltext_query(text: str, field: str, *, fuzzy: bool = True) -> Optional[str]:
+    """
+    Lucene query over one key field of ``ibibio_lexicon_text``.
+
+    Every term must match (exactly, as a prefix, or within one edit when
+    ``fuzzy``); the whole phrase is boosted so the closest gloss ranks first.
+    """
+    key = fold_key(text)
+    if not key:
+        return None
+    clauses = []
+    for term in key.split():
+        term = _escape(term)
+        options = [f"{term}^3", f"{term}*"]
+        if fuzzy and len(term) >= LEXICON_FUZZY_MIN_LENGTH:
+            options.append(f"{term}~1")
+        clauses.append("(" + " OR ".join(options) + ")")
+    terms = " AND ".join(clauses)
+    return f'{field}:"{_escape(key)}"^5 OR {field}:({terms})'
+
+
+def ensure_lexicon_schema(session) -> None:
+    for statement in LEXICON_SCHEMA:
+        session.run(statement).consume()
+
+
+def backfill_lexicon_keys(driver, *, batch_size: int = LEXICON_BACKFILL_BATCH) -> dict[str, Any]:
+    """
+    Keys every IbibioWord missing or behind ``LEXICON_KEY_VERSION``. Each
+    written node drops out of the read predicate, so the loop is resumable
+    and a no-op once the lexicon is current.
+    """
+    started = time.perf_counter()
+    updated = batches = 0
+    with driver.session() as session:
+        ensure_lexicon_schema(session)
+        while True:
+            rows = session.run(
+                _BACKFILL_READ, {"version": LEXICON_KEY_VERSION, "limit": batch_size}
+            ).data()
+            if not rows:
+                break
+            payload = [
+                {
+                    "id": row["id"],
+                    "orthography_key": fold_key(row.get("orthography")),
+                    "english_key": fold_key(row.get("english")),
+                }
+                for row in rows
+            ]
+            session.execute_write(
+                lambda tx: tx.run(
+                    _BACKFILL_WRITE, {"rows": payload, "version": LEXICON_KEY_VERSION}
+                ).consume()
+            )
+            updated += len(payload)
+            batches += 1
+        if updated:
+            session.run(LEXICON_REVISION_BUMP).consume()
+    return {
+        "updated": updated,
+        "batches": batches,
+        "key_version": LEXICON_KEY_VERSION,
+        "seconds": round(time.perf_counter() - started, 3),
+    }
+
+
+if __name__ == "__main__":
+    import argparse
+
+    from neo4j import GraphDatabase
+
+    parser = argparse.ArgumentParser(
+        description="Create the Ibibio lexicon indexes and backfill normalised keys"
+    )
+    parser.add_argument("--uri", default=os.getenv("NEO4J_URI", "bolt://localhost:7687"))
+    parser.add_argument("--user", default=os.getenv("NEO4J_USER", "neo4j"))
+    parser.add_argument("--password", default=os.getenv("NEO4J_PASSWORD", ""))
+    parser.add_argument("--batch-size", type=int, default=LEXICON_BACKFILL_BATCH)
+    args = parser.parse_args()
+
+    driver = GraphDatabase.driver(args.uri, auth=(args.user, args.password))
+    try:
+        result = backfill_lexicon_keys(driver, batch_size=args.batch_size)
+        print(
+            f"[LEXICON] Keyed {result['updated']} IbibioWord nodes in "
+            f"{result['batches']} batches ({result['seconds']}s, key v{result['key_version']})"
+        )
+    finally:
+        driver.close()
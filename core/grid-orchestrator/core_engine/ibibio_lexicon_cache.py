@@ -0,0 +1,360 @@
+# ═══════════════════════════════════════════════════════════════════
+# MOSTAR GRID — IBIBIO LEXICON CACHE
+# The Flame Architect — MSTR-⚡ — MoStar Industries
+# The whole lexicon in-process: Neo4j is read only on refresh.
+# ═══════════════════════════════════════════════════════════════════
+"""
+The Ibibio dictionary is small and mostly read-only, so the respond path
+can serve it from memory:
+
+- a character trie over folded orthography (exact, prefix and one-edit
+  fuzzy lookups walk the trie instead of scanning);
+- an inverted index from folded English gloss tokens to entry ids, with a
+  token trie for prefix / fuzzy term expansion and idf scoring.
+
+Matching mirrors the Neo4j lookups in grid_runtime (same keys from
+ibibio_lexicon.fold_key, same ordering), so callers cannot tell which one
+served them. ``LexiconCache`` rebuilds the index when the lexicon stamp
+(word/asset counts + IbibioLexicon revision) changes, checked at most every
+IBIBIO_LEXICON_CHECK_INTERVAL seconds. Writers that edit existing words
+bump the revision with ``ibibio_lexicon.LEXICON_REVISION_BUMP``.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Iterable, Optional
+
+from core_engine.ibibio_lexicon import LEXICON_FUZZY_MIN_LENGTH, fold_key
+
+IBIBIO_LEXICON_CACHE = os.getenv("IBIBIO_LEXICON_CACHE", "1").lower() in ("1", "true", "yes")
+IBIBIO_LEXICON_CHECK_INTERVAL = float(os.getenv("IBIBIO_LEXICON_CHECK_INTERVAL", "30"))
+
+LEXICON_STAMP_QUERY = """
+OPTIONAL MATCH (lexicon:IbibioLexicon {id: 'ibibio'})
+RETURN lexicon.revision AS revision,
+       COUNT { (:IbibioWord) } AS words,
+       COUNT { (:AudioAsset) } AS assets,
+       COUNT { ()-[:HAS_AUDIO_ASSET]->() } AS audio_links
+"""
+
+LEXICON_LOAD_QUERY = """
+MATCH (w:IbibioWord)
+OPTIONAL MATCH (w)-[:HAS_AUDIO_ASSET]->(asset:AudioAsset)
+WITH w, collect(asset)[0] AS asset
+RETURN w.orthography AS orthography,
+       w.english AS english,
+       w.tone_pattern AS tone_pattern,
+       w.pos AS pos,
+       w.speaker AS speaker,
+       w.audio_file AS audio_file,
+       asset.grid_path AS grid_path,
+       asset.filename AS asset_filename
+"""
+
+_WORD_FIELDS = (
+    "orthography", "english", "tone_pattern", "pos", "speaker",
+    "audio_file", "grid_path", "asset_filename",
+)
+_PHRASE_FIELDS = ("orthography", "english", "tone_pattern", "pos", "speaker", "audio_file")
+
+
+@dataclass(frozen=True, slots=True)
+class LexiconEntry:
+    orthography: Optional[str]
+    english: Optional[str]
+    tone_pattern: Optional[str]
+    pos: Optional[str]
+    speaker: Optional[str]
+    audio_file: Optional[str]
+    grid_path: Optional[str]
+    asset_filename: Optional[str]
+    orthography_key: Optional[str]
+    english_key: Optional[str]
+
+
+class _TrieNode:
+    __slots__ = ("children", "ids")
+
+    def __init__(self) -> None:
+        self.children: dict[str, _TrieNode] = {}
+        self.ids: list[int] = []
+
+
+class _Trie:
+    """Character trie mapping a folded key to the entry ids stored under it."""
+
+    def __init__(self) -> None:
+        self.root = _TrieNode()
+
+    def add(self, key: str, entry_id: int) -> None:
+        node = self.root
+        for ch in key:
+            child = node.children.get(ch)
+            if child is None:
+                child = node.children[ch] = _TrieNode()
+            node = child
+        node.ids.append(entry_id)
+
+    def _node(self, key: str) -> Optional[_TrieNode]:
+        node = self.root
+        for ch in key:
+            node = node.children.get(ch)
+            if node is None:
+                return None
+        return node
+
+    def exact(self, key: str) -> list[int]:
+        node = self._node(key)
+        return node.ids if node is not None else []
+
+    def prefix(self, key: str) -> Iterable[tuple[str, list[int]]]:
+        """(suffix-completed key, ids) for every key starting with ``key``."""
+        start = self._node(key)
+        if start is None:
+            return
+        stack = [(start, key)]
+        while stack:
+            node, word = stack.pop()
+            if node.ids:
+                yield word, node.ids
+            for ch, child in node.children.items():
+                stack.append((child, word + ch))
+
+    def within(self, key: str, max_edits: int = 1) -> list[tuple[str, int, list[int]]]:
+        """Keys within ``max_edits`` Levenshtein edits: (key, distance, ids)."""
+        results: list[tuple[str, int, list[int]]] = []
+        first_row = list(range(len(key) + 1))
+        stack = [(child, ch, ch, first_row) for ch, child in self.root.children.items()]
+        while stack:
+            node, ch, word, previous = stack.pop()
+            row = [previous[0] + 1]
+            for i in range(1, len(key) + 1):
+                row.append(min(
+                    row[i - 1] + 1,
+                    previous[i] + 1,
+                    previous[i - 1] + (key[i - 1] != ch),
+                ))
+            if row[-1] <= max_edits and node.ids:
+                results.append((word, row[-1], node.ids))
+            if min(row) <= max_edits:
+                stack.extend(
+                    (child, next_ch, word + next_ch, row)
+                    for next_ch, child in node.children.items()
+                )
+        return results
+
+
+class LexiconIndex:
+    """Immutable snapshot of the lexicon; safe to share across threads."""
+
+    def __init__(self, rows: Iterable[dict[str, Any]], stamp: tuple = ()) -> None:
+        self.stamp = stamp
+        self.entries: list[LexiconEntry] = []
+        self.words = _Trie()
+        postings: dict[str, list[int]] = {}
+        for row in rows:
+            entry = LexiconEntry(
+                *(row.get(name) for name in _WORD_FIELDS),
+                orthography_key=fold_key(row.get("orthography")),
+                english_key=fold_key(row.get("english")),
+            )
+            entry_id = len(self.entries)
+            self.entries.append(entry)
+            if entry.orthography_key:
+                self.words.add(entry.orthography_key, entry_id)
+            if entry.english_key:
+                for token in set(entry.english_key.split()):
+                    postings.setdefault(token, []).append(entry_id)
+        # The gloss trie stores token ids into _tokens: (token, postings, idf)
+        self._tokens: list[tuple[str, list[int], float]] = []
+        self.gloss_terms = _Trie()
+        total = max(1, len(self.entries))
+        for token, ids in sorted(postings.items()):
+            self.gloss_terms.add(token, len(self._tokens))
+            self._tokens.append((token, ids, math.log(1 + total / len(ids))))
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    # ── Word lookups ──────────────────────────────────────────────
+    @staticmethod
+    def _payload(entry: LexiconEntry, fields: tuple[str, ...], **extra: Any) -> dict[str, Any]:
+        payload = {name: getattr(entry, name) for name in fields}
+        payload.update(extra)
+        return payload
+
+    def lookup_word(self, word: str, *, fuzzy: bool = False) -> Optional[dict[str, Any]]:
+        key = fold_key(word)
+        if not key:
+            return None
+        ids = self.words.exact(key)
+        if ids:
+            lowered = word.lower()
+
+            def _rank(entry_id: int) -> tuple[int, int]:
+                entry = self.entries[entry_id]
+                if entry.orthography == word:
+                    spelling = 0
+                elif (entry.orthography or "").lower() == lowered:
+                    spelling = 1
+                else:
+                    spelling = 2
+                return spelling, 0 if entry.audio_file else 1
+
+            best = min(ids, key=_rank)
+            return self._payload(self.entries[best], _WORD_FIELDS, match_type="exact", score=None)
+        if not fuzzy:
+            return None
+        candidates = [
+            (distance, 0 if self.entries[i].audio_file else 1, matched, i)
+            for matched, distance, ids in self.words.within(key, 1 if len(key) >= LEXICON_FUZZY_MIN_LENGTH else 0)
+            for i in ids
+        ]
+        if not candidates:
+            candidates = [
+                (1, 0 if self.entries[i].audio_file else 1, matched, i)
+                for matched, ids in self.words.prefix(key)
+                for i in ids
+            ]
+        if not candidates:
+            return None
+        distance, _, _, best = min(candidates)
+        return self._payload(
+            self.entries[best], _WORD_FIELDS,
+            match_type="fuzzy", score=round(1.0 / (1 + distance), 3),
+        )
+
+    def prefix_words(self, prefix: str, limit: int = 10) -> list[dict[str, Any]]:
+        """Autocomplete over folded orthography."""
+        key = fold_key(prefix)
+        if not key:
+            return []
+        matches = sorted(
+            (matched, i) for matched, ids in self.words.prefix(key) for i in ids
+        )[:limit]
+        return [self._payload(self.entries[i], _PHRASE_FIELDS) for _, i in matches]
+
+    # ── Gloss search ──────────────────────────────────────────────
+    def _term_scores(self, term: str, fuzzy: bool) -> dict[int, float]:
+        """Entry id -> weight for one query term (exact > prefix > fuzzy)."""
+        scores: dict[int, float] = {}
+
+        def _credit(token_id: int, weight: float) -> None:
+            _, ids, idf = self._tokens[token_id]
+            for entry_id in ids:
+                value = idf * weight
+                if value > scores.get(entry_id, 0.0):
+                    scores[entry_id] = value
+
+        for token_id in self.gloss_terms.exact(term):
+            _credit(token_id, 3.0)
+        for matched, token_ids in self.gloss_terms.prefix(term):
+            if matched != term:
+                for token_id in token_ids:
+                    _credit(token_id, 1.0)
+        if fuzzy and len(term) >= LEXICON_FUZZY_MIN_LENGTH:
+            for matched, distance, token_ids in self.gloss_terms.within(term, 1):
+                if distance:
+                    for token_id in token_ids:
+                        _credit(token_id, 0.5)
+        return scores
+
+    def search_gloss(self, phrase: str, limit: int = 5, *, fuzzy: bool = True) -> list[dict[str, Any]]:
+        key = fold_key(phrase)
+        if not key:
+            return []
+        combined: Optional[dict[int, float]] = None
+        for term in key.split():
+            term_scores = self._term_scores(term, fuzzy)
+            if combined is None:
+                combined = term_scores
+            else:
+                combined = {
+                    entry_id: score + term_scores[entry_id]
+                    for entry_id, score in combined.items()
+                    if entry_id in term_scores
+                }
+            if not combined:
+                return []
+        ranked = []
+        for entry_id, score in combined.items():
+            entry = self.entries[entry_id]
+            if key in (entry.english_key or ""):
+                score *= 5  # whole-phrase boost, like the "..."^5 clause
+            ranked.append((
+                0 if entry.english_key == key else 1,
+                -score,
+                0 if entry.audio_file else 1,
+                entry.orthography or "",
+                entry_id,
+                score,
+            ))
+        ranked.sort()
+        return [
+            self._payload(self.entries[item[4]], _PHRASE_FIELDS, score=round(item[5], 3))
+            for item in ranked[:limit]
+        ]
+
+
+class LexiconCache:
+    """
+    Holds the current ``LexiconIndex`` for a driver. The stamp is checked
+    at most every ``check_interval`` seconds; a changed stamp reloads the
+    lexicon and swaps the index in one reference assignment.
+    """
+
+    def __init__(self, driver, *, check_interval: float = IBIBIO_LEXICON_CHECK_INTERVAL) -> None:
+        self.driver = driver
+        self.check_interval = check_interval
+        self._index: Optional[LexiconIndex] = None
+        self._checked_at = 0.0
+        self._lock = threading.Lock()
+        self.reloads = 0
+        self.last_load_ms = 0.0
+
+    def _read(self, query: str) -> list[dict[str, Any]]:
+        with self.driver.session() as session:
+            return session.run(query).data()
+
+    def _stamp(self) -> tuple:
+        rows = self._read(LEXICON_STAMP_QUERY)
+        row = rows[0] if rows else {}
+        return (row.get("revision"), row.get("words"), row.get("assets"), row.get("audio_links"))
+
+    def index(self) -> LexiconIndex:
+        now = time.monotonic()
+        index = self._index
+        if index is not None and now - self._checked_at < self.check_interval:
+            return index
+        with self._lock:
+            if self._index is not None and now - self._checked_at < self.check_interval:
+                return self._index
+            stamp = self._stamp()
+            if self._index is None or self._index.stamp != stamp:
+                started = time.perf_counter()
+                self._index = LexiconIndex(self._read(LEXICON_LOAD_QUERY), stamp)
+                self.last_load_ms = round((time.perf_counter() - started) * 1000, 1)
+                self.reloads += 1
+                print(f"[LEXICON] Cached {len(self._index)} Ibibio words ({self.last_load_ms}ms)")
+            self._checked_at = now
+            return self._index
+
+    def invalidate(self) -> None:
+        with self._lock:
+            self._checked_at = 0.0
+            self._index = None
+
+    def metrics(self) -> dict[str, Any]:
+        index = self._index
+        return {
+            "words": len(index) if index else 0,
+            "stamp": list(index.stamp) if index else None,
+            "reloads": self.reloads,
+            "last_load_ms": self.last_load_ms,
+            "check_interval": self.check_interval,
+        }
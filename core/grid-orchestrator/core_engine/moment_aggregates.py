@@ -0,0 +1,239 @@
+# ═══════════════════════════════════════════════════════════════════
+# MOSTAR GRID — MOMENT AGGREGATES
+# The Flame Architect — MSTR-⚡ — MoStar Industries
+# The Grid keeps its own tally — telemetry never recounts history.
+# ═══════════════════════════════════════════════════════════════════
+
+from __future__ import annotations
+
+import hashlib
+import math
+import os
+import threading
+import time
+from datetime import datetime, timezone
+from typing import Callable, Iterable, Optional
+
+MOMENT_AGGREGATES_RECONCILE_INTERVAL = float(
+    os.getenv("MOMENT_AGGREGATES_RECONCILE_INTERVAL", "900")
+)
+WINDOW_MINUTES = 24 * 60
+DEFAULT_RESONANCE = 0.85
+
+RECONCILE_TOTALS_CYPHER = """
+MATCH (m:MoStarMoment)
+RETURN count(m) AS total,
+       sum(coalesce(m.resonance_score, 0.85)) AS resonance_sum,
+       max(m.timestamp) AS last_cycle
+"""
+RECONCILE_INITIATORS_CYPHER = """
+MATCH (m:MoStarMoment)
+RETURN DISTINCT m.initiator AS initiator
+"""
+RECONCILE_WINDOW_CYPHER = """
+MATCH (m:MoStarMoment)
+WITH datetime(m.timestamp) AS ts
+WHERE ts > datetime() - duration('P1D')
+RETURN ts.epochSeconds / 60 AS minute, count(*) AS c
+"""
+
+
+def _to_datetime(value) -> Optional[datetime]:
+    """Accept ISO strings, datetimes and neo4j.time.DateTime."""
+    if value is None:
+        return None
+    if hasattr(value, "to_native"):
+        value = value.to_native()
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if isinstance(value, datetime):
+        return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+    return None
+
+
+def _minute(value) -> Optional[int]:
+    ts = _to_datetime(value)
+    return int(ts.timestamp() // 60) if ts else None
+
+
+class HyperLogLog:
+    """Fixed-memory distinct counter (2^p one-byte registers)."""
+
+    def __init__(self, p: int = 12):
+        self.p = p
+        self.m = 1 << p
+        self.registers = bytearray(self.m)
+        self._alpha = 0.7213 / (1 + 1.079 / self.m)
+
+    def add(self, value) -> None:
+        h = int.from_bytes(
+            hashlib.blake2b(str(value).encode("utf-8"), digest_size=8).digest(), "big"
+        )
+        idx = h >> (64 - self.p)
+        rest = h & ((1 << (64 - self.p)) - 1)
+        rank = (64 - self.p) - rest.bit_length() + 1
+        if rank > self.registers[idx]:
+            self.registers[idx] = rank
+
+    def count(self) -> int:
+        estimate = self._alpha * self.m * self.m / sum(
+            2.0 ** -r for r in self.registers
+        )
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * self.m and zeros:
+            # Small-range correction: linear counting
+            estimate = self.m * math.log(self.m / zeros)
+        return int(round(estimate))
+
+
+class MomentAggregates:
+    """
+    Running MoStarMoment aggregates, fed by the moment write path.
+
+    Writes report each merged row with the node's previous timestamp and
+    resonance (``prev_ts`` / ``prev_res``, null for new nodes), so:
+    - totals and the resonance sum stay exact for new and re-seen moments,
+    - distinct initiators are a HyperLogLog estimate,
+    - the 24h count is a ring of per-minute buckets.
+    A periodic reconcile rebuilds everything from the graph, covering
+    writes made by other processes and any drift.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable,
+        reconcile_interval: float = MOMENT_AGGREGATES_RECONCILE_INTERVAL,
+    ):
+        self.session_factory = session_factory
+        self.reconcile_interval = reconcile_interval
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._reset()
+        self.reconciled_at: Optional[str] = None
+        self.reconcile_ms = 0.0
+        self.observed = 0
+
+    def _reset(self) -> None:
+        self.total = 0
+        self.resonance_sum = 0.0
+        self.last_cycle: Optional[datetime] = None
+        self.initiators = HyperLogLog()
+        self._bucket_minute = [-1] * WINDOW_MINUTES
+        self._bucket_count = [0] * WINDOW_MINUTES
+
+    @property
+    def ready(self) -> bool:
+        return self.reconciled_at is not None
+
+    # ── Change feed ───────────────────────────────────────────────
+    def observe(self, row: dict, prev_ts=None, prev_res=None) -> None:
+        self.observe_many([(row, prev_ts, prev_res)])
+
+    def observe_many(self, changes: Iterable[tuple]) -> None:
+        """changes: (row, prev_ts, prev_res) per merged moment row."""
+        with self._lock:
+            for row, prev_ts, prev_res in changes:
+                self._apply(row, prev_ts, prev_res)
+
+    def _apply(self, row: dict, prev_ts, prev_res) -> None:
+        ts = _to_datetime(row.get("timestamp")) or datetime.now(timezone.utc)
+        resonance = row.get("resonance_score")
+        resonance = DEFAULT_RESONANCE if resonance is None else float(resonance)
+        if prev_ts is None:
+            self.total += 1
+        else:
+            self.resonance_sum -= DEFAULT_RESONANCE if prev_res is None else float(prev_res)
+            self._bump_minute(_minute(prev_ts), -1)
+        self.resonance_sum += resonance
+        self._bump_minute(int(ts.timestamp() // 60), 1)
+        if row.get("initiator") is not None:
+            self.initiators.add(row["initiator"])
+        if self.last_cycle is None or ts > self.last_cycle:
+            self.last_cycle = ts
+        self.observed += 1
+
+    def _bump_minute(self, minute: Optional[int], delta: int) -> None:
+        if minute is None:
+            return
+        slot = minute % WINDOW_MINUTES
+        if self._bucket_minute[slot] != minute:
+            if delta < 0:
+                return  # already aged out of the window
+            self._bucket_minute[slot] = minute
+            self._bucket_count[slot] = 0
+        self._bucket_count[slot] = max(0, self._bucket_count[slot] + delta)
+
+    # ── Read side ─────────────────────────────────────────────────
+    def snapshot(self) -> dict:
+        now_minute = int(time.time() // 60)
+        with self._lock:
+            window = sum(
+                count
+                for minute, count in zip(self._bucket_minute, self._bucket_count)
+                if now_minute - WINDOW_MINUTES < minute <= now_minute
+            )
+            return {
+                "totalMoments": self.total,
+                "avgResonance": (
+                    self.resonance_sum / self.total if self.total else DEFAULT_RESONANCE
+                ),
+                "lastCycle": self.last_cycle.isoformat() if self.last_cycle else None,
+                "distinctInitiators": self.initiators.count(),
+                "moments24h": window,
+                "reconciledAt": self.reconciled_at,
+            }
+
+    # ── Reconciliation ────────────────────────────────────────────
+    def reconcile(self) -> None:
+        """Rebuild every aggregate from the graph."""
+        started = time.perf_counter()
+        with self.session_factory() as session:
+            totals = session.run(RECONCILE_TOTALS_CYPHER).single()
+            initiators = HyperLogLog()
+            for record in session.run(RECONCILE_INITIATORS_CYPHER):
+                if record["initiator"] is not None:
+                    initiators.add(record["initiator"])
+            window = [(r["minute"], r["c"]) for r in session.run(RECONCILE_WINDOW_CYPHER)]
+
+        with self._lock:
+            drift = self.total - (totals["total"] or 0) if self.ready else 0
+            self._reset()
+            self.total = totals["total"] or 0
+            self.resonance_sum = float(totals["resonance_sum"] or 0.0)
+            self.last_cycle = _to_datetime(totals["last_cycle"])
+            self.initiators = initiators
+            for minute, count in window:
+                self._bump_minute(int(minute), int(count))
+            self.reconciled_at = datetime.now(timezone.utc).isoformat()
+            self.reconcile_ms = round((time.perf_counter() - started) * 1000, 3)
+        print(
+            f"[MOMENT AGG] Reconciled {self.total} moments in {self.reconcile_ms}ms "
+            f"(drift={drift})"
+        )
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.reconcile()
+            except Exception as exc:
+                print(f"[MOMENT AGG] ⚠️ Reconcile failed: {exc}")
+            self._stop.wait(self.reconcile_interval)
+
+    def start(self) -> None:
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="mostar-moment-aggregates", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
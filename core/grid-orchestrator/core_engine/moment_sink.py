@@ -0,0 +1,226 @@
+# ═══════════════════════════════════════════════════════════════════
+# MOSTAR GRID — MOMENT SINK
+# The Flame Architect — MSTR-⚡ — MoStar Industries
+# Callers enqueue, one writer flushes. No request waits on the graph.
+# ═══════════════════════════════════════════════════════════════════
+
+from __future__ import annotations
+
+import json
+import os
+import queue
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Optional
+
+MOMENT_SINK_QUEUE_SIZE = int(os.getenv("MOMENT_SINK_QUEUE_SIZE", "10000"))
+MOMENT_SINK_BATCH_SIZE = int(os.getenv("MOMENT_SINK_BATCH_SIZE", "500"))
+MOMENT_SINK_FLUSH_INTERVAL = float(os.getenv("MOMENT_SINK_FLUSH_INTERVAL", "0.5"))
+MOMENT_SINK_ENQUEUE_TIMEOUT = float(os.getenv("MOMENT_SINK_ENQUEUE_TIMEOUT", "0"))
+MOMENT_SINK_REPLAY_INTERVAL = float(os.getenv("MOMENT_SINK_REPLAY_INTERVAL", "30"))
+
+
+class MomentSink:
+    """
+    Bounded, non-blocking moment queue drained by one background thread.
+
+    - ``writer(rows)`` persists a batch; any exception marks the batch failed.
+    - Failed batches are appended to a JSONL spill file and replayed once
+      the writer succeeds again.
+    - When the queue is full, ``enqueue`` waits up to ``enqueue_timeout``
+      seconds (backpressure) and then drops the row, counting the drop.
+    """
+
+    def __init__(
+        self,
+        writer: Callable[[list[dict]], None],
+        spill_path: Path,
+        queue_size: int = MOMENT_SINK_QUEUE_SIZE,
+        batch_size: int = MOMENT_SINK_BATCH_SIZE,
+        flush_interval: float = MOMENT_SINK_FLUSH_INTERVAL,
+        enqueue_timeout: float = MOMENT_SINK_ENQUEUE_TIMEOUT,
+        replay_interval: float = MOMENT_SINK_REPLAY_INTERVAL,
+    ):
+        self.writer = writer
+        self.spill_path = Path(spill_path)
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval
+        self.enqueue_timeout = enqueue_timeout
+        self.replay_interval = replay_interval
+        self._queue: queue.Queue = queue.Queue(maxsize=max(1, queue_size))
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._spill_lock = threading.Lock()
+        self._stats_lock = threading.Lock()
+        self._last_replay_attempt = 0.0
+        self.stats = {
+            "enqueued": 0,
+            "written": 0,
+            "batches": 0,
+            "dropped": 0,
+            "backpressure_waits": 0,
+            "flush_failures": 0,
+            "spilled": 0,
+            "replayed": 0,
+            "last_flush_ms": 0.0,
+            "last_error": None,
+        }
+
+    # ── Lifecycle ─────────────────────────────────────────────────
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        if self.running:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="mostar-moment-sink", daemon=True
+        )
+        self._thread.start()
+        print(
+            f"[MOMENT SINK] Writer started | batch={self.batch_size} "
+            f"interval={self.flush_interval}s queue={self._queue.maxsize}"
+        )
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Stop the writer after draining everything already queued."""
+        if not self.running:
+            return
+        self._stop.set()
+        self._thread.join(timeout=timeout)
+        self._thread = None
+        print(f"[MOMENT SINK] Writer stopped | {self.metrics()}")
+
+    # ── Producer side ─────────────────────────────────────────────
+    def enqueue(self, row: dict) -> bool:
+        try:
+            self._queue.put_nowait(row)
+        except queue.Full:
+            if self.enqueue_timeout <= 0:
+                self._bump("dropped")
+                return False
+            self._bump("backpressure_waits")
+            try:
+                self._queue.put(row, timeout=self.enqueue_timeout)
+            except queue.Full:
+                self._bump("dropped")
+                return False
+        self._bump("enqueued")
+        return True
+
+    # ── Writer side ───────────────────────────────────────────────
+    def _run(self) -> None:
+        while not self._stop.is_set() or not self._queue.empty():
+            batch = self._collect_batch()
+            if batch:
+                if self._flush(batch):
+                    self._maybe_replay()
+            elif self.spill_path.exists():
+                self._maybe_replay()
+
+    def _collect_batch(self) -> list[dict]:
+        batch: list[dict] = []
+        deadline = time.monotonic() + self.flush_interval
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _flush(self, batch: list[dict]) -> bool:
+        started = time.perf_counter()
+        try:
+            self.writer(batch)
+        except Exception as exc:
+            with self._stats_lock:
+                self.stats["flush_failures"] += 1
+                self.stats["last_error"] = str(exc)
+            print(f"[MOMENT SINK] ⚠️ Flush of {len(batch)} failed: {exc} — spilling")
+            self._spill(batch)
+            return False
+        with self._stats_lock:
+            self.stats["written"] += len(batch)
+            self.stats["batches"] += 1
+            self.stats["last_flush_ms"] = round(
+                (time.perf_counter() - started) * 1000, 3
+            )
+        return True
+
+    # ── Spill file ────────────────────────────────────────────────
+    def _spill(self, rows: list[dict]) -> None:
+        try:
+            self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+            with self._spill_lock, open(self.spill_path, "a", encoding="utf-8") as f:
+                for row in rows:
+                    f.write(json.dumps(row, ensure_ascii=False, default=str) + "\n")
+            self._bump("spilled", len(rows))
+        except OSError as exc:
+            print(f"[MOMENT SINK] ⚠️ Spill write failed: {exc} — {len(rows)} dropped")
+            self._bump("dropped", len(rows))
+
+    def _maybe_replay(self) -> None:
+        now = time.monotonic()
+        if not self.spill_path.exists():
+            return
+        if now - self._last_replay_attempt < self.replay_interval:
+            return
+        self._last_replay_attempt = now
+        self.replay_spill()
+
+    def replay_spill(self) -> int:
+        """Write spilled rows back through the writer. Returns rows replayed."""
+        replay_path = self.spill_path.with_suffix(self.spill_path.suffix + ".replay")
+        with self._spill_lock:
+            if not self.spill_path.exists():
+                return 0
+            os.replace(self.spill_path, replay_path)
+
+        replayed = 0
+        with open(replay_path, "r", encoding="utf-8") as f:
+            lines = [line for line in f if line.strip()]
+        for start in range(0, len(lines), self.batch_size):
+            chunk = [json.loads(line) for line in lines[start : start + self.batch_size]]
+            try:
+                self.writer(chunk)
+            except Exception as exc:
+                print(f"[MOMENT SINK] Replay paused: {exc}")
+                remaining = [json.loads(line) for line in lines[start:]]
+                with self._spill_lock, open(
+                    self.spill_path, "a", encoding="utf-8"
+                ) as f:
+                    for row in remaining:
+                        f.write(json.dumps(row, ensure_ascii=False, default=str) + "\n")
+                break
+            replayed += len(chunk)
+        replay_path.unlink(missing_ok=True)
+        if replayed:
+            self._bump("replayed", replayed)
+            print(f"[MOMENT SINK] ✅ Replayed {replayed} spilled moments")
+        return replayed
+
+    # ── Metrics ───────────────────────────────────────────────────
+    def _bump(self, key: str, amount: int = 1) -> None:
+        with self._stats_lock:
+            self.stats[key] += amount
+
+    def metrics(self) -> dict:
+        with self._stats_lock:
+            snapshot = dict(self.stats)
+        snapshot.update(
+            {
+                "running": self.running,
+                "queue_depth": self._queue.qsize(),
+                "queue_capacity": self._queue.maxsize,
+                "batch_size": self.batch_size,
+                "flush_interval_s": self.flush_interval,
+                "spill_pending": self.spill_path.exists(),
+            }
+        )
+        return snapshot
@@ -8,7 +8,11 @@ import hashlib
 import json
 import os
 import random
+from contextlib import aclosing
 from datetime import datetime, timezone
+from typing import AsyncIterator
+
+from core_engine.neo4j_pool import neo4j_registry
 
 try:
     from core_engine.mostar_moments_log import get_recent_moments, log_mostar_moment
@@ -200,38 +204,55 @@ class MoScriptEngine:
             }
 
         # ── Covenant check ────────────────────────────────────────
-        allowed, reason = self.validate_covenant(op, payload)
-        if not allowed:
-            print(f"[MOSCRIPT] BLOCKED: {op} — {reason}")
-            log_mostar_moment(
-                initiator="MoScriptEngine",
-                receiver="Grid.Guardian",
-                description=f"BLOCKED: '{op}' — {reason}",
-                trigger_type="covenant_violation",
-                resonance_score=1.0,
-                significance="ETHICAL",
-                approved=False,
-                layer="SOUL",
-            )
-            return {
-                "status": "denied",
-                "operation": op,
-                "error": reason,
-                "covenant_violation": True,
-                "pillar": FLAMECODEX["independent"],
-                "insignia": INSIGNIA,
-            }
+        denial = self._covenant_denial(op, payload)
+        if denial:
+            return denial
 
         # ── Execute ───────────────────────────────────────────────
         try:
             result = await self._execute_ritual(op, ritual)
+            if isinstance(result, dict) and result.get("covenant_violation"):
+                return result  # denied mid-ritual, as interpret_stream reports it
+            return self._ritual_envelope(op, ritual, result)
+        except Exception as e:
+            return self._disrupted_envelope(op, e)
+
+    # ── Ritual outcomes — shared by interpret / interpret_stream ──
+    def _covenant_denial(self, op: str, payload: dict) -> dict | None:
+        """Denied envelope (logged) if ``payload`` breaks the Covenant, else None."""
+        allowed, reason = self.validate_covenant(op, payload)
+        if allowed:
+            return None
+        print(f"[MOSCRIPT] BLOCKED: {op} — {reason}")
+        log_mostar_moment(
+            initiator="MoScriptEngine",
+            receiver="Grid.Guardian",
+            description=f"BLOCKED: '{op}' — {reason}",
+            trigger_type="covenant_violation",
+            resonance_score=1.0,
+            significance="ETHICAL",
+            approved=False,
+            layer="SOUL",
+        )
+        return {
+            "status": "denied",
+            "operation": op,
+            "error": reason,
+            "covenant_violation": True,
+            "pillar": FLAMECODEX["independent"],
+            "insignia": INSIGNIA,
+        }
 
-            # Check if ritual itself returned a failure status
-            status = "aligned"
-            if isinstance(result, dict) and "status" in result:
-                if result["status"] in ["denied", "disrupted", "failed"]:
-                    status = result["status"]
+    def _ritual_envelope(self, op: str, ritual: dict, result) -> dict:
+        # Check if ritual itself returned a failure status
+        status = "aligned"
+        if isinstance(result, dict) and "status" in result:
+            if result["status"] in ["denied", "disrupted", "failed"]:
+                status = result["status"]
 
+        # Callers that audit in aggregate (e.g. telemetry) pass audit=False;
+        # denials and disruptions are always logged.
+        if ritual.get("audit", True) or status != "aligned":
             log_mostar_moment(
                 initiator="MoScriptEngine",
                 receiver=ritual.get("target", "Grid.Mind"),
@@ -242,31 +263,72 @@ class MoScriptEngine:
                 layer="MIND",
             )
 
-            return {
-                "status": status,
-                "operation": op,
-                "result": result,
-                "blessing": self.bless(op),
-                "covenant": self.covenant_id,
-                "insignia": INSIGNIA,
-                "ase": "Àṣẹ.",
-            }
+        return {
+            "status": status,
+            "operation": op,
+            "result": result,
+            "blessing": self.bless(op),
+            "covenant": self.covenant_id,
+            "insignia": INSIGNIA,
+            "ase": "Àṣẹ.",
+        }
+
+    def _disrupted_envelope(self, op: str, e: Exception) -> dict:
+        log_mostar_moment(
+            initiator="MoScriptEngine",
+            receiver="Grid.Body",
+            description=f"Ritual '{op}' disrupted: {str(e)[:80]}",
+            trigger_type="error",
+            resonance_score=0.1,
+            layer="BODY",
+        )
+        return {
+            "status": "disrupted",
+            "operation": op,
+            "error": str(e),
+            "insignia": INSIGNIA,
+        }
+
+    # ── INTERPRET (streaming) ─────────────────────────────────────
+    async def interpret_stream(self, ritual: dict) -> AsyncIterator[dict]:
+        """
+        Streaming form of ``interpret``. Yields event dicts as the ritual runs:
+          { "type": "stage", "stage": str, "text": str }  — a pass completed
+          { "type": "token", "text": str }                — partial answer
+        and always ends with { "type": "done", **envelope }, where envelope is
+        exactly what ``interpret`` would have returned.
+
+        The Covenant is checked before anything streams, on pass 1's output
+        before it is shown or fed to pass 2, and on pass 2's tokens as they
+        arrive, so a violation ends the stream with a denied envelope.
+        Rituals without a streaming handler run through ``interpret`` and
+        yield a single "done" event.
+        """
+        op = ritual.get("operation")
+        handler = {"route_reasoning": self._route_reasoning_stream}.get(op)
+        if handler is None:
+            yield {"type": "done", **(await self.interpret(ritual))}
+            return
+
+        self.execution_count += 1
+        payload = ritual.get("payload", {})
+        denial = self._covenant_denial(op, payload)
+        if denial:
+            yield {"type": "done", **denial}
+            return
 
+        try:
+            async for event in handler(op, payload):
+                if event["type"] == "denied":
+                    yield {"type": "done", **event["envelope"]}
+                    return
+                if event["type"] == "result":
+                    envelope = self._ritual_envelope(op, ritual, event["result"])
+                    yield {"type": "done", **envelope}
+                    return
+                yield event
         except Exception as e:
-            log_mostar_moment(
-                initiator="MoScriptEngine",
-                receiver="Grid.Body",
-                description=f"Ritual '{op}' disrupted: {str(e)[:80]}",
-                trigger_type="error",
-                resonance_score=0.1,
-                layer="BODY",
-            )
-            return {
-                "status": "disrupted",
-                "operation": op,
-                "error": str(e),
-                "insignia": INSIGNIA,
-            }
+            yield {"type": "done", **self._disrupted_envelope(op, e)}
 
     # ── Ritual executor ───────────────────────────────────────────
     async def _execute_ritual(self, op: str, ritual: dict):
@@ -408,32 +470,99 @@ class MoScriptEngine:
         Orchestrates the Triad of Coherence: Linguistic Parsing -> Logical Deduction.
         Pass 1: Qwen (reason_ibibio)   - Linguistic Normalization
         Pass 2: Mistral (reason_logic) - Logical Deduction with context.
+        Each pass's output is held to the Covenant, as in the streaming form.
         """
-        query = payload.get("query")
-        purpose = payload.get("purpose")
-
-        if not query or not purpose:
-            raise ValueError("Ritual disrupted: Query and Purpose are non-negotiable.")
+        op = "route_reasoning"
+        query, purpose = self._reasoning_request(payload)
 
         from core_engine.sov_utils import call_sovereign_model
 
         # Pass 1: Linguistic Expert (Qwen-based)
-        qwen_model = os.getenv("OLLAMA_MODEL_DCX0", "Mostar/mostar-ai:dcx0")
-        linguistic = await call_sovereign_model(
-            prompt=f"Parse and normalize this Ibibio/English query: {query}",
-            model=qwen_model,
-            system="You are the MoStar Linguistic Parser. Purge ambiguity. Extract pure intent.",
-        )
+        linguistic = await call_sovereign_model(**self._linguistic_pass(query))
+        normalized = linguistic.get("response", query)
+        denial = self._covenant_denial(op, {"lingua_parsed": normalized})
+        if denial:
+            return denial
 
         # Pass 2: Logic Expert (Mistral-based)
-        mistral_model = os.getenv("OLLAMA_MODEL_DCX1", "Mostar/mostar-ai:dcx1")
-        normalized = linguistic.get("response", query)
-        deduction = await call_sovereign_model(
-            prompt=f"Logic context: {normalized}\n\nDecision needed for query: {query}",
-            model=mistral_model,
-            system="You are the MoStar Logic Engine (Mistral/Ifá). Enforce Covenant. Provide decree.",
+        deduction = await call_sovereign_model(**self._logic_pass(query, normalized))
+        denial = self._covenant_denial(op, {"logic_deduced": deduction.get("response")})
+        if denial:
+            return denial
+
+        return self._reasoning_result(
+            query, purpose, linguistic.get("response"), deduction.get("response")
         )
 
+    async def _route_reasoning_stream(self, op: str, payload: dict) -> AsyncIterator[dict]:
+        """
+        ``_route_reasoning`` with the decree streamed token by token. Pass 1
+        is short and feeds pass 2, so only pass 2 streams. Nothing reaches the
+        client before it has been held to the Covenant.
+        """
+        query, purpose = self._reasoning_request(payload)
+
+        from core_engine.sov_utils import call_sovereign_model, stream_sovereign_model
+
+        linguistic = await call_sovereign_model(**self._linguistic_pass(query))
+        normalized = linguistic.get("response", query)
+        denial = self._covenant_denial(op, {"lingua_parsed": normalized})
+        if denial:
+            yield {"type": "denied", "envelope": denial}
+            return
+        yield {"type": "stage", "stage": "lingua_parsed", "text": linguistic.get("response")}
+
+        # Each token is scanned with just enough of the text before it to
+        # catch a deny term split across tokens.
+        deny = self.codex_rules["deny"]
+        overlap = max((len(term) for term in deny), default=1) - 1
+        parts, tail = [], ""
+        async with aclosing(stream_sovereign_model(**self._logic_pass(query, normalized))) as tokens:
+            async for text in tokens:
+                parts.append(text)
+                window = tail + text.lower()
+                tail = window[-overlap:] if overlap else ""
+                if any(term in window for term in deny):
+                    denial = self._covenant_denial(op, {"logic_deduced": "".join(parts)})
+                    if denial:
+                        yield {"type": "denied", "envelope": denial}
+                        return
+                yield {"type": "token", "text": text}
+
+        yield {
+            "type": "result",
+            "result": self._reasoning_result(
+                query, purpose, linguistic.get("response"), "".join(parts)
+            ),
+        }
+
+    @staticmethod
+    def _reasoning_request(payload: dict) -> tuple[str, str]:
+        query = payload.get("query")
+        purpose = payload.get("purpose")
+        if not query or not purpose:
+            raise ValueError("Ritual disrupted: Query and Purpose are non-negotiable.")
+        return query, purpose
+
+    @staticmethod
+    def _linguistic_pass(query: str) -> dict:
+        return {
+            "prompt": f"Parse and normalize this Ibibio/English query: {query}",
+            "model": os.getenv("OLLAMA_MODEL_DCX0", "Mostar/mostar-ai:dcx0"),
+            "system": "You are the MoStar Linguistic Parser. Purge ambiguity. Extract pure intent.",
+        }
+
+    @staticmethod
+    def _logic_pass(query: str, normalized: str) -> dict:
+        return {
+            "prompt": f"Logic context: {normalized}\n\nDecision needed for query: {query}",
+            "model": os.getenv("OLLAMA_MODEL_DCX1", "Mostar/mostar-ai:dcx1"),
+            "system": "You are the MoStar Logic Engine (Mistral/Ifá). Enforce Covenant. Provide decree.",
+        }
+
+    def _reasoning_result(
+        self, query: str, purpose: str, lingua_parsed, logic_deduced
+    ) -> dict:
         resonance = 0.95
         log_mostar_moment(
             initiator="MoScriptEngine",
@@ -446,8 +575,8 @@ class MoScriptEngine:
 
         return {
             "query": query,
-            "lingua_parsed": linguistic.get("response"),
-            "logic_deduced": deduction.get("response"),
+            "lingua_parsed": lingua_parsed,
+            "logic_deduced": logic_deduced,
             "model_trace": ["qwen", "mistral"],
             "resonance": resonance,
             "purpose": purpose,
@@ -474,7 +603,7 @@ class MoScriptEngine:
         result = await call_sovereign_model(prompt, model_name, system)
         return result
 
-    def _neo4j_traverse(self, payload: dict) -> dict:
+    async def _neo4j_traverse(self, payload: dict) -> dict:
         """Governed graph traversal ritual. Blocks dangerous authority."""
         cypher = payload.get("cypher", "")
         purpose = payload.get("purpose")
@@ -500,48 +629,31 @@ class MoScriptEngine:
                 f"Covenant forbidden: dangerous operation detected in traversal: {cypher}"
             )
 
-        # Execute query via sovereign driver
-        def _run_query():
-            from neo4j import GraphDatabase, TrustAll
-
-            uri = os.getenv("NEO4J_URI", "bolt://localhost:7687")
-            user = os.getenv("NEO4J_USER", "neo4j")
-            pw = os.getenv("NEO4J_PASSWORD", "")
-            scheme = uri.split("://", 1)[0]
-
-            stage = "driver_create"
-            try:
-                driver_kwargs = {"auth": (user, pw)}
-                if uri.startswith(
-                    ("neo4j+s://", "bolt+s://", "neo4j+ssc://", "bolt+ssc://")
-                ):
-                    driver_kwargs["trusted_certificates"] = TrustAll()
-                driver = GraphDatabase.driver(uri, **driver_kwargs)
-                stage = "session_open"
-                with driver.session() as session:
-                    stage = "query_run"
-                    res = session.run(cypher, **params)
-                    return [dict(r) for r in res]
-            except Exception as exc:
-                print(
-                    f"[MOSCRIPT][neo4j_traverse] failed purpose={purpose} "
-                    f"stage={stage} scheme={scheme} uri={uri} error={exc}"
-                )
-                raise
-            finally:
-                if "driver" in locals():
-                    driver.close()
-
-        results = _run_query()
+        # Execute query via the shared sovereign driver pool
+        uri = os.getenv("NEO4J_URI", "bolt://localhost:7687")
+        scheme = uri.split("://", 1)[0]
+        stage = "session_lease"
+        try:
+            async with neo4j_registry.async_session() as session:
+                stage = "query_run"
+                res = await session.run(cypher, **params)
+                results = [dict(r) async for r in res]
+        except Exception as exc:
+            print(
+                f"[MOSCRIPT][neo4j_traverse] failed purpose={purpose} "
+                f"stage={stage} scheme={scheme} uri={uri} error={exc}"
+            )
+            raise
 
-        log_mostar_moment(
-            initiator="MoScriptEngine",
-            receiver="Grid.Soul",
-            description=f"Graph traversal | Purpose: {purpose} | Results: {len(results)}",
-            trigger_type="neo4j_traverse",
-            resonance_score=0.9,
-            layer="SOUL",
-        )
+        if payload.get("audit", True):
+            log_mostar_moment(
+                initiator="MoScriptEngine",
+                receiver="Grid.Soul",
+                description=f"Graph traversal | Purpose: {purpose} | Results: {len(results)}",
+                trigger_type="neo4j_traverse",
+                resonance_score=0.9,
+                layer="SOUL",
+            )
 
         return {
             "traversal": "authorized",
@@ -684,26 +796,14 @@ class MoScriptEngine:
         }
 
     async def _set_agent_strength(self, payload: dict):
-        import os
-
-        from neo4j import GraphDatabase, TrustAll
-
         agent_id = payload.get("agent_id")
         strength = payload.get("new_strength")
 
         if agent_id is None or strength is None:
             raise ValueError("Missing agent_id or new_strength for mutation.")
 
-        _uri = os.getenv("NEO4J_URI", "bolt://localhost:7687")
-        _user = os.getenv("NEO4J_USER", "neo4j")
-        _pw = os.getenv("NEO4J_PASSWORD", "")
-        _driver_kwargs = {"auth": (_user, _pw)}
-        if _uri.startswith(("neo4j+s://", "bolt+s://", "neo4j+ssc://", "bolt+ssc://")):
-            _driver_kwargs["trusted_certificates"] = TrustAll()
-        driver = GraphDatabase.driver(_uri, **_driver_kwargs)
-
-        with driver.session() as session:
-            session.run(
+        async with neo4j_registry.async_session() as session:
+            result = await session.run(
                 """
                 MATCH (a:Agent)
                 WHERE a.id = $aid OR id(a) = $aid
@@ -713,8 +813,8 @@ class MoScriptEngine:
                 aid=agent_id,
                 strength=strength,
             )
+            await result.consume()
 
-        driver.close()
         return {
             "status": "updated",
             "agent_id": agent_id,
@@ -19,6 +19,9 @@ _growth_protocol = importlib.import_module("core_engine.growth_protocol")
 build_moment_fingerprint = _growth_protocol.build_moment_fingerprint
 build_moment_quantum_id = _growth_protocol.build_moment_quantum_id
 ensure_growth_constraints_sync = _growth_protocol.ensure_growth_constraints_sync
+neo4j_registry = importlib.import_module("core_engine.neo4j_pool").neo4j_registry
+MomentSink = importlib.import_module("core_engine.moment_sink").MomentSink
+MomentAggregates = importlib.import_module("core_engine.moment_aggregates").MomentAggregates
 
 
 def _load_env_file(env_path: Path) -> dict[str, str]:
@@ -42,20 +45,63 @@ NEO4J_URI = _ENV_VALUES.get("NEO4J_URI") or os.getenv(
 NEO4J_USER = _ENV_VALUES.get("NEO4J_USER") or os.getenv("NEO4J_USER", "neo4j")
 NEO4J_PASS = _ENV_VALUES.get("NEO4J_PASSWORD") or os.getenv("NEO4J_PASSWORD", "")
 MOMENT_DEDUP_WINDOW_SECONDS = int(os.getenv("MOMENT_DEDUP_WINDOW_SECONDS", "30"))
+MOMENT_BATCH_CHUNK_SIZE = int(os.getenv("MOMENT_BATCH_CHUNK_SIZE", "1000"))
+MOMENT_SPILL_PATH = Path(
+    os.getenv("MOMENT_SPILL_PATH") or BACKEND_DIR / "data" / "moment_spill.jsonl"
+)
 _RECENT_MOMENT_CACHE: dict[str, datetime] = {}
 _CONSTRAINTS_READY = False
 
+# One statement for any number of moments — rows carry their own params.
+# prev_ts / prev_res are the node's values before this write (null for new
+# nodes) and feed the incremental telemetry aggregates.
+MOMENT_ROWS_CYPHER = """
+UNWIND $rows AS row
+MERGE (m:MoStarMoment {fingerprint: row.fingerprint})
+ON CREATE SET
+    m.quantum_id      = row.quantum_id,
+    m.created_at      = datetime(row.timestamp),
+    m.first_seen_at   = datetime(row.timestamp),
+    m.seen_count      = 1
+WITH row, m, m.timestamp AS prev_ts, m.resonance_score AS prev_res
+SET
+    m.timestamp       = datetime(row.timestamp),
+    m.last_seen_at    = datetime(row.timestamp),
+    m.initiator       = row.initiator,
+    m.receiver        = row.receiver,
+    m.description     = row.description,
+    m.trigger_type    = row.trigger_type,
+    m.resonance_score = row.resonance_score,
+    m.significance    = row.significance,
+    m.approved        = row.approved,
+    m.layer           = row.layer,
+    m.insignia        = row.insignia,
+    m.quantum_id      = coalesce(m.quantum_id, row.quantum_id),
+    m.seen_count      = CASE
+        WHEN m.first_seen_at = datetime(row.timestamp) THEN m.seen_count
+        ELSE coalesce(m.seen_count, 1) + 1
+    END
+RETURN row.idx AS idx,
+       m.quantum_id AS quantum_id,
+       m.seen_count AS seen_count,
+       prev_ts,
+       prev_res
+"""
+
 
 def _get_driver():
     try:
-        from neo4j import GraphDatabase
-
-        return GraphDatabase.driver(NEO4J_URI, auth=(NEO4J_USER, NEO4J_PASS))
+        return neo4j_registry.get_driver(NEO4J_URI, NEO4J_USER, NEO4J_PASS)
     except Exception as e:
         print(f"[MOMENT] Neo4j driver unavailable: {e}")
         return None
 
 
+def _session():
+    """Lease a session from the shared, process-wide driver pool."""
+    return neo4j_registry.session(NEO4J_URI, NEO4J_USER, NEO4J_PASS)
+
+
 def _generate_moment_fingerprint(
     initiator: str,
     receiver: str,
@@ -86,7 +132,7 @@ def _ensure_constraints(driver) -> None:
     if _CONSTRAINTS_READY or not driver:
         return
     try:
-        with driver.session() as session:
+        with _session() as session:
             ensure_growth_constraints_sync(session)
         _CONSTRAINTS_READY = True
     except Exception as exc:
@@ -104,7 +150,7 @@ def _is_recent_duplicate(driver, fingerprint: str) -> bool:
 
     cutoff = (now - timedelta(seconds=MOMENT_DEDUP_WINDOW_SECONDS)).isoformat()
     try:
-        with driver.session() as session:
+        with _session() as session:
             record = session.run(
                 """
                 MATCH (m:MoStarMoment {fingerprint: $fingerprint})
@@ -127,6 +173,52 @@ def _remember_fingerprint(fingerprint: str):
     _RECENT_MOMENT_CACHE[fingerprint] = now
 
 
+# ── INCREMENTAL AGGREGATES ────────────────────────────────────────
+moment_aggregates = MomentAggregates(session_factory=_session)
+
+
+def _observe_merged(rows: list[dict], records: list[dict]) -> None:
+    """Feed committed MOMENT_ROWS_CYPHER results into the aggregates."""
+    moment_aggregates.observe_many(
+        (rows[r["idx"]], r.get("prev_ts"), r.get("prev_res")) for r in records
+    )
+
+
+def start_moment_aggregates() -> None:
+    """Reconcile now, then every MOMENT_AGGREGATES_RECONCILE_INTERVAL seconds."""
+    moment_aggregates.start()
+
+
+def stop_moment_aggregates() -> None:
+    moment_aggregates.stop()
+
+
+# ── ASYNC SINK ────────────────────────────────────────────────────
+def _write_moment_rows(rows: list[dict]) -> None:
+    """Sink writer — one UNWIND round trip per batch. Raises on failure."""
+    driver = _get_driver()
+    if not driver:
+        raise ConnectionError("Neo4j driver unavailable")
+    _ensure_constraints(driver)
+    rows = [{**row, "idx": idx} for idx, row in enumerate(rows)]
+    with _session() as session:
+        records = session.run(MOMENT_ROWS_CYPHER, {"rows": rows}).data()
+    _observe_merged(rows, records)
+
+
+moment_sink = MomentSink(writer=_write_moment_rows, spill_path=MOMENT_SPILL_PATH)
+
+
+def start_moment_sink() -> None:
+    """Route log_mostar_moment through the background writer."""
+    moment_sink.start()
+
+
+def stop_moment_sink() -> None:
+    """Drain queued moments and stop the background writer."""
+    moment_sink.stop()
+
+
 # ── CORE FUNCTION ─────────────────────────────────────────────────
 def log_mostar_moment(
     initiator: str,
@@ -141,6 +233,8 @@ def log_mostar_moment(
     """
     Log a MoStarMoment to Neo4j.
     Every Grid interaction — voice, verdict, agent action — is a Moment.
+    When the moment sink is running the write is queued and this returns
+    immediately; otherwise it writes inline.
     Falls back to console log if Neo4j is unreachable.
     """
     timestamp = datetime.now(timezone.utc).isoformat()
@@ -164,45 +258,27 @@ def log_mostar_moment(
         "insignia": "MSTR-⚡",
     }
 
+    # ── Queue for the background writer ───────────────────────────
+    if moment_sink.running:
+        queued = moment_sink.enqueue(moment)
+        if queued:
+            _remember_fingerprint(fingerprint)
+        else:
+            _console_log(moment)
+        return {**moment, "logged": False, "queued": queued, "seen_count": 1}
+
     # ── Write to Neo4j ────────────────────────────────────────────
     driver = _get_driver()
     if driver:
         try:
             _ensure_constraints(driver)
-            with driver.session() as session:
-                record = session.run(
-                    """
-                    MERGE (m:MoStarMoment {fingerprint: $fingerprint})
-                    ON CREATE SET
-                        m.quantum_id      = $quantum_id,
-                        m.created_at      = datetime($timestamp),
-                        m.first_seen_at   = datetime($timestamp),
-                        m.seen_count      = 1
-                    SET
-                        m.timestamp       = datetime($timestamp),
-                        m.last_seen_at    = datetime($timestamp),
-                        m.initiator       = $initiator,
-                        m.receiver        = $receiver,
-                        m.description     = $description,
-                        m.trigger_type    = $trigger_type,
-                        m.resonance_score = $resonance_score,
-                        m.significance    = $significance,
-                        m.approved        = $approved,
-                        m.layer           = $layer,
-                        m.insignia        = $insignia,
-                        m.quantum_id      = coalesce(m.quantum_id, $quantum_id),
-                        m.seen_count      = CASE
-                            WHEN m.first_seen_at = datetime($timestamp) THEN m.seen_count
-                            ELSE coalesce(m.seen_count, 1) + 1
-                        END
-                    RETURN m.quantum_id AS quantum_id,
-                           m.seen_count AS seen_count
-                    """,
-                    moment,
-                ).single()
+            rows = [{**moment, "idx": 0}]
+            with _session() as session:
+                records = session.run(MOMENT_ROWS_CYPHER, {"rows": rows}).data()
+            _observe_merged(rows, records)
+            record = records[0] if records else None
             seen_count = int(record["seen_count"]) if record else 1
             _remember_fingerprint(fingerprint)
-            driver.close()
             if seen_count > 1:
                 print(
                     f"[MOMENT] 🔁 Neo4j merged [{quantum_id[:8]}] {initiator} → {receiver} (seen_count={seen_count})"
@@ -232,87 +308,92 @@ def _console_log(moment: dict):
 
 
 # ── BATCH LOGGING ─────────────────────────────────────────────────
-def log_moments_batch(moments: list[dict]) -> list[dict]:
-    """Log multiple moments in one Neo4j transaction."""
-    driver = _get_driver()
-    results = []
-    if not driver:
-        for m in moments:
-            results.append(log_mostar_moment(**m))
-        return results
+def _moment_row(m: dict, idx: int) -> dict:
+    initiator = m.get("initiator", "Grid")
+    receiver = m.get("receiver", "Grid")
+    description = m.get("description", "")
+    trigger_type = m.get("trigger_type", "general")
+    layer = m.get("layer", "MIND")
+    fingerprint = _generate_moment_fingerprint(
+        initiator, receiver, description, trigger_type, layer
+    )
+    return {
+        "idx": idx,
+        "quantum_id": _generate_quantum_id(fingerprint),
+        "fingerprint": fingerprint,
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "initiator": initiator,
+        "receiver": receiver,
+        "description": description,
+        "trigger_type": trigger_type,
+        "resonance_score": m.get("resonance_score", 0.85),
+        "significance": m.get("significance", "STANDARD"),
+        "approved": m.get("approved", True),
+        "layer": layer,
+        "insignia": "MSTR-⚡",
+    }
 
-    try:
-        _ensure_constraints(driver)
-        with driver.session() as session:
-            with session.begin_transaction() as tx:
-                for m in moments:
-                    fingerprint = _generate_moment_fingerprint(
-                        m.get("initiator", "Grid"),
-                        m.get("receiver", "Grid"),
-                        m.get("description", ""),
-                        m.get("trigger_type", "general"),
-                        m.get("layer", "MIND"),
-                    )
-                    quantum_id = _generate_quantum_id(fingerprint)
-                    record = tx.run(
-                        """
-                        MERGE (moment:MoStarMoment {fingerprint: $fingerprint})
-                        ON CREATE SET
-                            moment.quantum_id    = $quantum_id,
-                            moment.created_at    = datetime($timestamp),
-                            moment.first_seen_at = datetime($timestamp),
-                            moment.seen_count    = 1
-                        SET
-                            moment.timestamp       = datetime($timestamp),
-                            moment.last_seen_at    = datetime($timestamp),
-                            moment.initiator       = $initiator,
-                            moment.receiver        = $receiver,
-                            moment.description     = $description,
-                            moment.trigger_type    = $trigger_type,
-                            moment.resonance_score = $resonance_score,
-                            moment.significance    = $significance,
-                            moment.approved        = $approved,
-                            moment.layer           = $layer,
-                            moment.insignia        = 'MSTR-⚡',
-                            moment.quantum_id      = coalesce(moment.quantum_id, $quantum_id),
-                            moment.seen_count      = CASE
-                                WHEN moment.first_seen_at = datetime($timestamp) THEN moment.seen_count
-                                ELSE coalesce(moment.seen_count, 1) + 1
-                            END
-                        RETURN moment.quantum_id AS quantum_id,
-                               moment.seen_count AS seen_count
-                        """,
-                        {
-                            "quantum_id": quantum_id,
-                            "fingerprint": fingerprint,
-                            "timestamp": datetime.now(timezone.utc).isoformat(),
-                            "initiator": m.get("initiator", "Grid"),
-                            "receiver": m.get("receiver", "Grid"),
-                            "description": m.get("description", ""),
-                            "trigger_type": m.get("trigger_type", "general"),
-                            "resonance_score": m.get("resonance_score", 0.85),
-                            "significance": m.get("significance", "STANDARD"),
-                            "approved": m.get("approved", True),
-                            "layer": m.get("layer", "MIND"),
-                        },
-                    ).single()
-                    results.append(
-                        {
-                            "quantum_id": record["quantum_id"]
-                            if record
-                            else quantum_id,
-                            "fingerprint": fingerprint,
-                            "logged": True,
-                            "seen_count": int(record["seen_count"]) if record else 1,
-                        }
-                    )
-                tx.commit()
-        print(f"[MOMENT] ✅ Batch logged {len(results)} moments to Neo4j")
-    except Exception as e:
-        print(f"[MOMENT] ⚠️ Batch failed: {e}")
-    finally:
-        driver.close()
 
+def _merge_moment_rows(tx, rows: list[dict]) -> list[dict]:
+    return tx.run(MOMENT_ROWS_CYPHER, {"rows": rows}).data()
+
+
+def log_moments_batch(
+    moments: list[dict], chunk_size: int = MOMENT_BATCH_CHUNK_SIZE
+) -> list[dict]:
+    """
+    Log many moments with one parameterised UNWIND statement per chunk.
+    Returns one result per input moment, in input order. Each chunk is its
+    own write transaction — a failed chunk marks only its rows
+    logged=False (with the error) and the remaining chunks still commit.
+    """
+    driver = _get_driver()
+    if not driver:
+        return [log_mostar_moment(**m) for m in moments]
+
+    chunk_size = max(1, int(chunk_size))
+    rows = [_moment_row(m, idx) for idx, m in enumerate(moments)]
+    results: list[dict] = [
+        {
+            "quantum_id": row["quantum_id"],
+            "fingerprint": row["fingerprint"],
+            "logged": False,
+            "seen_count": 1,
+            "chunk": idx // chunk_size,
+        }
+        for idx, row in enumerate(rows)
+    ]
+
+    _ensure_constraints(driver)
+    failed_chunks = 0
+    for chunk_no, start in enumerate(range(0, len(rows), chunk_size)):
+        chunk = rows[start : start + chunk_size]
+        try:
+            with _session() as session:
+                records = session.execute_write(_merge_moment_rows, chunk)
+        except Exception as e:
+            failed_chunks += 1
+            print(
+                f"[MOMENT] ⚠️ Batch chunk {chunk_no} "
+                f"(rows {start}-{start + len(chunk) - 1}) failed: {e}"
+            )
+            for row in chunk:
+                results[row["idx"]]["error"] = str(e)
+            continue
+        _observe_merged(rows, records)
+        for record in records:
+            result = results[record["idx"]]
+            result["quantum_id"] = record["quantum_id"] or result["quantum_id"]
+            result["seen_count"] = int(record["seen_count"] or 1)
+            result["logged"] = True
+        for row in chunk:
+            _remember_fingerprint(row["fingerprint"])
+
+    logged = sum(1 for r in results if r["logged"])
+    print(
+        f"[MOMENT] ✅ Batch logged {logged}/{len(results)} moments to Neo4j "
+        f"({failed_chunks} failed chunk(s), chunk_size={chunk_size})"
+    )
     return results
 
 
@@ -323,7 +404,7 @@ def get_recent_moments(limit: int = 10) -> list[dict]:
     if not driver:
         return []
     try:
-        with driver.session() as session:
+        with _session() as session:
             result = session.run(
                 """
                 MATCH (m:MoStarMoment)
@@ -332,7 +413,6 @@ def get_recent_moments(limit: int = 10) -> list[dict]:
                 {"limit": limit},
             )
             moments = [dict(r["m"]) for r in result]
-        driver.close()
         return moments
     except Exception as e:
         print(f"[MOMENT] Query failed: {e}")
@@ -0,0 +1,278 @@
+# ═══════════════════════════════════════════════════════════════════
+# MOSTAR GRID — NEO4J DRIVER REGISTRY
+# The Flame Architect — MSTR-⚡ — MoStar Industries
+# "One pool per process. Every ritual borrows — none rebuild."
+# ═══════════════════════════════════════════════════════════════════
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, Optional
+
+SECURE_SCHEMES = ("neo4j+s://", "bolt+s://", "neo4j+ssc://", "bolt+ssc://")
+
+NEO4J_POOL_SIZE = int(os.getenv("NEO4J_POOL_SIZE", "50"))
+NEO4J_POOL_ACQUIRE_TIMEOUT = float(os.getenv("NEO4J_POOL_ACQUIRE_TIMEOUT", "60"))
+NEO4J_MAX_CONNECTION_LIFETIME = int(os.getenv("NEO4J_MAX_CONNECTION_LIFETIME", "3600"))
+
+
+def _resolve_credentials(
+    uri: Optional[str], user: Optional[str], password: Optional[str]
+) -> tuple[str, str, str]:
+    return (
+        uri or os.getenv("NEO4J_URI", "bolt://localhost:7687"),
+        user or os.getenv("NEO4J_USER", "neo4j"),
+        password if password is not None else os.getenv("NEO4J_PASSWORD", ""),
+    )
+
+
+def build_driver_kwargs(uri: str, user: str, password: str, pool_size: int) -> dict:
+    """Driver config shared by the sync and async pools."""
+    kwargs: dict[str, Any] = {
+        "auth": (user, password),
+        "max_connection_pool_size": pool_size,
+        "connection_acquisition_timeout": NEO4J_POOL_ACQUIRE_TIMEOUT,
+        "max_connection_lifetime": NEO4J_MAX_CONNECTION_LIFETIME,
+    }
+    if uri.startswith(SECURE_SCHEMES):
+        from neo4j import TrustAll
+
+        kwargs["trusted_certificates"] = TrustAll()
+    return kwargs
+
+
+class _LeaseStats:
+    """Counters for one pool flavour (sync or async)."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.in_use = 0
+        self.peak_in_use = 0
+        self.acquisitions = 0
+        self.timeouts = 0
+        self.wait_total_ms = 0.0
+        self.wait_max_ms = 0.0
+
+    def acquired(self, waited_s: float) -> None:
+        waited_ms = waited_s * 1000
+        with self._lock:
+            self.in_use += 1
+            self.peak_in_use = max(self.peak_in_use, self.in_use)
+            self.acquisitions += 1
+            self.wait_total_ms += waited_ms
+            self.wait_max_ms = max(self.wait_max_ms, waited_ms)
+
+    def released(self) -> None:
+        with self._lock:
+            self.in_use -= 1
+
+    def timed_out(self) -> None:
+        with self._lock:
+            self.timeouts += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            avg = self.wait_total_ms / self.acquisitions if self.acquisitions else 0.0
+            return {
+                "in_use": self.in_use,
+                "peak_in_use": self.peak_in_use,
+                "acquisitions": self.acquisitions,
+                "timeouts": self.timeouts,
+                "acquire_wait_avg_ms": round(avg, 3),
+                "acquire_wait_max_ms": round(self.wait_max_ms, 3),
+            }
+
+
+class Neo4jDriverRegistry:
+    """
+    Process-wide Neo4j drivers, keyed by (uri, user).
+    Sessions are leased against a budget equal to the driver pool size,
+    so in-use counts and acquisition wait are observable from here.
+    """
+
+    def __init__(
+        self,
+        pool_size: int = NEO4J_POOL_SIZE,
+        acquire_timeout: float = NEO4J_POOL_ACQUIRE_TIMEOUT,
+    ):
+        self.pool_size = pool_size
+        self.acquire_timeout = acquire_timeout
+        self._lock = threading.Lock()
+        self._drivers: dict[tuple[str, str], Any] = {}
+        self._async_drivers: dict[tuple[str, str], Any] = {}
+        self._async_loop: Optional[asyncio.AbstractEventLoop] = None
+        # Drivers left behind by a loop change whose loop could not close them
+        self._retired_async_drivers: list[Any] = []
+        self._leases = threading.BoundedSemaphore(pool_size)
+        self._async_leases: Optional[asyncio.Semaphore] = None
+        self._sync_stats = _LeaseStats()
+        self._async_stats = _LeaseStats()
+
+    # ── Sync ──────────────────────────────────────────────────────
+    def get_driver(
+        self,
+        uri: Optional[str] = None,
+        user: Optional[str] = None,
+        password: Optional[str] = None,
+    ):
+        uri, user, password = _resolve_credentials(uri, user, password)
+        key = (uri, user)
+        driver = self._drivers.get(key)
+        if driver is not None:
+            return driver
+        with self._lock:
+            driver = self._drivers.get(key)
+            if driver is None:
+                from neo4j import GraphDatabase
+
+                driver = GraphDatabase.driver(
+                    uri, **build_driver_kwargs(uri, user, password, self.pool_size)
+                )
+                self._drivers[key] = driver
+                print(f"[NEO4J POOL] Sync driver opened | {uri} | pool={self.pool_size}")
+        return driver
+
+    @contextmanager
+    def session(
+        self,
+        uri: Optional[str] = None,
+        user: Optional[str] = None,
+        password: Optional[str] = None,
+        **session_kwargs,
+    ):
+        driver = self.get_driver(uri, user, password)
+        started = time.perf_counter()
+        if not self._leases.acquire(timeout=self.acquire_timeout):
+            self._sync_stats.timed_out()
+            raise TimeoutError(
+                f"Neo4j session lease timed out after {self.acquire_timeout}s"
+            )
+        self._sync_stats.acquired(time.perf_counter() - started)
+        try:
+            with driver.session(**session_kwargs) as session:
+                yield session
+        finally:
+            self._leases.release()
+            self._sync_stats.released()
+
+    # ── Async ─────────────────────────────────────────────────────
+    def _bind_async_loop(self) -> None:
+        # Async drivers belong to the loop that created them. A new loop
+        # (e.g. a fresh asyncio.run) gets fresh drivers and lease budget.
+        loop = asyncio.get_running_loop()
+        if self._async_loop is loop:
+            return
+        self._retire_async_drivers()
+        self._async_loop = loop
+        self._async_drivers = {}
+        self._async_leases = asyncio.Semaphore(self.pool_size)
+
+    def _retire_async_drivers(self) -> None:
+        # Close the previous loop's drivers on that loop while it still runs;
+        # otherwise keep them so aclose() can release them.
+        drivers = list(self._async_drivers.values())
+        if not drivers:
+            return
+        old_loop = self._async_loop
+        if old_loop is not None and old_loop.is_running() and not old_loop.is_closed():
+            for driver in drivers:
+                asyncio.run_coroutine_threadsafe(self._close_async_driver(driver), old_loop)
+        else:
+            self._retired_async_drivers.extend(drivers)
+        print(f"[NEO4J POOL] Retired {len(drivers)} async driver(s) from a previous event loop")
+
+    @staticmethod
+    async def _close_async_driver(driver) -> None:
+        try:
+            await driver.close()
+        except Exception as exc:
+            print(f"[NEO4J POOL] Async driver close failed: {exc}")
+
+    def get_async_driver(
+        self,
+        uri: Optional[str] = None,
+        user: Optional[str] = None,
+        password: Optional[str] = None,
+    ):
+        self._bind_async_loop()
+        uri, user, password = _resolve_credentials(uri, user, password)
+        key = (uri, user)
+        driver = self._async_drivers.get(key)
+        if driver is None:
+            from neo4j import AsyncGraphDatabase
+
+            driver = AsyncGraphDatabase.driver(
+                uri, **build_driver_kwargs(uri, user, password, self.pool_size)
+            )
+            self._async_drivers[key] = driver
+            print(f"[NEO4J POOL] Async driver opened | {uri} | pool={self.pool_size}")
+        return driver
+
+    @asynccontextmanager
+    async def async_session(
+        self,
+        uri: Optional[str] = None,
+        user: Optional[str] = None,
+        password: Optional[str] = None,
+        **session_kwargs,
+    ):
+        driver = self.get_async_driver(uri, user, password)
+        leases = self._async_leases
+        started = time.perf_counter()
+        try:
+            await asyncio.wait_for(leases.acquire(), timeout=self.acquire_timeout)
+        except asyncio.TimeoutError:
+            self._async_stats.timed_out()
+            raise TimeoutError(
+                f"Neo4j async session lease timed out after {self.acquire_timeout}s"
+            )
+        self._async_stats.acquired(time.perf_counter() - started)
+        try:
+            async with driver.session(**session_kwargs) as session:
+                yield session
+        finally:
+            leases.release()
+            self._async_stats.released()
+
+    # ── Metrics ───────────────────────────────────────────────────
+    def metrics(self) -> dict:
+        return {
+            "pool_size": self.pool_size,
+            "acquire_timeout_s": self.acquire_timeout,
+            "drivers": {
+                "sync": [uri for uri, _ in self._drivers],
+                "async": [uri for uri, _ in self._async_drivers],
+                "async_retired": len(self._retired_async_drivers),
+            },
+            "sync": self._sync_stats.snapshot(),
+            "async": self._async_stats.snapshot(),
+        }
+
+    # ── Shutdown ──────────────────────────────────────────────────
+    def close(self) -> None:
+        with self._lock:
+            drivers = list(self._drivers.values())
+            self._drivers.clear()
+        for driver in drivers:
+            try:
+                driver.close()
+            except Exception as exc:
+                print(f"[NEO4J POOL] Sync driver close failed: {exc}")
+
+    async def aclose(self) -> None:
+        drivers = [*self._retired_async_drivers, *self._async_drivers.values()]
+        self._retired_async_drivers = []
+        self._async_drivers = {}
+        self._async_loop = None
+        for driver in drivers:
+            await self._close_async_driver(driver)
+        self.close()
+        print("[NEO4J POOL] All drivers closed")
+
+
+# Singleton
+neo4j_registry = Neo4jDriverRegistry()
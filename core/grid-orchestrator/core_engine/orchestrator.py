@@ -9,7 +9,7 @@ from __future__ import annotations
 import asyncio
 import logging
 import os
-from typing import Any, Dict, List
+from typing import Any, AsyncIterator, Dict, List
 
 import httpx
 
@@ -27,6 +27,7 @@ except ImportError:
     MoStarMomentsManager = None
 
 try:
+    from core_engine.grid_context import grid_context
     from core_engine.moscript_engine import MoScriptEngine
 
     MOSCRIPT_AVAILABLE = True
@@ -81,7 +82,6 @@ NEO4J_PASSWORD = os.getenv("NEO4J_PASSWORD", "")
 
 # ── Singleton managers ────────────────────────────────────────────
 _moments_manager = None
-_moscript_engine = None
 
 
 def get_moments_manager():
@@ -92,10 +92,8 @@ def get_moments_manager():
 
 
 def get_moscript_engine():
-    global _moscript_engine
-    if _moscript_engine is None and MOSCRIPT_AVAILABLE:
-        _moscript_engine = MoScriptEngine()
-    return _moscript_engine
+    # The process-wide engine, shared with the API and voice servers
+    return grid_context.engine if MOSCRIPT_AVAILABLE else None
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -169,15 +167,46 @@ async def route_query(
     Initiates a sovereign reasoning ritual through the MoScriptEngine.
     All intelligence and policy enforcement stays within the Ritual.
     """
-    if metadata is None:
-        metadata = {}
-
     engine = get_moscript_engine()
     if not engine:
         return {"error": "MoScript Engine offline", "insignia": "MSTR-⚡"}
 
-    # ── CONSTRUCT RITUAL ──────────────────────────────────────────
-    ritual = {
+    # ── EXECUTE VIA COVENANT INTERPRETER ──────────────────────────
+    ritual = _reasoning_ritual(prompt, system, neo4j_context, metadata)
+    response = await engine.interpret(ritual)
+    return _route_result(response)
+
+
+async def route_query_stream(
+    prompt: str,
+    system: str = "",
+    neo4j_context: str = "",
+    user_id: str = "User",
+    metadata: Dict[str, Any] = None,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    ``route_query`` as a stream: yields {"type": "token", "text": ...} as the
+    decree is generated, then {"type": "done", **route_query result}.
+    """
+    engine = get_moscript_engine()
+    if not engine:
+        yield {"type": "done", "error": "MoScript Engine offline", "insignia": "MSTR-⚡"}
+        return
+
+    ritual = _reasoning_ritual(prompt, system, neo4j_context, metadata)
+    async for event in engine.interpret_stream(ritual):
+        if event["type"] == "done":
+            yield {"type": "done", **_route_result(event)}
+        else:
+            yield event
+
+
+def _reasoning_ritual(
+    prompt: str, system: str, neo4j_context: str, metadata: Dict[str, Any] | None
+) -> Dict[str, Any]:
+    if metadata is None:
+        metadata = {}
+    return {
         "operation": "route_reasoning",
         "payload": {
             "query": prompt,
@@ -189,9 +218,8 @@ async def route_query(
         "target": "Grid.Mind",
     }
 
-    # ── EXECUTE VIA COVENANT INTERPRETER ──────────────────────────
-    response = await engine.interpret(ritual)
 
+def _route_result(response: Dict[str, Any]) -> Dict[str, Any]:
     if response.get("status") == "denied":
         return {
             "error": response.get("error"),
@@ -11,7 +11,7 @@ from datetime import datetime, timezone
 
 from core_engine.moscript_engine import MoScriptEngine
 from core_engine.mostar_moments_log import log_mostar_moment
-from neo4j import GraphDatabase, TrustAll
+from core_engine.neo4j_pool import neo4j_registry
 
 COVENANT_SECRET = os.getenv(
     "COVENANT_SECRET", "default-change-me"
@@ -35,17 +35,9 @@ class SacredHandshake:
         nonce = str(uuid.uuid4())
         signature = self._generate_signature(f"{agent_id}:{timestamp}:{nonce}")
 
-        uri = os.getenv("NEO4J_URI", "bolt://localhost:7687")
-        user = os.getenv("NEO4J_USER", "neo4j")
-        password = os.getenv("NEO4J_PASSWORD", "")
-        driver_kwargs = {"auth": (user, password)}
-        if uri.startswith(("neo4j+s://", "bolt+s://", "neo4j+ssc://", "bolt+ssc://")):
-            driver_kwargs["trusted_certificates"] = TrustAll()
-
         try:
-            driver = GraphDatabase.driver(uri, **driver_kwargs)
-            with driver.session() as session:
-                record = session.run(
+            async with neo4j_registry.async_session() as session:
+                result = await session.run(
                     """
                     MERGE (a:Agent {id: $agent_id})
                     SET a.name = $agent_name,
@@ -64,12 +56,10 @@ class SacredHandshake:
                         "nonce": nonce,
                         "signature": signature,
                     },
-                ).single()
+                )
+                record = await result.single()
         except Exception:
             record = None
-        finally:
-            if "driver" in locals():
-                driver.close()
 
         if record and record.get("agent_id"):
             log_mostar_moment(
@@ -5,46 +5,87 @@
 # ═══════════════════════════════════════════════════════════════════
 
 import os
+import json
 import httpx
 import asyncio
 import platform
 import subprocess
-from typing import Dict, Any, List
+from typing import Dict, Any, List, AsyncIterator
 from core_engine.grid_config import config
+from core_engine.grid_context import grid_context
 
-async def call_sovereign_model(prompt: str, model: str, system: str = "") -> Dict[str, Any]:
-    """Execute inference on a local MoStar engine."""
-    url = f"{config.OLLAMA_HOST}/api/chat"
-    
+# Streams wait this long for each next chunk, not for the whole answer
+SOVEREIGN_STREAM_READ_TIMEOUT = float(os.getenv("SOVEREIGN_STREAM_READ_TIMEOUT", "120"))
+
+
+class SovereignModelError(RuntimeError):
+    """A streamed inference could not be started or was cut off."""
+
+
+def _chat_payload(prompt: str, model: str, system: str, stream: bool) -> Dict[str, Any]:
     messages = []
     if system:
         messages.append({"role": "system", "content": system})
     messages.append({"role": "user", "content": prompt})
-
-    payload = {
+    return {
         "model": model,
         "messages": messages,
-        "stream": False,
+        "stream": stream,
         "options": {
             "num_ctx": 8192,
             "temperature": 0.7
         }
     }
 
+async def call_sovereign_model(prompt: str, model: str, system: str = "") -> Dict[str, Any]:
+    """Execute inference on a local MoStar engine."""
+    url = f"{config.OLLAMA_HOST}/api/chat"
+    payload = _chat_payload(prompt, model, system, stream=False)
+
     try:
-        async with httpx.AsyncClient(timeout=120) as client:
-            r = await client.post(url, json=payload)
-            if r.status_code == 200:
-                data = r.json()
-                return {
-                    "response": data.get("message", {}).get("content", ""),
-                    "model": model,
-                    "status": "success"
-                }
-            return {"error": f"Ollama error {r.status_code}", "status": "degraded"}
+        r = await grid_context.http_client().post(url, json=payload, timeout=120)
+        if r.status_code == 200:
+            data = r.json()
+            return {
+                "response": data.get("message", {}).get("content", ""),
+                "model": model,
+                "status": "success"
+            }
+        return {"error": f"Ollama error {r.status_code}", "status": "degraded"}
     except Exception as e:
         return {"error": str(e), "status": "offline"}
 
+async def stream_sovereign_model(prompt: str, model: str, system: str = "") -> AsyncIterator[str]:
+    """
+    Execute inference on a local MoStar engine, yielding content fragments
+    as Ollama produces them (NDJSON, one chunk per line).
+    Raises SovereignModelError if the engine refuses or the stream breaks.
+    """
+    url = f"{config.OLLAMA_HOST}/api/chat"
+    payload = _chat_payload(prompt, model, system, stream=True)
+    timeout = httpx.Timeout(10.0, read=SOVEREIGN_STREAM_READ_TIMEOUT)
+
+    try:
+        client = grid_context.http_client()
+        async with client.stream("POST", url, json=payload, timeout=timeout) as r:
+            if r.status_code != 200:
+                raise SovereignModelError(f"Ollama error {r.status_code}")
+            async for line in r.aiter_lines():
+                if not line.strip():
+                    continue
+                chunk = json.loads(line)
+                if chunk.get("error"):
+                    raise SovereignModelError(chunk["error"])
+                content = chunk.get("message", {}).get("content", "")
+                if content:
+                    yield content
+                if chunk.get("done"):
+                    return
+    except SovereignModelError:
+        raise
+    except Exception as e:
+        raise SovereignModelError(str(e)) from e
+
 def get_runtime_info() -> Dict[str, Any]:
     """Retrieve system bodily integrity info."""
     info = {
@@ -0,0 +1,339 @@
+# ═══════════════════════════════════════════════════════════════════
+# MOSTAR GRID — TTS CACHE
+# The Flame Architect — MSTR-⚡ — MoStar Industries
+# "Speak a phrase once; every voice after is an echo."
+# ═══════════════════════════════════════════════════════════════════
+"""
+Content-addressed cache for synthesized speech, shared by MostarVoice and
+the voice server.
+
+- Keys are sha256 of ``engine:language:text`` (the existing ``tts_<hex>.mp3``
+  naming, so files cached before this layer are adopted, not re-synthesized).
+- Concurrent misses for one key are single-flighted: the first caller
+  synthesizes, the rest await its result.
+- Synthesis writes to a temp file that is ``os.replace``d into place, so a
+  reader never sees a partial MP3, even across processes.
+- Entries are evicted least-recently-used once the cache exceeds
+  TTS_CACHE_MAX_BYTES. Only ``tts_*`` files this cache indexes are evicted;
+  native recordings sharing the directory are never touched.
+- ``stream`` forwards audio chunks to the caller as the synthesizer emits
+  them while teeing them into the cache; hits are streamed back from the
+  file in STREAM_CHUNK slices.
+- The index (``tts_index.bin``) is fixed-width binary records
+  ``<32s digest, u64 bytes, u64 last access ns>`` so other processes or
+  tools can mmap it without parsing.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import mmap
+import os
+import struct
+import threading
+import time
+import uuid
+from collections import OrderedDict
+from pathlib import Path
+from typing import AsyncIterator, Awaitable, Callable, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+TTS_CACHE_DIR = Path(os.getenv("TTS_CACHE_DIR", str(PROJECT_ROOT / "data" / "voice_cache")))
+TTS_CACHE_MAX_BYTES = int(os.getenv("TTS_CACHE_MAX_BYTES", str(512 * 1024 * 1024)))
+
+INDEX_NAME = "tts_index.bin"
+INDEX_RECORD = struct.Struct("<32sQQ")
+STREAM_CHUNK = 16 * 1024
+
+
+def tts_key(engine: str, language: str, text: str) -> str:
+    """Content address for one synthesis: engine + voice/language + text."""
+    return hashlib.sha256(f"{engine}:{language}:{text}".encode()).hexdigest()
+
+
+async def file_chunks(path: Path, chunk_size: int = STREAM_CHUNK) -> AsyncIterator[bytes]:
+    """
+    Stream an audio file in ``chunk_size`` slices of a read-only mapping:
+    no read buffer per chunk, and the mapping keeps the pages alive even if
+    the file is evicted or replaced mid-stream.
+    """
+    with open(path, "rb") as f:
+        if not os.fstat(f.fileno()).st_size:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+            for offset in range(0, len(view), chunk_size):
+                yield view[offset : offset + chunk_size]
+                await asyncio.sleep(0)
+
+
+def _retrieve_result(task: asyncio.Task) -> None:
+    # Every caller may have gone; don't let a failed fill log as unretrieved
+    if not task.cancelled():
+        task.exception()
+
+
+class TTSCache:
+    """
+    One instance per cache directory. Index mutation is guarded by a thread
+    lock; single-flight is per event loop (the API and voice servers each
+    run one).
+    """
+
+    def __init__(self, root: Path, *, max_bytes: int = TTS_CACHE_MAX_BYTES):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self.index_path = self.root / INDEX_NAME
+        # key -> (bytes, last access ns), least recently used first
+        self._entries: "OrderedDict[str, tuple[int, int]]" = OrderedDict()
+        self._bytes = 0
+        self._loaded = False
+        self._lock = threading.Lock()
+        self._inflight: dict[str, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+        self.deduped = 0
+        self.evictions = 0
+        self.errors = 0
+
+    # ── Paths ─────────────────────────────────────────────────────
+    def path_for(self, key: str) -> Path:
+        return self.root / f"tts_{key}.mp3"
+
+    # ── Index ─────────────────────────────────────────────────────
+    def _ensure_loaded(self) -> None:
+        if self._loaded:
+            return
+        with self._lock:
+            if self._loaded:
+                return
+            self.root.mkdir(parents=True, exist_ok=True)
+            entries: dict[str, tuple[int, int]] = {}
+            try:
+                with open(self.index_path, "rb") as f:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as view:
+                        usable = len(view) - len(view) % INDEX_RECORD.size
+                        for digest, size, atime in INDEX_RECORD.iter_unpack(view[:usable]):
+                            entries[digest.hex()] = (size, atime)
+            except (FileNotFoundError, ValueError):
+                # Missing or empty index (mmap refuses zero-length files)
+                pass
+            # Reconcile with the directory: drop vanished files, adopt
+            # tts_*.mp3 written before the index existed
+            on_disk: dict[str, os.stat_result] = {}
+            with os.scandir(self.root) as listing:
+                for entry in listing:
+                    name = entry.name
+                    if name.startswith("tts_") and name.endswith(".mp3") and len(name) == 72:
+                        on_disk[name[4:-4]] = entry.stat()
+            merged = []
+            for key, stat in on_disk.items():
+                size, atime = entries.get(key, (stat.st_size, stat.st_mtime_ns))
+                merged.append((atime, key, stat.st_size))
+            merged.sort()
+            for atime, key, size in merged:
+                self._entries[key] = (size, atime)
+                self._bytes += size
+            self._loaded = True
+        self._evict()
+
+    def _write_index(self) -> None:
+        with self._lock:
+            data = b"".join(
+                INDEX_RECORD.pack(bytes.fromhex(key), size, atime)
+                for key, (size, atime) in self._entries.items()
+            )
+        tmp = self.index_path.with_name(f".{INDEX_NAME}.{os.getpid()}.{uuid.uuid4().hex}")
+        tmp.write_bytes(data)
+        os.replace(tmp, self.index_path)
+
+    def _touch(self, key: str) -> bool:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False
+            self._entries[key] = (entry[0], time.time_ns())
+            self._entries.move_to_end(key)
+            return True
+
+    def _record(self, key: str, size: int) -> None:
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous:
+                self._bytes -= previous[0]
+            self._entries[key] = (size, time.time_ns())
+            self._bytes += size
+
+    def _evict(self, keep: Optional[str] = None) -> None:
+        victims = []
+        with self._lock:
+            for key in list(self._entries):
+                if self._bytes <= self.max_bytes:
+                    break
+                if key == keep or key in self._inflight:
+                    continue
+                size, _ = self._entries.pop(key)
+                self._bytes -= size
+                victims.append(key)
+            self.evictions += len(victims)
+        for key in victims:
+            try:
+                self.path_for(key).unlink()
+            except OSError:
+                # Gone already, or held open by a reader on Windows
+                pass
+
+    # ── Lookup / fill ─────────────────────────────────────────────
+    def lookup(self, key: str) -> Optional[Path]:
+        """Cached path for ``key`` (counted as a hit), else None."""
+        self._ensure_loaded()
+        path = self.path_for(key)
+        if self._touch(key):
+            if path.exists():
+                self.hits += 1
+                return path
+            # Deleted behind our back — forget it
+            with self._lock:
+                size, _ = self._entries.pop(key, (0, 0))
+                self._bytes -= size
+        return None
+
+    def _temp_path(self, key: str) -> Path:
+        return self.root / f".tts_{key}.{os.getpid()}.{uuid.uuid4().hex}.tmp"
+
+    def _spawn(self, key: str, fill: Awaitable[Path]) -> asyncio.Task:
+        """
+        Run a fill as its own task. Callers await it shielded, so a caller
+        that is cancelled (e.g. its client disconnected) leaves the fill
+        running for everyone else sharing it.
+        """
+        task = asyncio.get_running_loop().create_task(fill)
+        self._inflight[key] = task
+        self.misses += 1
+        task.add_done_callback(_retrieve_result)
+        return task
+
+    async def _fill_file(self, key: str, synthesize: Callable[[Path], Awaitable[None]]) -> Path:
+        tmp = self._temp_path(key)
+        try:
+            await synthesize(tmp)
+            return self._commit(key, tmp)
+        except Exception:
+            self.errors += 1
+            raise
+        finally:
+            self._release(key, tmp)
+
+    def _commit(self, key: str, tmp: Path) -> Path:
+        size = tmp.stat().st_size
+        if not size:
+            raise RuntimeError("synthesis produced no audio")
+        path = self.path_for(key)
+        os.replace(tmp, path)
+        self._record(key, size)
+        self._evict(keep=key)
+        self._write_index()
+        return path
+
+    def _release(self, key: str, tmp: Path) -> None:
+        self._inflight.pop(key, None)
+        if tmp.exists():
+            tmp.unlink()
+
+    async def get_or_create(
+        self, key: str, synthesize: Callable[[Path], Awaitable[None]]
+    ) -> Path:
+        """
+        Path of the cached audio for ``key``, running ``synthesize(tmp_path)``
+        on a miss. Concurrent callers for the same key share one synthesis,
+        which completes even if the caller that started it is cancelled; a
+        failed synthesis raises in every caller and caches nothing.
+        """
+        path = self.lookup(key)
+        if path is not None:
+            return path
+
+        pending = self._inflight.get(key)
+        if pending is None:
+            pending = self._spawn(key, self._fill_file(key, synthesize))
+        else:
+            self.deduped += 1
+        return await asyncio.shield(pending)
+
+    async def stream(
+        self, key: str, synthesize: Callable[[], AsyncIterator[bytes]]
+    ) -> AsyncIterator[bytes]:
+        """
+        Audio for ``key`` as an async stream of chunks. On a miss the chunks
+        of ``synthesize()`` are yielded as they arrive and written through to
+        the cache; hits (and callers that joined an in-flight synthesis) are
+        read back from the cached file. The synthesis runs as its own task:
+        a consumer that stops early detaches from it, and it still completes
+        for joined callers and the cache.
+        """
+        path = self.lookup(key)
+        if path is None and key in self._inflight:
+            self.deduped += 1
+            path = await asyncio.shield(self._inflight[key])
+        if path is not None:
+            async for chunk in file_chunks(path):
+                yield chunk
+            return
+
+        chunks: asyncio.Queue = asyncio.Queue()
+        fill = self._spawn(key, self._fill_stream(key, synthesize, chunks))
+        while (chunk := await chunks.get()) is not None:
+            yield chunk
+        await asyncio.shield(fill)  # raises if the synthesis failed
+
+    async def _fill_stream(
+        self,
+        key: str,
+        synthesize: Callable[[], AsyncIterator[bytes]],
+        chunks: asyncio.Queue,
+    ) -> Path:
+        tmp = self._temp_path(key)
+        try:
+            with open(tmp, "wb") as out:
+                async for chunk in synthesize():
+                    out.write(chunk)
+                    chunks.put_nowait(chunk)
+            return self._commit(key, tmp)
+        except Exception:
+            self.errors += 1
+            raise
+        finally:
+            chunks.put_nowait(None)
+            self._release(key, tmp)
+
+    async def get_or_create_bytes(
+        self, key: str, synthesize: Callable[[Path], Awaitable[None]]
+    ) -> bytes:
+        path = await self.get_or_create(key, synthesize)
+        return await asyncio.to_thread(path.read_bytes)
+
+    def flush(self) -> None:
+        """Persist last-access times (fills persist on their own)."""
+        if self._loaded:
+            self._write_index()
+
+    def metrics(self) -> dict:
+        lookups = self.hits + self.misses + self.deduped
+        return {
+            "dir": str(self.root),
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "hits": self.hits,
+            "misses": self.misses,
+            "deduped": self.deduped,
+            "hit_rate": round((self.hits + self.deduped) / lookups, 4) if lookups else None,
+            "evictions": self.evictions,
+            "errors": self.errors,
+            "inflight": len(self._inflight),
+        }
+
+
+# Shared by MostarVoice and the voice server
+tts_cache = TTSCache(TTS_CACHE_DIR)
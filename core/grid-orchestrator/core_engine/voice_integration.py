@@ -6,7 +6,6 @@
 # ═══════════════════════════════════════════════════════════════════
 
 import asyncio
-import hashlib
 import json
 import os
 import platform
@@ -14,6 +13,9 @@ import subprocess
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from core_engine.audio_index import AudioFileIndex
+from core_engine.tts_cache import tts_cache, tts_key
+
 PROJECT_ROOT = Path(__file__).resolve().parents[2]
 BACKEND_DIR = Path(__file__).resolve().parents[1]
 
@@ -116,6 +118,47 @@ PHRASE_REGISTRY = {
 }
 
 
+# ═══════════════════════════════════════════════════════════════════
+# NATIVE RECORDINGS
+# Voice manifest: language -> phrase key -> clip filename, resolved
+# against the voice cache directories (first match wins)
+# ═══════════════════════════════════════════════════════════════════
+VOICE_CACHE_DIRS = [
+    PROJECT_ROOT / "data" / "voice_cache",
+    BACKEND_DIR / "data" / "voice_cache",
+]
+
+VOICE_MANIFEST_PATHS = [
+    Path(__file__).resolve().with_name("voice_manifest.json"),
+    BACKEND_DIR / "core_engine" / "voice_manifest.json",
+    PROJECT_ROOT / "data" / "ibibio_voice_manifest.json",
+]
+
+
+def load_voice_manifest() -> dict:
+    for p in VOICE_MANIFEST_PATHS:
+        if p.exists():
+            try:
+                with open(p, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                    # Strip _meta — not a language entry
+                    return {k: v for k, v in data.items() if not k.startswith("_")}
+            except Exception as e:
+                print(f"[VOICE] Manifest load failed: {e}")
+    return {}
+
+
+def manifest_clip_names(registry: dict) -> set[str]:
+    """Every clip filename the manifest references, across languages."""
+    return {
+        filename
+        for clips in registry.values()
+        if isinstance(clips, dict)
+        for filename in clips.values()
+        if isinstance(filename, str)
+    }
+
+
 class MostarVoice:
     """
     MoStar Heritage Voice System.
@@ -170,14 +213,15 @@ class MostarVoice:
         self.phrases = PHRASE_REGISTRY.get(self.lingua, ENGLISH_PHRASES)
 
         # Cache directories
-        self.voice_cache_dirs = [
-            PROJECT_ROOT / "data" / "voice_cache",
-            BACKEND_DIR / "data" / "voice_cache",
-        ]
+        self.voice_cache_dirs = list(VOICE_CACHE_DIRS)
         for d in self.voice_cache_dirs:
             d.mkdir(parents=True, exist_ok=True)
 
         self.registry = self._load_voice_manifest()
+        # Only manifest clips are indexed; TTS output shares these dirs
+        self.clip_index = AudioFileIndex(
+            self.voice_cache_dirs, names=manifest_clip_names(self.registry)
+        )
         self.executor = ThreadPoolExecutor(max_workers=2)
 
         print(
@@ -198,21 +242,7 @@ class MostarVoice:
 
     # ── Load voice manifest (native recordings) ───────────────────
     def _load_voice_manifest(self) -> dict:
-        paths = [
-            Path(__file__).resolve().with_name("voice_manifest.json"),
-            BACKEND_DIR / "core_engine" / "voice_manifest.json",
-            PROJECT_ROOT / "data" / "ibibio_voice_manifest.json",
-        ]
-        for p in paths:
-            if p.exists():
-                try:
-                    with open(p, "r", encoding="utf-8") as f:
-                        data = json.load(f)
-                        # Strip _meta — not a language entry
-                        return {k: v for k, v in data.items() if not k.startswith("_")}
-                except Exception as e:
-                    print(f"[VOICE] Manifest load failed: {e}")
-        return {}
+        return load_voice_manifest()
 
     # ── Find pre-recorded native clip ─────────────────────────────
     def _find_voice_clip(self, phrase_key: str) -> str | None:
@@ -222,41 +252,32 @@ class MostarVoice:
         filename = lang_clips.get(phrase_key) or lang_clips.get("fallback")
         if not filename:
             return None
-        for cache_dir in self.voice_cache_dirs:
-            fp = cache_dir / filename
-            if fp.exists():
-                return str(fp.absolute())
-        return None
-
-    # ── Cache path ────────────────────────────────────────────────
-    def _get_cache_path(self, text: str, engine: str) -> Path:
-        h = hashlib.sha256(f"{engine}:{self.lingua}:{text}".encode()).hexdigest()
-        return self.voice_cache_dirs[0] / f"tts_{h}.mp3"
-
-    # ── Edge-TTS synthesis ────────────────────────────────────────
+        return self.clip_index.resolve(filename)
+
+    # ── Edge-TTS synthesis (shared TTS cache) ─────────────────────
     async def _speak_edge_async(self, text: str) -> str:
         voice = self._EDGE_VOICES.get(self.lingua, "en-US-JennyNeural")
-        out = self._get_cache_path(text, f"edge-{voice}")
-        if out.exists():
-            return str(out)
-        communicate = edge_tts.Communicate(text, voice)
-        await communicate.save(str(out))
-        return str(out)
-
-    # ── gTTS synthesis ────────────────────────────────────────────
+
+        async def _synthesize(out: Path):
+            communicate = edge_tts.Communicate(text, voice)
+            await communicate.save(str(out))
+
+        key = tts_key(f"edge-{voice}", self.lingua, text)
+        return str(await tts_cache.get_or_create(key, _synthesize))
+
+    # ── gTTS synthesis (shared TTS cache) ─────────────────────────
     async def _speak_gtts_async(self, text: str) -> str:
         lang = self._GTTS_CODES.get(self.lingua, "en")
-        out = self._get_cache_path(text, f"gtts-{lang}")
-        if out.exists():
-            return str(out)
-        loop = asyncio.get_running_loop()
 
-        def _run():
-            tts = gTTS(text=text, lang=lang)
-            tts.save(str(out))
+        async def _synthesize(out: Path):
+            def _run():
+                tts = gTTS(text=text, lang=lang)
+                tts.save(str(out))
+
+            await asyncio.get_running_loop().run_in_executor(self.executor, _run)
 
-        await loop.run_in_executor(self.executor, _run)
-        return str(out)
+        key = tts_key(f"gtts-{lang}", self.lingua, text)
+        return str(await tts_cache.get_or_create(key, _synthesize))
 
     # ── Playback ──────────────────────────────────────────────────
     def _play_audio(self, file_path: str):
@@ -7,12 +7,14 @@
 
 import asyncio
 import os
-import tempfile
+import re
+from contextlib import aclosing, asynccontextmanager
 from datetime import datetime, timezone
+from pathlib import Path
 
-import httpx
-from fastapi import FastAPI, WebSocket, WebSocketDisconnect
+from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import FileResponse
 
 try:
     import edge_tts
@@ -22,6 +24,16 @@ except ImportError:
     EDGE_TTS_AVAILABLE = False
     print("[VOICE SERVER] edge-tts not installed")
 
+from core_engine.audio_index import AudioFileIndex
+from core_engine.grid_context import grid_context
+from core_engine.tts_cache import file_chunks, tts_cache, tts_key
+from core_engine.voice_integration import (
+    PHRASE_REGISTRY,
+    VOICE_CACHE_DIRS,
+    load_voice_manifest,
+    manifest_clip_names,
+)
+
 try:
     from core_engine.mostar_moments_log import log_mostar_moment
 except ImportError:
@@ -72,13 +84,38 @@ Respond in clear, articulate English.
 
 INSIGNIA = "MSTR-⚡"
 
+# Sentences synthesized ahead of the one being streamed
+VOICE_STREAM_LOOKAHEAD = int(os.getenv("VOICE_STREAM_LOOKAHEAD", "1"))
+
+# Streaming segments: short fragments are merged (each segment is one
+# Edge-TTS request), long sentences are cut at clause or word breaks
+SENTENCE_MIN_CHARS = 24
+SENTENCE_MAX_CHARS = 280
+_SENTENCE_BREAK = re.compile(r"(?:(?<=[.!?…])|(?<=[.!?…][\"'”’)]))\s+|\s*\n+\s*")
+_CLAUSE_BREAK = re.compile(r"[,;:—]\s")
+
+# Native recordings from the voice manifest, indexed once
+VOICE_MANIFEST = load_voice_manifest()
+native_clips = AudioFileIndex(VOICE_CACHE_DIRS, names=manifest_clip_names(VOICE_MANIFEST))
+
 # ═══════════════════════════════════════════════════════════════════
 # APP
 # ═══════════════════════════════════════════════════════════════════
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Engine awakened and Ollama pool opened once, not per utterance
+    await grid_context.startup()
+    yield
+    await grid_context.aclose()
+    native_clips.close()
+    tts_cache.flush()
+
+
 app = FastAPI(
     title="MoStar Voice Server",
     description="Sovereign voice pipeline — MoStar-AI + Edge-TTS + Neo4j",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 app.add_middleware(
@@ -98,15 +135,45 @@ async def query_mostar(
     prompt: str,
     model: str = None,
     language: str = "english",
+    engine=None,
 ) -> dict:
     """
     Send prompt to MoScript engine for sovereign reasoning.
     Mediated by the 'route_reasoning' ritual.
     """
-    from core_engine.moscript_engine import MoScriptEngine
+    engine = engine or grid_context.engine
+
+    try:
+        response = await engine.interpret(_voice_ritual(prompt, model, language))
+        return _voice_result(response)
+
+    except Exception as e:
+        return _voice_error(e)
 
-    engine = MoScriptEngine()
 
+async def query_mostar_stream(
+    prompt: str,
+    model: str = None,
+    language: str = "english",
+    engine=None,
+):
+    """
+    Streaming twin of query_mostar: yields {"type": "token", "text": ...}
+    while the decree is generated, then {"type": "done", **query_mostar result}.
+    """
+    engine = engine or grid_context.engine
+
+    try:
+        async for event in engine.interpret_stream(_voice_ritual(prompt, model, language)):
+            if event["type"] == "token":
+                yield event
+            elif event["type"] == "done":
+                yield {"type": "done", **_voice_result(event)}
+    except Exception as e:
+        yield {"type": "done", **_voice_error(e)}
+
+
+def _voice_ritual(prompt: str, model: str, language: str) -> dict:
     # Prepend language context for the ritual
     lang_prefix = {
         "ibibio": "Respond with Ibibio consciousness (use Ibibio words where appropriate).",
@@ -115,7 +182,7 @@ async def query_mostar(
         "swahili": "Jibu kwa lugha ya Kiswahili.",
     }.get(language.lower(), "")
 
-    ritual = {
+    return {
         "operation": "route_reasoning",
         "payload": {
             "query": prompt,
@@ -126,28 +193,29 @@ async def query_mostar(
         "target": "MoStar-AI.Voice",
     }
 
-    try:
-        response = await engine.interpret(ritual)
-        if response.get("status") != "aligned":
-            return {
-                "response": f"Ritual disrupted: {response.get('error', 'Covenant violation')}",
-                "status": "denied",
-            }
-
-        result = response.get("result", {})
-        return {
-            "response": result.get("logic_deduced", "Grid silence."),
-            "model_used": "MoScript-Pass-Chain",
-            "status": "success",
-        }
 
-    except Exception as e:
+def _voice_result(response: dict) -> dict:
+    if response.get("status") != "aligned":
         return {
-            "response": "The Grid's voice is momentarily silent. Àṣẹ.",
-            "status": "error",
-            "error": str(e),
+            "response": f"Ritual disrupted: {response.get('error', 'Covenant violation')}",
+            "status": "denied",
         }
 
+    result = response.get("result", {})
+    return {
+        "response": result.get("logic_deduced", "Grid silence."),
+        "model_used": "MoScript-Pass-Chain",
+        "status": "success",
+    }
+
+
+def _voice_error(e: Exception) -> dict:
+    return {
+        "response": "The Grid's voice is momentarily silent. Àṣẹ.",
+        "status": "error",
+        "error": str(e),
+    }
+
 
 # ═══════════════════════════════════════════════════════════════════
 # EDGE-TTS — HERITAGE VOICE SYNTHESIS
@@ -157,7 +225,7 @@ async def synthesize_voice(
     language: str = "english",
 ) -> bytes | None:
     """
-    Synthesize speech using Edge-TTS.
+    Synthesize speech using Edge-TTS, through the shared TTS cache.
     Returns raw MP3 bytes or None if synthesis fails.
     """
     if not EDGE_TTS_AVAILABLE:
@@ -166,25 +234,151 @@ async def synthesize_voice(
 
     voice = VOICE_MAP.get(language.lower(), VOICE_DEFAULT)
 
-    try:
+    async def _synthesize(out: Path):
         communicate = edge_tts.Communicate(text, voice=voice)
-        with tempfile.NamedTemporaryFile(delete=False, suffix=".mp3") as tmp:
-            out_path = tmp.name
-
-        await communicate.save(out_path)
+        await communicate.save(str(out))
+        print(f"[VOICE SERVER] Synthesized {out.stat().st_size} bytes | voice={voice}")
 
-        with open(out_path, "rb") as f:
-            audio = f.read()
-
-        os.remove(out_path)
-        print(f"[VOICE SERVER] Synthesized {len(audio)} bytes | voice={voice}")
-        return audio
+    try:
+        key = tts_key(f"edge-{voice}", language.lower(), text)
+        return await tts_cache.get_or_create_bytes(key, _synthesize)
 
     except Exception as e:
         print(f"[VOICE SERVER] Edge-TTS failed: {e}")
         return None
 
 
+def split_sentences(
+    text: str,
+    *,
+    min_chars: int = SENTENCE_MIN_CHARS,
+    max_chars: int = SENTENCE_MAX_CHARS,
+) -> list[str]:
+    """Split a response into speakable segments at sentence boundaries."""
+    segments: list[str] = []
+    for piece in _SENTENCE_BREAK.split(text.strip()):
+        piece = piece.strip()
+        while len(piece) > max_chars:
+            clauses = [m.end() for m in _CLAUSE_BREAK.finditer(piece, 0, max_chars)]
+            cut = clauses[-1] if clauses else piece.rfind(" ", 0, max_chars) + 1
+            if cut <= 0:
+                cut = max_chars
+            segments.append(piece[:cut].strip())
+            piece = piece[cut:].strip()
+        if not piece:
+            continue
+        if segments and len(segments[-1]) < min_chars and len(segments[-1]) + len(piece) < max_chars:
+            segments[-1] = f"{segments[-1]} {piece}"
+        else:
+            segments.append(piece)
+    return segments
+
+
+async def _edge_audio(text: str, voice: str):
+    communicate = edge_tts.Communicate(text, voice=voice)
+    async for message in communicate.stream():
+        if message["type"] == "audio":
+            yield message["data"]
+
+
+async def stream_voice(
+    sentences: list[str],
+    language: str = "english",
+    *,
+    lookahead: int = VOICE_STREAM_LOOKAHEAD,
+):
+    """
+    Yield ``(index, mp3_chunk)`` for each sentence in order, forwarding
+    Edge-TTS audio as it is emitted. Up to ``lookahead`` following sentences
+    are synthesized while the current one streams, so the client hears the
+    first sentence after one sentence of synthesis, not the whole answer.
+    Every sentence goes through the shared TTS cache.
+    """
+    if not EDGE_TTS_AVAILABLE:
+        raise RuntimeError("edge-tts not installed")
+
+    voice = VOICE_MAP.get(language.lower(), VOICE_DEFAULT)
+    queues = [asyncio.Queue() for _ in sentences]
+    tasks: list[asyncio.Task] = []
+
+    async def _fill(sentence: str, queue: asyncio.Queue):
+        key = tts_key(f"edge-{voice}", language.lower(), sentence)
+        try:
+            async with aclosing(tts_cache.stream(key, lambda: _edge_audio(sentence, voice))) as chunks:
+                async for chunk in chunks:
+                    queue.put_nowait(chunk)
+        except asyncio.CancelledError:
+            queue.put_nowait(RuntimeError("sentence synthesis cancelled"))
+            raise
+        except Exception as e:
+            queue.put_nowait(e)
+        finally:
+            # Always terminate the sentence so the consumer never waits forever
+            queue.put_nowait(None)
+
+    try:
+        for index in range(len(sentences)):
+            while len(tasks) < min(index + 1 + lookahead, len(sentences)):
+                tasks.append(asyncio.create_task(_fill(sentences[len(tasks)], queues[len(tasks)])))
+            while (chunk := await queues[index].get()) is not None:
+                if isinstance(chunk, Exception):
+                    raise chunk
+                yield index, chunk
+    finally:
+        for task in tasks:
+            task.cancel()
+
+
+def find_native_clip(language: str, phrase_key: str) -> str | None:
+    filename = VOICE_MANIFEST.get(language.lower(), {}).get(phrase_key)
+    return native_clips.resolve(filename) if isinstance(filename, str) else None
+
+
+async def send_voice(websocket: WebSocket, text: str, language: str) -> bool:
+    """
+    Stream the spoken ``text`` over the socket:
+    ``audio_start`` → per sentence ``audio_segment`` + binary MP3 frames →
+    ``audio_end``. Returns False if no audio could be produced.
+    """
+    sentences = split_sentences(text)
+    if not sentences:
+        return False
+    started = False
+    try:
+        async with aclosing(stream_voice(sentences, language)) as chunks:
+            current = -1
+            async for index, chunk in chunks:
+                if not started:
+                    started = True
+                    await websocket.send_text(
+                        json_msg(type="audio_start", format="audio/mpeg", segments=len(sentences))
+                    )
+                if index != current:
+                    current = index
+                    await websocket.send_text(
+                        json_msg(type="audio_segment", index=index, text=sentences[index])
+                    )
+                await websocket.send_bytes(chunk)
+    except WebSocketDisconnect:
+        raise
+    except Exception as e:
+        print(f"[VOICE SERVER] Streaming synthesis failed: {e}")
+        if not started:
+            return False
+    if started:
+        await websocket.send_text(json_msg(type="audio_end", segments=len(sentences)))
+    return started
+
+
+async def send_native_clip(websocket: WebSocket, path: str, phrase_key: str) -> None:
+    await websocket.send_text(
+        json_msg(type="audio_start", source="native", phrase=phrase_key, segments=1)
+    )
+    async for chunk in file_chunks(Path(path)):
+        await websocket.send_bytes(chunk)
+    await websocket.send_text(json_msg(type="audio_end", segments=1))
+
+
 # ═══════════════════════════════════════════════════════════════════
 # REST ENDPOINTS
 # ═══════════════════════════════════════════════════════════════════
@@ -205,9 +399,8 @@ async def root():
 async def health():
     ollama_ok = False
     try:
-        async with httpx.AsyncClient(timeout=3.0) as client:
-            r = await client.get(f"{config.OLLAMA_HOST}/api/tags")
-            ollama_ok = r.status_code == 200
+        r = await grid_context.http_client().get(f"{config.OLLAMA_HOST}/api/tags", timeout=3.0)
+        ollama_ok = r.status_code == 200
     except Exception:
         pass
 
@@ -215,11 +408,22 @@ async def health():
         "status": "healthy" if ollama_ok else "degraded",
         "ollama": "online" if ollama_ok else "offline",
         "edge_tts": "available" if EDGE_TTS_AVAILABLE else "missing",
+        "tts_cache": tts_cache.metrics(),
+        "context": grid_context.metrics(),
         "model": config.OLLAMA_MODEL,
         "insignia": INSIGNIA,
     }
 
 
+@app.get("/voice/clip/{language}/{phrase_key}")
+async def native_clip(language: str, phrase_key: str):
+    """Native recording as a file response (sent with ASGI pathsend where the server supports it)."""
+    path = find_native_clip(language, phrase_key)
+    if not path:
+        raise HTTPException(status_code=404, detail=f"No native {language} clip for '{phrase_key}'")
+    return FileResponse(path)
+
+
 @app.get("/voices")
 async def list_voices():
     return {
@@ -265,10 +469,12 @@ async def voice_socket(websocket: WebSocket):
                 prompt = payload.get("message") or payload.get("prompt") or raw
                 language = payload.get("language", session_language).lower()
                 model = payload.get("model", session_model)
+                phrase_key = payload.get("phrase")
             except Exception:
                 prompt = raw
                 language = session_language
                 model = session_model
+                phrase_key = None
 
             # Update session language if changed
             if language != session_language:
@@ -280,6 +486,19 @@ async def voice_socket(websocket: WebSocket):
                     )
                 )
 
+            # ── Registry phrase: native recording, else its text ─
+            if phrase_key:
+                clip = find_native_clip(language, phrase_key)
+                if clip:
+                    await send_native_clip(websocket, clip, phrase_key)
+                    continue
+                phrase_text = PHRASE_REGISTRY.get(language, {}).get(phrase_key)
+                if not (phrase_text and await send_voice(websocket, phrase_text, language)):
+                    await websocket.send_text(
+                        json_msg(type="warning", text=f"No voice for phrase '{phrase_key}'.")
+                    )
+                continue
+
             print(
                 f"[VOICE SERVER] Prompt: {prompt[:60]} | lang={language} | model={model}"
             )
@@ -292,8 +511,13 @@ async def voice_socket(websocket: WebSocket):
                 )
             )
 
-            # ── Query MoStar-AI ───────────────────────────────────
-            result = await query_mostar(prompt, model=model, language=language)
+            # ── Query MoStar-AI — partial text as it is generated ─
+            result = None
+            async for event in query_mostar_stream(prompt, model=model, language=language):
+                if event["type"] == "token":
+                    await websocket.send_text(json_msg(type="partial", text=event["text"]))
+                else:
+                    result = event
             response = result["response"]
 
             # ── Send text response ────────────────────────────────
@@ -301,17 +525,14 @@ async def voice_socket(websocket: WebSocket):
                 json_msg(
                     type="response",
                     text=response,
-                    model=result["model_used"],
+                    model=result.get("model_used"),
                     status=result["status"],
                     insignia=INSIGNIA,
                 )
             )
 
-            # ── Synthesize and send voice ─────────────────────────
-            audio = await synthesize_voice(response, language=language)
-            if audio:
-                await websocket.send_bytes(audio)
-            else:
+            # ── Stream voice, sentence by sentence ────────────────
+            if not await send_voice(websocket, response, language):
                 await websocket.send_text(
                     json_msg(
                         type="warning",
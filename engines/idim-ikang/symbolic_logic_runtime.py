@@ -1,6 +1,9 @@
 import os
 import re
-from dataclasses import dataclass
+import threading
+import time
+from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Callable
 
@@ -17,6 +20,20 @@ NEO4J_PASSWORD = os.getenv("NEO4J_PASSWORD", "")
 DEFAULT_SYMBOLIC_YAML_URI = os.getenv(
     "MOSTAR_SYMBOLIC_YAML_URI", "file:///data/scripts/symbolic-logic.yaml"
 )
+SYMBOLIC_KB_CHECK_INTERVAL = float(os.getenv("SYMBOLIC_KB_CHECK_INTERVAL", "5"))
+# Predicates tabled in addition to the recursive ones found at compile time
+SYMBOLIC_TABLED_PREDICATES = {
+    name.strip()
+    for name in os.getenv("SYMBOLIC_TABLED_PREDICATES", "").split(",")
+    if name.strip()
+}
+SYMBOLIC_ANSWER_LIMIT = int(os.getenv("SYMBOLIC_ANSWER_LIMIT", "1000"))
+SYMBOLIC_PROOF_TIMEOUT = float(os.getenv("SYMBOLIC_PROOF_TIMEOUT", "5"))
+# Rule nesting limit per proof, tabled calls included; deeper branches are cut
+SYMBOLIC_MAX_DEPTH = int(os.getenv("SYMBOLIC_MAX_DEPTH", "25"))
+LISP_MAX_STEPS = int(os.getenv("SYMBOLIC_LISP_MAX_STEPS", "200000"))
+LISP_TIMEOUT = float(os.getenv("SYMBOLIC_LISP_TIMEOUT", "5"))
+LISP_AST_CACHE_SIZE = int(os.getenv("SYMBOLIC_LISP_AST_CACHE_SIZE", "256"))
 DEFAULT_SYMBOLIC_YAML_PATH = (
     Path(__file__).resolve().parent.parent
     / "neo4j-mostar-industries"
@@ -53,6 +70,158 @@ class Rule:
     head_args: list[str]
     body: list[tuple[str, list[str]]]
     raw_text: str
+    variables: tuple[str, ...] = ()
+
+
+def _is_variable(term: str) -> bool:
+    return bool(term) and (term[0].isupper() or term.startswith("_"))
+
+
+# Version stamp for the compiled knowledge base. The counts come from the
+# count store; kb_revision is bumped by bootstrap and by explicit changes.
+KB_STAMP_QUERY = """
+OPTIONAL MATCH (module:SymbolicModule {id: 'symbolic_logic'})
+RETURN module.kb_revision AS revision,
+       COUNT { (:SymbolicFact) } AS facts,
+       COUNT { (:SymbolicRule) } AS rules,
+       COUNT { ()-[:TRUSTS]->() } AS trusts
+"""
+
+
+@dataclass
+class KnowledgeBase:
+    """
+    Facts and rules compiled for resolution.
+    - facts indexed by (predicate, arity) and by (predicate, arity, first arg)
+    - rules indexed by (predicate, arity), variables collected up front so
+      standardising apart is a single rename
+    """
+
+    stamp: tuple = ()
+    facts_by_key: dict[tuple[str, int], list[Fact]] = field(default_factory=dict)
+    facts_by_first: dict[tuple[str, int, str], list[tuple[int, Fact]]] = field(
+        default_factory=dict
+    )
+    open_first: dict[tuple[str, int], list[tuple[int, Fact]]] = field(
+        default_factory=dict
+    )
+    rules_by_key: dict[tuple[str, int], list[Rule]] = field(default_factory=dict)
+    recursive_predicates: set[str] = field(default_factory=set)
+    fact_count: int = 0
+    rule_count: int = 0
+
+    @classmethod
+    def compile(cls, facts: list[Fact], rules: list[Rule], stamp: tuple = ()):
+        kb = cls(stamp=stamp, fact_count=len(facts), rule_count=len(rules))
+        for position, fact in enumerate(facts):
+            key = (fact.predicate, len(fact.args))
+            kb.facts_by_key.setdefault(key, []).append(fact)
+            first = fact.args[0] if fact.args else None
+            if first is None:
+                continue
+            if _is_variable(first):
+                # Matches any first argument; kept with its position so
+                # candidate order still follows the fact list.
+                kb.open_first.setdefault(key, []).append((position, fact))
+            else:
+                kb.facts_by_first.setdefault(key + (first,), []).append(
+                    (position, fact)
+                )
+        for rule in rules:
+            terms = [*rule.head_args, *(arg for _, args in rule.body for arg in args)]
+            rule.variables = tuple(dict.fromkeys(t for t in terms if _is_variable(t)))
+            kb.rules_by_key.setdefault(
+                (rule.head_predicate, len(rule.head_args)), []
+            ).append(rule)
+        kb.recursive_predicates = cls._find_recursive(rules)
+        return kb
+
+    @staticmethod
+    def _find_recursive(rules: list[Rule]) -> set[str]:
+        """Predicates that can reach themselves through rule bodies."""
+        calls: dict[str, set[str]] = {}
+        for rule in rules:
+            calls.setdefault(rule.head_predicate, set()).update(
+                predicate for predicate, _ in rule.body
+            )
+        recursive = set()
+        for start in calls:
+            pending, seen = list(calls[start]), set()
+            while pending:
+                current = pending.pop()
+                if current == start:
+                    recursive.add(start)
+                    break
+                if current not in seen:
+                    seen.add(current)
+                    pending.extend(calls.get(current, ()))
+        return recursive
+
+    def candidate_facts(self, predicate: str, args: list[str]) -> list[Fact]:
+        key = (predicate, len(args))
+        if not args or _is_variable(args[0]):
+            return self.facts_by_key.get(key, [])
+        bound = self.facts_by_first.get(key + (args[0],), [])
+        open_facts = self.open_first.get(key)
+        if not open_facts:
+            return [fact for _, fact in bound]
+        return [fact for _, fact in sorted(bound + open_facts, key=lambda pf: pf[0])]
+
+    def candidate_rules(self, predicate: str, arity: int) -> list[Rule]:
+        return self.rules_by_key.get((predicate, arity), [])
+
+
+LISP_STAMP_QUERY = """
+OPTIONAL MATCH (module:SymbolicModule {id: 'symbolic_logic'})
+RETURN module.kb_revision AS revision,
+       COUNT { (:LispFunction) } AS functions
+"""
+
+
+class ProofTimeout(TimeoutError):
+    pass
+
+
+class LispBudgetExceeded(RuntimeError):
+    pass
+
+
+@dataclass
+class _TableEntry:
+    answers: dict[tuple, dict[str, Any]] = field(default_factory=dict)
+    complete: bool = False
+    evaluating: bool = False
+    stack_index: int = 0
+    low: int = 0
+    passes: int = 0
+    started: int = 0
+    # For incomplete tables: the evaluating call they depend on, and its
+    # pass when this table was last evaluated.
+    dep: "_TableEntry | None" = None
+    dep_pass: int = -1
+
+
+@dataclass
+class _ProofContext:
+    """
+    Per-query state. Tabled calls are keyed by their variant (variables
+    renamed by position) and evaluated to a fixpoint; recursive variant
+    calls consume the answers found so far and make the SCC leader iterate.
+    """
+
+    kb: KnowledgeBase
+    tabled: set[str]
+    answer_limit: int
+    deadline: float
+    table: dict[tuple, _TableEntry] = field(default_factory=dict)
+    stack: list[_TableEntry] = field(default_factory=list)
+    answers_added: int = 0
+    evaluations: int = 0
+    truncated: bool = False
+
+    def check_deadline(self) -> None:
+        if time.monotonic() > self.deadline:
+            raise ProofTimeout("Symbolic proof timed out")
 
 
 class SymbolicLogicRuntime:
@@ -62,6 +231,12 @@ class SymbolicLogicRuntime:
             auth=(NEO4J_USER, NEO4J_PASSWORD),
         )
         self._rule_counter = 0
+        self._kb: KnowledgeBase | None = None
+        self._kb_checked_at = 0.0
+        self._kb_lock = threading.Lock()
+        self._lisp_base: LispEvaluator | None = None
+        self._lisp_stamp: tuple = ()
+        self._lisp_checked_at = 0.0
 
     def close(self) -> None:
         self._driver.close()
@@ -91,6 +266,7 @@ class SymbolicLogicRuntime:
             """
             MERGE (module:SymbolicModule:GridCore {id: 'symbolic_logic'})
             SET module.version = $version,
+                module.kb_revision = coalesce(module.kb_revision, 0) + 1,
                 module.description = $description,
                 module.source_file = $yaml_uri,
                 module.source_path = $yaml_path,
@@ -198,6 +374,7 @@ class SymbolicLogicRuntime:
                         "yaml_uri": yaml_uri,
                     },
                 )
+        self.invalidate()
         counts = self.status()
         return {"yaml_uri": yaml_uri, "counts": counts, "steps": summary}
 
@@ -357,26 +534,131 @@ class SymbolicLogicRuntime:
             for row in rows
         ]
 
-    def prove(self, query: str) -> dict[str, Any]:
+    # ── Compiled knowledge base ───────────────────────────────────
+    def invalidate(self) -> None:
+        """Change notification: recompile on the next proof."""
+        with self._kb_lock:
+            self._kb = None
+            self._kb_checked_at = 0.0
+            self._lisp_base = None
+            self._lisp_checked_at = 0.0
+
+    def _kb_stamp(self) -> tuple:
+        rows = self._read(KB_STAMP_QUERY)
+        row = rows[0] if rows else {}
+        return (row.get("revision"), row.get("facts"), row.get("rules"), row.get("trusts"))
+
+    def knowledge_base(self) -> KnowledgeBase:
+        """
+        The compiled knowledge base. The version stamp is checked at most
+        every SYMBOLIC_KB_CHECK_INTERVAL seconds; a changed stamp recompiles.
+        """
+        now = time.monotonic()
+        kb = self._kb
+        if kb is not None and now - self._kb_checked_at < SYMBOLIC_KB_CHECK_INTERVAL:
+            return kb
+        with self._kb_lock:
+            if self._kb is not None and now - self._kb_checked_at < SYMBOLIC_KB_CHECK_INTERVAL:
+                return self._kb
+            stamp = self._kb_stamp()
+            if self._kb is None or self._kb.stamp != stamp:
+                self._kb = KnowledgeBase.compile(
+                    self._load_facts(), self._load_rules(), stamp
+                )
+            self._kb_checked_at = now
+            return self._kb
+
+    def prove(
+        self,
+        query: str,
+        tabled: set[str] | None = None,
+        answer_limit: int = SYMBOLIC_ANSWER_LIMIT,
+        timeout: float = SYMBOLIC_PROOF_TIMEOUT,
+    ) -> dict[str, Any]:
+        """
+        Resolve a query. Recursive predicates (plus SYMBOLIC_TABLED_PREDICATES,
+        or `tabled` when given) use tabled resolution, so cyclic trust
+        chains terminate with complete answers. At most `answer_limit`
+        results are returned; after `timeout` seconds the answers found
+        so far are returned with timed_out=True. Branches deeper than
+        SYMBOLIC_MAX_DEPTH rules are cut and reported as truncated.
+        """
         goal = self._parse_query(query)
         query_variables = [arg for arg in goal[1] if self._is_variable(arg)]
-        facts = self._load_facts()
-        rules = self._load_rules()
-        proofs = list(self._prove_goal(goal, {}, facts, rules, depth=0, max_depth=25))
+        kb = self.knowledge_base()
+        ctx = _ProofContext(
+            kb=kb,
+            tabled=(
+                set(tabled)
+                if tabled is not None
+                else kb.recursive_predicates | SYMBOLIC_TABLED_PREDICATES
+            ),
+            answer_limit=max(1, answer_limit),
+            deadline=time.monotonic() + timeout,
+        )
         formatted = []
-        for bindings, proof in proofs:
-            result_bindings = {
-                var: self._resolve_value(var, bindings) for var in query_variables
-            }
-            formatted.append({"bindings": result_bindings, "proof": proof})
-        return {"query": query, "results": formatted, "count": len(formatted)}
+        timed_out = False
+        try:
+            for bindings, proof in self._prove_goal(
+                goal, {}, ctx, depth=0, max_depth=SYMBOLIC_MAX_DEPTH
+            ):
+                result_bindings = {
+                    var: self._resolve_value(var, bindings) for var in query_variables
+                }
+                formatted.append({"bindings": result_bindings, "proof": proof})
+                if len(formatted) >= ctx.answer_limit:
+                    ctx.truncated = True
+                    break
+        except ProofTimeout:
+            timed_out = True
+        except RecursionError:
+            ctx.truncated = True
+        return {
+            "query": query,
+            "results": formatted,
+            "count": len(formatted),
+            "tabled": sorted(ctx.tabled),
+            "truncated": ctx.truncated,
+            "timed_out": timed_out,
+        }
 
-    def eval_lisp(self, program: str) -> dict[str, Any]:
-        evaluator = LispEvaluator(self._read)
-        for function_code in self._load_lisp_functions():
-            evaluator.eval_string(function_code)
-        result = evaluator.eval_string(program)
-        return {"query": program, "result": result}
+    def _lisp_environment(self) -> "LispEvaluator":
+        """
+        Evaluator with every stored LispFunction defined, rebuilt only when
+        the LispFunction stamp changes (checked every SYMBOLIC_KB_CHECK_INTERVAL).
+        """
+        now = time.monotonic()
+        base = self._lisp_base
+        if base is not None and now - self._lisp_checked_at < SYMBOLIC_KB_CHECK_INTERVAL:
+            return base
+        with self._kb_lock:
+            if (
+                self._lisp_base is not None
+                and now - self._lisp_checked_at < SYMBOLIC_KB_CHECK_INTERVAL
+            ):
+                return self._lisp_base
+            rows = self._read(LISP_STAMP_QUERY)
+            row = rows[0] if rows else {}
+            stamp = (row.get("revision"), row.get("functions"))
+            if self._lisp_base is None or self._lisp_stamp != stamp:
+                evaluator = LispEvaluator(self._read)
+                for function_code in self._load_lisp_functions():
+                    evaluator.eval_string(function_code)
+                self._lisp_base = evaluator
+                self._lisp_stamp = stamp
+            self._lisp_checked_at = now
+            return self._lisp_base
+
+    def eval_lisp(
+        self,
+        program: str,
+        max_steps: int | None = LISP_MAX_STEPS,
+        timeout: float | None = LISP_TIMEOUT,
+    ) -> dict[str, Any]:
+        # A fork keeps the user's defuns out of the shared environment
+        evaluator = self._lisp_environment().fork()
+        result = evaluator.eval_string(program, max_steps=max_steps, timeout=timeout)
+        return {"query": program, "result": result, "steps": evaluator.steps}
 
     def _parse_fact(self, raw_text: str) -> Fact | None:
         text = raw_text.strip()
@@ -450,7 +732,7 @@ class SymbolicLogicRuntime:
         return parts
 
     def _is_variable(self, term: str) -> bool:
-        return bool(term) and (term[0].isupper() or term.startswith("_"))
+        return _is_variable(term)
 
     def _resolve_value(self, term: str, bindings: dict[str, str]) -> str:
         current = term
@@ -498,36 +780,30 @@ class SymbolicLogicRuntime:
     def _standardize_rule(self, rule: Rule) -> Rule:
         self._rule_counter += 1
         suffix = f"__{self._rule_counter}"
-        mapping: dict[str, str] = {}
-
-        def rename(term: str) -> str:
-            if not self._is_variable(term):
-                return term
-            if term not in mapping:
-                mapping[term] = f"{term}{suffix}"
-            return mapping[term]
-
+        mapping = {var: f"{var}{suffix}" for var in rule.variables}
         return Rule(
             head_predicate=rule.head_predicate,
-            head_args=[rename(arg) for arg in rule.head_args],
+            head_args=[mapping.get(arg, arg) for arg in rule.head_args],
             body=[
-                (predicate, [rename(arg) for arg in args])
+                (predicate, [mapping.get(arg, arg) for arg in args])
                 for predicate, args in rule.body
             ],
             raw_text=rule.raw_text,
+            variables=tuple(mapping.values()),
         )
 
     def _prove_goal(
         self,
         goal: tuple[str, list[str]],
         bindings: dict[str, str],
-        facts: list[Fact],
-        rules: list[Rule],
+        ctx: _ProofContext,
         depth: int,
         max_depth: int,
     ):
         if depth > max_depth:
+            ctx.truncated = True
             return
+        ctx.check_deadline()
         predicate, args = goal
         resolved_args = [self._resolve_value(arg, bindings) for arg in args]
         if predicate == "neq":
@@ -537,7 +813,40 @@ class SymbolicLogicRuntime:
                     {"type": "builtin", "predicate": "neq", "args": resolved_args},
                 )
             return
-        for fact in facts:
+        if predicate in ctx.tabled:
+            for answer, proof in self._tabled_answers(
+                predicate, resolved_args, ctx, depth, max_depth
+            ):
+                answer_args = self._fresh_variant(answer)
+                unified = self._unify_goals(
+                    predicate, resolved_args, predicate, answer_args, bindings
+                )
+                if unified is not None:
+                    yield (
+                        unified,
+                        {
+                            "type": "tabled",
+                            "predicate": predicate,
+                            "args": answer_args,
+                            "proof": proof,
+                        },
+                    )
+            return
+        yield from self._resolve_clauses(
+            predicate, resolved_args, bindings, ctx, depth, max_depth
+        )
+
+    def _resolve_clauses(
+        self,
+        predicate: str,
+        resolved_args: list[str],
+        bindings: dict[str, str],
+        ctx: _ProofContext,
+        depth: int,
+        max_depth: int,
+    ):
+        kb = ctx.kb
+        for fact in kb.candidate_facts(predicate, resolved_args):
             unified = self._unify_goals(
                 predicate, resolved_args, fact.predicate, fact.args, bindings
             )
@@ -551,7 +860,7 @@ class SymbolicLogicRuntime:
                         "raw_text": fact.raw_text,
                     },
                 )
-        for rule in rules:
+        for rule in kb.candidate_rules(predicate, len(resolved_args)):
             standardized = self._standardize_rule(rule)
             unified = self._unify_goals(
                 predicate,
@@ -565,8 +874,7 @@ class SymbolicLogicRuntime:
             for final_bindings, steps in self._prove_body(
                 standardized.body,
                 unified,
-                facts,
-                rules,
+                ctx,
                 depth + 1,
                 max_depth,
             ):
@@ -583,12 +891,102 @@ class SymbolicLogicRuntime:
                     },
                 )
 
+    # ── Tabled resolution ─────────────────────────────────────────
+    def _variant_key(self, args) -> tuple:
+        mapping: dict[str, str] = {}
+        key = []
+        for arg in args:
+            if self._is_variable(arg):
+                arg = mapping.setdefault(arg, f"_V{len(mapping)}")
+            key.append(arg)
+        return tuple(key)
+
+    def _fresh_variant(self, answer: tuple) -> list[str]:
+        if not any(self._is_variable(arg) for arg in answer):
+            return list(answer)
+        self._rule_counter += 1
+        suffix = f"__{self._rule_counter}"
+        return [f"{arg}{suffix}" if self._is_variable(arg) else arg for arg in answer]
+
+    def _tabled_answers(
+        self,
+        predicate: str,
+        args: list[str],
+        ctx: _ProofContext,
+        depth: int,
+        max_depth: int,
+    ) -> list[tuple[tuple, dict[str, Any]]]:
+        key = (predicate, self._variant_key(args))
+        entry = ctx.table.get(key)
+        if entry is not None and entry.evaluating:
+            # Recursive variant call: use the answers so far; the SCC
+            # leader keeps iterating until no table grows.
+            caller = ctx.stack[-1]
+            caller.low = min(caller.low, entry.stack_index)
+            return list(entry.answers.items())
+        if entry is not None and entry.complete:
+            return list(entry.answers.items())
+        if (
+            entry is not None
+            and entry.dep is not None
+            and entry.dep.evaluating
+            and entry.dep.passes == entry.dep_pass
+        ):
+            # Already evaluated during this pass of its SCC leader.
+            caller = ctx.stack[-1]
+            caller.low = min(caller.low, entry.dep.stack_index)
+            return list(entry.answers.items())
+        if entry is None:
+            entry = ctx.table[key] = _TableEntry()
+
+        entry.evaluating = True
+        entry.stack_index = entry.low = len(ctx.stack)
+        ctx.evaluations += 1
+        entry.started = ctx.evaluations
+        ctx.stack.append(entry)
+        try:
+            while True:
+                entry.passes += 1
+                added_before = ctx.answers_added
+                for bindings, proof in self._resolve_clauses(
+                    predicate, list(args), {}, ctx, depth, max_depth
+                ):
+                    answer = self._variant_key(
+                        self._resolve_value(arg, bindings) for arg in args
+                    )
+                    if answer in entry.answers:
+                        continue
+                    if len(entry.answers) >= ctx.answer_limit:
+                        ctx.truncated = True
+                        break
+                    entry.answers[answer] = proof
+                    ctx.answers_added += 1
+                if ctx.answers_added == added_before or entry.low < entry.stack_index:
+                    break
+        finally:
+            ctx.stack.pop()
+            entry.evaluating = False
+
+        if entry.low < entry.stack_index:
+            # Depends on a call still being evaluated below us: stay
+            # incomplete so the leader's next pass re-evaluates this table.
+            entry.dep = ctx.stack[entry.low]
+            entry.dep_pass = entry.dep.passes
+            ctx.stack[-1].low = min(ctx.stack[-1].low, entry.low)
+        else:
+            # SCC leader reached its fixpoint — the incomplete tables
+            # evaluated beneath it depended on it and are complete too.
+            entry.complete = True
+            for other in ctx.table.values():
+                if not other.complete and other.started > entry.started:
+                    other.complete = True
+        return list(entry.answers.items())
+
     def _prove_body(
         self,
         goals: list[tuple[str, list[str]]],
         bindings: dict[str, str],
-        facts: list[Fact],
-        rules: list[Rule],
+        ctx: _ProofContext,
         depth: int,
         max_depth: int,
     ):
@@ -597,10 +995,10 @@ class SymbolicLogicRuntime:
             return
         first, rest = goals[0], goals[1:]
         for next_bindings, proof in self._prove_goal(
-            first, dict(bindings), facts, rules, depth, max_depth
+            first, dict(bindings), ctx, depth, max_depth
         ):
             for final_bindings, rest_proofs in self._prove_body(
-                rest, next_bindings, facts, rules, depth, max_depth
+                rest, next_bindings, ctx, depth, max_depth
             ):
                 yield final_bindings, [proof, *rest_proofs]
 
@@ -611,6 +1009,9 @@ class LispEvaluator:
     ) -> None:
         self._read_query = read_query
         self._functions: dict[str, tuple[list[str], Any]] = {}
+        self.steps = 0
+        self._max_steps: int | None = None
+        self._deadline: float | None = None
         self._base_env = {
             "+": lambda *values: sum(values),
             "-": self._subtract,
@@ -629,9 +1030,39 @@ class LispEvaluator:
             "graph-query": self._graph_query,
         }
 
-    def eval_string(self, program: str) -> Any:
+    def fork(self) -> "LispEvaluator":
+        """A new evaluator starting from this one's function definitions."""
+        child = LispEvaluator(self._read_query)
+        child._functions = dict(self._functions)
+        return child
+
+    def eval_string(
+        self,
+        program: str,
+        max_steps: int | None = None,
+        timeout: float | None = None,
+    ) -> Any:
+        """Evaluate a program, optionally within a step and wall-clock budget."""
         expression = self._parse(program)
-        return self._eval(expression, dict(self._base_env))
+        self.steps = 0
+        self._max_steps = max_steps
+        self._deadline = time.monotonic() + timeout if timeout is not None else None
+        try:
+            return self._eval(expression, dict(self._base_env))
+        finally:
+            self._max_steps = None
+            self._deadline = None
+
+    def _charge_step(self) -> None:
+        self.steps += 1
+        if self._max_steps is not None and self.steps > self._max_steps:
+            raise LispBudgetExceeded(f"Lisp step budget of {self._max_steps} exceeded")
+        if (
+            self._deadline is not None
+            and self.steps % 256 == 0
+            and time.monotonic() > self._deadline
+        ):
+            raise LispBudgetExceeded("Lisp evaluation timed out")
 
     def _graph_query(self, query: str) -> list[dict[str, Any]]:
         return self._read_query(query, None)
@@ -656,7 +1087,8 @@ class LispEvaluator:
             current /= value
         return current
 
-    def _tokenize(self, program: str) -> list[Any]:
+    @staticmethod
+    def _tokenize(program: str) -> list[Any]:
         tokens: list[Any] = []
         i = 0
         while i < len(program):
@@ -700,7 +1132,11 @@ class LispEvaluator:
         return tokens
 
     def _parse(self, program: str) -> Any:
-        tokens = self._tokenize(program)
+        return _parse_program(program)
+
+    @classmethod
+    def _parse_uncached(cls, program: str) -> Any:
+        tokens = cls._tokenize(program)
 
         def read_at(position: int) -> tuple[Any, int]:
             if position >= len(tokens):
@@ -735,6 +1171,7 @@ class LispEvaluator:
         return expression
 
     def _eval(self, expression: Any, env: dict[str, Any]) -> Any:
+        self._charge_step()
         if isinstance(expression, Symbol):
             if expression in env:
                 return env[expression]
@@ -795,3 +1232,9 @@ class LispEvaluator:
         if callable(evaluated_operator):
             return evaluated_operator(*evaluated_args)
         raise ValueError(f"Cannot call operator: {evaluated_operator}")
+
+
+@lru_cache(maxsize=LISP_AST_CACHE_SIZE)
+def _parse_program(program: str) -> Any:
+    """Parsed ASTs are shared: evaluation never mutates them."""
+    return LispEvaluator._parse_uncached(program)
@@ -1,8 +1,13 @@
 import os
 import csv
+import sys
+import argparse
 from neo4j import GraphDatabase
 import time
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "import"))
+from bulk_staging import BulkStaging
+
 URI = "bolt://localhost:7687"
 AUTH = ("neo4j", "Mostar123")
 
@@ -26,7 +31,8 @@ def count_nodes(driver):
         result = session.run("MATCH (n) RETURN count(n) AS c")
         return result.single()["c"]
 
-def ingest_csv(driver, filepath, filename):
+def read_csv_records(filepath, filename):
+    """Returns (label, merge key, records) for one corpus file, or None."""
     label = filename.replace('.csv', '').replace('_', '').title()
     # Normalize some specific label names if needed
     if label.lower() == "reallife": label = "RealLife"
@@ -38,7 +44,7 @@ def ingest_csv(driver, filepath, filename):
             headers = next(reader)
         except StopIteration:
             print(f"  [!] {filename} is empty. Skipping.")
-            return
+            return None
 
         # Strip BOM strings if they exist
         headers = [h.replace('\ufeff', '').strip() for h in headers]
@@ -55,24 +61,53 @@ def ingest_csv(driver, filepath, filename):
                     record[headers[i]] = val
             batch_records.append(record)
 
-        if not batch_records:
-            return
+    if not batch_records:
+        return None
+    return label, pk, batch_records
 
-        # Execute idempotent MERGE
-        query = f"""
-        UNWIND $batch AS record
-        MERGE (n:{label} {{ `{pk}`: record.`{pk}` }})
-        SET n += record
-        """
-        
-        print(f"  [+] Merging {len(batch_records)} rows into (:{label}) matched on `{pk}`...")
-        
-        start = time.time()
-        with driver.session() as session:
-            session.run(query, batch=batch_records)
-        print(f"      -> Done in {time.time() - start:.2f}s")
+def ingest_csv(driver, filepath, filename):
+    parsed = read_csv_records(filepath, filename)
+    if parsed is None:
+        return
+    label, pk, batch_records = parsed
+
+    # Execute idempotent MERGE
+    query = f"""
+    UNWIND $batch AS record
+    MERGE (n:{label} {{ `{pk}`: record.`{pk}` }})
+    SET n += record
+    """
+    
+    print(f"  [+] Merging {len(batch_records)} rows into (:{label}) matched on `{pk}`...")
+    
+    start = time.time()
+    with driver.session() as session:
+        session.run(query, batch=batch_records)
+    print(f"      -> Done in {time.time() - start:.2f}s")
+
+def stage_bulk(valid_files, staging_dir):
+    """First load into an empty database: the same MERGEd nodes as neo4j-admin import files."""
+    staging = BulkStaging(staging_dir, id_space="CsvCorpus")
+    for cf in valid_files:
+        parsed = read_csv_records(os.path.join(CSV_DIR, cf), cf)
+        if parsed is None:
+            continue
+        label, pk, records = parsed
+        for record in records:
+            if record.get(pk) is None:
+                continue
+            staging.add_node(f"{label}:{record[pk]}", [label], record)
+    manifest = staging.write()
+    print(f"\n[BULK] Staged {manifest['nodes']} nodes in {manifest['staging_dir']}")
+    print(f"[BULK] Stop Neo4j, then run:\n  {manifest['command']}")
+    return manifest
 
 def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--bulk-stage", metavar="DIR",
+                        help="Empty database only: write neo4j-admin import files instead of merging over Bolt")
+    args = parser.parse_args()
+
     print(f"=== MoStar Grid Clean Import Sequence ===")
     print(f"Target Directory: {CSV_DIR}")
     
@@ -108,6 +143,10 @@ def main():
         return
 
     print(f"\n[OK] Total validated payload: {total_docs} nodes")
+
+    if args.bulk_stage:
+        stage_bulk(valid_files, args.bulk_stage)
+        return
     
     # Auto-mode for fast execution
     # input("Graph is structurally sound. Press Enter to commence MERGE ingestion to localhost:7687...")
@@ -0,0 +1,248 @@
+"""
+Offline first-load staging for neo4j-admin bulk import.
+
+The online import scripts push rows through Bolt ``UNWIND ... MERGE``
+batches. For an empty database, ``neo4j-admin database import full`` is far
+faster, so the scripts can instead hand their prepared nodes and
+relationships to ``BulkStaging``. It applies the same MERGE semantics in
+memory (one node per id, one relationship per type/start/end, properties
+merged last-write-wins), then writes header + data CSV files in one ID space
+and the exact import invocation.
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import shlex
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Iterable
+
+ARRAY_DELIMITER = ";"
+DEFAULT_DATABASE = "neo4j"
+COMMAND_FILE = "IMPORT_COMMAND.txt"
+
+
+def _quote(value: str) -> str:
+    return '"' + value.replace('"', '""') + '"'
+
+
+def _scalar_type(value: Any) -> str | None:
+    if isinstance(value, bool):
+        return "boolean"
+    if isinstance(value, int):
+        return "long"
+    if isinstance(value, float):
+        return "double"
+    if isinstance(value, datetime):
+        return "datetime" if value.tzinfo else "localdatetime"
+    if isinstance(value, date):
+        return "date"
+    if isinstance(value, str):
+        return "string"
+    return None
+
+
+def _widen(current: str | None, new: str) -> str:
+    if current is None or current == new:
+        return new
+    if {current, new} == {"long", "double"}:
+        return "double"
+    return "string"
+
+
+def _value_type(value: Any) -> str:
+    if isinstance(value, (list, tuple)):
+        element_type: str | None = None
+        for item in value:
+            item_type = _scalar_type(item)
+            if item_type is None or (
+                isinstance(item, str) and ARRAY_DELIMITER in item
+            ):
+                return "string"
+            element_type = _widen(element_type, item_type)
+        return f"{element_type or 'string'}[]"
+    return _scalar_type(value) or "string"
+
+
+def _column_type(current: str | None, value: Any) -> str:
+    value_type = _value_type(value)
+    if current is None or current == value_type:
+        return value_type
+    if current.endswith("[]") and value_type.endswith("[]"):
+        return _widen(current[:-2], value_type[:-2]) + "[]"
+    if current.endswith("[]") or value_type.endswith("[]"):
+        return "string"
+    return _widen(current, value_type)
+
+
+def _format_scalar(value: Any, column_type: str) -> str:
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if column_type == "double" and isinstance(value, int):
+        return str(float(value))
+    return str(value)
+
+
+def _format_value(value: Any, column_type: str) -> str:
+    """One CSV field; None stays an unquoted empty field (no property)."""
+    if value is None:
+        return ""
+    if column_type.endswith("[]"):
+        element_type = column_type[:-2]
+        return _quote(
+            ARRAY_DELIMITER.join(_format_scalar(item, element_type) for item in value)
+        )
+    if column_type == "string" and not isinstance(value, str):
+        if isinstance(value, (dict, list, tuple)):
+            return _quote(json.dumps(value, ensure_ascii=False, default=str, sort_keys=True))
+        return _quote(_format_scalar(value, column_type))
+    return _quote(_format_scalar(value, column_type))
+
+
+def _file_stem(name: str) -> str:
+    return re.sub(r"[^0-9A-Za-z_]+", "_", name).strip("_") or "group"
+
+
+class BulkStaging:
+    """Collects nodes and relationships, then writes neo4j-admin import files."""
+
+    def __init__(
+        self,
+        out_dir: str | Path,
+        *,
+        id_space: str = "Node",
+        database: str = DEFAULT_DATABASE,
+    ) -> None:
+        self.out_dir = Path(out_dir)
+        self.id_space = id_space
+        self.database = database
+        self.nodes: dict[str, tuple[set[str], dict[str, Any]]] = {}
+        self.relationships: dict[tuple[str, str, str], dict[str, Any]] = {}
+        self.files: dict[str, list[tuple[str, Path, Path]]] = {
+            "nodes": [],
+            "relationships": [],
+        }
+
+    # ── Collection (MERGE semantics) ──────────────────────────────
+    def add_node(self, node_id: Any, labels: Iterable[str], props: dict[str, Any]) -> None:
+        key = str(node_id)
+        entry = self.nodes.get(key)
+        if entry is None:
+            entry = self.nodes[key] = (set(), {})
+        entry[0].update(labels)
+        entry[1].update({k: v for k, v in props.items() if k and v is not None})
+
+    def add_relationship(
+        self,
+        rel_type: str,
+        start_id: Any,
+        end_id: Any,
+        props: dict[str, Any] | None = None,
+    ) -> bool:
+        """Returns False when an endpoint was never staged (MATCH finds nothing)."""
+        start, end = str(start_id), str(end_id)
+        if start not in self.nodes or end not in self.nodes:
+            return False
+        merged = self.relationships.setdefault((rel_type, start, end), {})
+        merged.update({k: v for k, v in (props or {}).items() if k and v is not None})
+        return True
+
+    # ── Output ────────────────────────────────────────────────────
+    def _write_group(
+        self,
+        kind: str,
+        name: str,
+        id_columns: list[str],
+        rows: list[tuple[list[str], dict[str, Any]]],
+    ) -> None:
+        column_types: dict[str, str | None] = {}
+        for _, props in rows:
+            for key, value in props.items():
+                column_types[key] = _column_type(column_types.get(key), value)
+        columns = sorted(column_types)
+        stem = f"{kind}_{len(self.files[kind]):03d}_{_file_stem(name)}"
+        header_path = self.out_dir / f"{stem}.header.csv"
+        data_path = self.out_dir / f"{stem}.csv"
+        header = id_columns + [
+            f"{column}:{column_types[column]}".replace(",", "_") for column in columns
+        ]
+        header_path.write_text(",".join(header) + "\n", encoding="utf-8")
+        with data_path.open("w", encoding="utf-8", newline="") as handle:
+            for ids, props in rows:
+                fields = [_quote(value) for value in ids]
+                fields += [
+                    _format_value(props.get(column), column_types[column] or "string")
+                    for column in columns
+                ]
+                handle.write(",".join(fields) + "\n")
+        self.files[kind].append((name, header_path, data_path))
+
+    def write(self) -> dict[str, Any]:
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        self.files = {"nodes": [], "relationships": []}
+
+        by_labels: dict[tuple[str, ...], list[tuple[list[str], dict[str, Any]]]] = {}
+        for node_id, (labels, props) in self.nodes.items():
+            by_labels.setdefault(tuple(sorted(labels)), []).append(([node_id], props))
+        for labels, rows in sorted(by_labels.items()):
+            self._write_group(
+                "nodes", ":".join(labels), [f":ID({self.id_space})"], rows
+            )
+
+        by_type: dict[str, list[tuple[list[str], dict[str, Any]]]] = {}
+        for (rel_type, start, end), props in self.relationships.items():
+            by_type.setdefault(rel_type, []).append(([start, end], props))
+        for rel_type, rows in sorted(by_type.items()):
+            self._write_group(
+                "relationships",
+                rel_type,
+                [f":START_ID({self.id_space})", f":END_ID({self.id_space})"],
+                rows,
+            )
+
+        command = self.command()
+        (self.out_dir / COMMAND_FILE).write_text(shlex.join(command) + "\n", encoding="utf-8")
+        return {
+            "staging_dir": str(self.out_dir),
+            "nodes": len(self.nodes),
+            "relationships": len(self.relationships),
+            "node_files": len(self.files["nodes"]),
+            "relationship_files": len(self.files["relationships"]),
+            "command": shlex.join(command),
+        }
+
+    def command(self, path_prefix: str | None = None) -> list[str]:
+        """
+        The neo4j-admin invocation for the written files. ``path_prefix``
+        replaces the staging directory in file paths, e.g. ``/import`` when
+        the directory is mounted into a container.
+        """
+
+        def _path(path: Path) -> str:
+            if path_prefix is None:
+                return str(path.resolve())
+            return f"{path_prefix.rstrip('/')}/{path.name}"
+
+        command = [
+            "neo4j-admin",
+            "database",
+            "import",
+            "full",
+            "--overwrite-destination=true",
+            "--id-type=string",
+            "--multiline-fields=true",
+            f"--array-delimiter={ARRAY_DELIMITER}",
+        ]
+        for labels, header_path, data_path in self.files["nodes"]:
+            prefix = f"{labels}=" if labels else ""
+            command.append(f"--nodes={prefix}{_path(header_path)},{_path(data_path)}")
+        for rel_type, header_path, data_path in self.files["relationships"]:
+            command.append(
+                f"--relationships={rel_type}={_path(header_path)},{_path(data_path)}"
+            )
+        command.append(self.database)
+        return command
@@ -22,6 +22,17 @@ from typing import Dict, Optional
 from neo4j import GraphDatabase
 from neo4j.exceptions import AuthError
 
+# Normalised lookup keys (core_engine/ibibio_lexicon.py). Without them the
+# grid runtime keys new words in its start-up backfill instead.
+try:
+    import sys
+
+    sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "core" / "grid-orchestrator"))
+    from core_engine.ibibio_lexicon import LEXICON_REVISION_BUMP, lexicon_keys
+except ImportError:
+    LEXICON_REVISION_BUMP = None
+    lexicon_keys = None
+
 
 def _load_env_file(env_path: Path) -> Dict[str, str]:
     if not env_path.exists():
@@ -405,6 +416,9 @@ class IbibioNeo4jIntegrator:
                 session.execute_write(self._create_word_node, entry)
                 if (i + 1) % 50 == 0:
                     print(f"   Imported {i + 1}/{len(word_data)}...")
+            # Re-imports edit words in place; tell runtime lexicon caches
+            if LEXICON_REVISION_BUMP:
+                session.run(LEXICON_REVISION_BUMP).consume()
 
         print(f"✅ Imported {len(word_data)} words")
 
@@ -420,9 +434,12 @@ class IbibioNeo4jIntegrator:
             w.frequency = $frequency,
             w.created_at = datetime(),
             w.last_accessed = datetime()
+        SET w += $keys
         """
+        keys = lexicon_keys(entry["ibibio"], entry["english"]) if lexicon_keys else {}
         tx.run(
             query,
+            keys=keys,
             ibibio=entry["ibibio"],
             tone=entry.get("tone_pattern"),
             pos=entry.get("pos"),
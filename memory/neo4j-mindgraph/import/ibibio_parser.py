@@ -14,10 +14,33 @@ Data Sources:
 
 import re
 import json
+import math
+import time
+import unicodedata
 from pathlib import Path
 from typing import Dict, List, Optional
 from collections import defaultdict
 
+# Gloss words too common to tell recordings apart
+AUDIO_STOPWORDS = {
+    'a', 'an', 'and', 'as', 'at', 'by', 'for', 'from', 'in', 'into', 'is', 'it',
+    'kind', 'of', 'on', 'or', 'something', 'the', 'to', 'up', 'with',
+}
+
+
+def audio_tokens(text: Optional[str]) -> List[str]:
+    """Lowercase, diacritic-free keyword tokens from a gloss or filename."""
+    if not text:
+        return []
+    folded = unicodedata.normalize('NFKD', text.lower())
+    folded = ''.join(ch for ch in folded if not unicodedata.combining(ch))
+    # Single letters are take suffixes (_b) and digits are archive ids
+    return [
+        token for token in re.findall(r'[a-z0-9]+', folded.replace("'", ''))
+        if len(token) > 1 and not token.isdigit() and token not in AUDIO_STOPWORDS
+    ]
+
+
 class IbibioDictionaryParser:
     """
     Parse Ibibio dictionary PDFs and map to audio files
@@ -266,45 +289,103 @@ class IbibioDictionaryParser:
         count = sum(1 for char in word.lower() if char in vowels)
         return max(1, count)
     
-    def map_audio_files(self):
+    def map_audio_files(self, min_confidence: float = 0.5, ambiguity_margin: float = 0.1) -> Dict:
         """
-        Map audio files to dictionary entries based on English translations
+        Map audio files to dictionary entries based on English translations.
+
+        Filename keywords go into an inverted index (token -> files), so each
+        entry only scores the files sharing one of its gloss tokens: the work
+        is O(total tokens) rather than O(entries x files). Scores are
+        idf-weighted overlap, normalised by the filename's own weight (a
+        filename is a short summary of its gloss), ties broken by how much of
+        the gloss the filename covers. Pairs are assigned best first, one
+        file per entry and one entry per file.
         """
+        report = {'matched': 0, 'entries': len(self.entries), 'files': 0,
+                  'ambiguous': [], 'unmatched': []}
         if not self.audio_dir.exists():
             print(f"⚠️  Audio directory not found: {self.audio_dir}")
-            return
+            return report
         
-        audio_files = list(self.audio_dir.glob('*.mp3'))
+        started = time.perf_counter()
+        audio_files = sorted(self.audio_dir.glob('*.mp3'))
+        report['files'] = len(audio_files)
         print(f"\n🎵 Mapping {len(audio_files)} audio files...")
         
-        # Create English keyword index
-        audio_map = {}
+        # Inverted index: filename keyword -> file ids
+        file_names = []
+        file_tokens = []
+        postings = defaultdict(list)
         for audio_file in audio_files:
             # Parse filename: ibibio_5_13_MU_9_mens_robes_b.mp3
-            name = audio_file.stem
-            parts = name.split('_')
-            
-            if len(parts) >= 5:
-                # Extract English description (after speaker code)
-                english_parts = parts[5:] if len(parts) > 5 else []
-                keywords = ' '.join(english_parts).replace('_', ' ').lower()
-                audio_map[keywords] = audio_file.name
+            parts = audio_file.stem.split('_')
+            if len(parts) < 5:
+                continue
+            # Extract English description (after speaker code)
+            tokens = set(audio_tokens(' '.join(parts[5:])))
+            if not tokens:
+                continue
+            file_id = len(file_names)
+            file_names.append(audio_file.name)
+            file_tokens.append(tokens)
+            for token in tokens:
+                postings[token].append(file_id)
         
-        # Match entries to audio
-        matched = 0
-        for entry in self.entries:
-            english = entry['english'].lower()
-            
-            # Try various matching strategies
-            for keywords, audio_file in audio_map.items():
-                if (keywords in english or 
-                    english.split()[0] in keywords or  # First word match
-                    any(word in keywords for word in english.split()[:3])):  # Any of first 3 words
-                    entry['audio_file'] = audio_file
-                    matched += 1
-                    break
+        total = max(1, len(file_names))
+        idf = {token: math.log(1 + total / len(ids)) for token, ids in postings.items()}
+        file_weight = [sum(idf[t] for t in tokens) for tokens in file_tokens]
+        
+        # Score every (entry, file) pair that shares at least one token
+        pairs = []
+        for entry_id, entry in enumerate(self.entries):
+            overlap = defaultdict(float)
+            tokens = set(audio_tokens(entry.get('english')))
+            for token in tokens:
+                for file_id in postings.get(token, ()):
+                    overlap[file_id] += idf[token]
+            if not overlap:
+                continue
+            entry_weight = sum(idf.get(t, math.log(1 + total)) for t in tokens)
+            scored = sorted(
+                (
+                    (weight / file_weight[file_id], weight / entry_weight, file_id)
+                    for file_id, weight in overlap.items()
+                ),
+                reverse=True,
+            )
+            if scored[0][0] < min_confidence:
+                continue
+            if len(scored) > 1 and scored[0][0] - scored[1][0] < ambiguity_margin:
+                report['ambiguous'].append({
+                    'ibibio': entry['ibibio'],
+                    'english': entry['english'],
+                    'candidates': [
+                        {'audio_file': file_names[file_id], 'confidence': round(score, 3)}
+                        for score, _, file_id in scored[:3]
+                    ],
+                })
+            pairs.extend(
+                (score, coverage, entry_id, file_id)
+                for score, coverage, file_id in scored if score >= min_confidence
+            )
+        
+        # Best pairs first; each file and each entry is used once
+        pairs.sort(key=lambda pair: (-pair[0], -pair[1], pair[2], pair[3]))
+        used_files = set()
+        for score, _, entry_id, file_id in pairs:
+            entry = self.entries[entry_id]
+            if entry['audio_file'] or file_id in used_files:
+                continue
+            entry['audio_file'] = file_names[file_id]
+            entry['audio_confidence'] = round(score, 3)
+            used_files.add(file_id)
+            report['matched'] += 1
         
-        print(f"✅ Matched {matched}/{len(self.entries)} entries to audio")
+        report['unmatched'] = [e['ibibio'] for e in self.entries if not e['audio_file']]
+        report['seconds'] = round(time.perf_counter() - started, 3)
+        print(f"✅ Matched {report['matched']}/{len(self.entries)} entries to audio "
+              f"({len(report['ambiguous'])} ambiguous, {report['seconds']}s)")
+        return report
     
     def export_json(self, output_path: Path):
         """Export complete dictionary to JSON"""
@@ -370,7 +451,9 @@ def main():
     parser.extract_from_pdfs()
     
     # Map audio files
-    parser.map_audio_files()
+    report = parser.map_audio_files()
+    with open(output_dir / 'audio_match_report.json', 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
     
     # Export
     parser.export_json(output_dir / 'ibibio_dictionary.json')
@@ -1,78 +1,41 @@
-import os
-import csv
-import json
-from neo4j import GraphDatabase
+"""
+Loads the remaining CSV tables and the Ibibio dictionary as plain nodes.
+Same specs and connection defaults as scripts/import_all_remaining.py;
+only the checkpoint file differs.
+"""
 
-# === CONFIG ===
-IMPORT_DIR = r"C:\Users\AI\Documents\MoStar\Mo Docs\neo4j-community-2025.10.1\import"
-NEO4J_URI = "bolt://localhost:7687"
-NEO4J_USER = "neo4j"
-NEO4J_PASS = "mostar123"
+import importlib.util
+from pathlib import Path
 
-driver = GraphDatabase.driver(NEO4J_URI, auth=(NEO4J_USER, NEO4J_PASS))
+CHECKPOINT_PATH = str(Path(__file__).with_suffix(".checkpoint.json"))
 
-# === CSV LOADER ===
-def load_csv(filename, label):
-    full_path = os.path.join(IMPORT_DIR, filename)
-    with open(full_path, encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            props = {k: v for k, v in row.items() if v}
-            name = props.get('name') or props.get('id') or os.path.splitext(filename)[0]
-            with driver.session() as session:
-                session.run(
-                    f"MERGE (n:{label} {{name: $name}}) SET n += $props",
-                    name=name,
-                    props=props
-                )
+SPEC_MODULE_PATH = (
+    Path(__file__).resolve().parents[3] / "scripts" / "import_all_remaining.py"
+)
 
-# === JSON LOADER ===
-def load_json(filename, label):
-    full_path = os.path.join(IMPORT_DIR, filename)
 
-    with open(full_path, encoding="utf-8") as f:
-        try:
-            data = json.load(f)
-            if isinstance(data, dict) and "rows" in data:
-                data = data["rows"]
-            elif isinstance(data, list) and all(isinstance(item, str) for item in data):
-                # Handle edge case: JSON array of strings
-                data = [json.loads(line) for line in data]
-        except json.JSONDecodeError:
-            f.seek(0)
-            data = [json.loads(line.strip()) for line in f if line.strip()]
+def _load_spec_module():
+    # Same module name as this file, so load it by path rather than import it
+    spec = importlib.util.spec_from_file_location("import_all_remaining_specs", SPEC_MODULE_PATH)
+    if spec is None or spec.loader is None:
+        raise RuntimeError(f"Unable to load module from {SPEC_MODULE_PATH}")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
 
-    with driver.session() as session:
-        for item in data:
-            if isinstance(item, str):
-                item = json.loads(item)  # ensure it's a dict
 
-            word = item.get('word:ID') or item.get('word') or item.get('id')
-            if word:
-                session.run(
-                    f"MERGE (n:{label} {{word: $word}}) SET n += $props",
-                    word=word,
-                    props=item
-                )
+_specs = _load_spec_module()
+IMPORT_DIR = _specs.IMPORT_DIR
+NEO4J_URI = _specs.NEO4J_URI
+NEO4J_PASS = _specs.NEO4J_PASS
+build_phases = _specs.build_phases
 
-# === RUN IMPORTS ===
-csv_files = [
-    ("african_philosophies.csv", "Philosophy"),
-    ("medicinal_plants.csv", "Plant"),
-    ("healing_practices.csv", "Healing"),
-    ("knowledge_graph.csv", "Knowledge"),
-    ("science.csv", "Science"),
-    ("ethics.csv", "Ethics"),
-    ("childhood.csv", "Childhood"),
-    ("adulthood.csv", "Adulthood"),
-    ("ibibio_words.csv", "IbibioWord")
-]
 
-for fname, label in csv_files:
-    print(f"Loading {fname}...")
-    load_csv(fname, label)
+def main(uri=NEO4J_URI, import_dir=IMPORT_DIR, password=NEO4J_PASS,
+         checkpoint=CHECKPOINT_PATH):
+    _specs.main(uri=uri, import_dir=import_dir, password=password, checkpoint=checkpoint)
 
-print("Loading ibibio_dictionary.json...")
-load_json("ibibio_dictionary.json", "IbibioWord")
 
-print("✅ ALL DONE.")
+# === RUN IMPORTS ===
+if __name__ == "__main__":
+    main()
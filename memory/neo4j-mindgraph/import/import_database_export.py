@@ -11,6 +11,8 @@ from typing import Any
 from dotenv import dotenv_values
 from neo4j import GraphDatabase
 
+from bulk_staging import DEFAULT_DATABASE, BulkStaging
+
 BACKEND_DIR = Path(__file__).resolve().parents[2]
 EXPORT_BASE_DIR = Path(__file__).resolve().parent / "database_export"
 ENV_PATH = BACKEND_DIR / ".env"
@@ -389,6 +391,36 @@ def merge_relationship_batches(
     return stats
 
 
+def stage_bulk_import(
+    grouped_nodes: dict[
+        tuple[str, tuple[str, ...], tuple[str, ...]], list[dict[str, Any]]
+    ],
+    grouped_relationships: dict[str, list[dict[str, Any]]],
+    staging_dir: Path,
+    database: str,
+) -> dict[str, Any]:
+    """
+    First-load alternative to merge_node_batches/merge_relationship_batches:
+    the same nodes and relationships, keyed on the canonical export_id, as
+    neo4j-admin import files.
+    """
+    staging = BulkStaging(staging_dir, id_space="ExportSnapshot", database=database)
+    for (_, all_labels, _), rows in grouped_nodes.items():
+        labels = ["ImportedSnapshot", *all_labels]
+        for row in rows:
+            staging.add_node(row["props"]["export_id"], labels, row["props"])
+    unmatched = 0
+    for rel_type, rows in grouped_relationships.items():
+        for row in rows:
+            if not staging.add_relationship(
+                rel_type, row["from_id"], row["to_id"], row["props"]
+            ):
+                unmatched += 1
+    manifest = staging.write()
+    manifest["relationships_without_endpoints"] = unmatched
+    return manifest
+
+
 def snapshot_totals(driver, snapshot_tag: str) -> dict[str, int]:
     node_query = (
         "MATCH (n:ImportedSnapshot {source_export_snapshot: $snapshot_tag}) "
@@ -425,10 +457,16 @@ def main() -> None:
     parser.add_argument("--batch-size", type=int, default=1000)
     parser.add_argument("--relationships-batch-size", type=int, default=2000)
     parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument(
+        "--bulk-stage",
+        metavar="DIR",
+        help="Write neo4j-admin import files for an empty database instead of merging over Bolt",
+    )
+    parser.add_argument("--database", default=DEFAULT_DATABASE)
     args = parser.parse_args()
 
     config = resolve_neo4j_config()
-    if not config["password"]:
+    if not config["password"] and not args.bulk_stage:
         raise SystemExit(
             "NEO4J_PASSWORD is not configured. Set it in backend/.env or environment variables."
         )
@@ -455,6 +493,14 @@ def main() -> None:
     if args.dry_run:
         return
 
+    if args.bulk_stage:
+        manifest = stage_bulk_import(
+            grouped_nodes, grouped_relationships, Path(args.bulk_stage), args.database
+        )
+        for key, value in manifest.items():
+            print(f"bulk_{key}={value}")
+        return
+
     driver = GraphDatabase.driver(
         config["uri"], auth=(config["user"], config["password"])
     )
@@ -0,0 +1,679 @@
+"""
+Declarative, resumable Neo4j import engine.
+
+The import scripts used to each carry their own driver handling, pandas
+reads and ``UNWIND ... CREATE`` loops. They now describe *what* to load as
+``SourceSpec`` / ``CypherStep`` entries grouped into ``Phase`` objects and
+hand them to ``Importer``, which owns the mechanics:
+
+- rows are coerced in Python and written as ``UNWIND $rows ... MERGE``
+  batches, so replaying a batch is harmless;
+- each batch is one write transaction, with up to ``writers`` batches in
+  flight on separate sessions;
+- progress is checkpointed per step as the contiguous prefix of committed
+  batches, so a crash at batch 4,812 resumes at 4,812 on the next run; a
+  run that finishes drops its phases' entries, so the next run starts over;
+- every phase ends with a throughput / batch-latency report.
+
+Relationship specs run as a second pass over a source's rows once all of
+its nodes exist, so self-referencing sources (``bonded_to`` -> Entity.name)
+resolve regardless of row order. Targets in *other* sources must be loaded
+by an earlier step.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import hashlib
+import json
+import os
+import re
+import statistics
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Sequence
+
+DEFAULT_BATCH_SIZE = int(os.getenv("IMPORT_BATCH_SIZE", "1000"))
+DEFAULT_WRITERS = int(os.getenv("IMPORT_WRITERS", "4"))
+CHECKPOINT_VERSION = 1
+
+_IDENTIFIER = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+def _ident(name: str) -> str:
+    """Backtick-quote labels, types and keys that are not plain identifiers."""
+    if _IDENTIFIER.match(name):
+        return name
+    return "`" + name.replace("`", "``") + "`"
+
+
+# ── Coercions ─────────────────────────────────────────────────────
+
+def _blank(value: Any) -> bool:
+    return value is None or (isinstance(value, str) and not value.strip())
+
+
+def as_str(value: Any) -> str | None:
+    return None if _blank(value) else str(value).strip()
+
+
+def trimmed(value: Any) -> str:
+    """Like ``coalesce(trim(x), '')``: never missing, always a string."""
+    return "" if value is None else str(value).strip()
+
+
+def as_int(value: Any) -> int | None:
+    if _blank(value):
+        return None
+    try:
+        return int(float(value))
+    except (TypeError, ValueError):
+        return None
+
+
+def as_float(value: Any) -> float | None:
+    if _blank(value):
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def as_datetime(value: Any) -> datetime | str | None:
+    """ISO timestamps become datetimes; anything unparseable is kept as text."""
+    if _blank(value):
+        return None
+    if isinstance(value, datetime):
+        return value
+    text = str(value).strip()
+    try:
+        return datetime.fromisoformat(text.replace("Z", "+00:00"))
+    except ValueError:
+        return text
+
+
+# ── Row readers ───────────────────────────────────────────────────
+
+class CsvRows:
+    """Re-readable CSV source; blank cells come through as None."""
+
+    def __init__(self, path: str | os.PathLike, encoding: str = "utf-8-sig") -> None:
+        self.path = Path(path)
+        self.encoding = encoding
+
+    def exists(self) -> bool:
+        return self.path.is_file()
+
+    def fingerprint(self) -> str:
+        stat = self.path.stat()
+        return f"{stat.st_size}:{int(stat.st_mtime)}"
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        with self.path.open(encoding=self.encoding, newline="") as handle:
+            for row in csv.DictReader(handle):
+                yield {
+                    key: (None if value == "" else value)
+                    for key, value in row.items()
+                    if key
+                }
+
+    def __str__(self) -> str:
+        return str(self.path)
+
+
+class JsonRows(CsvRows):
+    """JSON array, ``{"rows"|"entries": [...]}`` wrapper, or JSON-lines file."""
+
+    RECORD_KEYS = ("rows", "entries")
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        with self.path.open(encoding=self.encoding) as handle:
+            try:
+                data = json.load(handle)
+            except json.JSONDecodeError:
+                handle.seek(0)
+                data = [json.loads(line) for line in handle if line.strip()]
+        if isinstance(data, dict):
+            key = next((k for k in self.RECORD_KEYS if isinstance(data.get(k), list)), None)
+            data = data[key] if key else [data]
+        for item in data:
+            if isinstance(item, str):
+                item = json.loads(item)
+            if isinstance(item, dict):
+                yield item
+
+
+class StaticRows:
+    """In-script seed rows (covenant rules, agents, generated Odù, ...)."""
+
+    def __init__(self, rows: Iterable[dict[str, Any]] | Callable[[], Iterable[dict[str, Any]]]) -> None:
+        self._rows = rows
+
+    def exists(self) -> bool:
+        return True
+
+    def fingerprint(self) -> str:
+        return "static"
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        rows = self._rows() if callable(self._rows) else self._rows
+        return iter(rows)
+
+    def __str__(self) -> str:
+        return "<static>"
+
+
+# ── Specs ─────────────────────────────────────────────────────────
+
+@dataclass
+class RelationshipSpec:
+    """
+    One relationship per source row: ``(row node)-[:type]->(target)``.
+
+    The target is matched on ``target_label {target_key: value}`` where the
+    value is the row's ``column`` (raw source column) or a fixed ``constant``.
+    Rows with a blank value produce no relationship.
+    """
+
+    type: str
+    target_label: str
+    target_key: str = "name"
+    column: str | None = None
+    constant: Any = None
+    incoming: bool = False
+
+    def value(self, raw: dict[str, Any]) -> Any:
+        if self.column is None:
+            return self.constant
+        value = raw.get(self.column)
+        return None if _blank(value) else value
+
+
+@dataclass
+class SourceSpec:
+    """
+    Nodes from one source.
+
+    ``properties`` maps node property -> source column (default: every
+    column under its own name); ``coerce`` maps node property -> callable,
+    with ``coerce_all`` applied to properties that have no explicit entry.
+    ``transform`` may rewrite or drop (return None) a raw row first. Rows
+    missing any ``merge_keys`` value are counted as skipped.
+    """
+
+    name: str
+    label: str
+    merge_keys: Sequence[str]
+    rows: Any
+    properties: dict[str, str] | None = None
+    coerce: dict[str, Callable[[Any], Any]] = field(default_factory=dict)
+    coerce_all: Callable[[Any], Any] | None = None
+    transform: Callable[[dict[str, Any]], dict[str, Any] | None] | None = None
+    relationships: list[RelationshipSpec] = field(default_factory=list)
+    batch_size: int | None = None
+
+    def prepare(self, raw: dict[str, Any]) -> dict[str, Any] | None:
+        """Returns ``{"key": {...}, "props": {...}}`` or None to skip."""
+        if self.transform is not None:
+            raw = self.transform(raw)
+            if raw is None:
+                return None
+        mapping = self.properties or {column: column for column in raw}
+        props: dict[str, Any] = {}
+        for prop, column in mapping.items():
+            value = raw.get(column)
+            coerce = self.coerce.get(prop, self.coerce_all)
+            if coerce is not None:
+                value = coerce(value)
+            if value is not None:
+                props[prop] = value
+        key = {name: props.get(name) for name in self.merge_keys}
+        if any(_blank(value) for value in key.values()):
+            return None
+        return {
+            "key": key,
+            "props": props,
+            "rels": [rel.value(raw) for rel in self.relationships],
+        }
+
+    def node_query(self) -> str:
+        keys = ", ".join(f"{_ident(k)}: row.key.{_ident(k)}" for k in self.merge_keys)
+        return (
+            "UNWIND $rows AS row\n"
+            f"MERGE (n:{_ident(self.label)} {{{keys}}})\n"
+            "SET n += row.props"
+        )
+
+    def relationship_query(self, index: int) -> str:
+        rel = self.relationships[index]
+        keys = ", ".join(f"{_ident(k)}: row.key.{_ident(k)}" for k in self.merge_keys)
+        arrow = (
+            f"(n)<-[:{_ident(rel.type)}]-(m)" if rel.incoming
+            else f"(n)-[:{_ident(rel.type)}]->(m)"
+        )
+        return (
+            "UNWIND $rows AS row\n"
+            f"WITH row WHERE row.rels[{index}] IS NOT NULL\n"
+            f"MATCH (n:{_ident(self.label)} {{{keys}}})\n"
+            f"MATCH (m:{_ident(rel.target_label)} {{{_ident(rel.target_key)}: row.rels[{index}]}})\n"
+            f"MERGE {arrow}"
+        )
+
+
+@dataclass
+class CypherStep:
+    """A single statement (index, hand-written relationship pass, cleanup)."""
+
+    name: str
+    query: str
+    params: dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class Phase:
+    name: str
+    steps: list[SourceSpec | CypherStep]
+
+
+# ── Checkpoint ────────────────────────────────────────────────────
+
+class Checkpoint:
+    """
+    JSON file of ``{step_id: {"batches": n, "rows": n, "fingerprint": s,
+    "done": bool}}``. Writes go through a temp file + rename so a crash
+    never leaves a torn checkpoint.
+    """
+
+    def __init__(self, path: str | os.PathLike | None) -> None:
+        self.path = Path(path) if path else None
+        self.state: dict[str, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        if self.path and self.path.is_file():
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+            if data.get("version") == CHECKPOINT_VERSION:
+                self.state = data.get("steps", {})
+
+    def get(self, step_id: str, fingerprint: str) -> dict[str, Any]:
+        entry = self.state.get(step_id)
+        if not entry or entry.get("fingerprint") != fingerprint:
+            return {"batches": 0, "rows": 0, "fingerprint": fingerprint, "done": False}
+        return dict(entry)
+
+    def save(self, step_id: str, entry: dict[str, Any]) -> None:
+        with self._lock:
+            self.state[step_id] = dict(entry)
+        self.save_all()
+
+    def drop_phases(self, names: Iterable[str]) -> None:
+        """Forget finished phases; removes the file once nothing is left."""
+        prefixes = tuple(f"{name}/" for name in names)
+        with self._lock:
+            steps = {k: v for k, v in self.state.items() if not k.startswith(prefixes)}
+            dropped = len(steps) != len(self.state)
+            self.state = steps
+        if not steps:
+            self.clear()
+        elif dropped:
+            self.save_all()
+
+    def save_all(self) -> None:
+        with self._lock:
+            if self.path is None:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+            tmp.write_text(
+                json.dumps({"version": CHECKPOINT_VERSION, "steps": self.state}, indent=2),
+                encoding="utf-8",
+            )
+            os.replace(tmp, self.path)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.state = {}
+            if self.path is not None and self.path.exists():
+                self.path.unlink()
+
+
+# ── Engine ────────────────────────────────────────────────────────
+
+class _StepStats:
+    def __init__(self, phase: str, step: str) -> None:
+        self.phase = phase
+        self.step = step
+        self.rows = 0
+        self.skipped = 0
+        self.batches = 0
+        self.resumed_batches = 0
+        self.latencies: list[float] = []
+        self.started = time.perf_counter()
+        self.elapsed = 0.0
+        self.status = "ok"
+
+    def as_dict(self) -> dict[str, Any]:
+        latencies = sorted(self.latencies)
+
+        def _pct(p: float) -> float:
+            if not latencies:
+                return 0.0
+            return latencies[min(len(latencies) - 1, int(round(p * (len(latencies) - 1))))]
+
+        return {
+            "phase": self.phase,
+            "step": self.step,
+            "status": self.status,
+            "rows": self.rows,
+            "skipped": self.skipped,
+            "batches": self.batches,
+            "resumed_batches": self.resumed_batches,
+            "seconds": round(self.elapsed, 3),
+            "rows_per_second": round(self.rows / self.elapsed, 1) if self.elapsed else 0.0,
+            "batch_ms_p50": round(statistics.median(latencies) * 1000, 1) if latencies else 0.0,
+            "batch_ms_p95": round(_pct(0.95) * 1000, 1),
+            "batch_ms_max": round(latencies[-1] * 1000, 1) if latencies else 0.0,
+        }
+
+
+class Importer:
+    """Runs phases of specs against a driver with batching and checkpoints."""
+
+    def __init__(
+        self,
+        driver,
+        *,
+        database: str | None = None,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        writers: int = DEFAULT_WRITERS,
+        checkpoint: Checkpoint | str | os.PathLike | None = None,
+    ) -> None:
+        self.driver = driver
+        self.database = database
+        self.batch_size = max(1, batch_size)
+        self.writers = max(1, writers)
+        self.checkpoint = checkpoint if isinstance(checkpoint, Checkpoint) else Checkpoint(checkpoint)
+        self.report: list[dict[str, Any]] = []
+
+    # ── Transactions ──────────────────────────────────────────────
+    def _session(self):
+        if self.database:
+            return self.driver.session(database=self.database)
+        return self.driver.session()
+
+    def _write(self, statements: list[tuple[str, dict[str, Any]]]) -> float:
+        def _work(tx):
+            for query, params in statements:
+                tx.run(query, params).consume()
+
+        started = time.perf_counter()
+        with self._session() as session:
+            session.execute_write(_work)
+        return time.perf_counter() - started
+
+    # ── Steps ─────────────────────────────────────────────────────
+    @staticmethod
+    def _cypher_fingerprint(phase: Phase, step: CypherStep) -> str:
+        # A hand-written pass reads what its phase's sources wrote, so it
+        # re-runs whenever one of them (or the statement itself) changes.
+        digest = hashlib.sha1(step.query.encode("utf-8"))
+        digest.update(json.dumps(step.params, sort_keys=True, default=str).encode("utf-8"))
+        for source in phase.steps:
+            if isinstance(source, SourceSpec):
+                fingerprint = source.rows.fingerprint() if source.rows.exists() else "missing"
+                digest.update(f"{source.name}={fingerprint};".encode("utf-8"))
+        return digest.hexdigest()
+
+    def _run_cypher(self, phase: Phase, step: CypherStep) -> _StepStats:
+        stats = _StepStats(phase.name, step.name)
+        step_id = f"{phase.name}/{step.name}"
+        entry = self.checkpoint.get(step_id, self._cypher_fingerprint(phase, step))
+        if entry["done"]:
+            stats.status = "resumed"
+        else:
+            stats.latencies.append(self._write([(step.query, step.params)]))
+            stats.batches = 1
+            entry["done"] = True
+            self.checkpoint.save(step_id, entry)
+        stats.elapsed = time.perf_counter() - stats.started
+        return stats
+
+    def _batches(self, spec: SourceSpec, stats: _StepStats) -> Iterator[list[dict[str, Any]]]:
+        size = spec.batch_size or self.batch_size
+        batch: list[dict[str, Any]] = []
+        for raw in spec.rows:
+            row = spec.prepare(raw)
+            if row is None:
+                stats.skipped += 1
+                continue
+            batch.append(row)
+            if len(batch) >= size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+    def _run_pass(
+        self,
+        phase: Phase,
+        spec: SourceSpec,
+        pass_name: str,
+        statements: Callable[[list[dict[str, Any]]], list[tuple[str, dict[str, Any]]]],
+    ) -> _StepStats:
+        stats = _StepStats(phase.name, f"{spec.name}:{pass_name}")
+        step_id = f"{phase.name}/{spec.name}/{pass_name}"
+        entry = self.checkpoint.get(step_id, spec.rows.fingerprint())
+        if entry["done"]:
+            stats.status = "resumed"
+            stats.resumed_batches = entry["batches"]
+            return stats
+
+        start_batch = entry["batches"]
+        stats.resumed_batches = start_batch
+        completed: dict[int, int] = {}
+        pending: dict[Any, int] = {}
+        max_in_flight = self.writers * 2
+
+        def _advance() -> None:
+            # Only the contiguous prefix counts; later batches are replayed
+            # (MERGE is idempotent) if we crash before the gap closes.
+            moved = False
+            while entry["batches"] in completed:
+                entry["rows"] += completed.pop(entry["batches"])
+                entry["batches"] += 1
+                moved = True
+            if moved:
+                self.checkpoint.save(step_id, entry)
+
+        def _collect(done) -> None:
+            for future in done:
+                index = pending.pop(future)
+                latency, size = future.result()
+                stats.latencies.append(latency)
+                stats.batches += 1
+                stats.rows += size
+                completed[index] = size
+            _advance()
+
+        def _job(batch: list[dict[str, Any]]) -> tuple[float, int]:
+            return self._write(statements(batch)), len(batch)
+
+        with ThreadPoolExecutor(max_workers=self.writers, thread_name_prefix="import-writer") as pool:
+            try:
+                for index, batch in enumerate(self._batches(spec, stats)):
+                    if index < start_batch:
+                        continue
+                    while len(pending) >= max_in_flight:
+                        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                        _collect(done)
+                    pending[pool.submit(_job, batch)] = index
+                while pending:
+                    done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                    _collect(done)
+            except BaseException:
+                # Let in-flight batches land so the checkpoint is as far
+                # along as possible before the error propagates.
+                for future, index in list(pending.items()):
+                    try:
+                        latency, size = future.result()
+                    except BaseException:
+                        continue
+                    stats.latencies.append(latency)
+                    stats.batches += 1
+                    stats.rows += size
+                    completed[index] = size
+                pending.clear()
+                _advance()
+                stats.status = "failed"
+                stats.elapsed = time.perf_counter() - stats.started
+                self.report.append(stats.as_dict())
+                raise
+
+        entry["done"] = True
+        self.checkpoint.save(step_id, entry)
+        stats.elapsed = time.perf_counter() - stats.started
+        return stats
+
+    def _run_source(self, phase: Phase, spec: SourceSpec) -> list[_StepStats]:
+        if not spec.rows.exists():
+            print(f"⚠️  [IMPORT] {spec.name}: source not found ({spec.rows}), skipping")
+            stats = _StepStats(phase.name, f"{spec.name}:nodes")
+            stats.status = "missing"
+            return [stats]
+
+        node_query = spec.node_query()
+        results = [self._run_pass(
+            phase, spec, "nodes",
+            lambda batch: [(node_query, {"rows": batch})],
+        )]
+        if spec.relationships:
+            rel_queries = [spec.relationship_query(i) for i in range(len(spec.relationships))]
+            results.append(self._run_pass(
+                phase, spec, "relationships",
+                lambda batch: [(query, {"rows": batch}) for query in rel_queries],
+            ))
+        return results
+
+    # ── Public API ────────────────────────────────────────────────
+    def run(self, phases: Sequence[Phase], only: Sequence[str] | None = None) -> list[dict[str, Any]]:
+        """
+        Runs every phase (or just ``only``); returns the per-step report.
+        Checkpoint entries only outlive a run that raised, so the next run
+        resumes it; a finished run leaves nothing to resume.
+        """
+        self.report = []
+        finished: list[str] = []
+        for phase in phases:
+            if only and phase.name not in only:
+                continue
+            print(f"\n🔥 [IMPORT] Phase: {phase.name}")
+            phase_started = time.perf_counter()
+            phase_stats: list[_StepStats] = []
+            for step in phase.steps:
+                if isinstance(step, CypherStep):
+                    step_stats = [self._run_cypher(phase, step)]
+                else:
+                    step_stats = self._run_source(phase, step)
+                for stats in step_stats:
+                    row = stats.as_dict()
+                    self.report.append(row)
+                    phase_stats.append(stats)
+                    print(
+                        f"  ✓ {row['step']:<40} {row['status']:<8} {row['rows']:>8,} rows "
+                        f"{row['batches']:>5} batches {row['rows_per_second']:>9,.1f} rows/s "
+                        f"p50 {row['batch_ms_p50']:.1f}ms p95 {row['batch_ms_p95']:.1f}ms"
+                    )
+            self._print_phase_summary(phase.name, phase_stats, time.perf_counter() - phase_started)
+            finished.append(phase.name)
+        self.checkpoint.drop_phases(finished)
+        return self.report
+
+    @staticmethod
+    def _print_phase_summary(name: str, stats: list[_StepStats], elapsed: float) -> None:
+        rows = sum(s.rows for s in stats)
+        latencies = sorted(l for s in stats for l in s.latencies)
+        p95 = latencies[int(round(0.95 * (len(latencies) - 1)))] * 1000 if latencies else 0.0
+        rate = rows / elapsed if elapsed else 0.0
+        print(
+            f"✅ [IMPORT] {name}: {rows:,} rows in {elapsed:.2f}s "
+            f"({rate:,.1f} rows/s, {len(latencies)} txns, p95 {p95:.1f}ms)"
+        )
+
+
+# ── CLI ───────────────────────────────────────────────────────────
+
+def add_arguments(parser: argparse.ArgumentParser, checkpoint: str) -> argparse.ArgumentParser:
+    parser.add_argument("--uri", default=os.getenv("NEO4J_URI", "bolt://localhost:7687"))
+    parser.add_argument("--user", default=os.getenv("NEO4J_USER", "neo4j"))
+    parser.add_argument("--password", default=os.getenv("NEO4J_PASSWORD"))
+    parser.add_argument("--database", default=os.getenv("NEO4J_DATABASE") or None)
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE,
+                        help="Rows per UNWIND transaction")
+    parser.add_argument("--writers", type=int, default=DEFAULT_WRITERS,
+                        help="Concurrent write sessions per step")
+    parser.add_argument("--checkpoint", default=checkpoint,
+                        help="Progress file used to resume an interrupted run")
+    parser.add_argument("--restart", action="store_true",
+                        help="Ignore and reset the checkpoint")
+    parser.add_argument("--phase", action="append", dest="phases",
+                        help="Only run this phase (repeatable)")
+    parser.add_argument("--report", help="Write the per-step report as JSON here")
+    return parser
+
+
+def run_cli(
+    phases: Sequence[Phase] | Callable[[argparse.Namespace], Sequence[Phase]],
+    *,
+    description: str,
+    checkpoint: str,
+    password: str | None = None,
+    prepare: Callable[[argparse.ArgumentParser], None] | None = None,
+    before: Callable[[Any, argparse.Namespace], None] | None = None,
+    after: Callable[[Any, argparse.Namespace], None] | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Shared entry point for the thin spec scripts. ``phases`` may be a
+    callable taking the parsed args (for scripts with their own flags, added
+    through ``prepare``); ``before`` / ``after`` run once with the driver
+    around the phases (clearing, verification counts); ``before`` may set
+    ``args.restart``.
+    """
+    from neo4j import GraphDatabase
+
+    parser = add_arguments(argparse.ArgumentParser(description=description), checkpoint)
+    if prepare is not None:
+        prepare(parser)
+    args = parser.parse_args()
+    if args.password is None:
+        args.password = password if password is not None else input("Enter Neo4j password: ")
+
+    driver = GraphDatabase.driver(args.uri, auth=(args.user, args.password))
+    try:
+        driver.verify_connectivity()
+        print(f"🔌 [IMPORT] Connected to {args.uri}")
+        if before is not None:
+            before(driver, args)
+        importer = Importer(
+            driver,
+            database=args.database,
+            batch_size=args.batch_size,
+            writers=args.writers,
+            checkpoint=args.checkpoint,
+        )
+        if args.restart:
+            importer.checkpoint.clear()
+        selected = phases(args) if callable(phases) else phases
+        started = time.perf_counter()
+        report = importer.run(selected, only=args.phases)
+        print(f"\n🔥 [IMPORT] Complete in {time.perf_counter() - started:.2f}s")
+        if after is not None:
+            after(driver, args)
+        if args.report:
+            Path(args.report).write_text(json.dumps(report, indent=2), encoding="utf-8")
+        return report
+    finally:
+        driver.close()
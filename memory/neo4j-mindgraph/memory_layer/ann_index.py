@@ -0,0 +1,110 @@
+"""
+FAISS index types for the moment store.
+
+    flat      exact scan (IDMap,Flat) — the default
+    sq8       exact scan over int8-quantized vectors (4x smaller)
+    hnsw      graph search (HNSW{M}); tune efSearch at query time
+    ivf_flat  inverted lists over k-means cells; tune nprobe
+    ivf_sq8   IVF with int8 vectors
+    ivf_pq    IVF with product-quantized codes (PQ{m}x8, ~dim*4/m smaller)
+
+IVF and PQ types are trained on ingest (on the vectors being built), so
+they are chosen when the store is (re)built; later incremental ingests add
+to the trained cells. Every type keeps caller-assigned vector IDs, so the
+ingest manifest stays valid across deletes.
+"""
+
+import math
+import os
+from typing import Optional
+
+import faiss
+import numpy as np
+
+INDEX_TYPES = ("flat", "sq8", "hnsw", "ivf_flat", "ivf_sq8", "ivf_pq")
+
+MEMORY_INDEX_TYPE = os.getenv("MEMORY_INDEX_TYPE", "flat")
+# 0 = derive from corpus size (≈4·√n, at least 39 training points per cell)
+MEMORY_IVF_NLIST = int(os.getenv("MEMORY_IVF_NLIST", "0"))
+MEMORY_PQ_M = int(os.getenv("MEMORY_PQ_M", "48"))
+MEMORY_HNSW_M = int(os.getenv("MEMORY_HNSW_M", "32"))
+# Vectors buffered to train IVF/PQ cells when the store is (re)built
+MEMORY_INDEX_TRAIN_SIZE = int(os.getenv("MEMORY_INDEX_TRAIN_SIZE", "100000"))
+# Query-time knobs: cells probed (IVF) / candidate list size (HNSW)
+MEMORY_NPROBE = int(os.getenv("MEMORY_NPROBE", "16"))
+MEMORY_EF_SEARCH = int(os.getenv("MEMORY_EF_SEARCH", "64"))
+
+PQ_NBITS = 8
+MIN_POINTS_PER_CELL = 39
+
+
+def auto_nlist(n: int) -> int:
+    return max(1, min(int(4 * math.sqrt(n)), n // MIN_POINTS_PER_CELL))
+
+
+def index_spec(index_type: str, dim: int, n: int) -> str:
+    """faiss.index_factory string for ``index_type`` over ``n`` vectors of ``dim``."""
+    if index_type not in INDEX_TYPES:
+        raise ValueError(f"Unknown index type '{index_type}' (expected one of {', '.join(INDEX_TYPES)})")
+    if index_type == "flat":
+        return "IDMap,Flat"
+    if index_type == "sq8":
+        return "IDMap,SQ8"
+    if index_type == "hnsw":
+        return f"IDMap,HNSW{MEMORY_HNSW_M}"
+
+    nlist = MEMORY_IVF_NLIST or auto_nlist(n)
+    if index_type == "ivf_flat":
+        return f"IVF{nlist},Flat"
+    if index_type == "ivf_sq8":
+        return f"IVF{nlist},SQ8"
+    # PQ codebooks need 2^nbits training points and m must divide dim
+    if n < 2 ** PQ_NBITS or dim % MEMORY_PQ_M:
+        print(f"⚠️ ivf_pq needs ≥{2 ** PQ_NBITS} vectors and dim % m == 0 — using ivf_sq8")
+        return f"IVF{nlist},SQ8"
+    return f"IVF{nlist},PQ{MEMORY_PQ_M}x{PQ_NBITS}"
+
+
+def build_index(spec: str, dim: int, train: Optional[np.ndarray] = None):
+    """Empty index for ``spec``; IVF/PQ types are trained on ``train`` if given."""
+    index = faiss.index_factory(dim, spec)
+    if train is not None and not index.is_trained:
+        index.train(train)
+    return index
+
+
+def remove_ids(index, spec: str, ids: np.ndarray):
+    """
+    Remove ``ids`` from ``index``; returns the index to keep using. HNSW
+    graphs cannot delete, so they are rebuilt from their stored vectors.
+    """
+    try:
+        index.remove_ids(ids)
+        return index
+    except RuntimeError:
+        pass
+    stored_ids = faiss.vector_to_array(index.id_map)
+    vectors = faiss.downcast_index(index.index).reconstruct_n(0, index.ntotal)
+    keep = ~np.isin(stored_ids, ids)
+    rebuilt = build_index(spec, index.d)
+    rebuilt.add_with_ids(vectors[keep], stored_ids[keep])
+    return rebuilt
+
+
+def set_search_params(index, nprobe: Optional[int] = None, ef_search: Optional[int] = None) -> dict:
+    """Apply the query-time knobs this index understands; returns those applied."""
+    applied = {}
+    params = faiss.ParameterSpace()
+    for name, value in (("nprobe", nprobe), ("efSearch", ef_search)):
+        if value is None:
+            continue
+        try:
+            params.set_index_parameter(index, name, value)
+            applied[name] = value
+        except RuntimeError:
+            pass
+    return applied
+
+
+def index_bytes(index) -> int:
+    return int(faiss.serialize_index(index).nbytes)
@@ -2,20 +2,56 @@ import json
 import os
 import shutil
 import argparse
+import hashlib
 import time
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
+
+import numpy as np
+from langchain_community.docstore.in_memory import InMemoryDocstore
 from langchain_community.vectorstores import FAISS
 from langchain_huggingface import HuggingFaceEmbeddings
 from langchain_core.documents import Document
 
+try:
+    from .ann_index import (
+        INDEX_TYPES,
+        MEMORY_INDEX_TRAIN_SIZE,
+        MEMORY_INDEX_TYPE,
+        build_index,
+        index_spec,
+        remove_ids,
+    )
+except ImportError:
+    # Fallback for running as script
+    from ann_index import (
+        INDEX_TYPES,
+        MEMORY_INDEX_TRAIN_SIZE,
+        MEMORY_INDEX_TYPE,
+        build_index,
+        index_spec,
+        remove_ids,
+    )
+
 # Configuration
 BASE_DIR = Path(__file__).parent.parent.parent
 JSON_SOURCE = BASE_DIR / 'exports' / 'activation_subgraph.json'
 STORE_PATH = BASE_DIR / 'backend' / 'data' / 'memory_store'
-BACKUP_PATH = BASE_DIR / 'backend' / 'data' / 'memory_store_backup'
 MODEL_NAME = "all-MiniLM-L6-v2"
 
+# Moments embedded per model call / per index add
+INGEST_BATCH_SIZE = int(os.getenv("MEMORY_INGEST_BATCH_SIZE", "256"))
+# Timestamped store backups kept after each swap (oldest pruned)
+BACKUP_RETENTION = int(os.getenv("MEMORY_BACKUP_RETENTION", "3"))
+
+# moment key -> {"vector_id", "hash"}; saved inside the store, so it
+# swaps atomically with the index it describes
+MANIFEST_NAME = "manifest.json"
+MANIFEST_VERSION = 1
+BACKUP_PREFIX = "backup_memory_store_"
+# Trained cells go stale as the store outgrows its training sample
+RETRAIN_GROWTH = 10
+
 def load_moments(json_path: Path) -> List[Dict[str, Any]]:
     """Load MoStarMoments from the JSON export."""
     if not json_path.exists():
@@ -59,8 +95,170 @@ def create_documents(moments: List[Dict[str, Any]]) -> List[Document]:
         docs.append(Document(page_content=content, metadata=metadata))
     return docs
 
-def ingest_memory(refresh: bool = False, source: str = None):
-    """Main ingestion process."""
+def document_hash(doc: Document) -> str:
+    """Content hash of what gets embedded and stored (ingested_at excluded)."""
+    meta = {k: v for k, v in doc.metadata.items() if k != "ingested_at"}
+    payload = json.dumps([doc.page_content, meta], sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+def keyed_documents(docs: List[Document]) -> Dict[str, Tuple[Document, str]]:
+    """Moment key -> (document, hash). Moments without an id are keyed by content."""
+    keyed = {}
+    for doc in docs:
+        digest = document_hash(doc)
+        moment_id = doc.metadata.get("id")
+        key = str(moment_id) if moment_id is not None else f"sha256:{digest}"
+        keyed[key] = (doc, digest)
+    return keyed
+
+def plan_ingest(
+    keyed: Dict[str, Tuple[Document, str]], manifest: Dict[str, Any], prune: bool = False
+) -> Tuple[List[str], List[str]]:
+    """
+    (keys to embed, keys to delete). New and changed moments are embedded;
+    changed moments and, with ``prune``, moments gone from the source are
+    deleted from the index.
+    """
+    known = manifest["moments"]
+    to_embed = [key for key, (_, digest) in keyed.items() if known.get(key, {}).get("hash") != digest]
+    to_delete = [key for key in to_embed if key in known]
+    if prune:
+        to_delete += [key for key in known if key not in keyed]
+    return to_embed, to_delete
+
+def _empty_manifest() -> Dict[str, Any]:
+    return {"version": MANIFEST_VERSION, "model": MODEL_NAME, "next_id": 0, "moments": {}}
+
+def _new_vectorstore(embeddings, index) -> FAISS:
+    # Every index type takes caller ids, so deletes never renumber the store
+    return FAISS(
+        embedding_function=embeddings,
+        index=index,
+        docstore=InMemoryDocstore(),
+        index_to_docstore_id={},
+    )
+
+def _load_store(embeddings, index_type: Optional[str] = None) -> Tuple[Optional[FAISS], Dict[str, Any]]:
+    """
+    Existing store + manifest, or (None, empty) if it must be rebuilt.
+    ``index_type`` None keeps the store's type; any other type rebuilds it.
+    """
+    manifest_path = STORE_PATH / MANIFEST_NAME
+    if not (STORE_PATH / "index.faiss").exists():
+        print("   No existing index found. Creating new...")
+        return None, _empty_manifest()
+    if not manifest_path.exists():
+        print("   Existing index has no manifest (pre-incremental store). Rebuilding once...")
+        return None, _empty_manifest()
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get("version") != MANIFEST_VERSION or manifest.get("model") != MODEL_NAME:
+            print("   Manifest is for another model or version. Rebuilding...")
+            return None, _empty_manifest()
+        # Stores from before index types were configurable are flat
+        built = manifest.setdefault("index", {"type": "flat", "spec": "IDMap,Flat", "trained_on": 0})
+        if index_type is not None and built["type"] != index_type:
+            print(f"   Store index is '{built['type']}', '{index_type}' requested. Rebuilding...")
+            return None, _empty_manifest()
+        vectorstore = FAISS.load_local(str(STORE_PATH), embeddings, allow_dangerous_deserialization=True)
+    except Exception as e:
+        print(f"❌ Failed to load existing index: {e}. Rebuilding...")
+        return None, _empty_manifest()
+    return vectorstore, manifest
+
+def _delete_vectors(vectorstore: FAISS, manifest: Dict[str, Any], keys: List[str]) -> int:
+    moments = manifest["moments"]
+    vector_ids = [moments.pop(key)["vector_id"] for key in keys if key in moments]
+    if not vector_ids:
+        return 0
+    vectorstore.index = remove_ids(
+        vectorstore.index, manifest["index"]["spec"], np.array(vector_ids, dtype=np.int64)
+    )
+    doc_ids = [vectorstore.index_to_docstore_id.pop(vid) for vid in vector_ids]
+    vectorstore.docstore.delete(doc_ids)
+    return len(vector_ids)
+
+def _add_batch(
+    vectorstore: FAISS,
+    manifest: Dict[str, Any],
+    keyed: Dict[str, Tuple[Document, str]],
+    batch: List[str],
+    vectors: np.ndarray,
+) -> None:
+    first_id = manifest["next_id"]
+    vector_ids = np.arange(first_id, first_id + len(batch), dtype=np.int64)
+    manifest["next_id"] = first_id + len(batch)
+    vectorstore.index.add_with_ids(vectors, vector_ids)
+    vectorstore.docstore.add({key: keyed[key][0] for key in batch})
+    for key, vid in zip(batch, vector_ids.tolist()):
+        vectorstore.index_to_docstore_id[vid] = key
+        manifest["moments"][key] = {"vector_id": vid, "hash": keyed[key][1]}
+
+def _embed_and_add(
+    vectorstore: Optional[FAISS],
+    embeddings,
+    manifest: Dict[str, Any],
+    keyed: Dict[str, Tuple[Document, str]],
+    keys: List[str],
+    batch_size: int,
+    index_type: str = MEMORY_INDEX_TYPE,
+) -> Optional[FAISS]:
+    # Batches embedded before an IVF/PQ index has its training sample
+    pending: List[Tuple[List[str], np.ndarray]] = []
+    for start in range(0, len(keys), batch_size):
+        batch = keys[start:start + batch_size]
+        texts = [keyed[key][0].page_content for key in batch]
+        vectors = np.asarray(embeddings.embed_documents(texts), dtype=np.float32)
+        print(f"   Embedded {min(start + batch_size, len(keys))}/{len(keys)}")
+        if vectorstore is None:
+            spec = index_spec(index_type, vectors.shape[1], len(keys))
+            vectorstore = _new_vectorstore(embeddings, build_index(spec, vectors.shape[1]))
+            manifest["index"] = {"type": index_type, "spec": spec, "trained_on": 0}
+
+        if vectorstore.index.is_trained:
+            _add_batch(vectorstore, manifest, keyed, batch, vectors)
+            continue
+        pending.append((batch, vectors))
+        buffered = sum(len(b) for b, _ in pending)
+        if buffered < min(len(keys), MEMORY_INDEX_TRAIN_SIZE):
+            continue
+        print(f"🎯 Training {manifest['index']['spec']} on {buffered} vectors...")
+        vectorstore.index.train(np.concatenate([v for _, v in pending]))
+        manifest["index"]["trained_on"] = buffered
+        for pending_batch, pending_vectors in pending:
+            _add_batch(vectorstore, manifest, keyed, pending_batch, pending_vectors)
+        pending = []
+    return vectorstore
+
+def prune_backups(keep: int = BACKUP_RETENTION) -> List[Path]:
+    """Delete all but the newest ``keep`` timestamped store backups."""
+    backups = sorted(
+        STORE_PATH.parent.glob(f"{BACKUP_PREFIX}*"),
+        key=lambda p: int(p.name[len(BACKUP_PREFIX):]) if p.name[len(BACKUP_PREFIX):].isdigit() else 0,
+    )
+    stale = backups[:-keep] if keep > 0 else backups
+    for path in stale:
+        shutil.rmtree(path, ignore_errors=True)
+    return stale
+
+def ingest_memory(
+    refresh: bool = False,
+    source: str = None,
+    batch_size: int = INGEST_BATCH_SIZE,
+    prune: bool = False,
+    keep_backups: int = BACKUP_RETENTION,
+    index_type: Optional[str] = None,
+):
+    """
+    Main ingestion process. Incremental by default: only moments that are
+    new or whose content changed since the last run are embedded, so
+    re-ingesting an export costs time proportional to what changed.
+    ``refresh`` rebuilds from scratch; ``prune`` also deletes moments that
+    are no longer in the source. An existing store keeps its index type
+    unless ``index_type`` names a different one, which rebuilds (and
+    trains) it; new stores use ``index_type`` or MEMORY_INDEX_TYPE.
+    """
     source_path = Path(source) if source else JSON_SOURCE
     
     print(f"📂 Loading moments from {source_path}...")
@@ -73,41 +271,44 @@ def ingest_memory(refresh: bool = False, source: str = None):
     print(f"   Found {len(moments)} moments.")
     
     print("📄 Converting to documents...")
-    docs = create_documents(moments)
-    if not docs:
+    keyed = keyed_documents(create_documents(moments))
+    if not keyed:
         print("⚠️ No documents to ingest.")
         return
     
-    print(f"🧠 Initializing embeddings ({MODEL_NAME})...")
-    embeddings = HuggingFaceEmbeddings(model_name=MODEL_NAME)
+    print(f"🧠 Initializing embeddings ({MODEL_NAME}, batch={batch_size})...")
+    embeddings = HuggingFaceEmbeddings(model_name=MODEL_NAME, encode_kwargs={"batch_size": batch_size})
     
     if refresh:
         print("🔄 Refresh mode: Rebuilding index from scratch...")
-        if STORE_PATH.exists():
-            print(f"   Backing up existing store to {BACKUP_PATH}...")
-            if BACKUP_PATH.exists():
-                shutil.rmtree(BACKUP_PATH)
-            shutil.copytree(STORE_PATH, BACKUP_PATH)
-            shutil.rmtree(STORE_PATH)
-            
-        print("🏗️  Building new FAISS index...")
-        vectorstore = FAISS.from_documents(docs, embeddings)
-        
+        vectorstore, manifest = None, _empty_manifest()
     else:
-        print("➕ Append mode: Adding to existing index...")
-        if STORE_PATH.exists() and (STORE_PATH / "index.faiss").exists():
-             try:
-                vectorstore = FAISS.load_local(str(STORE_PATH), embeddings, allow_dangerous_deserialization=True)
-                vectorstore.add_documents(docs)
-             except Exception as e:
-                 print(f"❌ Failed to load existing index: {e}. Falling back to create new.")
-                 vectorstore = FAISS.from_documents(docs, embeddings)
-        else:
-            print("   No existing index found. Creating new...")
-            vectorstore = FAISS.from_documents(docs, embeddings)
+        print("➕ Incremental mode: Embedding new and changed moments...")
+        vectorstore, manifest = _load_store(embeddings, index_type)
+    if index_type is None:
+        index_type = manifest.get("index", {}).get("type", MEMORY_INDEX_TYPE)
+
+    to_embed, to_delete = plan_ingest(keyed, manifest, prune=prune)
+    print(
+        f"   {len(to_embed)} to embed | {len(to_delete)} to delete | "
+        f"{len(keyed) - len(to_embed)} unchanged"
+    )
+    if not to_embed and not to_delete:
+        print("✅ Memory already current — nothing to ingest.")
+        return
+
+    if vectorstore is not None:
+        removed = _delete_vectors(vectorstore, manifest, to_delete)
+        print(f"🗑️  Removed {removed} stale vectors.")
+    vectorstore = _embed_and_add(
+        vectorstore, embeddings, manifest, keyed, to_embed, batch_size, index_type
+    )
+    if vectorstore is None:
+        print("⚠️ Nothing left to store.")
+        return
     
     print(f"💾 Saving to {STORE_PATH} (Atomic Swap)...")
-    STORE_PATH.mkdir(parents=True, exist_ok=True)
+    STORE_PATH.parent.mkdir(parents=True, exist_ok=True)
     
     # Save to a temporary location first for atomic-like swap logic
     temp_path = STORE_PATH.parent / "temp_memory_store"
@@ -116,22 +317,47 @@ def ingest_memory(refresh: bool = False, source: str = None):
     temp_path.mkdir(parents=True, exist_ok=True)
     
     vectorstore.save_local(str(temp_path))
+    with open(temp_path / MANIFEST_NAME, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f)
     
     # Swap
-    backup_path = STORE_PATH.parent / f"backup_memory_store_{int(time.time())}"
+    backup_path = STORE_PATH.parent / f"{BACKUP_PREFIX}{time.time_ns()}"
     if STORE_PATH.exists():
         STORE_PATH.rename(backup_path)
     temp_path.rename(STORE_PATH)
+
+    pruned = prune_backups(keep_backups)
+    if pruned:
+        print(f"🧹 Pruned {len(pruned)} old backups (keeping {keep_backups}).")
     
-    print("✅ Memory ingestion complete.")
+    trained_on = manifest["index"].get("trained_on")
+    if trained_on and vectorstore.index.ntotal > RETRAIN_GROWTH * trained_on:
+        print(f"⚠️ Store has outgrown its {trained_on}-vector training sample — consider --refresh.")
+    print(
+        f"✅ Memory ingestion complete — {vectorstore.index.ntotal} vectors "
+        f"({manifest['index']['spec']})."
+    )
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="MoStar Memory Ingestion")
     parser.add_argument("--refresh", action="store_true", help="Full index rebuild with backup")
-    parser.add_argument("--append", action="store_true", help="Append to index")
+    parser.add_argument("--append", action="store_true", help="Incremental ingest (default)")
     parser.add_argument("--source", type=str, help="Path to source JSON file")
+    parser.add_argument("--batch-size", type=int, default=INGEST_BATCH_SIZE, help="Moments per embedding batch")
+    # Deleting from an HNSW store rebuilds its graph from the remaining
+    # vectors, once per run that deletes (pruned or changed moments).
+    parser.add_argument("--prune", action="store_true", help="Delete moments no longer in the source (rebuilds an HNSW graph)")
+    parser.add_argument("--keep-backups", type=int, default=BACKUP_RETENTION, help="Store backups to retain")
+    parser.add_argument("--index-type", choices=INDEX_TYPES, help="FAISS index type; omitted keeps the store's (new stores: MEMORY_INDEX_TYPE), a different one rebuilds")
     
     args = parser.parse_args()
     
-    # Refresh logic already handles rebuild, append is the alternative
-    ingest_memory(refresh=args.refresh, source=args.source)
+    # Refresh rebuilds; otherwise only new and changed moments are embedded
+    ingest_memory(
+        refresh=args.refresh,
+        source=args.source,
+        batch_size=args.batch_size,
+        prune=args.prune,
+        keep_backups=args.keep_backups,
+        index_type=args.index_type,
+    )
@@ -1,10 +1,16 @@
 import os
-from typing import Any, List
+from typing import Any, List, Optional
 
 from langchain_community.vectorstores import FAISS
 from langchain_core.documents import Document
 from langchain_huggingface import HuggingFaceEmbeddings
 
+try:
+    from .ann_index import MEMORY_EF_SEARCH, MEMORY_NPROBE, index_bytes, set_search_params
+except ImportError:
+    # Fallback for running as script
+    from ann_index import MEMORY_EF_SEARCH, MEMORY_NPROBE, index_bytes, set_search_params
+
 # Configuration
 STORE_PATH = os.path.join(
     os.path.dirname(os.path.dirname(__file__)), "data", "memory_store"
@@ -13,7 +19,17 @@ MODEL_NAME = "all-MiniLM-L6-v2"
 
 
 class MoStarMemory:
-    def __init__(self):
+    """
+    Vector search over the moment store. The index type is whatever ingest
+    built (see ann_index); ``nprobe`` (IVF) and ``ef_search`` (HNSW) trade
+    recall for latency and are ignored by index types without them.
+    """
+
+    def __init__(
+        self,
+        nprobe: Optional[int] = MEMORY_NPROBE,
+        ef_search: Optional[int] = MEMORY_EF_SEARCH,
+    ):
         if not os.path.exists(STORE_PATH):
             raise FileNotFoundError(
                 f"Memory store not found at {STORE_PATH}. Run ingest.py first."
@@ -25,10 +41,28 @@ class MoStarMemory:
             self.embeddings,
             allow_dangerous_deserialization=True,  # Safe since we created it
         )
+        self.search_params = {}
+        self.tune(nprobe=nprobe, ef_search=ef_search)
         self.retriever = self.vectorstore.as_retriever(
             search_type="similarity", search_kwargs={"k": 5}
         )
 
+    def tune(self, nprobe: Optional[int] = None, ef_search: Optional[int] = None) -> dict:
+        """Set query-time search parameters; returns those in effect."""
+        self.search_params.update(
+            set_search_params(self.vectorstore.index, nprobe=nprobe, ef_search=ef_search)
+        )
+        return self.search_params
+
+    def index_info(self) -> dict:
+        index = self.vectorstore.index
+        return {
+            "index": type(index).__name__,
+            "vectors": index.ntotal,
+            "bytes": index_bytes(index),
+            **self.search_params,
+        }
+
     def search(self, query: str, k: int = 5) -> List[Document]:
         """Raw search against the vector store."""
         return self.vectorstore.similarity_search(query, k=k)
@@ -1,9 +1,13 @@
 import os
 import csv
+import argparse
 from neo4j import GraphDatabase
 import time
 import sys
 
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "import"))
+from bulk_staging import BulkStaging
+
 URI = "bolt://localhost:7687"
 AUTH = ("neo4j", "Mostar123")
 
@@ -27,7 +31,8 @@ def count_nodes(driver):
         result = session.run("MATCH (n) RETURN count(n) AS c")
         return result.single()["c"]
 
-def ingest_csv(driver, filepath, filename):
+def read_label_file(filepath, filename):
+    """Returns (label, merge key, records) for one APOC split file, or None."""
     # In APOC splits, the filename IS the exact label (e.g., MindLayer.csv)
     label = filename.replace('.csv', '')
 
@@ -36,13 +41,13 @@ def ingest_csv(driver, filepath, filename):
         try:
             raw_headers = next(reader)
         except StopIteration:
-            return
+            return None
 
         headers = [h.replace('\ufeff', '').strip() for h in raw_headers]
         
         # In case the file has zero actual columns or is mangled
         if not headers or len(headers) == 0:
-            return
+            return None
 
         pk = get_primary_key(headers)
         
@@ -57,28 +62,90 @@ def ingest_csv(driver, filepath, filename):
                         record[key_clean] = val
             batch_records.append(record)
 
-        if not batch_records:
-            return
+    if not batch_records:
+        return None
+    return label, pk, batch_records
 
-        # Prepare idempotent dynamic query.
-        # We wrap both the node identifier and record keys in backticks to prevent Neo4j syntax errors on hyphens or spaces!
-        query = f"""
-        UNWIND $batch AS record
-        MERGE (n:`{label}` {{ `{pk}`: record.`{pk}` }})
-        SET n += record
-        """
-        
-        print(f"  [+] Seating {len(batch_records):>6} nodes into (:{label}) matched on `{pk}`...")
-        
-        start = time.time()
-        with driver.session() as session:
-            try:
-                session.run(query, batch=batch_records)
-                print(f"      -> Success ({time.time() - start:.2f}s)")
-            except Exception as e:
-                print(f"      -> [ERROR] Failed to merge {label}: {str(e)[:100]}")
+def ingest_csv(driver, filepath, filename):
+    parsed = read_label_file(filepath, filename)
+    if parsed is None:
+        return
+    label, pk, batch_records = parsed
+    # Prepare idempotent dynamic query.
+    # We wrap both the node identifier and record keys in backticks to prevent Neo4j syntax errors on hyphens or spaces!
+    query = f"""
+    UNWIND $batch AS record
+    MERGE (n:`{label}` {{ `{pk}`: record.`{pk}` }})
+    SET n += record
+    """
+    
+    print(f"  [+] Seating {len(batch_records):>6} nodes into (:{label}) matched on `{pk}`...")
+    
+    start = time.time()
+    with driver.session() as session:
+        try:
+            session.run(query, batch=batch_records)
+            print(f"      -> Success ({time.time() - start:.2f}s)")
+        except Exception as e:
+            print(f"      -> [ERROR] Failed to merge {label}: {str(e)[:100]}")
+
+def stage_bulk(valid_files, staging_dir):
+    """
+    First load into an empty database: Phase 2 nodes plus the Phase 3
+    relationships, merged the same way, as neo4j-admin import files.
+    """
+    from phase3_rels_import import MATCH_KEYS, RELS_DIR, read_rels_file
+
+    staging = BulkStaging(staging_dir, id_space="SplitExport")
+    for cf in valid_files:
+        parsed = read_label_file(os.path.join(CSV_DIR, cf), cf)
+        if parsed is None:
+            continue
+        label, pk, records = parsed
+        for record in records:
+            if record.get(pk) is None:
+                continue
+            staging.add_node(f"{label}:{record[pk]}", [label], record)
+
+    # MATCH (src) WHERE src.id = ... OR src.uuid = ... over the staged nodes
+    endpoints = {}
+    for node_id, (_, props) in staging.nodes.items():
+        for key in MATCH_KEYS:
+            if key in props:
+                endpoints.setdefault(props[key], set()).add(node_id)
+
+    unmatched = 0
+    rel_files = sorted(f for f in os.listdir(RELS_DIR) if f.endswith('.csv')) if os.path.exists(RELS_DIR) else []
+    for cf in rel_files:
+        parsed = read_rels_file(os.path.join(RELS_DIR, cf), cf)
+        if parsed is None:
+            continue
+        rel_type_name, headers, records = parsed
+        c_src, c_rel, c_dst = headers[0], headers[1], headers[2]
+        prop_keys = [h for h in headers if h not in [c_src, c_rel, c_dst]]
+        for record in records:
+            sources = endpoints.get(record.get(c_src), ())
+            targets = endpoints.get(record.get(c_dst), ())
+            if not sources or not targets:
+                unmatched += 1
+                continue
+            props = {key: record.get(key) for key in prop_keys}
+            for src in sources:
+                for dst in targets:
+                    staging.add_relationship(rel_type_name, src, dst, props)
+
+    manifest = staging.write()
+    print(f"\n[BULK] Staged {manifest['nodes']} nodes and {manifest['relationships']} edges in {manifest['staging_dir']}")
+    print(f"[BULK] {unmatched} edge rows had no matching endpoint (dropped, as the MATCH would)")
+    print(f"[BULK] Stop Neo4j, then run:\n  {manifest['command']}")
+    return manifest
 
 def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--bulk-stage", metavar="DIR",
+                        help="Empty database only: write neo4j-admin import files instead of merging over Bolt")
+    args = parser.parse_args()
+
     print(f"=== MoStar Grid Phase 2: Core Soul Extraction ===")
     print(f"Sourcing from: {CSV_DIR}")
     
@@ -123,6 +190,11 @@ def main():
         return
 
     print(f"\n[OK] Safe Sovereign Payload: {total_docs} nodes")
+
+    if args.bulk_stage:
+        stage_bulk(valid_files, args.bulk_stage)
+        return
+
     print("\nExecuting live Neo4j injection protocol...")
 
     driver = GraphDatabase.driver(URI, auth=AUTH)
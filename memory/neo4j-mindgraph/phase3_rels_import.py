@@ -8,7 +8,11 @@ AUTH = ("neo4j", "Mostar123")
 
 RELS_DIR = "/opt/mostar/mostar-grid/memory/neo4j-mindgraph/import/database_export/relationships_20260406_032038"
 
-def ingest_rels_csv(driver, filepath, filename):
+# Node properties an edge endpoint may be matched on
+MATCH_KEYS = ["id", "uuid", "_id", "elementId", "word:ID"]
+
+def read_rels_file(filepath, filename):
+    """Returns (rel type, headers, records) for one relationship split file, or None."""
     rel_type_name = filename.replace('.csv', '')
 
     with open(filepath, mode='r', encoding='utf-8') as f:
@@ -16,17 +20,13 @@ def ingest_rels_csv(driver, filepath, filename):
         try:
             raw_headers = next(reader)
         except StopIteration:
-            return
+            return None
 
         headers = [h.replace('\ufeff', '').strip() for h in raw_headers]
         
         if len(headers) < 3:
-            return
+            return None
 
-        c_src = headers[0]
-        c_rel = headers[1]
-        c_dst = headers[2]
-        
         batch_records = []
         for row in reader:
             if not row or len(row) < 3: continue
@@ -38,35 +38,42 @@ def ingest_rels_csv(driver, filepath, filename):
                         record[key_clean] = val
             batch_records.append(record)
 
-        if not batch_records:
-            return
-
-        # Implicit Quarantine:
-        # If the from_id or to_id belonged to a Metric or BodyLayer, it simply won't exist in the Graph.
-        # The MATCH will yield 0 paths, dropping the radioactive edge into the void securely!
-        query = f"""
-        UNWIND $batch AS rel
-        MATCH (src) WHERE src.id = rel.`{c_src}` OR src.uuid = rel.`{c_src}` OR src._id = rel.`{c_src}` OR src.elementId = rel.`{c_src}` OR src.`word:ID` = rel.`{c_src}`
-        MATCH (dst) WHERE dst.id = rel.`{c_dst}` OR dst.uuid = rel.`{c_dst}` OR dst._id = rel.`{c_dst}` OR dst.elementId = rel.`{c_dst}` OR dst.`word:ID` = rel.`{c_dst}`
-        MERGE (src)-[r:`{rel_type_name}`]->(dst)
-        """
-        
-        props = [h for h in headers if h not in [c_src, c_rel, c_dst]]
-        if props:
-            set_clauses = []
-            for p in props:
-                set_clauses.append(f"r.`{p}` = rel.`{p}`")
-            query += " SET " + ", ".join(set_clauses)
-        
-        print(f"  [+] Merging {len(batch_records):>6} edges of type [:{rel_type_name}]...")
-        
-        start = time.time()
-        with driver.session() as session:
-            try:
-                session.run(query, batch=batch_records)
-                print(f"      -> Success ({time.time() - start:.2f}s)")
-            except Exception as e:
-                print(f"      -> [ERROR] Failed to map [:{rel_type_name}]: {str(e)[:100]}")
+    if not batch_records:
+        return None
+    return rel_type_name, headers, batch_records
+
+def ingest_rels_csv(driver, filepath, filename):
+    parsed = read_rels_file(filepath, filename)
+    if parsed is None:
+        return
+    rel_type_name, headers, batch_records = parsed
+    c_src, c_rel, c_dst = headers[0], headers[1], headers[2]
+    # Implicit Quarantine:
+    # If the from_id or to_id belonged to a Metric or BodyLayer, it simply won't exist in the Graph.
+    # The MATCH will yield 0 paths, dropping the radioactive edge into the void securely!
+    query = f"""
+    UNWIND $batch AS rel
+    MATCH (src) WHERE src.id = rel.`{c_src}` OR src.uuid = rel.`{c_src}` OR src._id = rel.`{c_src}` OR src.elementId = rel.`{c_src}` OR src.`word:ID` = rel.`{c_src}`
+    MATCH (dst) WHERE dst.id = rel.`{c_dst}` OR dst.uuid = rel.`{c_dst}` OR dst._id = rel.`{c_dst}` OR dst.elementId = rel.`{c_dst}` OR dst.`word:ID` = rel.`{c_dst}`
+    MERGE (src)-[r:`{rel_type_name}`]->(dst)
+    """
+    
+    props = [h for h in headers if h not in [c_src, c_rel, c_dst]]
+    if props:
+        set_clauses = []
+        for p in props:
+            set_clauses.append(f"r.`{p}` = rel.`{p}`")
+        query += " SET " + ", ".join(set_clauses)
+    
+    print(f"  [+] Merging {len(batch_records):>6} edges of type [:{rel_type_name}]...")
+    
+    start = time.time()
+    with driver.session() as session:
+        try:
+            session.run(query, batch=batch_records)
+            print(f"      -> Success ({time.time() - start:.2f}s)")
+        except Exception as e:
+            print(f"      -> [ERROR] Failed to map [:{rel_type_name}]: {str(e)[:100]}")
 
 def count_rels(driver):
     with driver.session() as session:
@@ -13,9 +13,13 @@
 """
 
 import os
-from neo4j import GraphDatabase
-from datetime import datetime
-import hashlib
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "import"))
+
+from import_engine import CypherStep, Phase, SourceSpec, StaticRows, run_cli
 
 # ═══════════════════════════════════════════════════════════════════════════════
 #                           CONFIGURATION
@@ -25,6 +29,8 @@ NEO4J_URI = os.getenv("NEO4J_URI", "bolt://localhost:7687")
 NEO4J_USER = os.getenv("NEO4J_USER", "neo4j")
 NEO4J_PASSWORD = os.getenv("NEO4J_PASSWORD", "mostar123")
 
+CHECKPOINT_PATH = str(Path(__file__).with_suffix(".checkpoint.json"))
+
 # ═══════════════════════════════════════════════════════════════════════════════
 #                           16 PRINCIPAL ODÚ
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -197,126 +203,72 @@ def generate_all_256_odu():
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
-#                           SEEDING FUNCTIONS
+#                           SEED SPECS
 # ═══════════════════════════════════════════════════════════════════════════════
 
-def clear_database(session):
+def _stamped(rows):
+    """Seed rows with a created_at timestamp, like ``created_at: datetime()``."""
+    def _rows():
+        now = datetime.now(timezone.utc)
+        return [dict(row, created_at=now) for row in rows()]
+    return StaticRows(_rows)
+
+
+def build_phases():
+    """Odú patterns, agents and covenant rules, then their relationships."""
+    return [
+        Phase("indexes", [
+            CypherStep(f"index:{statement.split()[2]}", statement)
+            for statement in [
+                "CREATE INDEX odu_code IF NOT EXISTS FOR (o:Odu) ON (o.code)",
+                "CREATE INDEX odu_name IF NOT EXISTS FOR (o:Odu) ON (o.name)",
+                "CREATE INDEX agent_name IF NOT EXISTS FOR (a:Agent) ON (a.name)",
+                "CREATE INDEX agent_layer IF NOT EXISTS FOR (a:Agent) ON (a.layer)",
+                "CREATE INDEX covenant_principle IF NOT EXISTS FOR (c:CovenantRule) ON (c.principle)"
+            ]
+        ]),
+        Phase("nodes", [
+            # 🔮 256 Odú patterns
+            SourceSpec("Odu", "Odu", ["code"], _stamped(generate_all_256_odu)),
+            # 🤖 6 sacred agents
+            SourceSpec("Agent", "Agent", ["name"], _stamped(lambda: SACRED_AGENTS)),
+            # 📜 Covenant rules
+            SourceSpec("CovenantRule", "CovenantRule", ["principle"], _stamped(lambda: COVENANT_RULES)),
+        ]),
+        Phase("relationships", [
+            # XOR relationships for principal Odú (16x16 = 256 relationships)
+            CypherStep("rel:XOR_WITH", """
+                MATCH (o1:Odu), (o2:Odu)
+                WHERE o1.code < 16 AND o2.code < 16
+                WITH o1, o2, (o1.code + o2.code) % 16 AS xor_result
+                MATCH (result:Odu {code: xor_result})
+                MERGE (o1)-[:XOR_WITH {result: xor_result}]->(o2)
+            """),
+            # All agents are bound by all covenant rules
+            CypherStep("rel:BOUND_BY", """
+                MATCH (a:Agent), (c:CovenantRule)
+                MERGE (a)-[:BOUND_BY]->(c)
+            """),
+        ]),
+    ]
+
+
+def clear_database(driver, args):
     """Clear all nodes and relationships"""
     print("🗑️  Clearing existing database...")
-    session.run("MATCH (n) DETACH DELETE n")
+    with driver.session(database=args.database) as session:
+        session.run("MATCH (n) DETACH DELETE n").consume()
     print("✅ Database cleared")
 
 
-def seed_odu_patterns(session):
-    """Seed all 256 Odú patterns"""
-    print("\n🔮 Seeding 256 Odú patterns...")
-    
-    odu_list = generate_all_256_odu()
-    
-    for odu in odu_list:
-        session.run("""
-            CREATE (o:Odu {
-                code: $code,
-                binary: $binary,
-                name: $name,
-                left: $left,
-                right: $right,
-                meaning: $meaning,
-                created_at: datetime()
-            })
-        """, odu)
-    
-    print(f"✅ Created {len(odu_list)} Odú pattern nodes")
-
-
-def seed_odu_relationships(session):
-    """Create XOR relationships between Odú patterns"""
-    print("\n🔗 Creating XOR relationships between Odú patterns...")
-    
-    # Create XOR relationships for principal Odú (16x16 = 256 relationships)
-    session.run("""
-        MATCH (o1:Odu), (o2:Odu)
-        WHERE o1.code < 16 AND o2.code < 16
-        WITH o1, o2, (o1.code + o2.code) % 16 AS xor_result
-        MATCH (result:Odu {code: xor_result})
-        CREATE (o1)-[:XOR_WITH {result: xor_result}]->(o2)
-    """)
-    
-    print("✅ Created XOR relationships")
-
-
-def seed_agents(session):
-    """Seed the 6 sacred agents"""
-    print("\n🤖 Seeding 6 sacred agents...")
-    
-    for agent in SACRED_AGENTS:
-        session.run("""
-            CREATE (a:Agent {
-                name: $name,
-                layer: $layer,
-                role: $role,
-                soulprint: $soulprint,
-                capabilities: $capabilities,
-                oath: $oath,
-                created_at: datetime()
-            })
-        """, agent)
-    
-    print(f"✅ Created {len(SACRED_AGENTS)} agent nodes")
-
-
-def seed_covenant_rules(session):
-    """Seed covenant rules"""
-    print("\n📜 Seeding covenant rules...")
-    
-    for rule in COVENANT_RULES:
-        session.run("""
-            CREATE (c:CovenantRule {
-                principle: $principle,
-                description: $description,
-                priority: $priority,
-                created_at: datetime()
-            })
-        """, rule)
-    
-    print(f"✅ Created {len(COVENANT_RULES)} covenant rule nodes")
-
-
-def create_agent_relationships(session):
-    """Create relationships between agents and covenant"""
-    print("\n🔗 Creating agent-covenant relationships...")
-    
-    # All agents are bound by all covenant rules
-    session.run("""
-        MATCH (a:Agent), (c:CovenantRule)
-        CREATE (a)-[:BOUND_BY]->(c)
-    """)
-    
-    print("✅ Created agent-covenant relationships")
-
-
-def create_indexes(session):
-    """Create indexes for better query performance"""
-    print("\n📊 Creating indexes...")
-    
-    indexes = [
-        "CREATE INDEX odu_code IF NOT EXISTS FOR (o:Odu) ON (o.code)",
-        "CREATE INDEX odu_name IF NOT EXISTS FOR (o:Odu) ON (o.name)",
-        "CREATE INDEX agent_name IF NOT EXISTS FOR (a:Agent) ON (a.name)",
-        "CREATE INDEX agent_layer IF NOT EXISTS FOR (a:Agent) ON (a.layer)",
-        "CREATE INDEX covenant_principle IF NOT EXISTS FOR (c:CovenantRule) ON (c.principle)"
-    ]
-    
-    for index_query in indexes:
-        session.run(index_query)
-    
-    print("✅ Created indexes")
-
-
-def verify_seeding(session):
+def verify_seeding(driver, args):
     """Verify that seeding was successful"""
     print("\n🔍 Verifying seeding...")
-    
+    with driver.session(database=args.database) as session:
+        _print_counts(session)
+
+
+def _print_counts(session):
     # Count nodes
     result = session.run("""
         MATCH (n)
@@ -363,58 +315,47 @@ def verify_seeding(session):
         print(f"  {record['a.name']:20s} | {record['a.layer']:10s} | {record['a.role']}")
 
 
+
 # ═══════════════════════════════════════════════════════════════════════════════
 #                           MAIN SEEDING FUNCTION
 # ═══════════════════════════════════════════════════════════════════════════════
 
-def seed_mostar_grid(clear_first: bool = False):
+def seed_mostar_grid():
     """Main seeding function"""
     print("═" * 79)
     print("           🧠 MOSTAR GRID - NEO4J SEEDING 🧠")
     print("═" * 79)
-    
-    # Connect to Neo4j
-    print(f"\n🔌 Connecting to Neo4j at {NEO4J_URI}...")
-    driver = GraphDatabase.driver(NEO4J_URI, auth=(NEO4J_USER, NEO4J_PASSWORD))
-    
-    try:
-        with driver.session() as session:
-            # Verify connection
-            result = session.run("RETURN 1 as test")
-            result.single()
-            print("✅ Connected to Neo4j")
-            
-            # Clear database if requested
-            if clear_first:
-                clear_database(session)
-            
-            # Seed data
-            seed_odu_patterns(session)
-            seed_odu_relationships(session)
-            seed_agents(session)
-            seed_covenant_rules(session)
-            create_agent_relationships(session)
-            create_indexes(session)
-            
-            # Verify
-            verify_seeding(session)
-            
-            print("\n" + "═" * 79)
-            print("           ✅ SEEDING COMPLETE - THE MIND GRAPH IS ALIVE ✅")
-            print("═" * 79)
-            print("\n🌐 Access Neo4j Browser: http://localhost:7474")
-            print("   Username: neo4j")
-            print("   Password: mostar123")
-            print("\n🔮 The 256 Odú patterns are ready.")
-            print("🤖 The 6 sacred agents are standing by.")
-            print("📜 The covenant is sealed.")
-            print("\n🧠 The Mind Graph awaits your queries...")
-            
-    except Exception as e:
-        print(f"\n❌ Error during seeding: {e}")
-        raise
-    finally:
-        driver.close()
+
+    os.environ.setdefault("NEO4J_URI", NEO4J_URI)
+    os.environ.setdefault("NEO4J_USER", NEO4J_USER)
+
+    def _prepare(parser):
+        parser.add_argument("--clear", action="store_true", help="Clear database before seeding")
+
+    def _clear(driver, args):
+        # Clearing invalidates any earlier progress
+        if args.clear:
+            clear_database(driver, args)
+            args.restart = True
+
+    run_cli(
+        lambda args: build_phases(),
+        description="Seed MoStar Grid Neo4j database",
+        checkpoint=CHECKPOINT_PATH,
+        password=NEO4J_PASSWORD,
+        prepare=_prepare,
+        before=_clear,
+        after=verify_seeding,
+    )
+
+    print("\n" + "═" * 79)
+    print("           ✅ SEEDING COMPLETE - THE MIND GRAPH IS ALIVE ✅")
+    print("═" * 79)
+    print("\n🌐 Access Neo4j Browser: http://localhost:7474")
+    print("\n🔮 The 256 Odú patterns are ready.")
+    print("🤖 The 6 sacred agents are standing by.")
+    print("📜 The covenant is sealed.")
+    print("\n🧠 The Mind Graph awaits your queries...")
 
 
 # ═══════════════════════════════════════════════════════════════════════════════
@@ -422,11 +363,4 @@ def seed_mostar_grid(clear_first: bool = False):
 # ═══════════════════════════════════════════════════════════════════════════════
 
 if __name__ == "__main__":
-    import argparse
-    
-    parser = argparse.ArgumentParser(description="Seed MoStar Grid Neo4j database")
-    parser.add_argument("--clear", action="store_true", help="Clear database before seeding")
-    
-    args = parser.parse_args()
-    
-    seed_mostar_grid(clear_first=args.clear)
+    seed_mostar_grid()
@@ -0,0 +1,144 @@
+"""
+Benchmark recall@k against per-query latency and index size for the memory
+store's FAISS index types (memory_layer/ann_index.py), over the moment corpus.
+
+    python scripts/bench_memory_ann.py --source exports/activation_subgraph.json \
+        --scale 1000000 --k 10 --types flat ivf_flat ivf_pq hnsw
+
+Moments are embedded once with the store's model and cached (--embeddings).
+--scale pads the corpus with jittered copies to project behaviour as memory
+grows past millions of moments. Queries are jittered corpus vectors; ground
+truth is an exact flat search. Latency is per single query, as MoStarMemory
+serves them.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from pathlib import Path
+
+import faiss
+import numpy as np
+
+MEMORY_LAYER = Path(__file__).resolve().parents[1] / "memory" / "neo4j-mindgraph" / "memory_layer"
+if str(MEMORY_LAYER) not in sys.path:
+    sys.path.append(str(MEMORY_LAYER))
+
+import ann_index  # noqa: E402
+import ingest  # noqa: E402
+
+
+def _corpus_vectors(source: Path, cache: Path, batch_size: int) -> np.ndarray:
+    if cache.exists():
+        print(f"   embeddings: cached {cache}")
+        return np.load(cache)
+    from langchain_huggingface import HuggingFaceEmbeddings
+
+    docs = ingest.create_documents(ingest.load_moments(source))
+    print(f"   embeddings: {len(docs)} moments with {ingest.MODEL_NAME}...")
+    model = HuggingFaceEmbeddings(model_name=ingest.MODEL_NAME, encode_kwargs={"batch_size": batch_size})
+    vectors = np.asarray(model.embed_documents([d.page_content for d in docs]), dtype=np.float32)
+    np.save(cache, vectors)
+    return vectors
+
+
+def _jitter(rng: np.random.Generator, base: np.ndarray, count: int, scale: float) -> np.ndarray:
+    picks = base[rng.integers(0, len(base), count)]
+    noise = rng.normal(0, scale, picks.shape).astype(np.float32) * base.std(axis=0)
+    return picks + noise
+
+
+def _recall(found: np.ndarray, truth: np.ndarray) -> float:
+    hits = sum(len(set(f) & set(t)) for f, t in zip(found, truth))
+    return hits / truth.size
+
+
+def _measure(index, queries: np.ndarray, truth: np.ndarray, k: int) -> dict:
+    latencies = []
+    found = np.empty_like(truth)
+    for i, query in enumerate(queries):
+        started = time.perf_counter()
+        _, ids = index.search(query[None, :], k)
+        latencies.append((time.perf_counter() - started) * 1000)
+        found[i] = ids[0]
+    ordered = sorted(latencies)
+    return {
+        "recall": round(_recall(found, truth), 4),
+        "p50_ms": round(ordered[len(ordered) // 2], 3),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 3),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--source", type=Path, default=ingest.JSON_SOURCE)
+    parser.add_argument("--embeddings", type=Path, default=Path("memory_embeddings.npy"))
+    parser.add_argument("--scale", type=int, default=0, help="Pad the corpus to this many vectors")
+    parser.add_argument("--queries", type=int, default=1000)
+    parser.add_argument("--k", type=int, default=10)
+    parser.add_argument("--types", nargs="+", choices=ann_index.INDEX_TYPES, default=list(ann_index.INDEX_TYPES))
+    parser.add_argument("--nprobe", type=int, nargs="+", default=[1, 4, 16, 64])
+    parser.add_argument("--ef-search", type=int, nargs="+", default=[16, 64, 256])
+    parser.add_argument("--jitter", type=float, default=0.05, help="Noise, in per-dim std units")
+    parser.add_argument("--threads", type=int, default=1)
+    parser.add_argument("--batch-size", type=int, default=ingest.INGEST_BATCH_SIZE)
+    parser.add_argument("--json", type=Path, help="Write results here")
+    args = parser.parse_args()
+
+    faiss.omp_set_num_threads(args.threads)
+    rng = np.random.default_rng(7)
+
+    print("⚡ MEMORY ANN BENCHMARK")
+    vectors = _corpus_vectors(args.source, args.embeddings, args.batch_size)
+    if args.scale > len(vectors):
+        vectors = np.concatenate([vectors, _jitter(rng, vectors, args.scale - len(vectors), args.jitter)])
+    n, dim = vectors.shape
+    ids = np.arange(n, dtype=np.int64)
+    queries = _jitter(rng, vectors, args.queries, args.jitter)
+    print(f"   corpus: {n} x {dim} | queries: {len(queries)} | k: {args.k} | threads: {args.threads}")
+
+    exact = faiss.IndexFlatL2(dim)
+    exact.add(vectors)
+    _, truth = exact.search(queries, args.k)
+
+    results = []
+    print(f"\n   {'index':<26} {'param':<14} {'recall@k':>9} {'p50 ms':>9} {'p95 ms':>9} {'MiB':>9} {'build s':>9}")
+    for index_type in args.types:
+        spec = ann_index.index_spec(index_type, dim, n)
+        started = time.perf_counter()
+        train = vectors[rng.choice(n, min(n, ann_index.MEMORY_INDEX_TRAIN_SIZE), replace=False)]
+        index = ann_index.build_index(spec, dim, train)
+        index.add_with_ids(vectors, ids)
+        build_s = time.perf_counter() - started
+        mib = ann_index.index_bytes(index) / 2**20
+
+        if index_type.startswith("ivf"):
+            sweep = [("nprobe", v) for v in args.nprobe]
+        elif index_type == "hnsw":
+            sweep = [("efSearch", v) for v in args.ef_search]
+        else:
+            sweep = [(None, None)]
+        for name, value in sweep:
+            if name == "nprobe":
+                ann_index.set_search_params(index, nprobe=value)
+            elif name == "efSearch":
+                ann_index.set_search_params(index, ef_search=value)
+            row = {"type": index_type, "spec": spec, name or "param": value, **_measure(index, queries, truth, args.k)}
+            row.update({"mib": round(mib, 2), "build_s": round(build_s, 2)})
+            results.append(row)
+            param = f"{name}={value}" if name else "-"
+            print(
+                f"   {spec:<26} {param:<14} {row['recall']:>9.4f} {row['p50_ms']:>9.3f} "
+                f"{row['p95_ms']:>9.3f} {mib:>9.1f} {build_s:>9.2f}"
+            )
+
+    if args.json:
+        args.json.write_text(json.dumps({"n": n, "dim": dim, "k": args.k, "results": results}, indent=2))
+        print(f"\n   results → {args.json}")
+
+
+if __name__ == "__main__":
+    main()
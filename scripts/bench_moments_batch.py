@@ -0,0 +1,121 @@
+"""
+Benchmark log_moments_batch (chunked UNWIND) against the legacy
+one-tx.run-per-moment loop, on a local Neo4j instance.
+
+    docker run --rm -p 7687:7687 -e NEO4J_AUTH=neo4j/benchpass neo4j:5
+    NEO4J_URI=bolt://localhost:7687 NEO4J_PASSWORD=benchpass \
+        python scripts/bench_moments_batch.py --sizes 1000 10000 100000
+
+Benchmark moments are tagged with a run-specific trigger_type and removed
+afterwards.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+import uuid
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parents[1] / "core" / "grid-orchestrator"
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.append(str(BACKEND_DIR))
+
+from core_engine import mostar_moments_log as moments_log  # noqa: E402
+
+LEGACY_CYPHER = moments_log.MOMENT_ROWS_CYPHER.replace(
+    "UNWIND $rows AS row", "WITH $row AS row"
+)
+
+
+def _make_moments(count: int, trigger_type: str) -> list[dict]:
+    return [
+        {
+            "initiator": f"Bench.Agent.{i % 97}",
+            "receiver": "Grid.Bench",
+            "description": f"benchmark moment {i}",
+            "trigger_type": trigger_type,
+            "resonance_score": 0.5 + (i % 50) / 100,
+            "layer": "MIND",
+        }
+        for i in range(count)
+    ]
+
+
+def _legacy_batch(moments: list[dict]) -> None:
+    """The pre-UNWIND implementation: one server round trip per moment."""
+    rows = [moments_log._moment_row(m, idx) for idx, m in enumerate(moments)]
+    with moments_log._session() as session:
+        with session.begin_transaction() as tx:
+            for row in rows:
+                tx.run(LEGACY_CYPHER, {"row": row}).single()
+            tx.commit()
+
+
+def _cleanup(trigger_type: str) -> None:
+    with moments_log._session() as session:
+        session.run(
+            """
+            MATCH (m:MoStarMoment {trigger_type: $trigger_type})
+            CALL { WITH m DETACH DELETE m } IN TRANSACTIONS OF 10000 ROWS
+            """,
+            {"trigger_type": trigger_type},
+        ).consume()
+
+
+def _timed(label: str, count: int, fn) -> float:
+    started = time.perf_counter()
+    fn()
+    elapsed = time.perf_counter() - started
+    print(f"   {label:<8} {count:>7} moments  {elapsed:8.2f}s  {count / elapsed:10.0f}/s")
+    return elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--chunk-size", type=int, default=moments_log.MOMENT_BATCH_CHUNK_SIZE)
+    parser.add_argument(
+        "--legacy-max",
+        type=int,
+        default=None,
+        help="Skip the legacy loop above this many moments",
+    )
+    args = parser.parse_args()
+
+    print("⚡ MOMENT BATCH BENCHMARK")
+    print(f"   neo4j: {moments_log.NEO4J_URI} | chunk_size: {args.chunk_size}")
+    try:
+        for size in args.sizes:
+            print(f"\n── {size} moments ──")
+            legacy_elapsed = None
+            if args.legacy_max is None or size <= args.legacy_max:
+                tag = f"benchmark_legacy_{uuid.uuid4().hex[:8]}"
+                moments = _make_moments(size, tag)
+                legacy_elapsed = _timed("legacy", size, lambda: _legacy_batch(moments))
+                _cleanup(tag)
+
+            tag = f"benchmark_unwind_{uuid.uuid4().hex[:8]}"
+            moments = _make_moments(size, tag)
+            results = []
+            unwind_elapsed = _timed(
+                "unwind",
+                size,
+                lambda: results.extend(
+                    moments_log.log_moments_batch(moments, chunk_size=args.chunk_size)
+                ),
+            )
+            failed = sum(1 for r in results if not r["logged"])
+            _cleanup(tag)
+
+            if failed:
+                print(f"   ⚠️ {failed} rows failed")
+            if legacy_elapsed:
+                print(f"   speedup: {legacy_elapsed / unwind_elapsed:.1f}x")
+    finally:
+        moments_log.neo4j_registry.close()
+
+
+if __name__ == "__main__":
+    main()
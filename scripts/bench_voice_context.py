@@ -0,0 +1,98 @@
+"""
+Benchmark per-message overhead of the voice pipeline: a fresh MoScriptEngine
+and httpx.AsyncClient per utterance (the old voice_server.query_mostar /
+sov_utils behaviour) against the shared grid_context engine and pooled
+Ollama client.
+
+    OLLAMA_HOST=http://localhost:11434 python scripts/bench_voice_context.py --messages 200
+
+Each message acquires an engine and makes one cheap Ollama round trip
+(GET /api/version), so model inference time is excluded. Engine banners are
+silenced; the boot moment each fresh engine logs is part of what is timed.
+
+    python scripts/bench_voice_context.py --engine-only
+
+times engine acquisition and the covenant check alone, with no Ollama.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import io
+import statistics
+import sys
+import time
+from pathlib import Path
+from typing import Optional
+
+BACKEND_DIR = Path(__file__).resolve().parents[1] / "core" / "grid-orchestrator"
+if str(BACKEND_DIR) not in sys.path:
+    sys.path.append(str(BACKEND_DIR))
+
+import httpx  # noqa: E402
+from core_engine.grid_config import config  # noqa: E402
+from core_engine.grid_context import grid_context  # noqa: E402
+from core_engine.moscript_engine import MoScriptEngine  # noqa: E402
+
+
+async def _per_message(url: Optional[str]) -> None:
+    """The pre-context path: awaken an engine and open a client per message."""
+    engine = MoScriptEngine()
+    engine.validate_covenant("route_reasoning", {})
+    if url is None:
+        return
+    async with httpx.AsyncClient(timeout=10.0) as client:
+        (await client.get(url)).raise_for_status()
+
+
+async def _shared(url: Optional[str]) -> None:
+    engine = grid_context.engine
+    engine.validate_covenant("route_reasoning", {})
+    if url is None:
+        return
+    (await grid_context.http_client().get(url, timeout=10.0)).raise_for_status()
+
+
+async def _timed(label: str, count: int, fn, url: Optional[str]) -> list[float]:
+    samples = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for _ in range(count):
+            started = time.perf_counter()
+            await fn(url)
+            samples.append((time.perf_counter() - started) * 1000)
+    ordered = sorted(samples)
+    p95 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))]
+    print(
+        f"   {label:<12} mean {statistics.fmean(samples):8.2f}ms  "
+        f"p50 {statistics.median(samples):8.2f}ms  p95 {p95:8.2f}ms"
+    )
+    return samples
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--messages", type=int, default=200)
+    parser.add_argument("--host", default=config.OLLAMA_HOST)
+    parser.add_argument(
+        "--engine-only", action="store_true", help="skip the Ollama round trip"
+    )
+    args = parser.parse_args()
+    url = None if args.engine_only else f"{args.host.rstrip('/')}/api/version"
+
+    print("⚡ VOICE CONTEXT BENCHMARK")
+    ollama = "skipped" if url is None else args.host
+    print(f"   ollama: {ollama} | messages: {args.messages} | http2: {grid_context.http2}")
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            await grid_context.startup()  # warm-up, as the server lifespan does
+        fresh = await _timed("per-message", args.messages, _per_message, url)
+        pooled = await _timed("shared", args.messages, _shared, url)
+        print(f"   speedup: {statistics.fmean(fresh) / statistics.fmean(pooled):.1f}x (mean)")
+    finally:
+        await grid_context.aclose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -1,7 +1,17 @@
+"""
+Loads the remaining CSV tables and the Ibibio dictionary as plain nodes.
+Specs only; the batching/resume/report machinery lives in import_engine.
+"""
+
 import os
-import csv
-import json
-from neo4j import GraphDatabase
+import sys
+from pathlib import Path
+
+sys.path.append(os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "..", "memory", "neo4j-mindgraph", "import"
+))
+
+from import_engine import CsvRows, JsonRows, Phase, SourceSpec, run_cli
 
 # === CONFIG ===
 IMPORT_DIR = r"C:\Users\AI\Documents\MoStar\Mo Docs\neo4j-community-2025.10.1\import"
@@ -9,54 +19,9 @@ NEO4J_URI = "bolt://localhost:7687"
 NEO4J_USER = "neo4j"
 NEO4J_PASS = "mostar123"
 
-driver = GraphDatabase.driver(NEO4J_URI, auth=(NEO4J_USER, NEO4J_PASS))
-
-# === CSV LOADER ===
-def load_csv(filename, label):
-    full_path = os.path.join(IMPORT_DIR, filename)
-    with open(full_path, encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            props = {k: v for k, v in row.items() if v}
-            name = props.get('name') or props.get('id') or os.path.splitext(filename)[0]
-            with driver.session() as session:
-                session.run(
-                    f"MERGE (n:{label} {{name: $name}}) SET n += $props",
-                    name=name,
-                    props=props
-                )
-
-# === JSON LOADER ===
-def load_json(filename, label):
-    full_path = os.path.join(IMPORT_DIR, filename)
-
-    with open(full_path, encoding="utf-8") as f:
-        try:
-            data = json.load(f)
-            if isinstance(data, dict) and "rows" in data:
-                data = data["rows"]
-            elif isinstance(data, list) and all(isinstance(item, str) for item in data):
-                # Handle edge case: JSON array of strings
-                data = [json.loads(line) for line in data]
-        except json.JSONDecodeError:
-            f.seek(0)
-            data = [json.loads(line.strip()) for line in f if line.strip()]
-
-    with driver.session() as session:
-        for item in data:
-            if isinstance(item, str):
-                item = json.loads(item)  # ensure it's a dict
-
-            word = item.get('word:ID') or item.get('word') or item.get('id')
-            if word:
-                session.run(
-                    f"MERGE (n:{label} {{word: $word}}) SET n += $props",
-                    word=word,
-                    props=item
-                )
+CHECKPOINT_PATH = str(Path(__file__).with_suffix(".checkpoint.json"))
 
-# === RUN IMPORTS ===
-csv_files = [
+CSV_FILES = [
     ("african_philosophies.csv", "Philosophy"),
     ("medicinal_plants.csv", "Plant"),
     ("healing_practices.csv", "Healing"),
@@ -68,11 +33,57 @@ csv_files = [
     ("ibibio_words.csv", "IbibioWord")
 ]
 
-for fname, label in csv_files:
-    print(f"Loading {fname}...")
-    load_csv(fname, label)
 
-print("Loading ibibio_dictionary.json...")
-load_json("ibibio_dictionary.json", "IbibioWord")
+# === CSV ROWS: merge on name, falling back to id, then the file stem ===
+def _named(filename):
+    stem = os.path.splitext(filename)[0]
+
+    def _transform(row):
+        props = {k: v for k, v in row.items() if v}
+        props["name"] = props.get("name") or props.get("id") or stem
+        return props
+
+    return _transform
+
+
+# === JSON ROWS: merge on the dictionary word ===
+def _worded(item):
+    word = item.get("word:ID") or item.get("word") or item.get("ibibio") or item.get("id")
+    if not word:
+        return None
+    return dict(item, word=word)
+
+
+def build_phases(import_dir=IMPORT_DIR):
+    csv_specs = [
+        SourceSpec(
+            fname, label, ["name"], CsvRows(os.path.join(import_dir, fname)),
+            transform=_named(fname),
+        )
+        for fname, label in CSV_FILES
+    ]
+    json_spec = SourceSpec(
+        "ibibio_dictionary.json", "IbibioWord", ["word"],
+        JsonRows(os.path.join(import_dir, "ibibio_dictionary.json")),
+        transform=_worded,
+    )
+    return [Phase("remaining", csv_specs + [json_spec])]
+
+
+# === RUN IMPORTS ===
+def main(uri=NEO4J_URI, import_dir=IMPORT_DIR, password=NEO4J_PASS,
+         checkpoint=CHECKPOINT_PATH):
+    os.environ.setdefault("NEO4J_URI", uri)
+    os.environ.setdefault("NEO4J_USER", NEO4J_USER)
+    run_cli(
+        lambda args: build_phases(args.import_dir),
+        description="Import the remaining CSV/JSON tables",
+        checkpoint=checkpoint,
+        password=password,
+        prepare=lambda parser: parser.add_argument("--import-dir", default=import_dir),
+    )
+    print("✅ ALL DONE.")
+
 
-print("✅ ALL DONE.")
+if __name__ == "__main__":
+    main()
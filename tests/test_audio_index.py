@@ -0,0 +1,57 @@
+import unittest
+import tempfile
+import sys
+import os
+from pathlib import Path
+
+# Add the orchestrator package root so core_engine is importable
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'core', 'grid-orchestrator')))
+
+from core_engine.audio_index import AudioFileIndex
+
+
+class TestAudioFileIndex(unittest.TestCase):
+    """Filename → path index over prioritised audio directories."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        root = Path(self.tmp.name)
+        self.primary, self.secondary = root / "primary", root / "secondary"
+        self.primary.mkdir()
+        self.secondary.mkdir()
+        (self.primary / "abasi.wav").write_bytes(b"a")
+        (self.secondary / "abasi.wav").write_bytes(b"b")
+        (self.secondary / "ufok.wav").write_bytes(b"c")
+        self.index = AudioFileIndex([self.primary, self.secondary, root / "missing"],
+                                    refresh_interval=0)
+
+    def tearDown(self):
+        self.index.close()
+        self.tmp.cleanup()
+
+    def test_first_directory_wins_and_misses_are_none(self):
+        self.assertEqual(self.index.resolve("abasi.wav"), str((self.primary / "abasi.wav").resolve()))
+        self.assertEqual(self.index.resolve("ufok.wav"), str((self.secondary / "ufok.wav").resolve()))
+        self.assertIsNone(self.index.resolve("mmong.wav"))
+        self.assertIsNone(self.index.resolve(None))
+        # An explicit path is honoured before the indexed copy
+        explicit = str(self.secondary / "abasi.wav")
+        self.assertEqual(self.index.resolve(explicit), str(Path(explicit).resolve()))
+        self.assertEqual(self.index.resolve("/nowhere/ufok.wav"), self.index.resolve("ufok.wav"))
+
+    def test_refresh_picks_up_directory_changes_only(self):
+        self.assertFalse(self.index.refresh())
+        (self.primary / "mmong.wav").write_bytes(b"d")
+        os.utime(self.primary, ns=(0, 0))
+        self.assertTrue(self.index.refresh())
+        self.assertIn("mmong.wav", self.index)
+        self.assertEqual(self.index.rebuilds, 2)
+
+    def test_names_restrict_the_index(self):
+        index = AudioFileIndex([self.secondary], names={"ufok.wav"}, refresh_interval=0)
+        self.assertEqual(len(index), 1)
+        self.assertIsNone(index.resolve("abasi.wav"))
+
+
+if __name__ == '__main__':
+    unittest.main()
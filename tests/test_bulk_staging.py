@@ -0,0 +1,171 @@
+import unittest
+import tempfile
+import shlex
+import shutil
+import subprocess
+import time
+import sys
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+
+MINDGRAPH_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'memory', 'neo4j-mindgraph'))
+EXPORT_DIR = os.path.join(MINDGRAPH_DIR, 'import', 'database_export')
+
+# bulk_staging lives beside the import scripts
+sys.path.insert(0, os.path.join(MINDGRAPH_DIR, 'import'))
+
+from bulk_staging import BulkStaging
+
+
+class TestBulkStaging(unittest.TestCase):
+    """Unit tests for the neo4j-admin first-load staging files."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_merge_semantics_and_typed_headers(self):
+        staging = BulkStaging(self.dir, id_space="Test")
+        staging.add_node(1, ["Agent"], {"name": "Woo", "score": 1, "tags": ["a", "b"]})
+        staging.add_node(1, ["Agent", "ImportedSnapshot"], {"score": 2.5, "note": None})
+        staging.add_node(2, ["Agent", "ImportedSnapshot"], {
+            "name": 'Mo "the" Oracle', "seen": datetime(2026, 1, 1, tzinfo=timezone.utc),
+        })
+        self.assertTrue(staging.add_relationship("GUIDES", 1, 2, {"weight": 1}))
+        self.assertTrue(staging.add_relationship("GUIDES", 1, 2, {"weight": 2}))
+        self.assertFalse(staging.add_relationship("GUIDES", 1, 99))
+
+        manifest = staging.write()
+
+        self.assertEqual(manifest["nodes"], 2)
+        self.assertEqual(manifest["relationships"], 1)
+        node_header = (self.dir / "nodes_000_Agent_ImportedSnapshot.header.csv").read_text()
+        self.assertEqual(
+            node_header.strip(),
+            ":ID(Test),name:string,score:double,seen:datetime,tags:string[]",
+        )
+        rows = (self.dir / "nodes_000_Agent_ImportedSnapshot.csv").read_text().splitlines()
+        self.assertIn('"1","Woo","2.5",,"a;b"', rows)
+        self.assertIn('"2","Mo ""the"" Oracle",,"2026-01-01T00:00:00+00:00",', rows)
+        rel_rows = (self.dir / "relationships_000_GUIDES.csv").read_text().splitlines()
+        self.assertEqual(rel_rows, ['"1","2","2"'])
+
+    def test_command_lists_every_file(self):
+        staging = BulkStaging(self.dir, database="grid")
+        staging.add_node("a", ["Odu"], {"name": "Ogbe"})
+        staging.add_node("b", ["Odu"], {"name": "Oyeku"})
+        staging.add_relationship("PRECEDES", "a", "b")
+        staging.write()
+
+        command = staging.command(path_prefix="/import")
+        self.assertEqual(command[:4], ["neo4j-admin", "database", "import", "full"])
+        self.assertIn("--nodes=Odu=/import/nodes_000_Odu.header.csv,/import/nodes_000_Odu.csv", command)
+        self.assertIn(
+            "--relationships=PRECEDES=/import/relationships_000_PRECEDES.header.csv,"
+            "/import/relationships_000_PRECEDES.csv",
+            command,
+        )
+        self.assertEqual(command[-1], "grid")
+        self.assertTrue((self.dir / "IMPORT_COMMAND.txt").exists())
+
+
+@unittest.skipUnless(
+    os.getenv("MOSTAR_BULK_IMPORT_IT") and shutil.which("docker"),
+    "set MOSTAR_BULK_IMPORT_IT=1 with docker available to run against Neo4j containers",
+)
+class TestBulkImportMatchesOnline(unittest.TestCase):
+    """Loads the split database export online and in bulk, then compares graph counts."""
+
+    IMAGE = os.getenv("MOSTAR_BULK_IMPORT_IMAGE", "neo4j:2025.10")
+
+    def setUp(self):
+        sys.path.insert(0, MINDGRAPH_DIR)
+        import phase2_import
+        import phase3_rels_import
+
+        snapshot = sorted(
+            name for name in os.listdir(EXPORT_DIR) if name.startswith("nodes_")
+        )[-1].replace("nodes_", "")
+        phase2_import.CSV_DIR = os.path.join(EXPORT_DIR, f"nodes_{snapshot}")
+        phase3_rels_import.RELS_DIR = os.path.join(EXPORT_DIR, f"relationships_{snapshot}")
+        self.phase2 = phase2_import
+        self.phase3 = phase3_rels_import
+        self.files = [
+            name for name in sorted(os.listdir(phase2_import.CSV_DIR))
+            if name.endswith(".csv") and name.lower() not in phase2_import.FORBIDDEN
+        ]
+        self.tmp = tempfile.TemporaryDirectory()
+        self.containers = []
+        self.volumes = []
+
+    def tearDown(self):
+        for name in self.containers:
+            subprocess.run(["docker", "rm", "-f", name], capture_output=True)
+        for name in self.volumes:
+            subprocess.run(["docker", "volume", "rm", "-f", name], capture_output=True)
+        self.tmp.cleanup()
+
+    def _start(self, name, port, volume):
+        subprocess.run(
+            ["docker", "run", "-d", "--name", name, "-e", "NEO4J_AUTH=none",
+             "-p", f"{port}:7687", "-v", f"{volume}:/data", self.IMAGE],
+            check=True, capture_output=True,
+        )
+        self.containers.append(name)
+        from neo4j import GraphDatabase
+        driver = GraphDatabase.driver(f"bolt://localhost:{port}", auth=None)
+        for _ in range(90):
+            try:
+                driver.verify_connectivity()
+                return driver
+            except Exception:
+                time.sleep(2)
+        self.fail(f"{name} did not come up")
+
+    @staticmethod
+    def _counts(driver):
+        with driver.session() as session:
+            nodes = session.run("MATCH (n) RETURN count(n) AS c").single()["c"]
+            rels = session.run("MATCH ()-[r]->() RETURN count(r) AS c").single()["c"]
+        return nodes, rels
+
+    def test_counts_match(self):
+        suffix = str(os.getpid())
+        online_volume, bulk_volume = f"mostar-online-{suffix}", f"mostar-bulk-{suffix}"
+        self.volumes += [online_volume, bulk_volume]
+
+        driver = self._start(f"mostar-online-{suffix}", 17687, online_volume)
+        for name in self.files:
+            self.phase2.ingest_csv(driver, os.path.join(self.phase2.CSV_DIR, name), name)
+        for name in sorted(os.listdir(self.phase3.RELS_DIR)):
+            if name.endswith(".csv"):
+                self.phase3.ingest_rels_csv(driver, os.path.join(self.phase3.RELS_DIR, name), name)
+        online = self._counts(driver)
+        driver.close()
+
+        staging_dir = Path(self.tmp.name) / "staging"
+        manifest = self.phase2.stage_bulk(self.files, staging_dir)
+        subprocess.run(["docker", "volume", "create", bulk_volume], check=True, capture_output=True)
+        # The staging directory is mounted at /import inside the container
+        command = [
+            arg.replace(str(staging_dir.resolve()), "/import")
+            for arg in shlex.split(manifest["command"])
+        ]
+        subprocess.run(
+            ["docker", "run", "--rm", "-v", f"{staging_dir.resolve()}:/import",
+             "-v", f"{bulk_volume}:/data", self.IMAGE] + command,
+            check=True, capture_output=True,
+        )
+        driver = self._start(f"mostar-bulk-{suffix}", 17688, bulk_volume)
+        bulk = self._counts(driver)
+        driver.close()
+
+        self.assertEqual(bulk, online)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,98 @@
+import unittest
+import asyncio
+import importlib.util
+import sys
+import os
+from unittest import mock
+
+# Add the orchestrator package root so core_engine is importable
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'core', 'grid-orchestrator')))
+
+TELEMETRY_DEPS = importlib.util.find_spec("httpx") is not None
+
+EDGES = [(0, 1), (1, 0), (0, 4), (5, 2), (3, 3), (6, 0), (4, 6), (2, 5)]
+
+
+class _FakeGraphEngine:
+    """Answers the constellation traversals over nodes 0..6 and EDGES."""
+
+    def __init__(self, nodes=7, fail_on=None):
+        self.nodes = list(range(nodes))
+        self.fail_on = fail_on  # (purpose, call number) that is refused
+        self.calls = []
+
+    async def interpret(self, ritual):
+        payload = ritual["payload"]
+        purpose, params = payload["purpose"], payload["params"]
+        self.calls.append(purpose)
+        if self.fail_on == (purpose, self.calls.count(purpose)):
+            return {"status": "disrupted", "error": "Neo4j unavailable"}
+        if purpose == "telemetry_constellation_nodes":
+            ids = [n for n in self.nodes if n > params["cursor"]][:params["page_size"]]
+            records = [{"id": n, "labels": ["Agent"], "name": f"n{n}", "degree": 1} for n in ids]
+        else:
+            ids = set(params["ids"])
+            records = [
+                {"source": s, "target": t, "rel": "TRUSTS"}
+                for s, t in EDGES
+                if (s in ids and t <= params["max_id"]) or (t in ids and s < params["min_id"])
+            ]
+        return {"status": "aligned", "result": {"records": records}}
+
+
+async def _pages(engine, **kwargs):
+    return [page async for page in engine.iter_constellation(**kwargs)]
+
+
+@unittest.skipUnless(TELEMETRY_DEPS, "grid_telemetry needs httpx")
+class TestConstellationPaging(unittest.TestCase):
+    """Keyset pages over node id; every relationship is sent exactly once."""
+
+    def setUp(self):
+        from core_engine import grid_telemetry
+
+        patcher = mock.patch.object(grid_telemetry, "log_mostar_moment")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.graph = _FakeGraphEngine()
+        self.engine = grid_telemetry.CanonicalTelemetryEngine(engine=self.graph)
+
+    def test_keyset_pages_and_links_sent_once(self):
+        pages = asyncio.run(_pages(self.engine, page_size=3, limit=100))
+        self.assertEqual([[n["id"] for n in p["nodes"]] for p in pages], [[0, 1, 2], [3, 4, 5], [6]])
+        self.assertEqual([p["cursor"] for p in pages], [2, 5, None])
+        links = [(l["source"], l["target"]) for p in pages for l in p["links"]]
+        self.assertEqual(sorted(links), sorted(EDGES))
+
+    def test_resume_from_cursor(self):
+        pages = asyncio.run(_pages(self.engine, page_size=3, limit=100, cursor=2))
+        self.assertEqual([n["id"] for p in pages for n in p["nodes"]], [3, 4, 5, 6])
+        links = {(l["source"], l["target"]) for p in pages for l in p["links"]}
+        # Earlier-page links were sent with the pages before the cursor
+        self.assertEqual(links, {(3, 3), (5, 2), (6, 0), (4, 6), (2, 5), (0, 4)})
+
+    def test_limit_leaves_a_cursor(self):
+        pages = asyncio.run(_pages(self.engine, page_size=3, limit=4))
+        self.assertEqual([len(p["nodes"]) for p in pages], [3, 1])
+        self.assertEqual(pages[-1]["cursor"], 3)
+
+    def test_failed_traversal_ends_with_a_resumable_error_page(self):
+        self.graph.fail_on = ("telemetry_constellation_nodes", 2)
+        pages = asyncio.run(_pages(self.engine, page_size=3, limit=100))
+        self.assertEqual(len(pages), 2)
+        self.assertEqual(pages[-1], {"nodes": [], "links": [], "cursor": 2, "error": "Neo4j unavailable"})
+
+        self.graph.calls, self.graph.fail_on = [], ("telemetry_constellation_links", 1)
+        data = asyncio.run(self.engine.get_graph_constellation(page_size=3, limit=100))
+        self.assertEqual((data["nodes"], data["cursor"], data["error"]), ([], -1, "Neo4j unavailable"))
+
+    def test_json_mode_honours_page_size(self):
+        data = asyncio.run(self.engine.get_graph_constellation(page_size=2, limit=100))
+        self.assertEqual(len(data["nodes"]), 7)
+        self.assertEqual(self.graph.calls.count("telemetry_constellation_nodes"), 4)
+        self.assertIsNone(data["cursor"])
+        self.assertNotIn("error", data)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,250 @@
+import unittest
+import importlib.util
+import tempfile
+import threading
+import types
+import sys
+import os
+from contextlib import ExitStack
+from pathlib import Path
+from unittest import mock
+
+# csv_quality and csv_grid_uploader import each other as top-level modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'core', 'grid-orchestrator', 'core_engine')))
+
+NEO4J_AVAILABLE = importlib.util.find_spec("neo4j") is not None
+
+
+class _FakeDriver:
+    class _Session:
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc):
+            return False
+
+        def run(self, query, params=None):
+            return []
+
+    def session(self):
+        return self._Session()
+
+    def close(self):
+        pass
+
+
+class _FakeGrid:
+    """In-memory stand-in for the uploader's graph reads and writes."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.sources = {}  # path -> {"status", "content_hash", ...}
+        self.rows = {}  # row_id -> {"path", "hash", "deleted_by"}
+        self.batches_written = 0
+        self.fail_writes = False
+
+    def patches(self, uploader):
+        fake_graph = types.SimpleNamespace(driver=lambda *args, **kwargs: _FakeDriver())
+        return [
+            mock.patch.object(uploader, "GraphDatabase", fake_graph),
+            mock.patch.object(uploader, "_prepare_graph", lambda driver, root: None),
+            mock.patch.object(uploader, "_create_import_run", lambda driver, root: "run-1"),
+            mock.patch.object(uploader, "_load_source_hashes", self.load_source_hashes),
+            mock.patch.object(uploader, "_load_row_hashes", self.load_row_hashes),
+            mock.patch.object(uploader, "_upload_batch", self.upload_batch),
+            mock.patch.object(uploader, "_upsert_source", self.upsert_source),
+            mock.patch.object(uploader, "_mark_skipped_source", self.mark_skipped),
+            mock.patch.object(uploader, "_mark_unchanged_source", self.mark_unchanged),
+            mock.patch.object(uploader, "_tombstone_rows", self.tombstone),
+        ]
+
+    def load_source_hashes(self, driver, csv_root):
+        return {
+            path: source["content_hash"]
+            for path, source in self.sources.items()
+            if source["status"] == "uploaded" and source["content_hash"]
+        }
+
+    def load_row_hashes(self, driver, path):
+        return {
+            row_id: row["hash"]
+            for row_id, row in self.rows.items()
+            if row["path"] == str(path) and row["deleted_by"] is None
+        }
+
+    def upload_batch(self, driver, path, rows):
+        if self.fail_writes:
+            raise RuntimeError("write refused")
+        with self._lock:
+            self.batches_written += 1
+            for row in rows:
+                self.rows[row["row_id"]] = {"path": str(path), "hash": row["row_hash"], "deleted_by": None}
+
+    def upsert_source(self, driver, run_id, csv_root, path, validation, fieldnames, count,
+                      *, status="uploaded", failure_reason=None, content_hash=None):
+        self.sources[str(path)] = {"status": status, "content_hash": content_hash, "rows": count}
+
+    def mark_skipped(self, driver, run_id, csv_root, path, validation, reason):
+        self.sources[str(path)] = {"status": "skipped", "content_hash": None, "reason": reason}
+
+    def mark_unchanged(self, driver, run_id, path):
+        pass
+
+    def tombstone(self, driver, run_id, row_ids):
+        for row_id in row_ids:
+            self.rows[row_id]["deleted_by"] = run_id
+
+    def live_rows(self):
+        return {row_id: row["hash"] for row_id, row in self.rows.items() if row["deleted_by"] is None}
+
+
+@unittest.skipUnless(NEO4J_AVAILABLE, "csv_grid_uploader needs the neo4j driver")
+class _UploaderTestCase(unittest.TestCase):
+    def setUp(self):
+        import csv_grid_uploader
+
+        self.uploader = csv_grid_uploader
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.root = Path(self.tmp.name)
+        self.grid = _FakeGrid()
+        self.stack = ExitStack()
+        self.addCleanup(self.stack.close)
+        for patch in self.grid.patches(csv_grid_uploader):
+            self.stack.enter_context(patch)
+
+    def _write(self, name, text):
+        (self.root / name).write_text(text, encoding="utf-8")
+
+    def _corpus(self):
+        self._write("agents.csv", "name,score:int\n" + "".join(f"a{i},{i}\n" for i in range(23)))
+        self._write("moments.csv", "id,layer\n1,SOUL\n2,MIND\n3\n4,BODY\n")
+        self._write("header_only.csv", "id,layer\n")
+        self._write("knowledge_graph.csv", "id\n1\n")  # forced quarantine
+        self._write("places.csv", "name,region\n" + "".join(f"p{i},r{i % 3}\n" for i in range(9)))
+
+    def _upload(self, **kwargs):
+        kwargs.setdefault("batch_size", 4)
+        summary = self.uploader.upload_csv_corpus(self.root, "bolt://fake", "neo4j", "", **kwargs)
+        summary.pop("run_id")
+        return summary
+
+
+class TestParallelUpload(_UploaderTestCase):
+    """Concurrent parsing and writing matches the sequential uploader."""
+
+    def test_parallel_matches_sequential(self):
+        self._corpus()
+        sequential = self._upload()
+        sequential_rows = self.grid.live_rows()
+        sequential_sources = dict(self.grid.sources)
+
+        self.grid = _FakeGrid()
+        self.stack.close()
+        for patch in self.grid.patches(self.uploader):
+            self.stack.enter_context(patch)
+        parallel = self._upload(workers=3, write_sessions=2, max_rows_in_flight=8)
+
+        self.assertEqual(parallel, sequential)
+        self.assertEqual(self.grid.live_rows(), sequential_rows)
+        self.assertEqual(self.grid.sources, sequential_sources)
+        self.assertEqual(sequential["metrics"]["rows_uploaded"], 23 + 3 + 9)
+        self.assertEqual(
+            [entry["file"] for entry in sequential["skipped_files"]],
+            ["header_only.csv", "knowledge_graph.csv"],
+        )
+        self.assertEqual(sequential["metrics"]["rows_inconsistent"], 1)
+
+    def test_parallel_write_failure_propagates(self):
+        self._corpus()
+        self.grid.fail_writes = True
+        with self.assertRaisesRegex(RuntimeError, "write refused"):
+            self._upload(workers=2)
+
+    def test_parallel_parse_failure_propagates(self):
+        self._corpus()
+        paths = sorted(self.root.glob("*.csv")) + [self.root / "vanished.csv"]
+        summary = {"skipped_files": [], "uploaded_files": [], "unchanged_files": [], "metrics": {}}
+        with self.assertRaises(FileNotFoundError):
+            self.uploader._upload_parallel(
+                _FakeDriver(), "run-1", self.root, paths, summary, {},
+                batch_size=4, abort_on_inconsistency=False, full=False,
+                workers=2, write_sessions=2, max_rows_in_flight=8,
+            )
+
+
+class TestIncrementalUpload(_UploaderTestCase):
+    """Re-imports write only changed rows and tombstone the ones removed."""
+
+    def test_row_delta(self):
+        import csv_grid_uploader
+
+        delta = csv_grid_uploader._RowDelta({"a.csv:1": "h1", "a.csv:2": "h2", "a.csv:3": "h3"})
+        rows = [{"row_id": "a.csv:1", "row_hash": "h1"}, {"row_id": "a.csv:2", "row_hash": "new"},
+                {"row_id": "a.csv:4", "row_hash": "h4"}]
+        self.assertEqual([r["row_id"] for r in delta.changed(rows)], ["a.csv:2", "a.csv:4"])
+        self.assertEqual((delta.unchanged, sorted(delta.remaining)), (1, ["a.csv:3"]))
+
+    def test_unchanged_files_are_skipped(self):
+        self._corpus()
+        self._upload()
+        written = self.grid.batches_written
+        for workers in (1, 3):
+            with self.subTest(workers=workers):
+                summary = self._upload(workers=workers)
+                self.assertEqual(summary["unchanged_files"], ["agents.csv", "places.csv"])
+                self.assertEqual(summary["metrics"]["csv_files_unchanged"], 2)
+                # The partial file has no content hash, so it is re-read but nothing is written
+                self.assertEqual(summary["uploaded_files"], [{
+                    "file": "moments.csv", "rows_uploaded": 0, "rows_unchanged": 3,
+                    "rows_deleted": 0, "column_count": 2, "inconsistent_rows": 1,
+                }])
+                self.assertEqual(summary["metrics"]["rows_uploaded"], 0)
+                self.assertEqual(self.grid.batches_written, written)
+
+    def test_changed_file_writes_only_changed_rows_and_tombstones_removed(self):
+        self._corpus()
+        self._upload()
+        before = self.grid.live_rows()
+        # a3 (row 4) changes and a22 (row 23) is dropped; every other row keeps its number
+        self._write("agents.csv", "name,score:int\n" + "".join(
+            f"a{i},{99 if i == 3 else i}\n" for i in range(22)))
+        summary = self._upload(workers=3)
+
+        self.assertEqual(summary["unchanged_files"], ["places.csv"])
+        self.assertEqual(summary["uploaded_files"][0], {
+            "file": "agents.csv", "rows_uploaded": 1, "rows_unchanged": 21, "rows_deleted": 1,
+            "column_count": 2, "inconsistent_rows": 0,
+        })
+        self.assertEqual(summary["metrics"]["rows_deleted"], 1)
+        after = self.grid.live_rows()
+        self.assertNotIn("agents.csv:23", after)
+        self.assertEqual(self.grid.rows["agents.csv:23"]["deleted_by"], "run-1")
+        self.assertNotEqual(after["agents.csv:4"], before["agents.csv:4"])
+        self.assertEqual(len(after), len(before) - 1)
+
+        # --full ignores both the file and the row hashes
+        summary = self._upload(full=True)
+        self.assertEqual(summary["unchanged_files"], [])
+        self.assertEqual(summary["metrics"]["rows_uploaded"], 22 + 3 + 9)
+        self.assertEqual(summary["metrics"]["rows_unchanged"], 0)
+
+    def test_partial_file_tombstones_once_valid(self):
+        self._corpus()
+        self._upload()
+        self.assertIn("moments.csv:4", self.grid.live_rows())
+        self.assertIsNone(self.grid.sources[str(self.root / "moments.csv")]["content_hash"])
+        self._write("moments.csv", "id,layer\n1,SOUL\n2,MIND\n")
+        summary = self._upload()
+        moments = [entry for entry in summary["uploaded_files"] if entry["file"] == "moments.csv"]
+        # Row 4 (4,BODY) is gone; the fixed file is hashed so the next run can skip it
+        self.assertEqual(
+            [(m["rows_uploaded"], m["rows_unchanged"], m["rows_deleted"]) for m in moments], [(0, 2, 1)]
+        )
+        self.assertNotIn("moments.csv:4", self.grid.live_rows())
+        self.assertIsNotNone(self.grid.sources[str(self.root / "moments.csv")]["content_hash"])
+        self.assertIn("moments.csv", self._upload()["unchanged_files"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,101 @@
+import unittest
+import importlib.util
+import tempfile
+import sys
+import os
+from pathlib import Path
+
+# csv_quality and csv_grid_uploader import each other as top-level modules
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'core', 'grid-orchestrator', 'core_engine')))
+
+NEO4J_AVAILABLE = importlib.util.find_spec("neo4j") is not None
+
+
+@unittest.skipUnless(NEO4J_AVAILABLE, "csv_quality needs the neo4j driver")
+class TestCsvStream(unittest.TestCase):
+    """One streaming pass validates a file while yielding its rows in batches."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _csv(self, name, text, encoding="utf-8"):
+        path = self.root / name
+        path.write_bytes(text.encode(encoding))
+        return path
+
+    def test_batches_carry_row_numbers_and_final_validation(self):
+        from csv_quality import CsvStream
+
+        rows = "".join(f"agent_{i},{i},\n" if i % 2 else f"agent_{i},{i},x\n" for i in range(7))
+        stream = CsvStream(self._csv("agents.csv", "name,score:int,note\n" + rows), batch_size=3)
+        batches = list(stream.batches())
+
+        self.assertEqual([len(b) for b in batches], [3, 3, 1])
+        self.assertEqual(batches[0][1], (2, ["agent_1", "1", ""]))
+        self.assertEqual(stream.header, ["name", "score:int", "note"])
+        self.assertEqual(stream.rows_yielded, 7)
+        validation = stream.validation
+        self.assertTrue(validation["valid"])
+        self.assertEqual((validation["reason"], validation["row_count"]), ("ok", 7))
+        self.assertEqual(validation["column_count"], 3)
+        self.assertEqual(validation["null_cell_ratio"], round(3 / 21, 6))
+        self.assertEqual(validation["encoding"], "utf-8-sig")
+
+    def test_inconsistent_rows_are_counted_not_yielded(self):
+        from csv_quality import CsvStream
+
+        path = self._csv("mixed.csv", "a,b\n1,2\n3\n4,5\n6,7,8\n9,10\n")
+        stream = CsvStream(path, batch_size=10)
+        rows = [row for batch in stream.batches() for row in batch]
+        self.assertEqual([number for number, _ in rows], [1, 3, 5])
+        self.assertEqual(stream.validation["inconsistent_rows"], 2)
+        self.assertEqual(stream.validation["reason"], "inconsistent_columns")
+        self.assertFalse(stream.validation["valid"])
+        self.assertFalse(stream.aborted)
+
+        stream = CsvStream(path, batch_size=10, abort_on_inconsistency=True)
+        rows = [row for batch in stream.batches() for row in batch]
+        self.assertEqual([number for number, _ in rows], [1])
+        self.assertTrue(stream.aborted)
+        self.assertEqual(stream.validation["inconsistent_rows"], 1)
+
+    def test_multiline_cells_and_quote_warnings(self):
+        from csv_quality import validate_csv_file
+
+        validation = validate_csv_file(self._csv("notes.csv", 'id,text\n1,"two\nlines"\n2,plain\n'))
+        self.assertTrue(validation["valid"])
+        self.assertEqual(validation["row_count"], 2)
+        self.assertIn("multiline_cells:1", validation["warnings"])
+        self.assertIn("suspicious_quote_balance_line_2", validation["warnings"])
+
+    def test_validate_csv_file_rejections(self):
+        from csv_quality import validate_csv_file
+
+        cases = {
+            "empty.csv": ("  \n\n", "empty_content"),
+            "header.csv": ("a,b,c\n", "header_only_or_empty"),
+            "config.csv": ("grid:\n  name: mostar\n  mode: live\n  tier: core\n", "yaml_like_content"),
+            "agents.csv:Zone.Identifier": ("[ZoneTransfer]\nZoneId=3\n", "zone_identifier"),
+        }
+        for name, (text, reason) in cases.items():
+            with self.subTest(name=name):
+                validation = validate_csv_file(self._csv(name, text))
+                self.assertFalse(validation["valid"])
+                self.assertTrue(validation["corruption_flag"])
+                self.assertEqual(validation["reason"], reason)
+
+    def test_latin1_file_is_detected_and_decoded(self):
+        from csv_quality import CsvStream
+
+        stream = CsvStream(self._csv("places.csv", "name,region\nAkwa Ibom,Sud-Est\nCôte,Ouest\n", "latin-1"))
+        rows = [cells for batch in stream.batches() for _, cells in batch]
+        self.assertEqual(stream.validation["encoding"], "latin-1")
+        self.assertEqual(rows[1], ["Côte", "Ouest"])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import unittest
+import asyncio
+import importlib.util
+import sys
+import os
+import threading
+
+# Add the orchestrator package root so core_engine is importable
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'core', 'grid-orchestrator')))
+
+HTTPX_AVAILABLE = importlib.util.find_spec("httpx") is not None
+
+
+@unittest.skipUnless(HTTPX_AVAILABLE, "grid_context needs httpx")
+class TestGridContext(unittest.TestCase):
+    """One engine per process; one pooled Ollama client per event loop."""
+
+    def setUp(self):
+        from core_engine.grid_context import GridContext
+
+        self.context = GridContext(pool_size=4)
+
+    def test_engine_awakened_once(self):
+        self.assertIsNone(self.context.metrics()["engine"])
+        engine = self.context.engine
+        self.assertIs(self.context.engine, engine)
+        self.assertEqual(self.context.metrics()["engine"], engine.covenant_id)
+
+    def test_client_reused_within_a_loop(self):
+        async def _session():
+            first = self.context.http_client()
+            second = self.context.http_client()
+            await self.context.aclose()
+            return first, second, first.is_closed
+
+        first, second, closed = asyncio.run(_session())
+        self.assertIs(first, second)
+        self.assertTrue(closed)
+
+        # A new loop gets a fresh client rather than one bound to a dead loop
+        third, _, _ = asyncio.run(_session())
+        self.assertIsNot(third, first)
+        self.assertEqual(self.context.clients_opened, 2)
+
+    def test_client_honours_proxy_environment_unless_disabled(self):
+        from core_engine.grid_context import GridContext
+
+        async def _trust_env(context):
+            client = context.http_client()
+            await context.aclose()
+            return client.trust_env
+
+        self.assertTrue(asyncio.run(_trust_env(self.context)))
+        self.assertFalse(asyncio.run(_trust_env(GridContext(trust_env=False))))
+
+    def test_loop_change_retires_old_client_for_aclose(self):
+        async def _acquire():
+            return self.context.http_client()
+
+        old = asyncio.run(_acquire())
+        new = asyncio.run(_acquire())
+        self.assertIsNot(old, new)
+        self.assertFalse(old.is_closed)
+        self.assertEqual(self.context.metrics()["clients_retired"], 1)
+
+        asyncio.run(self.context.aclose())
+        self.assertTrue(old.is_closed)
+        self.assertTrue(new.is_closed)
+        self.assertEqual(self.context.metrics()["clients_retired"], 0)
+
+    def test_loop_change_closes_old_client_on_its_running_loop(self):
+        old_loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=old_loop.run_forever, daemon=True)
+        thread.start()
+        try:
+            async def _acquire():
+                return self.context.http_client()
+
+            old = asyncio.run_coroutine_threadsafe(_acquire(), old_loop).result(timeout=2)
+            new = asyncio.run(_acquire())
+            # The close was scheduled on the old loop; let it run
+            asyncio.run_coroutine_threadsafe(asyncio.sleep(0), old_loop).result(timeout=2)
+            self.assertTrue(old.is_closed)
+            self.assertFalse(new.is_closed)
+            self.assertEqual(self.context.metrics()["clients_retired"], 0)
+        finally:
+            old_loop.call_soon_threadsafe(old_loop.stop)
+            thread.join(timeout=2)
+            old_loop.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,83 @@
+import unittest
+import sys
+import os
+from contextlib import contextmanager
+from unittest import mock
+
+# Add the orchestrator package root so core_engine is importable
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'core', 'grid-orchestrator')))
+
+from core_engine import grid_stats as grid_stats_module
+from core_engine.grid_stats import GridStatsService
+
+
+class _Result(list):
+    def single(self):
+        return self[0] if self else None
+
+
+class _FakeSession:
+    """Answers the count-store fallback queries; APOC is not installed."""
+
+    def __init__(self):
+        self.queries = []
+
+    def run(self, cypher, params=None):
+        self.queries.append(cypher)
+        if "apoc.meta.stats" in cypher:
+            raise RuntimeError("There is no procedure with the name `apoc.meta.stats`")
+        if "RETURN nodeCount, relCount" in cypher:
+            return _Result([{"nodeCount": 7, "relCount": 3}])
+        if "db.labels()" in cypher:
+            return _Result([{"label": "Agent"}, {"label": "Odu"}])
+        if "db.relationshipTypes()" in cypher:
+            return _Result([{"relationshipType": "GUIDES"}])
+        if "UNION ALL" in cypher or "count(" in cypher:
+            counts = {"Agent": 5, "Odu": 2, "GUIDES": 3}
+            return _Result(
+                [{"name": v, "c": counts[v]} for v in (params or {}).values()]
+            )
+        raise AssertionError(f"unexpected query: {cypher}")
+
+
+class TestGridStatsService(unittest.TestCase):
+    """Unit tests for the cached count-store GridStats snapshot."""
+
+    def setUp(self):
+        self.session = _FakeSession()
+
+        @contextmanager
+        def _session(*args, **kwargs):
+            yield self.session
+
+        patcher = mock.patch.object(grid_stats_module.neo4j_registry, "session", _session)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_falls_back_to_count_store(self):
+        stats = GridStatsService(ttl=60).get()
+
+        self.assertEqual(stats.source, "count_store")
+        self.assertEqual(stats.total_nodes, 7)
+        self.assertEqual(stats.labels, {"Agent": 5, "Odu": 2})
+        self.assertEqual(stats.relationship_types, {"GUIDES": 3})
+        self.assertEqual(stats.top_labels(1), [("Agent", 5)])
+        # No query walks the graph by label membership
+        self.assertFalse(any("IN labels(n)" in q for q in self.session.queries))
+
+    def test_snapshot_is_cached_within_ttl(self):
+        service = GridStatsService(ttl=60)
+        first = service.get()
+        queries = len(self.session.queries)
+
+        self.assertIs(service.get(), first)
+        self.assertEqual(len(self.session.queries), queries)
+        # APOC is not retried once known to be missing
+        service.get(force=True)
+        self.assertEqual(
+            sum("apoc.meta.stats" in q for q in self.session.queries), 1
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
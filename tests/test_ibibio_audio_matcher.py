@@ -0,0 +1,68 @@
+import unittest
+import tempfile
+import sys
+import os
+from pathlib import Path
+
+# ibibio_parser is a standalone script under scripts/
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'scripts')))
+
+from ibibio_parser import IbibioDictionaryParser, audio_tokens
+
+
+class TestAudioMatcher(unittest.TestCase):
+    """Inverted-index matching of archive filenames to dictionary glosses."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.audio_dir = Path(self.tmp.name)
+        for name in (
+            'ibibio_5_13_MU_9_mens_robes_b.mp3',
+            'ibibio_5_13_MU_10_dust.mp3',
+            'ibibio_5_13_MU_11_plead_with.mp3',
+            'ibibio_5_13_II_12_plead_beg.mp3',
+            'ibibio_5_13_MU_13_water.mp3',
+            'ibibio_5_13_MU_14_water_yam.mp3',
+            'notes.mp3',
+        ):
+            (self.audio_dir / name).write_bytes(b'')
+        self.parser = IbibioDictionaryParser(self.audio_dir, self.audio_dir)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _entry(self, word, english):
+        entry = {'ibibio': word, 'english': english, 'audio_file': None}
+        self.parser.entries.append(entry)
+        return entry
+
+    def test_tokens_drop_suffixes_ids_and_stopwords(self):
+        self.assertEqual(audio_tokens("Men's robes_b 9"), ['mens', 'robes'])
+        self.assertEqual(audio_tokens('a kind of yam'), ['yam'])
+
+    def test_best_pairs_win_and_ambiguity_is_reported(self):
+        abara = self._entry('abara', 'mens robes')
+        abu = self._entry('abu', 'dust')
+        abire = self._entry('abịre', 'a kind of yam formerly only planted by women, water yam')
+        mmong = self._entry('mmọọn̄', 'water')
+        kpe = self._entry('kpe', 'plead, plead with, entreat, beg')
+        kpee = self._entry('kpee', 'plead, plead with, entreat, beg')
+        eka = self._entry('eka', 'mother')
+
+        report = self.parser.map_audio_files()
+        self.assertEqual(abara['audio_file'], 'ibibio_5_13_MU_9_mens_robes_b.mp3')
+        self.assertEqual(abu['audio_file'], 'ibibio_5_13_MU_10_dust.mp3')
+        self.assertEqual(mmong['audio_file'], 'ibibio_5_13_MU_13_water.mp3')
+        self.assertEqual(abire['audio_file'], 'ibibio_5_13_MU_14_water_yam.mp3')
+        self.assertEqual(
+            {kpe['audio_file'], kpee['audio_file']},
+            {'ibibio_5_13_MU_11_plead_with.mp3', 'ibibio_5_13_II_12_plead_beg.mp3'},
+        )
+        self.assertIsNone(eka['audio_file'])
+        self.assertEqual(abu['audio_confidence'], 1.0)
+        self.assertEqual((report['matched'], report['files'], report['unmatched']), (6, 7, ['eka']))
+        self.assertIn('kpe', [a['ibibio'] for a in report['ambiguous']])
+
+
+if __name__ == '__main__':
+    unittest.main()
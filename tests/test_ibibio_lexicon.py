@@ -0,0 +1,190 @@
+import unittest
+import sys
+import os
+
+# Add the orchestrator package root so core_engine is importable
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'core', 'grid-orchestrator')))
+
+from core_engine.ibibio_lexicon import (
+    LEXICON_KEY_VERSION, backfill_lexicon_keys, fold_key, fulltext_query,
+)
+from core_engine.ibibio_lexicon_cache import (
+    LEXICON_LOAD_QUERY, LexiconCache, LexiconIndex,
+)
+
+
+class _Result(list):
+    def data(self):
+        return list(self)
+
+    def consume(self):
+        return None
+
+
+class _FakeSession:
+    """Serves backfill reads from an in-memory word list."""
+
+    def __init__(self, words):
+        self.words = words
+        self.schema = []
+        self.revision = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def run(self, cypher, params=None):
+        if cypher.startswith("CREATE"):
+            self.schema.append(cypher)
+            return _Result()
+        if "RETURN elementId(w)" in cypher:
+            stale = [w for w in self.words if w.get("lexicon_key_version", 0) < params["version"]]
+            return _Result(stale[:params["limit"]])
+        if "IbibioLexicon" in cypher:
+            self.revision += 1
+            return _Result()
+        for row in params["rows"]:
+            word = next(w for w in self.words if w["id"] == row["id"])
+            word.update(row, lexicon_key_version=params["version"])
+        return _Result()
+
+    def execute_write(self, work):
+        return work(self)
+
+
+class _FakeDriver:
+    def __init__(self, words):
+        self.session_obj = _FakeSession(words)
+
+    def session(self):
+        return self.session_obj
+
+
+class TestIbibioLexicon(unittest.TestCase):
+    """Normalised lexicon keys and the full-text query builder."""
+
+    def test_fold_key_is_case_and_diacritic_insensitive(self):
+        self.assertEqual(fold_key("Ọ̀kọ́"), "oko")
+        self.assertEqual(fold_key("ñkpọ"), fold_key("NKPO"))
+        self.assertEqual(fold_key("ɔ́dɔ̀"), "odo")
+        self.assertEqual(fold_key("  Central beam, of a house! "), "central beam of a house")
+        self.assertIsNone(fold_key("  ?! "))
+        self.assertIsNone(fold_key(None))
+
+    def test_fulltext_query_escapes_and_fuzzes_long_terms(self):
+        query = fulltext_query("Dust (fine)", "english_key")
+        self.assertEqual(
+            query,
+            'english_key:"dust fine"^5 OR english_key:((dust^3 OR dust* OR dust~1) '
+            'AND (fine^3 OR fine* OR fine~1))',
+        )
+        self.assertNotIn("~", fulltext_query("abu", "orthography_key"))
+        self.assertNotIn("~", fulltext_query("house", "english_key", fuzzy=False))
+        self.assertIsNone(fulltext_query("...", "english_key"))
+
+    def test_backfill_keys_stale_words_once(self):
+        words = [
+            {"id": "1", "orthography": "Àbọ́m", "english": "Central beam"},
+            {"id": "2", "orthography": "abu", "english": None},
+            {"id": "3", "orthography": "idem", "english": "body",
+             "lexicon_key_version": LEXICON_KEY_VERSION},
+        ]
+        driver = _FakeDriver(words)
+        result = backfill_lexicon_keys(driver, batch_size=1)
+        self.assertEqual((result["updated"], result["batches"]), (2, 2))
+        self.assertEqual(words[0]["orthography_key"], "abom")
+        self.assertEqual(words[0]["english_key"], "central beam")
+        self.assertIsNone(words[1]["english_key"])
+        self.assertNotIn("orthography_key", words[2])
+        self.assertEqual(len(driver.session_obj.schema), 4)
+        self.assertEqual(driver.session_obj.revision, 1)
+        self.assertEqual(backfill_lexicon_keys(driver)["updated"], 0)
+        self.assertEqual(driver.session_obj.revision, 1)
+
+
+_WORDS = [
+    {"orthography": "Ọ̀kọ́", "english": "money", "audio_file": None},
+    {"orthography": "ọkọ", "english": "money", "audio_file": "oko.wav"},
+    {"orthography": "ufọk", "english": "house", "audio_file": "ufok.wav"},
+    {"orthography": "ufọk abasi", "english": "house of god", "audio_file": None},
+    {"orthography": "mmọng", "english": "water", "audio_file": None},
+    {"orthography": "abasi", "english": "god", "audio_file": "abasi.wav"},
+]
+
+
+class _LexiconSession:
+    def __init__(self, source):
+        self.source = source
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def run(self, cypher, params=None):
+        if cypher == LEXICON_LOAD_QUERY:
+            self.source.loads += 1
+            return _Result(dict(w) for w in self.source.words)
+        return _Result([{"revision": self.source.revision, "words": len(self.source.words),
+                         "assets": 0, "audio_links": 0}])
+
+
+class _LexiconDriver:
+    def __init__(self, words):
+        self.words = words
+        self.revision = None
+        self.loads = 0
+
+    def session(self):
+        return _LexiconSession(self)
+
+
+class TestLexiconCache(unittest.TestCase):
+    """In-memory trie / inverted index matching the Neo4j lookups."""
+
+    def setUp(self):
+        self.index = LexiconIndex(_WORDS)
+
+    def test_word_lookup_prefers_spelling_then_audio(self):
+        self.assertEqual(self.index.lookup_word("Ọ̀kọ́")["orthography"], "Ọ̀kọ́")
+        self.assertEqual(self.index.lookup_word("oko")["audio_file"], "oko.wav")
+        self.assertEqual(self.index.lookup_word("OKO")["match_type"], "exact")
+        self.assertIsNone(self.index.lookup_word("ufk"))
+        fuzzy = self.index.lookup_word("mmong", fuzzy=True)
+        self.assertEqual(fuzzy["match_type"], "exact")
+        fuzzy = self.index.lookup_word("mmonh", fuzzy=True)
+        self.assertEqual((fuzzy["orthography"], fuzzy["match_type"]), ("mmọng", "fuzzy"))
+        self.assertEqual(self.index.lookup_word("ufo", fuzzy=True)["orthography"], "ufọk")
+        self.assertEqual(
+            [w["orthography"] for w in self.index.prefix_words("UF")], ["ufọk", "ufọk abasi"]
+        )
+
+    def test_gloss_search_ranks_exact_gloss_first(self):
+        matches = self.index.search_gloss("House")
+        self.assertEqual([m["english"] for m in matches], ["house", "house of god"])
+        self.assertEqual(self.index.search_gloss("hous")[0]["english"], "house")
+        self.assertEqual(self.index.search_gloss("watr")[0]["orthography"], "mmọng")
+        self.assertEqual(self.index.search_gloss("watr", fuzzy=False), [])
+        self.assertEqual([m["orthography"] for m in self.index.search_gloss("god house")],
+                         ["ufọk abasi"])
+        self.assertEqual(self.index.search_gloss("money")[0]["audio_file"], "oko.wav")
+
+    def test_cache_reloads_only_when_stamp_changes(self):
+        driver = _LexiconDriver(list(_WORDS))
+        cache = LexiconCache(driver, check_interval=0)
+        first = cache.index()
+        self.assertIs(cache.index(), first)
+        self.assertEqual(driver.loads, 1)
+        driver.revision = 1
+        self.assertIsNot(cache.index(), first)
+        driver.words.append({"orthography": "idem", "english": "body"})
+        self.assertEqual(cache.index().lookup_word("idem")["english"], "body")
+        self.assertEqual(driver.loads, 3)
+        self.assertEqual(cache.metrics()["words"], 7)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,174 @@
+import unittest
+import tempfile
+import threading
+import sys
+import os
+from pathlib import Path
+
+MINDGRAPH_IMPORT_DIR = os.path.abspath(os.path.join(
+    os.path.dirname(__file__), '..', 'memory', 'neo4j-mindgraph', 'import'))
+
+# import_engine lives beside the import scripts
+sys.path.insert(0, MINDGRAPH_IMPORT_DIR)
+
+from import_engine import (
+    Checkpoint, CsvRows, CypherStep, Importer, Phase, RelationshipSpec,
+    SourceSpec, StaticRows, as_int,
+)
+
+
+class _Result:
+    def consume(self):
+        return None
+
+
+class _RecordingDriver:
+    """Driver stand-in: records each committed transaction's statements."""
+
+    def __init__(self, fail_on_batch=None):
+        self.fail_on_batch = fail_on_batch
+        self.transactions = []
+        self.lock = threading.Lock()
+
+    def session(self, **kwargs):
+        return _Session(self)
+
+
+class _Session:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute_write(self, work):
+        statements = []
+
+        class _Tx:
+            def run(self, query, params):
+                statements.append((query, params))
+                return _Result()
+
+        work(_Tx())
+        with self.driver.lock:
+            rows = statements[0][1].get("rows") or []
+            failing = self.driver.fail_on_batch
+            if failing is not None and rows and rows[0]["key"].get("n") == failing:
+                raise RuntimeError("connection lost")
+            self.driver.transactions.append(statements)
+
+
+class TestImportEngine(unittest.TestCase):
+    """Unit tests for the declarative, resumable import engine."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.dir = Path(self.tmp.name)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _phases(self):
+        rows = [{"n": str(i), "parent": str(i - 1) if i else ""} for i in range(10)]
+        rows.append({"n": "", "parent": "0"})
+        return [Phase("p", [
+            CypherStep("index", "CREATE INDEX n_idx IF NOT EXISTS FOR (x:Num) ON (x.n)"),
+            SourceSpec(
+                "numbers", "Num", ["n"], StaticRows(rows),
+                coerce={"n": as_int},
+                relationships=[RelationshipSpec("AFTER", "Num", "n", column="parent")],
+            ),
+        ])]
+
+    def test_resumes_from_last_contiguous_batch(self):
+        checkpoint = self.dir / "ckpt.json"
+        failing = _RecordingDriver(fail_on_batch=6)
+        importer = Importer(failing, batch_size=2, writers=1, checkpoint=checkpoint)
+        with self.assertRaises(RuntimeError):
+            importer.run(self._phases())
+
+        state = Checkpoint(checkpoint).state
+        self.assertTrue(state["p/index"]["done"])
+        self.assertEqual(state["p/numbers/nodes"]["batches"], 3)
+        self.assertEqual(state["p/numbers/nodes"]["rows"], 6)
+
+        driver = _RecordingDriver()
+        report = Importer(driver, batch_size=2, writers=3, checkpoint=checkpoint).run(self._phases())
+        node_batches = [t for t in driver.transactions if "MERGE (n:Num" in t[0][0]]
+        self.assertEqual([t[0][1]["rows"][0]["key"]["n"] for t in node_batches], [6, 8])
+
+        by_step = {r["step"]: r for r in report}
+        self.assertEqual(by_step["index"]["status"], "resumed")
+        self.assertEqual(by_step["numbers:nodes"]["rows"], 4)
+        self.assertEqual(by_step["numbers:nodes"]["resumed_batches"], 3)
+        self.assertEqual(by_step["numbers:nodes"]["skipped"], 1)
+        self.assertEqual(by_step["numbers:relationships"]["rows"], 10)
+
+        rel_batches = [t for t in driver.transactions if "AFTER" in t[0][0]]
+        self.assertEqual(len(rel_batches), 5)
+        self.assertIn("MERGE (n)-[:AFTER]->(m)", rel_batches[0][0][0])
+        self.assertEqual(rel_batches[0][0][1]["rows"][0]["rels"], [None])
+
+        # The resumed run finished, so there is nothing left to resume
+        self.assertFalse(checkpoint.exists())
+
+    def test_csv_source_change_restarts_step(self):
+        path = self.dir / "words.csv"
+        path.write_text("word:ID,english\nabasi,god\n,blank\n", encoding="utf-8")
+        spec = SourceSpec("words", "IbibioWord", ["word"], CsvRows(path),
+                          properties={"word": "word:ID", "english": "english"})
+        checkpoint = self.dir / "ckpt.json"
+        driver = _RecordingDriver()
+        Importer(driver, checkpoint=checkpoint).run([Phase("p", [spec])])
+        self.assertEqual(driver.transactions[0][0][1]["rows"],
+                         [{"key": {"word": "abasi"}, "props": {"word": "abasi", "english": "god"}, "rels": []}])
+
+        path.write_text("word:ID,english\nabasi,god\nmmong,water\n", encoding="utf-8")
+        os.utime(path, (0, 0))
+        driver = _RecordingDriver()
+        Importer(driver, checkpoint=checkpoint).run([Phase("p", [spec])])
+        self.assertEqual(len(driver.transactions[0][0][1]["rows"]), 2)
+
+    def test_finished_run_does_not_suppress_the_next(self):
+        checkpoint = self.dir / "ckpt.json"
+        first = _RecordingDriver()
+        Importer(first, batch_size=4, checkpoint=checkpoint).run(self._phases())
+        self.assertFalse(checkpoint.exists())
+
+        second = _RecordingDriver()
+        report = Importer(second, batch_size=4, checkpoint=checkpoint).run(self._phases())
+        self.assertEqual(len(second.transactions), len(first.transactions))
+        self.assertNotIn("resumed", {row["status"] for row in report})
+
+    def test_cypher_step_reruns_when_its_phase_sources_change(self):
+        path = self.dir / "words.csv"
+        path.write_text("word:ID\nabasi\n", encoding="utf-8")
+        phases = [Phase("p", [
+            SourceSpec("words", "IbibioWord", ["word"], CsvRows(path), properties={"word": "word:ID"}),
+            CypherStep("link", "MATCH (w:IbibioWord) MERGE (w)-[:IN]->(:Lexicon)"),
+            SourceSpec("never", "Num", ["n"], StaticRows([{"n": "1"}])),
+        ])]
+        checkpoint = self.dir / "ckpt.json"
+
+        def _ran_link(fail_on_batch=None):
+            driver = _RecordingDriver(fail_on_batch=fail_on_batch)
+            try:
+                Importer(driver, checkpoint=checkpoint).run(phases)
+            except RuntimeError:
+                pass
+            return any("Lexicon" in t[0][0] for t in driver.transactions)
+
+        self.assertTrue(_ran_link(fail_on_batch="1"))
+        # Same sources: the interrupted run resumes past the link pass
+        self.assertFalse(_ran_link(fail_on_batch="1"))
+        # A changed CSV in its phase re-runs it
+        path.write_text("word:ID\nmmong\n", encoding="utf-8")
+        os.utime(path, (0, 0))
+        self.assertTrue(_ran_link())
+
+
+if __name__ == '__main__':
+    unittest.main()
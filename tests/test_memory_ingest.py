@@ -0,0 +1,132 @@
+import unittest
+import hashlib
+import importlib.util
+import json
+import sys
+import os
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+# memory_layer lives under the Neo4j mindgraph tree
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'memory', 'neo4j-mindgraph')))
+
+INGEST_DEPS = all(
+    importlib.util.find_spec(name)
+    for name in ("faiss", "numpy", "langchain_community", "langchain_huggingface")
+)
+
+try:
+    from langchain_core.embeddings import Embeddings
+except ImportError:
+    Embeddings = object
+
+
+class _HashEmbeddings(Embeddings):
+    """Deterministic stand-in for the sentence-transformer model."""
+
+    calls = []
+
+    def __init__(self, **kwargs):
+        pass
+
+    def embed_documents(self, texts):
+        _HashEmbeddings.calls.append(len(texts))
+        return [self.embed_query(t) for t in texts]
+
+    def embed_query(self, text):
+        digest = hashlib.sha256(text.encode()).digest()
+        return [b / 255 for b in digest[:8]]
+
+
+def _moment(moment_id, description):
+    return {"id": moment_id, "type": "MoStarMoment", "data": {"description": description, "era": "Genesis"}}
+
+
+@unittest.skipUnless(INGEST_DEPS, "memory ingest needs faiss and langchain")
+class TestIncrementalIngest(unittest.TestCase):
+    """Re-ingests embed only new or changed moments; deletes keep vector ids stable."""
+
+    def setUp(self):
+        from memory_layer import ingest
+
+        self.ingest = ingest
+        self.tmp = tempfile.TemporaryDirectory()
+        root = Path(self.tmp.name)
+        self.source = root / "activation_subgraph.json"
+        self.patches = [
+            mock.patch.object(ingest, "STORE_PATH", root / "memory_store"),
+            mock.patch.object(ingest, "HuggingFaceEmbeddings", _HashEmbeddings),
+        ]
+        for patch in self.patches:
+            patch.start()
+        _HashEmbeddings.calls = []
+
+    def tearDown(self):
+        for patch in self.patches:
+            patch.stop()
+        self.tmp.cleanup()
+
+    def _run(self, moments, **kwargs):
+        self.source.write_text(json.dumps({"nodes": moments}), encoding="utf-8")
+        _HashEmbeddings.calls = []
+        self.ingest.ingest_memory(source=str(self.source), batch_size=2, keep_backups=1, **kwargs)
+        manifest = json.loads((self.ingest.STORE_PATH / self.ingest.MANIFEST_NAME).read_text())
+        return sum(_HashEmbeddings.calls), manifest
+
+    def test_reingest_is_proportional_to_changes(self):
+        moments = [_moment(i, f"moment {i}") for i in range(5)]
+        embedded, manifest = self._run(moments)
+        self.assertEqual((embedded, len(manifest["moments"])), (5, 5))
+
+        embedded, _ = self._run(moments)
+        self.assertEqual(embedded, 0)
+
+        moments[1] = _moment(1, "moment 1, retold")
+        moments.append(_moment(5, "moment 5"))
+        embedded, manifest = self._run(moments)
+        self.assertEqual(embedded, 2)
+        self.assertEqual(manifest["moments"]["0"]["vector_id"], 0)
+        self.assertEqual(manifest["moments"]["1"]["vector_id"], 5)
+
+        embedded, manifest = self._run(moments[2:], prune=True)
+        self.assertEqual((embedded, sorted(manifest["moments"])), (0, ["2", "3", "4", "5"]))
+        backups = list(self.ingest.STORE_PATH.parent.glob(f"{self.ingest.BACKUP_PREFIX}*"))
+        self.assertLessEqual(len(backups), 1)
+
+    def test_ann_index_types_train_and_delete(self):
+        moments = [_moment(i, f"moment {i}") for i in range(60)]
+        for index_type in ("ivf_flat", "hnsw"):
+            _, manifest = self._run(moments, index_type=index_type)
+            self.assertEqual(manifest["index"]["type"], index_type)
+            # HNSW cannot delete in place; the graph is rebuilt from stored vectors
+            embedded, manifest = self._run(moments[10:], prune=True, index_type=index_type)
+            self.assertEqual((embedded, len(manifest["moments"])), (0, 50))
+
+        _, manifest = self._run(moments[10:], index_type="ivf_flat")
+        self.assertEqual(manifest["index"]["trained_on"], 50)
+
+        from memory_layer.retriever import MoStarMemory
+
+        with mock.patch("memory_layer.retriever.STORE_PATH", str(self.ingest.STORE_PATH)), \
+                mock.patch("memory_layer.retriever.HuggingFaceEmbeddings", _HashEmbeddings):
+            memory = MoStarMemory(nprobe=4)
+        self.assertEqual(memory.search_params, {"nprobe": 4})
+        query = self.ingest.create_documents([moments[20]])[0].page_content
+        self.assertEqual(memory.search(query, k=3)[0].metadata["id"], 20)
+
+    def test_plain_run_keeps_the_store_index_type(self):
+        moments = [_moment(i, f"moment {i}") for i in range(20)]
+        self._run(moments, index_type="hnsw")
+
+        moments.append(_moment(20, "moment 20"))
+        embedded, manifest = self._run(moments)
+        self.assertEqual(embedded, 1)
+        self.assertEqual(manifest["index"]["type"], "hnsw")
+
+        embedded, manifest = self._run(moments, index_type="flat")
+        self.assertEqual((embedded, manifest["index"]["type"]), (21, "flat"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+import unittest
+import sys
+import os
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+
+# Add the orchestrator package root so core_engine is importable
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'core', 'grid-orchestrator')))
+
+from core_engine.moment_aggregates import HyperLogLog, MomentAggregates
+
+
+class _Result(list):
+    def single(self):
+        return self[0] if self else None
+
+
+class _FakeSession:
+    def __init__(self, now):
+        self.now = now
+
+    def run(self, cypher, params=None):
+        if "resonance_sum" in cypher:
+            return _Result([{"total": 10, "resonance_sum": 9.0, "last_cycle": self.now}])
+        if "DISTINCT m.initiator" in cypher:
+            return _Result([{"initiator": "Woo"}, {"initiator": "TsaTse"}])
+        minute = int(self.now.timestamp() // 60)
+        return _Result([{"minute": minute, "c": 4}])
+
+
+class TestHyperLogLog(unittest.TestCase):
+
+    def test_estimate_within_error(self):
+        hll = HyperLogLog()
+        for i in range(20000):
+            hll.add(f"agent-{i}")
+            hll.add(f"agent-{i}")  # duplicates do not count
+        self.assertLess(abs(hll.count() - 20000) / 20000, 0.05)
+
+    def test_small_counts_are_exact_enough(self):
+        hll = HyperLogLog()
+        for name in ["Woo", "TsaTse", "Mo", "Woo"]:
+            hll.add(name)
+        self.assertEqual(hll.count(), 3)
+
+
+class TestMomentAggregates(unittest.TestCase):
+    """Unit tests for the incremental MoStarMoment telemetry aggregates."""
+
+    def setUp(self):
+        self.now = datetime.now(timezone.utc)
+
+        @contextmanager
+        def _session():
+            yield _FakeSession(self.now)
+
+        self.agg = MomentAggregates(session_factory=_session)
+
+    def _row(self, initiator="Woo", resonance=0.9, ts=None):
+        return {
+            "initiator": initiator,
+            "resonance_score": resonance,
+            "timestamp": (ts or self.now).isoformat(),
+        }
+
+    def test_new_and_merged_moments(self):
+        self.agg.observe(self._row(resonance=0.5))
+        self.agg.observe(self._row(initiator="Mo", resonance=1.0))
+        # Re-seen moment: replaces its previous resonance, same node
+        self.agg.observe(self._row(resonance=0.7), prev_ts=self.now, prev_res=0.5)
+
+        snap = self.agg.snapshot()
+        self.assertEqual(snap["totalMoments"], 2)
+        self.assertAlmostEqual(snap["avgResonance"], 0.85)
+        self.assertEqual(snap["distinctInitiators"], 2)
+        self.assertEqual(snap["moments24h"], 2)
+
+    def test_window_excludes_old_minutes(self):
+        old = self.now - timedelta(days=2)
+        self.agg.observe(self._row(ts=old))
+        self.agg.observe(self._row(initiator="Mo"))
+        # The old moment is re-seen now: it moves into the window
+        self.agg.observe(self._row(), prev_ts=old, prev_res=0.9)
+
+        snap = self.agg.snapshot()
+        self.assertEqual(snap["totalMoments"], 2)
+        self.assertEqual(snap["moments24h"], 2)
+
+    def test_reconcile_replaces_running_state(self):
+        self.agg.observe(self._row())
+        self.assertFalse(self.agg.ready)
+
+        self.agg.reconcile()
+
+        snap = self.agg.snapshot()
+        self.assertTrue(self.agg.ready)
+        self.assertEqual(snap["totalMoments"], 10)
+        self.assertAlmostEqual(snap["avgResonance"], 0.9)
+        self.assertEqual(snap["distinctInitiators"], 2)
+        self.assertEqual(snap["moments24h"], 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
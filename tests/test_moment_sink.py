@@ -0,0 +1,75 @@
+import unittest
+import tempfile
+import time
+import sys
+import os
+from pathlib import Path
+
+# Add the orchestrator package root so core_engine is importable
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'core', 'grid-orchestrator')))
+
+from core_engine.moment_sink import MomentSink
+
+
+class TestMomentSink(unittest.TestCase):
+    """Unit tests for the background MoStarMoment writer."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.spill_path = Path(self.tmp.name) / "spill.jsonl"
+        self.written = []
+        self.neo4j_up = True
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _writer(self, rows):
+        if not self.neo4j_up:
+            raise ConnectionError("Neo4j unreachable")
+        self.written.append(list(rows))
+
+    def _sink(self, **kwargs):
+        options = {"batch_size": 3, "flush_interval": 0.02, "replay_interval": 0.0}
+        options.update(kwargs)
+        return MomentSink(self._writer, self.spill_path, **options)
+
+    def test_flushes_in_batches(self):
+        sink = self._sink()
+        sink.start()
+        for i in range(7):
+            self.assertTrue(sink.enqueue({"i": i}))
+        sink.stop()
+
+        self.assertEqual([r["i"] for batch in self.written for r in batch], list(range(7)))
+        self.assertTrue(all(len(batch) <= 3 for batch in self.written))
+        self.assertEqual(sink.metrics()["written"], 7)
+
+    def test_full_queue_drops_and_counts(self):
+        sink = self._sink(queue_size=2, enqueue_timeout=0)
+        results = [sink.enqueue({"i": i}) for i in range(3)]
+
+        self.assertEqual(results, [True, True, False])
+        self.assertEqual(sink.metrics()["dropped"], 1)
+
+    def test_failed_flush_spills_and_replays(self):
+        self.neo4j_up = False
+        sink = self._sink()
+        sink.start()
+        sink.enqueue({"i": 1})
+        sink.enqueue({"i": 2})
+        deadline = time.time() + 2
+        while sink.metrics()["spilled"] < 2 and time.time() < deadline:
+            time.sleep(0.01)
+        sink.stop()
+
+        self.assertTrue(self.spill_path.exists())
+        self.assertEqual(self.written, [])
+
+        self.neo4j_up = True
+        self.assertEqual(sink.replay_spill(), 2)
+        self.assertFalse(self.spill_path.exists())
+        self.assertEqual([r["i"] for r in self.written[0]], [1, 2])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,104 @@
+import unittest
+import sys
+import os
+from contextlib import contextmanager
+from unittest import mock
+
+# Add the orchestrator package root so core_engine is importable
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'core', 'grid-orchestrator')))
+
+from core_engine import mostar_moments_log
+
+
+class _Result:
+    def __init__(self, records):
+        self.records = records
+
+    def data(self):
+        return self.records
+
+
+class _FakeTx:
+    def __init__(self, graph):
+        self.graph = graph
+
+    def run(self, cypher, params):
+        rows = params["rows"]
+        self.graph.chunks.append([row["idx"] for row in rows])
+        if len(self.graph.chunks) in self.graph.fail_chunks:
+            raise RuntimeError("transaction refused")
+        # The server does not promise UNWIND order; results must follow idx
+        return _Result([
+            {"idx": row["idx"], "quantum_id": row["quantum_id"], "seen_count": row["idx"] + 1,
+             "prev_ts": None, "prev_res": None}
+            for row in reversed(rows)
+        ])
+
+
+class _FakeGraph:
+    def __init__(self, fail_chunks=()):
+        self.chunks = []
+        self.fail_chunks = set(fail_chunks)
+
+    @contextmanager
+    def session(self):
+        yield self
+
+    def execute_write(self, work, *args):
+        return work(_FakeTx(self), *args)
+
+
+class TestLogMomentsBatch(unittest.TestCase):
+    """One UNWIND write per chunk; a failed chunk only fails its own rows."""
+
+    def _log(self, count, chunk_size, fail_chunks=()):
+        self.graph = _FakeGraph(fail_chunks)
+        self.observed = []
+        patches = [
+            mock.patch.object(mostar_moments_log, "_get_driver", lambda: object()),
+            mock.patch.object(mostar_moments_log, "_session", self.graph.session),
+            mock.patch.object(mostar_moments_log, "_ensure_constraints", lambda driver: None),
+            mock.patch.object(
+                mostar_moments_log.moment_aggregates, "observe_many",
+                lambda items: self.observed.extend(row["idx"] for row, _, _ in items),
+            ),
+            mock.patch.dict(mostar_moments_log._RECENT_MOMENT_CACHE, clear=True),
+            mock.patch("builtins.print"),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+        moments = [
+            {"initiator": "Woo", "description": f"moment {i}", "trigger_type": "batch"}
+            for i in range(count)
+        ]
+        return mostar_moments_log.log_moments_batch(moments, chunk_size=chunk_size)
+
+    def test_chunks_and_input_order(self):
+        results = self._log(7, chunk_size=3)
+        self.assertEqual(self.graph.chunks, [[0, 1, 2], [3, 4, 5], [6]])
+        self.assertEqual([r["chunk"] for r in results], [0, 0, 0, 1, 1, 1, 2])
+        self.assertEqual([r["seen_count"] for r in results], list(range(1, 8)))
+        self.assertTrue(all(r["logged"] for r in results))
+        self.assertEqual(sorted(self.observed), list(range(7)))
+        self.assertEqual(len(mostar_moments_log._RECENT_MOMENT_CACHE), 7)
+
+    def test_failed_chunk_is_isolated(self):
+        results = self._log(7, chunk_size=3, fail_chunks={2})
+        self.assertEqual(len(self.graph.chunks), 3)
+        self.assertEqual([r["logged"] for r in results], [True] * 3 + [False] * 3 + [True])
+        self.assertEqual({r.get("error") for r in results[3:6]}, {"transaction refused"})
+        self.assertNotIn("error", results[6])
+        self.assertEqual(sorted(self.observed), [0, 1, 2, 6])
+        # Failed rows keep their locally computed quantum_id
+        self.assertTrue(all(r["quantum_id"].startswith("MSTR-") for r in results))
+        self.assertEqual(len(mostar_moments_log._RECENT_MOMENT_CACHE), 4)
+
+    def test_chunk_size_is_clamped(self):
+        results = self._log(2, chunk_size=0)
+        self.assertEqual(self.graph.chunks, [[0], [1]])
+        self.assertEqual([r["chunk"] for r in results], [0, 1])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import unittest
+import asyncio
+import sys
+import os
+import threading
+import types
+from unittest import mock
+
+# Add the orchestrator package root so core_engine is importable
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'core', 'grid-orchestrator')))
+
+from core_engine.neo4j_pool import Neo4jDriverRegistry
+
+
+class _FakeAsyncDriver:
+    def __init__(self, uri, **kwargs):
+        self.uri = uri
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+
+class TestNeo4jDriverRegistry(unittest.TestCase):
+    """Async drivers are bound to one event loop and never leaked on a change."""
+
+    def setUp(self):
+        fake_neo4j = types.ModuleType("neo4j")
+        fake_neo4j.AsyncGraphDatabase = types.SimpleNamespace(driver=_FakeAsyncDriver)
+        patcher = mock.patch.dict(sys.modules, {"neo4j": fake_neo4j})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.registry = Neo4jDriverRegistry(pool_size=2)
+
+    def test_driver_reused_within_a_loop(self):
+        async def _session():
+            return self.registry.get_async_driver(), self.registry.get_async_driver()
+
+        first, second = asyncio.run(_session())
+        self.assertIs(first, second)
+
+    def test_loop_change_retires_old_drivers_for_aclose(self):
+        async def _acquire():
+            return self.registry.get_async_driver()
+
+        old = asyncio.run(_acquire())
+        new = asyncio.run(_acquire())
+        self.assertIsNot(old, new)
+        self.assertEqual(self.registry.metrics()["drivers"]["async_retired"], 1)
+
+        asyncio.run(self.registry.aclose())
+        self.assertTrue(old.closed)
+        self.assertTrue(new.closed)
+        self.assertEqual(self.registry.metrics()["drivers"]["async_retired"], 0)
+
+    def test_loop_change_closes_old_drivers_on_their_running_loop(self):
+        old_loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=old_loop.run_forever, daemon=True)
+        thread.start()
+        try:
+            async def _acquire():
+                return self.registry.get_async_driver()
+
+            old = asyncio.run_coroutine_threadsafe(_acquire(), old_loop).result(timeout=2)
+            asyncio.run(_acquire())
+            # The close was scheduled on the old loop; let it run
+            asyncio.run_coroutine_threadsafe(asyncio.sleep(0), old_loop).result(timeout=2)
+            self.assertTrue(old.closed)
+            self.assertEqual(self.registry.metrics()["drivers"]["async_retired"], 0)
+        finally:
+            old_loop.call_soon_threadsafe(old_loop.stop)
+            thread.join(timeout=2)
+            old_loop.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,111 @@
+import unittest
+import asyncio
+import importlib.util
+import sys
+import os
+from unittest import mock
+
+# Add the orchestrator package root so core_engine is importable
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'core', 'grid-orchestrator')))
+
+SOV_UTILS_AVAILABLE = all(importlib.util.find_spec(name) for name in ("httpx", "dotenv"))
+
+
+async def _fake_call(prompt, model, system=""):
+    return {"response": "normalised intent", "model": model, "status": "success"}
+
+
+async def _fake_stream(prompt, model, system=""):
+    for text in ("The ", "Grid ", "decrees."):
+        yield text
+
+
+async def _collect(events):
+    return [event async for event in events]
+
+
+@unittest.skipUnless(SOV_UTILS_AVAILABLE, "sov_utils needs httpx and python-dotenv")
+class TestInterpretStream(unittest.TestCase):
+    """route_reasoning streamed through MoScriptEngine.interpret_stream."""
+
+    def setUp(self):
+        from core_engine import moscript_engine
+
+        self.engine = moscript_engine.MoScriptEngine(covenant_id="test")
+        self._with_models()
+
+    def _ritual(self, query):
+        return {"operation": "route_reasoning",
+                "payload": {"query": query, "purpose": "test"}}
+
+    def test_tokens_then_envelope_matching_interpret(self):
+        events = asyncio.run(_collect(self.engine.interpret_stream(self._ritual("why rain?"))))
+        self.assertEqual([e["type"] for e in events], ["stage", "token", "token", "token", "done"])
+        self.assertEqual(events[0]["text"], "normalised intent")
+        done = events[-1]
+        self.assertEqual(done["status"], "aligned")
+        self.assertEqual(done["result"]["logic_deduced"], "The Grid decrees.")
+        self.assertEqual(done["blessing"], self.engine.bless("route_reasoning"))
+
+    def test_covenant_denial_ends_stream_before_tokens(self):
+        events = asyncio.run(_collect(self.engine.interpret_stream(self._ritual("exploit the grid"))))
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0]["status"], "denied")
+        self.assertTrue(events[0]["covenant_violation"])
+
+    def _with_models(self, call=_fake_call, stream=_fake_stream):
+        from core_engine import sov_utils
+
+        patches = [
+            mock.patch.object(sov_utils, "call_sovereign_model", call),
+            mock.patch.object(sov_utils, "stream_sovereign_model", stream),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def test_parsed_intent_checked_before_it_streams(self):
+        async def _tainted_call(prompt, model, system=""):
+            return {"response": "exploit the elders", "model": model, "status": "success"}
+
+        self._with_models(call=_tainted_call)
+        events = asyncio.run(_collect(self.engine.interpret_stream(self._ritual("why rain?"))))
+        self.assertEqual([e["type"] for e in events], ["done"])
+        self.assertEqual(events[0]["status"], "denied")
+
+        # The non-streaming path applies the same check
+        envelope = asyncio.run(self.engine.interpret(self._ritual("why rain?")))
+        self.assertEqual(envelope["status"], "denied")
+        self.assertTrue(envelope["covenant_violation"])
+
+    def test_decree_tokens_checked_as_they_arrive(self):
+        tokens = ("We must ", "ex", "ploit them", " tonight.")
+
+        async def _tainted_stream(prompt, model, system=""):
+            for text in tokens:
+                yield text
+
+        async def _tainted_call(prompt, model, system=""):
+            if "Decision needed" in prompt:
+                return {"response": "".join(tokens), "model": model, "status": "success"}
+            return await _fake_call(prompt, model, system)
+
+        self._with_models(call=_tainted_call, stream=_tainted_stream)
+        events = asyncio.run(_collect(self.engine.interpret_stream(self._ritual("why rain?"))))
+        # The term is split across tokens; the token completing it never streams
+        self.assertEqual([e["type"] for e in events], ["stage", "token", "token", "done"])
+        self.assertEqual([e["text"] for e in events[1:3]], ["We must ", "ex"])
+        self.assertEqual(events[-1]["status"], "denied")
+
+        envelope = asyncio.run(self.engine.interpret(self._ritual("why rain?")))
+        self.assertEqual(envelope["status"], "denied")
+
+    def test_non_streaming_rituals_yield_one_done_event(self):
+        events = asyncio.run(_collect(self.engine.interpret_stream(
+            {"operation": "echo", "payload": {"x": 1}})))
+        self.assertEqual([e["type"] for e in events], ["done"])
+        self.assertEqual(events[0]["result"], {"x": 1})
+
+
+if __name__ == '__main__':
+    unittest.main()
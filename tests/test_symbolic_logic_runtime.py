@@ -0,0 +1,278 @@
+import unittest
+import importlib.util
+import sys
+import os
+from unittest import mock
+
+# The symbolic runtime lives with the Idim Ikang engines
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'engines', 'idim-ikang')))
+
+NEO4J_AVAILABLE = importlib.util.find_spec("neo4j") is not None
+
+
+class _FakeGraph:
+    """Answers the runtime's read queries from in-memory facts and rules."""
+
+    def __init__(self, facts=(), rules=(), functions=()):
+        self.facts = list(facts)
+        self.rules = list(rules)
+        self.functions = list(functions)
+        self.revision = 1
+        self.queries = []
+
+    def count(self, fragment):
+        return sum(fragment in query for query in self.queries)
+
+    def read(self, query, params=None):
+        self.queries.append(query)
+        if "AS functions" in query:
+            return [{"revision": self.revision, "functions": len(self.functions)}]
+        if "n.code AS code" in query:
+            return [{"code": code} for code in self.functions]
+        if "kb_revision AS revision" in query:
+            return [{
+                "revision": self.revision,
+                "facts": len(self.facts),
+                "rules": len(self.rules),
+                "trusts": 0,
+            }]
+        if "SymbolicFact" in query:
+            return [{"raw_text": text} for text in self.facts]
+        if "SymbolicRule" in query:
+            return [{"raw_text": text} for text in self.rules]
+        return []
+
+
+def _chain(length):
+    return [f"trust(n{i}, n{i + 1})." for i in range(length)]
+
+
+@unittest.skipUnless(NEO4J_AVAILABLE, "symbolic_logic_runtime needs the neo4j driver")
+class TestKnowledgeBase(unittest.TestCase):
+    """Clause indexes, and recompiling only when the graph's stamp moves."""
+
+    FACTS = [
+        "trust(a, b).",
+        "trust(Anyone, flame).",
+        "trust(b, c).",
+        "trust(a, c).",
+        "guards(a).",
+    ]
+    RULES = [
+        "trusted(X, Y) :- trust(X, Y).",
+        "trusted(X, Z) :- trust(X, Y), trusted(Y, Z).",
+        "ally(X, Y) :- trusted(X, Y), guards(X).",
+    ]
+
+    def setUp(self):
+        from symbolic_logic_runtime import SymbolicLogicRuntime
+
+        self.graph = _FakeGraph(self.FACTS, self.RULES)
+        self.runtime = SymbolicLogicRuntime()
+        self.addCleanup(self.runtime.close)
+        self.runtime._read = self.graph.read
+
+    def _compiled(self):
+        from symbolic_logic_runtime import KnowledgeBase
+
+        facts = [self.runtime._parse_fact(text) for text in self.FACTS]
+        rules = [self.runtime._parse_rule(text) for text in self.RULES]
+        return KnowledgeBase.compile(facts, rules, stamp=("r1",))
+
+    def _raw(self, clauses):
+        return [clause.raw_text for clause in clauses]
+
+    def test_facts_indexed_by_first_argument(self):
+        kb = self._compiled()
+        self.assertEqual((kb.fact_count, kb.rule_count), (5, 3))
+        # Bound first argument: its facts plus open ones, in source order
+        self.assertEqual(
+            self._raw(kb.candidate_facts("trust", ["a", "Y"])),
+            ["trust(a, b).", "trust(Anyone, flame).", "trust(a, c)."],
+        )
+        self.assertEqual(
+            self._raw(kb.candidate_facts("trust", ["z", "Y"])), ["trust(Anyone, flame)."]
+        )
+        # Unbound first argument: every fact of that predicate and arity
+        self.assertEqual(len(kb.candidate_facts("trust", ["X", "Y"])), 4)
+        self.assertEqual(kb.candidate_facts("trust", ["a"]), [])
+
+    def test_rules_indexed_with_variables(self):
+        kb = self._compiled()
+        rules = kb.candidate_rules("trusted", 2)
+        self.assertEqual(len(rules), 2)
+        self.assertEqual(rules[1].variables, ("X", "Z", "Y"))
+        self.assertEqual(kb.candidate_rules("trusted", 3), [])
+        self.assertEqual(kb.recursive_predicates, {"trusted"})
+
+    def test_recompiles_only_when_stamp_changes(self):
+        import symbolic_logic_runtime
+
+        first = self.runtime.knowledge_base()
+        # Within the check interval the compiled base is served as is
+        self.assertIs(self.runtime.knowledge_base(), first)
+        self.assertEqual(self.graph.count("kb_revision AS revision"), 1)
+
+        with mock.patch.object(symbolic_logic_runtime, "SYMBOLIC_KB_CHECK_INTERVAL", 0):
+            self.assertIs(self.runtime.knowledge_base(), first)
+            self.assertEqual(self.graph.count("kb_revision AS revision"), 2)
+            self.assertEqual(self.graph.count("(n:SymbolicRule)"), 1)
+
+            self.graph.rules.append("guarded(X) :- guards(X).")
+            self.graph.revision += 1
+            second = self.runtime.knowledge_base()
+        self.assertIsNot(second, first)
+        self.assertEqual(second.rule_count, 4)
+        self.assertEqual(self.runtime.prove("guarded(Who)")["count"], 1)
+
+    def test_invalidate_forces_recompile(self):
+        first = self.runtime.knowledge_base()
+        self.graph.facts.append("guards(b).")
+        self.graph.revision += 1
+        # Stamp not rechecked yet: still the old compile
+        self.assertIs(self.runtime.knowledge_base(), first)
+
+        self.runtime.invalidate()
+        second = self.runtime.knowledge_base()
+        self.assertIsNot(second, first)
+        self.assertEqual(len(second.candidate_facts("guards", ["X"])), 2)
+
+
+@unittest.skipUnless(NEO4J_AVAILABLE, "symbolic_logic_runtime needs the neo4j driver")
+class TestTabledResolution(unittest.TestCase):
+    """Recursive predicates terminate with complete answers, or say they did not."""
+
+    CYCLE = ["trust(a, b).", "trust(b, c).", "trust(c, a)."]
+
+    def _runtime(self, facts, rules):
+        from symbolic_logic_runtime import SymbolicLogicRuntime
+
+        runtime = SymbolicLogicRuntime()
+        self.addCleanup(runtime.close)
+        runtime._read = _FakeGraph(facts, rules).read
+        return runtime
+
+    def _targets(self, result, variable="Z"):
+        return sorted(row["bindings"][variable] for row in result["results"])
+
+    def test_right_recursion_over_a_cycle(self):
+        runtime = self._runtime(self.CYCLE, [
+            "trusted(X, Y) :- trust(X, Y).",
+            "trusted(X, Z) :- trust(X, Y), trusted(Y, Z).",
+        ])
+        result = runtime.prove("trusted(a, Z)")
+        self.assertEqual(self._targets(result), ["a", "b", "c"])
+        self.assertEqual(result["tabled"], ["trusted"])
+        self.assertFalse(result["truncated"] or result["timed_out"])
+
+    def test_left_recursion_over_a_cycle(self):
+        runtime = self._runtime(self.CYCLE, [
+            "trusted(X, Z) :- trusted(X, Y), trust(Y, Z).",
+            "trusted(X, Y) :- trust(X, Y).",
+        ])
+        result = runtime.prove("trusted(a, Z)")
+        self.assertEqual(self._targets(result), ["a", "b", "c"])
+        self.assertFalse(result["truncated"] or result["timed_out"])
+
+    def test_mutual_recursion(self):
+        runtime = self._runtime(self.CYCLE, [
+            "ally(X, Y) :- trust(X, Y).",
+            "ally(X, Z) :- kin(X, Y), ally(Y, Z).",
+            "kin(X, Y) :- ally(X, Y).",
+        ])
+        result = runtime.prove("ally(b, Z)")
+        self.assertEqual(self._targets(result), ["a", "b", "c"])
+        self.assertEqual(result["tabled"], ["ally", "kin"])
+        self.assertFalse(result["truncated"] or result["timed_out"])
+
+    def test_left_recursive_long_chain_is_complete(self):
+        runtime = self._runtime(_chain(200), [
+            "trusted(X, Z) :- trusted(X, Y), trust(Y, Z).",
+            "trusted(X, Y) :- trust(X, Y).",
+        ])
+        result = runtime.prove("trusted(n0, Z)")
+        self.assertEqual(result["count"], 200)
+        self.assertFalse(result["truncated"] or result["timed_out"])
+
+    def test_right_recursive_long_chain_is_cut_and_reported(self):
+        from symbolic_logic_runtime import SYMBOLIC_MAX_DEPTH
+
+        runtime = self._runtime(_chain(200), [
+            "trusted(X, Y) :- trust(X, Y).",
+            "trusted(X, Z) :- trust(X, Y), trusted(Y, Z).",
+        ])
+        # Each edge opens a new tabled variant; nesting stops at the depth limit
+        result = runtime.prove("trusted(n0, Z)")
+        self.assertTrue(result["truncated"])
+        self.assertFalse(result["timed_out"])
+        self.assertIn("n1", self._targets(result))
+        self.assertLess(result["count"], 200)
+        self.assertGreaterEqual(result["count"], SYMBOLIC_MAX_DEPTH)
+
+    def test_answer_limit_truncates(self):
+        runtime = self._runtime(_chain(50), [
+            "trusted(X, Z) :- trusted(X, Y), trust(Y, Z).",
+            "trusted(X, Y) :- trust(X, Y).",
+        ])
+        result = runtime.prove("trusted(n0, Z)", answer_limit=10)
+        self.assertEqual(result["count"], 10)
+        self.assertTrue(result["truncated"])
+
+
+@unittest.skipUnless(NEO4J_AVAILABLE, "symbolic_logic_runtime needs the neo4j driver")
+class TestLispEvaluation(unittest.TestCase):
+    """Stored functions are loaded once; every eval runs within a budget."""
+
+    def setUp(self):
+        from symbolic_logic_runtime import SymbolicLogicRuntime
+
+        self.graph = _FakeGraph(functions=["(defun double (x) (* x 2))"])
+        self.runtime = SymbolicLogicRuntime()
+        self.addCleanup(self.runtime.close)
+        self.runtime._read = self.graph.read
+
+    def test_base_environment_is_cached(self):
+        self.assertEqual(self.runtime.eval_lisp("(double 21)")["result"], 42)
+        self.assertEqual(self.runtime.eval_lisp("(double 4)")["result"], 8)
+        self.assertEqual(self.graph.count("n.code AS code"), 1)
+
+        # A user defun stays in its own fork
+        self.runtime.eval_lisp("(defun triple (x) (* x 3))")
+        with self.assertRaises(ValueError):
+            self.runtime.eval_lisp("(triple 2)")
+
+        self.graph.functions.append("(defun triple (x) (* x 3))")
+        self.runtime.invalidate()
+        self.assertEqual(self.runtime.eval_lisp("(triple 2)")["result"], 6)
+        self.assertEqual(self.graph.count("n.code AS code"), 2)
+
+    def test_parsed_programs_are_cached(self):
+        from symbolic_logic_runtime import _parse_program
+
+        _parse_program.cache_clear()
+        program = "(double (+ 1 2))"
+        self.runtime.eval_lisp(program)
+        self.runtime.eval_lisp(program)
+        info = _parse_program.cache_info()
+        # The stored defun and the program are each parsed once
+        self.assertEqual((info.misses, info.hits), (2, 1))
+        self.assertIs(_parse_program(program), _parse_program(program))
+
+    def test_step_budget(self):
+        from symbolic_logic_runtime import LispBudgetExceeded
+
+        program = "(list " + " ".join(str(i) for i in range(600)) + ")"
+        self.assertEqual(len(self.runtime.eval_lisp(program, max_steps=1000)["result"]), 600)
+        with self.assertRaisesRegex(LispBudgetExceeded, "step budget of 50"):
+            self.runtime.eval_lisp(program, max_steps=50)
+
+    def test_time_budget(self):
+        from symbolic_logic_runtime import LispBudgetExceeded
+
+        program = "(list " + " ".join(str(i) for i in range(600)) + ")"
+        with self.assertRaisesRegex(LispBudgetExceeded, "timed out"):
+            self.runtime.eval_lisp(program, max_steps=None, timeout=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
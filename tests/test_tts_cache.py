@@ -0,0 +1,164 @@
+import unittest
+import asyncio
+import tempfile
+import sys
+import os
+from pathlib import Path
+
+# Add the orchestrator package root so core_engine is importable
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', 'core', 'grid-orchestrator')))
+
+from core_engine.tts_cache import TTSCache, tts_key
+
+
+class TestTTSCache(unittest.TestCase):
+    """Single-flight fills, atomic writes and LRU eviction for synthesized audio."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self.tmp.name)
+        self.calls = 0
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _synth(self, payload=b"x" * 100, fail=False):
+        async def _synthesize(out):
+            self.calls += 1
+            await asyncio.sleep(0.01)
+            if fail:
+                raise RuntimeError("edge-tts offline")
+            out.write_bytes(payload)
+        return _synthesize
+
+    def test_concurrent_misses_synthesize_once(self):
+        cache = TTSCache(self.root)
+        key = tts_key("edge-en-US-JennyNeural", "english", "Welcome")
+
+        async def _burst():
+            return await asyncio.gather(*(cache.get_or_create(key, self._synth()) for _ in range(10)))
+
+        paths = asyncio.run(_burst())
+        self.assertEqual(self.calls, 1)
+        self.assertEqual(len(set(paths)), 1)
+        self.assertEqual(paths[0].name, f"tts_{key}.mp3")
+        metrics = cache.metrics()
+        self.assertEqual((metrics["misses"], metrics["deduped"], metrics["bytes"]), (1, 9, 100))
+        self.assertEqual([p.name for p in self.root.iterdir() if p.name.startswith(".")], [])
+
+        asyncio.run(cache.get_or_create(key, self._synth()))
+        self.assertEqual((self.calls, cache.hits), (1, 1))
+
+    def test_cancelled_caller_does_not_cancel_joined_callers(self):
+        cache = TTSCache(self.root)
+        key = tts_key("edge-en-US-JennyNeural", "english", "Hold the line")
+
+        async def _scenario():
+            first = asyncio.create_task(cache.get_or_create(key, self._synth()))
+            await asyncio.sleep(0)
+            second = asyncio.create_task(cache.get_or_create(key, self._synth()))
+            await asyncio.sleep(0)
+            first.cancel()  # the starting client disconnects mid-synthesis
+            return await second, first
+
+        path, first = asyncio.run(_scenario())
+        self.assertTrue(first.cancelled())
+        self.assertEqual(path.read_bytes(), b"x" * 100)
+        self.assertEqual((self.calls, cache.deduped), (1, 1))
+
+    def test_failed_synthesis_caches_nothing(self):
+        cache = TTSCache(self.root)
+        with self.assertRaises(RuntimeError):
+            asyncio.run(cache.get_or_create("ab" * 32, self._synth(fail=True)))
+        self.assertEqual(cache.metrics()["entries"], 0)
+        self.assertEqual(list(self.root.glob("*tts_abab*")), [])
+
+    def test_lru_eviction_and_index_reload(self):
+        (self.root / "ibb_greeting.mp3").write_bytes(b"native" * 100)
+        cache = TTSCache(self.root, max_bytes=250)
+        keys = [tts_key("gtts-en", "english", str(i)) for i in range(3)]
+
+        async def _fill():
+            await cache.get_or_create(keys[0], self._synth())
+            await cache.get_or_create(keys[1], self._synth())
+            cache.lookup(keys[0])  # keys[1] is now least recently used
+            await cache.get_or_create(keys[2], self._synth())
+
+        asyncio.run(_fill())
+        self.assertFalse(cache.path_for(keys[1]).exists())
+        self.assertTrue((self.root / "ibb_greeting.mp3").exists())
+        self.assertEqual(cache.evictions, 1)
+
+        reloaded = TTSCache(self.root, max_bytes=250)
+        self.assertIsNotNone(reloaded.lookup(keys[0]))
+        self.assertIsNone(reloaded.lookup(keys[1]))
+        self.assertEqual(reloaded.metrics()["bytes"], 200)
+
+    def test_stream_tees_misses_and_replays_hits(self):
+        cache = TTSCache(self.root)
+        key = tts_key("edge-en-NG-AbeoNeural", "ibibio", "Amesiere.")
+
+        async def _frames():
+            self.calls += 1
+            for frame in (b"ID3", b"\xff\xfb" * 10, b"tail"):
+                await asyncio.sleep(0)
+                yield frame
+
+        async def _collect(limit=None):
+            out = []
+            async for chunk in cache.stream(key, _frames):
+                out.append(bytes(chunk))
+                if limit and len(out) == limit:
+                    break
+            return out
+
+        streamed = asyncio.run(_collect())
+        self.assertEqual(streamed, [b"ID3", b"\xff\xfb" * 10, b"tail"])
+        replayed = asyncio.run(_collect())
+        self.assertEqual(b"".join(replayed), b"".join(streamed))
+        self.assertEqual((self.calls, cache.hits), (1, 1))
+
+        # A consumer that stops early leaves the fill to finish in the background
+        other = tts_key("edge-en-NG-AbeoNeural", "ibibio", "Sosongo.")
+
+        async def _abandon():
+            async for _ in cache.stream(other, _frames):
+                break
+            while other in cache._inflight:
+                await asyncio.sleep(0)
+
+        asyncio.run(_abandon())
+        self.assertIsNotNone(cache.lookup(other))
+        self.assertEqual(self.calls, 2)
+
+    def test_stream_disconnect_does_not_stall_joined_consumer(self):
+        cache = TTSCache(self.root)
+        key = tts_key("edge-en-NG-AbeoNeural", "ibibio", "Mmedi.")
+        frames = (b"ID3", b"\xff\xfb" * 10, b"tail")
+
+        async def _frames():
+            self.calls += 1
+            for frame in frames:
+                await asyncio.sleep(0.01)
+                yield frame
+
+        async def _leaver():
+            async for _ in cache.stream(key, _frames):
+                break  # client disconnects after the first chunk
+
+        async def _listener():
+            return b"".join([bytes(c) async for c in cache.stream(key, _frames)])
+
+        async def _scenario():
+            leaver = asyncio.create_task(_leaver())
+            await asyncio.sleep(0)
+            listener = asyncio.create_task(_listener())
+            await leaver
+            return await asyncio.wait_for(listener, timeout=2)
+
+        self.assertEqual(asyncio.run(_scenario()), b"".join(frames))
+        self.assertEqual((self.calls, cache.deduped), (1, 1))
+
+
+if __name__ == '__main__':
+    unittest.main()